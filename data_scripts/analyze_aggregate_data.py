@@ -6,10 +6,11 @@ import statsmodels.stats.weightstats as smw
 import matplotlib.pyplot as plt
 import argparse
 import os
+import json
 from IPython.display import display
 
 # The names of columns that are not metrics and must hence always be included in the dataframes
-NON_METRIC_COLUMNS = ["model", "input", "deployment-mechanism"]
+NON_METRIC_COLUMNS = ["model", "input", "deployment-mechanism", "threads", "storage", "device", "resolution"]
 
 # The absolute path of the "data_scripts" directory where this script is in
 SCRIPTS_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -24,6 +25,25 @@ RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
 # an experiment set are stored 
 AGGREGATE_CSV_FILENAME = "aggregate_results.csv"
 
+# The input resolution assumed for aggregate results written before the resolution was recorded, and the template
+# of the suffix giving the resolution in the filenames of models exported at several, e.g. efficientnet_b3_res300.pt
+DEFAULT_INPUT_RESOLUTION = 224
+MODEL_RESOLUTION_SUFFIX_TEMPLATE = "_res{resolution}"
+
+# The thread count recorded when the binaries were left to pick their own number of intra-op threads, which
+# is also assumed for aggregate results written before the thread count was recorded
+DEFAULT_THREADS = 0
+
+# The storage medium recorded when the models and inputs were read from the suite's own directory, which is also assumed
+# for aggregate results written before the storage medium was recorded
+DEFAULT_STORAGE = "default"
+
+# The device profile recorded when the workloads were given all of the device's CPUs, which is also assumed for aggregate
+# results written before the device profile was recorded, and the file in the set's results directory recording the 
+# number of CPUs each device profile left the workloads
+DEFAULT_DEVICE = "default"
+DEVICE_PROFILES_FILENAME = "device_profiles.json"
+
 # Maps deployment mechanisms to colors and line styles for plotting
 DEPLOYMENT_MECHANISM_TO_COLOR = {
     "wasm_aot": "tab:red",
@@ -38,33 +58,29 @@ DEPLOYMENT_MECHANISM_TO_LINESTYLE = {
     "native": ":",
 }
 
-def chart_compare_across_models_or_inputs(aggregate_df, metrics, across_models, variable_values, constant_value, 
-    view_output, save_output, plots_path):
-    """Produce charts comparing the performance of different deployment mechanisms across different models or inputs.
+# The colors given to sub-mechanisms of the deployment mechanisms above, such as the Docker image variants, in the
+# order they appear; each sub-mechanism keeps the line style of its parent deployment mechanism
+SUB_MECHANISM_COLORS = ["tab:purple", "tab:brown", "tab:pink", "tab:gray", "tab:olive", "tab:cyan"]
+
+def chart_compare_across_variable(aggregate_df, metrics, variable, constant, variable_values, constant_value, 
+    plot_filename_prefix, view_output, save_output, plots_path):
+    """Produce charts comparing the performance of different deployment mechanisms across different values of a variable,
+    such as the model, the input or the input resolution.
     
     Args:
-        aggregate_df: The dataframe containing the aggregate results.
+        aggregate_df: The dataframe containing the aggregate results, with one row per deployment mechanism and variable value.
         metrics: The metrics to analyze.
-        across_models: Whether to compare across models or inputs.
+        variable: The name of the column holding the variable.
+        constant: The name of the column holding the constant.
         variable_values: The values of the variable (e.g. if comparing across models, then the names of the models) to compare.
-        constant_value: The value of the constant (e.g. if comparing across models, then the name of the input) to use in comparing models.
+        constant_value: The value of the constant (e.g. if comparing across models, then the name of the input) to use in comparing.
+        plot_filename_prefix: The prefix of the filenames of the saved plots.
         view_output: Whether to view the output of the analysis.
         save_output: Whether to save the output of the analysis to files.
         plots_path: The path to the directory where the plots should be saved.
     """
     deployment_mechanisms = aggregate_df["deployment-mechanism"].unique()
-    variable_values_str = "_".join(variable_values)
-
-    if across_models:            
-        # If comparing across models, then models represent the variable, while the input represents a constant
-        variable = "model"
-        constant = "input"
-        plot_filename_prefix = f"aggregate_models_{variable_values_str}_for_input_{constant_value}"
-    else:
-        # Otherwise, it is the other way around
-        variable = "input"
-        constant = "model"
-        plot_filename_prefix = f"aggregate_models_{variable_values_str}_for_model_{constant_value}"
+    deployment_mechanism_styles = get_deployment_mechanism_styles(deployment_mechanisms)
 
     for metric in metrics:
         # Ensure this metric is in this dataframe (since some metrics are only for the perf dataframes,
@@ -76,14 +92,17 @@ def chart_compare_across_models_or_inputs(aggregate_df, metrics, across_models,
 
             for deployment_mechanism in deployment_mechanisms:
 
-                # Get only the rows for this deployment mechanism
+                # Get only the rows for this deployment mechanism, ordered the same way as the variable values; if
+                # an experiment was analyzed more than once, its most recent results are used
                 deployment_mechanism_metric_df = aggregate_df[aggregate_df["deployment-mechanism"] == deployment_mechanism]
+                deployment_mechanism_metric_df = deployment_mechanism_metric_df.drop_duplicates(subset=variable, keep="last")
+                deployment_mechanism_metric_df = deployment_mechanism_metric_df.set_index(variable).reindex(variable_values)
                 
                 # Plot the mean and confidence interval for each deployment mechanism
                 means = deployment_mechanism_metric_df[f"{metric}-mean"].tolist()
                 errors = [deployment_mechanism_metric_df[f"{metric}-error-lower"].tolist(), deployment_mechanism_metric_df[f"{metric}-error-upper"].tolist()]
-                plt.errorbar(variable_values, means, yerr=errors, label=deployment_mechanism, capsize=5, 
-                    color=DEPLOYMENT_MECHANISM_TO_COLOR[deployment_mechanism], linestyle=DEPLOYMENT_MECHANISM_TO_LINESTYLE[deployment_mechanism])
+                plt.errorbar([str(value) for value in variable_values], means, yerr=errors, label=deployment_mechanism, capsize=5, 
+                    color=deployment_mechanism_styles[deployment_mechanism][0], linestyle=deployment_mechanism_styles[deployment_mechanism][1])
 
             # Set title and labels
             plt.title(f"{metric_name_without_hyphen} by {variable} on {constant} {constant_value}\nfor different deployment mechanisms")
@@ -103,36 +122,55 @@ def chart_compare_across_models_or_inputs(aggregate_df, metrics, across_models,
             if view_output:
                 plt.show()
 
-def compare_across_models_or_inputs(aggregate_df, across_models, variable_values, constant_value, 
+def get_deployment_mechanism_styles(deployment_mechanisms):
+    """Get the color and line style to plot each deployment mechanism with. Sub-mechanisms, whose names extend 
+    those of the deployment mechanisms in DEPLOYMENT_MECHANISM_TO_COLOR (e.g. docker_slim), are given the next
+    color in SUB_MECHANISM_COLORS and the line style of their parent.
+
+    Args:
+        deployment_mechanisms: The deployment mechanisms to plot.
+    Returns:
+        dict: A mapping of each deployment mechanism to a tuple of its color and line style.
+    """
+    styles = {}
+    sub_mechanisms = 0
+    for deployment_mechanism in deployment_mechanisms:
+        if deployment_mechanism in DEPLOYMENT_MECHANISM_TO_COLOR:
+            styles[deployment_mechanism] = (DEPLOYMENT_MECHANISM_TO_COLOR[deployment_mechanism], 
+                DEPLOYMENT_MECHANISM_TO_LINESTYLE[deployment_mechanism])
+            continue
+
+        # The parent is the longest known deployment mechanism the sub-mechanism's name starts with
+        parents = [parent for parent in DEPLOYMENT_MECHANISM_TO_LINESTYLE if deployment_mechanism.startswith(f"{parent}_")]
+        linestyle = DEPLOYMENT_MECHANISM_TO_LINESTYLE[max(parents, key=len)] if parents else "-"
+        styles[deployment_mechanism] = (SUB_MECHANISM_COLORS[sub_mechanisms % len(SUB_MECHANISM_COLORS)], linestyle)
+        sub_mechanisms += 1
+
+    return styles
+
+def compare_across_variable(aggregate_df, variable, constant, variable_values, constant_value, plot_filename_prefix,
     metrics, view_output, save_output, plots_path):
-    """Compare the performance of different deployment mechanisms across different models or inputs.
+    """Compare the performance of different deployment mechanisms across different values of a variable.
 
     Args:
         aggregate_df: The dataframe containing the aggregate results.
-        across_models: Whether to compare across models or inputs.
+        variable: The name of the column holding the variable.
+        constant: The name of the column holding the constant.
         variable_values: The values of the variable (e.g. if comparing across models, then the names of the models) to compare.
-        constant_value: The value of the constant (e.g. if comparing across models, then the name of the input) to use in comparing models.
+        constant_value: The value of the constant (e.g. if comparing across models, then the name of the input) to use in comparing.
+        plot_filename_prefix: The prefix of the filenames of the saved plots.
         metrics: The metrics to analyze.
         view_output: Whether to view the output of the analysis.
         save_output: Whether to save the output of the analysis to files.
         plots_path: The path to the directory where the plots should be saved.
     """
-    if across_models:
-        # If comparing across models, then models represent the variable, while the input represents a constant
-        variable = "model"
-        constant = "input"
-    else:
-        # Otherwise, it is the other way around
-        variable = "input"
-        constant = "model"
-
     # Filter the dataframes to only include rows with the specified variable values and constant value
     aggregate_df = aggregate_df[aggregate_df[variable].isin(variable_values)]
     aggregate_df = aggregate_df[aggregate_df[constant] == constant_value]
 
     # For each metric and deployment mechanism, lineplot the mean and confidence intervals
-    chart_compare_across_models_or_inputs(aggregate_df, metrics, across_models, variable_values, constant_value, view_output, 
-        save_output, plots_path)
+    chart_compare_across_variable(aggregate_df, metrics, variable, constant, variable_values, constant_value, 
+        plot_filename_prefix, view_output, save_output, plots_path)
 
 def compare_across_models(aggregate_df, models_to_compare, input, metrics, view_output, save_output, plots_path):
     """Compare the performance of different deployment mechanisms across different models.
@@ -146,7 +184,10 @@ def compare_across_models(aggregate_df, models_to_compare, input, metrics, view_
         save_output: Whether to save the output of the analysis to files.
         plots_path: The path to the directory where the plots should be saved.
     """
-    compare_across_models_or_inputs(aggregate_df, True, models_to_compare, input, metrics, view_output, save_output, plots_path)
+    # Models represent the variable, while the input represents a constant
+    plot_filename_prefix = f"aggregate_models_{'_'.join(models_to_compare)}_for_input_{input}"
+    compare_across_variable(aggregate_df, "model", "input", models_to_compare, input, plot_filename_prefix, metrics, 
+        view_output, save_output, plots_path)
 
 def compare_across_inputs(aggregate_df, inputs_to_compare, model, metrics, view_output, save_output, plots_path):
     """Compare the performance of different deployment mechanisms across different inputs.
@@ -160,7 +201,160 @@ def compare_across_inputs(aggregate_df, inputs_to_compare, model, metrics, view_
         save_output: Whether to save the output of the analysis to files.
         plots_path: The path to the directory where the plots should be saved.
     """
-    compare_across_models_or_inputs(aggregate_df, False, inputs_to_compare, model, metrics, view_output, save_output, plots_path)
+    # Inputs represent the variable, while the model represents a constant
+    plot_filename_prefix = f"aggregate_models_{'_'.join(inputs_to_compare)}_for_model_{model}"
+    compare_across_variable(aggregate_df, "input", "model", inputs_to_compare, model, plot_filename_prefix, metrics, 
+        view_output, save_output, plots_path)
+
+def compare_across_resolutions(aggregate_df, base_model, input, metrics, view_output, save_output, plots_path):
+    """Compare the performance of different deployment mechanisms across the input resolutions a model was exported at.
+
+    Args:
+        aggregate_df: The dataframe containing the aggregate results.
+        base_model: The model to compare resolutions of, without any resolution suffix (e.g. efficientnet_b3.pt).
+        input: The single input to use in comparing resolutions.
+        metrics: The metrics to analyze.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        plots_path: The path to the directory where the plots should be saved.
+    """
+    aggregate_df = add_resolution_columns(aggregate_df)
+    aggregate_df = aggregate_df[aggregate_df["input"] == input]
+
+    # Resolutions represent the variable, while the model (at any resolution) represents a constant
+    resolutions = sorted(aggregate_df.loc[aggregate_df["base-model"] == base_model, "resolution"].unique().tolist())
+    plot_filename_prefix = f"aggregate_resolutions_{'_'.join(str(resolution) for resolution in resolutions)}_for_model_{base_model}_input_{input}"
+    compare_across_variable(aggregate_df, "resolution", "base-model", resolutions, base_model, plot_filename_prefix, metrics, 
+        view_output, save_output, plots_path)
+
+def compare_across_devices(aggregate_df, device_profiles, model, input, metrics, view_output, save_output, plots_path):
+    """Compare the performance of different deployment mechanisms across the device profiles emulating smaller edge
+    devices, ordered by the number of CPUs each leaves the workloads, to characterize how they scale with it.
+
+    Args:
+        aggregate_df: The dataframe containing the aggregate results, across device profiles.
+        device_profiles: The device profiles recorded for the set, as a dictionary mapping each device profile's name to
+            its CPU quota, its set of CPUs and the number of CPUs it leaves the workloads.
+        model: The single model to use in comparing device profiles.
+        input: The single input to use in comparing device profiles.
+        metrics: The metrics to analyze.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        plots_path: The path to the directory where the plots should be saved.
+    """
+    aggregate_df = aggregate_df[aggregate_df["input"] == input].copy()
+
+    # Device profiles that were not recorded, such as those of results collected before they were, come last
+    devices = aggregate_df.loc[aggregate_df["model"] == model, "device"].unique().tolist()
+    devices.sort(key=lambda device: (device not in device_profiles, device_profiles.get(device, {}).get("available-cpus", 0), device))
+    device_labels = {device: f"{device} ({device_profiles[device]['available-cpus']:g} CPUs)" if device in device_profiles 
+        else device for device in devices}
+    aggregate_df["device"] = aggregate_df["device"].map(device_labels)
+
+    # Device profiles represent the variable, while the model represents a constant
+    plot_filename_prefix = f"aggregate_devices_{'_'.join(devices)}_for_model_{model}_input_{input}"
+    compare_across_variable(aggregate_df, "device", "model", [device_labels[device] for device in devices], model, 
+        plot_filename_prefix, metrics, view_output, save_output, plots_path)
+
+def read_device_profiles(experiments_set_path):
+    """Read the device profiles recorded for an experiment set by the data collection.
+
+    Args:
+        experiments_set_path: The path to the experiment set's results directory.
+    Returns:
+        dict: The device profiles, keyed by their names, which is empty if none were recorded.
+    """
+    device_profiles_path = os.path.join(experiments_set_path, DEVICE_PROFILES_FILENAME)
+    if not os.path.exists(device_profiles_path):
+        return {}
+    with open(device_profiles_path, "r") as f:
+        return json.load(f)
+
+def get_base_model(model, resolution):
+    """Get a model's name without the suffix giving the input resolution it was exported at, if it has one.
+
+    Args:
+        model: The filename of the model.
+        resolution: The input resolution the model was run at.
+    Returns:
+        str: The model's filename without the resolution suffix (e.g. efficientnet_b3.pt for efficientnet_b3_res300.pt).
+    """
+    stem, extension = os.path.splitext(model)
+    resolution_suffix = MODEL_RESOLUTION_SUFFIX_TEMPLATE.format(resolution=resolution)
+    if stem.endswith(resolution_suffix):
+        stem = stem[:-len(resolution_suffix)]
+    return stem + extension
+
+def add_resolution_columns(aggregate_df):
+    """Complete the column holding the input resolution each model was run at, as recorded by the data collection, and
+    add a column holding the model's name without the resolution.
+
+    Args:
+        aggregate_df: The dataframe containing the aggregate results.
+    Returns:
+        pd.DataFrame: The dataframe with the "resolution" and "base-model" columns.
+    """
+    if "resolution" not in aggregate_df.columns:
+        aggregate_df = aggregate_df.assign(resolution=DEFAULT_INPUT_RESOLUTION)
+    aggregate_df = aggregate_df.fillna({"resolution": DEFAULT_INPUT_RESOLUTION}).astype({"resolution": int})
+    aggregate_df["base-model"] = [get_base_model(model, resolution) 
+        for model, resolution in zip(aggregate_df["model"], aggregate_df["resolution"])]
+    return aggregate_df
+
+def filter_threads(aggregate_df, threads):
+    """Filter the aggregate dataframe to the results obtained with a given thread count.
+
+    Args:
+        aggregate_df: The aggregate dataframe containing the results.
+        threads: The thread count to keep results for, or None if the results must all share a single thread count.
+    Returns:
+        pd.DataFrame: The filtered aggregate dataframe.
+    """
+    if "threads" not in aggregate_df.columns:
+        aggregate_df = aggregate_df.assign(threads=DEFAULT_THREADS)
+    aggregate_df = aggregate_df.fillna({"threads": DEFAULT_THREADS})
+
+    if threads is None:
+        thread_counts = aggregate_df["threads"].unique()
+        if len(thread_counts) > 1:
+            print(f"The experiments were run with multiple thread counts ({', '.join(str(int(t)) for t in sorted(thread_counts))}); "
+                + "you must provide the thread count to compare at.")
+            exit(1)
+        return aggregate_df
+
+    return aggregate_df[aggregate_df["threads"] == threads]
+
+def filter_storage(aggregate_df, storage):
+    """Filter the aggregate dataframe to the results obtained with the model and input read from a given storage medium.
+
+    Args:
+        aggregate_df: The aggregate dataframe containing the results.
+        storage: The storage medium to keep results for.
+    Returns:
+        pd.DataFrame: The filtered aggregate dataframe.
+    """
+    if "storage" not in aggregate_df.columns:
+        aggregate_df = aggregate_df.assign(storage=DEFAULT_STORAGE)
+    aggregate_df = aggregate_df.fillna({"storage": DEFAULT_STORAGE})
+    return aggregate_df[aggregate_df["storage"] == storage]
+
+def filter_device(aggregate_df, device):
+    """Filter the aggregate dataframe to the results obtained under a given device profile.
+
+    Args:
+        aggregate_df: The aggregate dataframe containing the results.
+        device: The device profile to keep results for, or None to keep the results for every device profile.
+    Returns:
+        pd.DataFrame: The filtered aggregate dataframe.
+    """
+    if "device" not in aggregate_df.columns:
+        aggregate_df = aggregate_df.assign(device=DEFAULT_DEVICE)
+    aggregate_df = aggregate_df.fillna({"device": DEFAULT_DEVICE})
+
+    if device is None:
+        return aggregate_df
+
+    return aggregate_df[aggregate_df["device"] == device]
 
 def remove_irrelevant_df_columns(df, metric_cols):
     """Remove columns not relevant to the analysis from the dataframe.
@@ -182,6 +376,20 @@ def main():
     parser.add_argument("--compare-across-inputs", action="store_true", help="Compare across inputs.")
     parser.add_argument("--inputs-to-compare", type=str, help="The inputs to compare.")
     parser.add_argument("--model", type=str, help="The model to use in comparing inputs.")
+    parser.add_argument("--compare-across-resolutions", action="store_true", help="Compare across input resolutions.")
+    parser.add_argument("--resolutions-model", type=str, 
+        help="The model to compare the input resolutions of, without any resolution suffix (e.g. efficientnet_b3.pt).")
+    parser.add_argument("--resolutions-input", type=str, help="The single input to use in comparing resolutions.")
+    parser.add_argument("--compare-across-devices", action="store_true", 
+        help="Compare across the device profiles emulating smaller edge devices, ordered by the number of CPUs each leaves.")
+    parser.add_argument("--devices-model", type=str, help="The single model to use in comparing device profiles.")
+    parser.add_argument("--devices-input", type=str, help="The single input to use in comparing device profiles.")
+    parser.add_argument("--threads", type=int, 
+        help="The thread count to compare at; required if the experiments were run with more than one thread count.")
+    parser.add_argument("--storage", type=str, default=DEFAULT_STORAGE,
+        help="The storage medium the models and inputs were read from to compare at.")
+    parser.add_argument("--device", type=str, default=DEFAULT_DEVICE,
+        help="The device profile to compare at, other than when comparing across device profiles.")
     parser.add_argument("--metrics", type=str, help="The metrics to analyze.")
     parser.add_argument("--view-output", action="store_true", help="View the output of the analysis.")
     parser.add_argument("--save-output", action="store_true", 
@@ -206,6 +414,13 @@ def main():
     # Remove irrelevant columns from the dataframe
     aggregate_df = remove_irrelevant_df_columns(aggregate_df, metric_cols)
 
+    # Only compare results obtained with the same thread count, storage medium and device profile
+    aggregate_df = filter_threads(aggregate_df, args.threads)
+    aggregate_df = filter_storage(aggregate_df, args.storage)
+    # except when comparing across device profiles
+    devices_aggregate_df = filter_device(aggregate_df, None)
+    aggregate_df = filter_device(aggregate_df, args.device)
+
     # Get the path to the plots directory
     plots_path = os.path.join(analyzed_results_path, "plots")
 
@@ -229,6 +444,24 @@ def main():
         inputs_to_compare = [input.strip() for input in args.inputs_to_compare.split(",")]
         compare_across_inputs(aggregate_df, inputs_to_compare, args.model, metrics, args.view_output, args.save_output,
             plots_path)
+    if args.compare_across_resolutions:
+        if args.resolutions_model is None:
+            print("You must provide a single model, without any resolution suffix, to compare resolutions of.")
+            exit(1)
+        if args.resolutions_input is None:
+            print("You must provide a single input to use in comparing resolutions.")
+            exit(1)
+        compare_across_resolutions(aggregate_df, args.resolutions_model, args.resolutions_input, metrics, args.view_output, 
+            args.save_output, plots_path)
+    if args.compare_across_devices:
+        if args.devices_model is None:
+            print("You must provide a single model to use in comparing device profiles.")
+            exit(1)
+        if args.devices_input is None:
+            print("You must provide a single input to use in comparing device profiles.")
+            exit(1)
+        compare_across_devices(devices_aggregate_df, read_device_profiles(experiments_set_path), args.devices_model, 
+            args.devices_input, metrics, args.view_output, args.save_output, plots_path)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
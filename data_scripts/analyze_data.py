@@ -2,18 +2,84 @@
    in the performance of different deployment mechanisms and quantifying the extent of that difference.
 """
 import pandas as pd
+import numpy as np
 import statsmodels.stats.weightstats as smw
+from scipy import stats
 from itertools import combinations
 import matplotlib.pyplot as plt
 import argparse
 import os
 import csv
+import re
+import zlib
+
+# The names of the columns holding the experiment dimensions swept alongside the deployment mechanism, and
+# the values assumed for results files collected before a dimension was recorded
+DIMENSION_COLUMNS = ["threads", "storage", "device"]
+DEFAULT_DIMENSION_VALUES = {"threads": 0, "storage": "default", "device": "default"}
+
+# The name of the column holding the input resolution the model was run at, which is the same for every trial in a
+# results file, and the resolution assumed for results files collected before it was recorded
+RESOLUTION_COLUMN = "resolution"
+DEFAULT_INPUT_RESOLUTION = 224
+
+# The ways the inputs can have been passed to the binaries, and the component the data collection appends to the
+# input in the names of the results files for each of them
+INPUT_MODE_FILENAME_SUFFIXES = {"raw": "", "pre_decoded": "-pre_decoded"}
+
+# The names of the columns holding the thermal state of the device sampled at the start and end of each trial,
+# which older results files do not include
+THERMAL_COLUMNS = ["start-temperature-celsius", "end-temperature-celsius", "start-cpu-frequency-mhz", 
+    "end-cpu-frequency-mhz", "throttled"]
+
+# The name of the column flagging trials whose energy was estimated from their CPU time rather than measured
+ENERGY_ESTIMATED_COLUMN = "energy-estimated"
 
 # The names of columns that are not metrics and must hence always be included in the dataframes
-NON_METRIC_COLUMNS = ["index", "deployment-mechanism", "trial-number"]
+NON_METRIC_COLUMNS = ["index", "deployment-mechanism", "trial-number"] + DIMENSION_COLUMNS + [RESOLUTION_COLUMN] + \
+    THERMAL_COLUMNS + [ENERGY_ESTIMATED_COLUMN]
+
+# The number of inferences run in each trial of the standard experiments, which per-inference metrics are divided by
+INFERENCES_PER_TRIAL = 1
+
+# The size of a cache line in bytes, which each cache miss is assumed to transfer from memory
+CACHE_LINE_BYTES = 64
+
+# The metrics derived from those in the results files, each the ratio of a numerator and a denominator written as
+# pandas expressions over the results' columns, with names quoted in backticks. Each trial's value is the ratio of
+# its numerator and denominator, while a deployment mechanism's value is the ratio of their means, with a
+# confidence interval from the delta method or from bootstrapping the trials. A metric is only derived when every
+# column it refers to is in the results, which for metrics combining perf and time columns is once they are merged.
+# Those metrics set "paired-trials" to False, since the perf and time trials merged into a row were not run together:
+# their numerator and denominator are estimated and resampled independently, and their per-trial values are not
+# analyzed or plotted
+DERIVED_METRICS = {
+    "instructions-per-cycle": {"numerator": "`instructions`", "denominator": "`cpu-cycles`", "higher-is-better": True},
+    "cycles-per-instruction": {"numerator": "`cpu-cycles`", "denominator": "`instructions`"},
+    "cache-miss-rate": {"numerator": "`cache-misses`", "denominator": "`cache-references`"},
+    "branch-miss-rate": {"numerator": "`branch-misses`", "denominator": "`branch-instructions`"},
+    "cache-misses-per-kilo-instruction": {"numerator": "`cache-misses` * 1000", "denominator": "`instructions`"},
+    "branch-misses-per-kilo-instruction": {"numerator": "`branch-misses` * 1000", "denominator": "`instructions`"},
+    "instructions-per-inference": {"numerator": "`instructions`", "denominator": f"{INFERENCES_PER_TRIAL}"},
+    "page-faults-per-inference": {"numerator": "`page-faults`", "denominator": f"{INFERENCES_PER_TRIAL}"},
+    "major-faults-per-inference": {"numerator": "`major-faults`", "denominator": f"{INFERENCES_PER_TRIAL}"},
+    "cache-miss-bytes-per-inference": {"numerator": f"`cache-misses` * {CACHE_LINE_BYTES}", 
+        "denominator": f"{INFERENCES_PER_TRIAL}"},
+    "memory-bandwidth-proxy-bytes-per-second": {"numerator": f"`cache-misses` * {CACHE_LINE_BYTES}", 
+        "denominator": "`wall-time-seconds`", "confidence-interval": "bootstrap", "paired-trials": False},
+    "cpu-seconds-per-inference": {"numerator": "`cpu-usage-seconds`", "denominator": f"{INFERENCES_PER_TRIAL}", 
+        "confidence-interval": "bootstrap"}
+}
+
+# The ways the confidence interval of a derived metric can be computed, the delta method being the default
+DERIVED_METRIC_CI_DELTA = "delta"
+DERIVED_METRIC_CI_BOOTSTRAP = "bootstrap"
+
+# The pattern of the column names quoted in the expressions of derived metrics
+DERIVED_METRIC_COLUMN_PATTERN = re.compile(r"`([^`]+)`")
 
 # The names of extra columns computed from values in the result files 
-COMPUTED_COLUMNS = ["instructions-per-cycle", "cycles-per-instruction"]
+COMPUTED_COLUMNS = list(DERIVED_METRICS)
 
 # The absolute path of the "data_scripts" directory where this script is in
 SCRIPTS_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -28,18 +94,98 @@ RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
 # an experiment set are stored 
 AGGREGATE_CSV_FILENAME = "aggregate_results.csv"
 
+# The thread count recorded when the binaries were left to pick their own number of intra-op threads
+DEFAULT_THREADS = 0
+
+# The metric used to compute the speedup and parallel efficiency across thread counts
+THREAD_SCALING_METRIC = "wall-time-seconds"
+
+# The name recorded for the storage medium of the suite's own directory, which the other storage media the models and
+# inputs were read from are compared against, and the metrics compared between storage media
+DEFAULT_STORAGE = "default"
+STORAGE_METRICS = ["wall-time-seconds", "io-read-bytes", "major-faults"]
+
+# The name recorded for the device profile giving the workloads all of the device's CPUs, rather than emulating a 
+# smaller edge device
+DEFAULT_DEVICE = "default"
+
+# The metrics recorded for each trial of density experiments, in which several instances of a deployment mechanism
+# run concurrently
+DENSITY_METRICS = ["min-instance-latency-seconds", "mean-instance-latency-seconds", "max-instance-latency-seconds",
+    "makespan-seconds", "throughput-inferences-per-second", "max-total-rss-bytes", "max-total-pss-bytes", 
+    "max-pss-per-instance-bytes", "cpu-utilization-percentage", "max-cpu-utilization-percentage"]
+
+# The memory limit recorded for trials of memory experiments run without one, the number of bytes in a mebibyte, 
+# which memory limits are reported in, and the metrics of those trials averaged over all of them, including those 
+# that did not complete
+UNLIMITED_MEMORY = 0
+BYTES_PER_MIB = 2 ** 20
+MEMORY_MEAN_METRICS = ["peak-memory-bytes", "oom-kills", "reclaim-scanned-pages", "reclaim-stolen-pages"]
+
+# The characteristics of each Docker mechanism's image recorded by image experiments
+IMAGE_METRICS = ["image-size-bytes", "image-layers", "load-seconds", "start-latency-seconds", "first-run-seconds"]
+
+# The measurements of the AoT compilation of each WebAssembly AoT mechanism's file, and the baseline mechanism that
+# the time saved per inference by AoT compilation is measured against, to find how many inferences it takes to
+# recoup the compilation
+AOT_METRICS = ["compile-seconds", "artifact-size-bytes", "peak-compile-memory-bytes"]
+AOT_BASELINE_MECHANISM = "wasm_interpreted"
+
+# The timings recorded for each request of load experiments, in which requests arrive open-loop at an offered rate,
+# and the percentiles of them to summarize
+LOAD_LATENCY_METRICS = ["start-delay-seconds", "service-time-seconds", "latency-seconds"]
+LOAD_PERCENTILES = [50, 90, 99, 99.9]
+
+# How finely the percentile distribution of the latencies of load experiments resolves the tail, as the number of
+# percentiles reported each time their distance to 100 halves, as in HdrHistogram's output
+LOAD_PERCENTILE_TICKS_PER_HALF_DISTANCE = 5
+
+# A deployment mechanism is considered saturated at an offered rate once its achieved throughput falls below this 
+# fraction of the offered rate, or its p99 latency exceeds this factor of its p99 latency at the lowest offered rate
+LOAD_KNEE_THROUGHPUT_FRACTION = 0.9
+LOAD_KNEE_LATENCY_FACTOR = 2
+
+# The percentiles of each metric compared between deployment mechanisms alongside the mean, since the metrics
+# can be heavily skewed by outliers, and the number of bootstrap resamples used for their confidence intervals; 
+# the resamples are seeded so the confidence intervals are reproducible
+DISTRIBUTION_PERCENTILES = [50, 90, 99]
+BOOTSTRAP_RESAMPLES = 2000
+BOOTSTRAP_SEED = 0
+
+# The fraction of a flame graph's width a frame must span for its function to be labelled, and the number of characters 
+# of the label that fit per fraction of the width
+FLAME_GRAPH_LABEL_MIN_WIDTH = 0.03
+FLAME_GRAPH_LABEL_CHARACTERS_PER_WIDTH = 150
+
 # Numbers representing the different views of the Docker overhead
 DOCKER_OVERHEAD_EXCLUDE_DAEMON = 0
 DOCKER_OVERHEAD_INCLUDE_FULL_DAEMON = 1
 DOCKER_OVERHEAD_INCLUDE_ADDITIONAL_DAEMON = 2
 
-def welch_t_test_with_confidence_interval(arr_x, arr_y, alpha=0.05):
+# The suffix added to the perf rows of each Docker mechanism, such as "docker" or its image variants like 
+# "docker_slim", for each view of the Docker overhead, and the pattern splitting such rows into the two
+DOCKER_OVERHEAD_VIEW_SUFFIXES = {
+    DOCKER_OVERHEAD_EXCLUDE_DAEMON: "container",
+    DOCKER_OVERHEAD_INCLUDE_FULL_DAEMON: "container_and_daemon",
+    DOCKER_OVERHEAD_INCLUDE_ADDITIONAL_DAEMON: "container_and_daemon_extra_overhead"
+}
+DOCKER_PERF_ROW_PATTERN = re.compile(r"^(docker(?:_[a-z_]+?)?)_(container(?:_and_daemon(?:_extra_overhead)?)?)$")
+
+# The suffix of the columns of the variance of the estimate of the Docker daemon's baseline subtracted from each 
+# metric, which only the view including just the daemon's extra overhead has, and which is added to the variance of 
+# that view's means, since the baseline is estimated rather than known
+DAEMON_BASELINE_VARIANCE_COLUMN_SUFFIX = "-baseline-variance"
+
+def welch_t_test_with_confidence_interval(arr_x, arr_y, alpha=0.05, extra_variance_x=0, extra_variance_y=0):
     """Perform Welch's t-test on two samples and calculate the confidence interval of the difference of the means.
 
     Args:
         arr_x: First sample.
         arr_y: Second sample.
         alpha: Significance level for the confidence interval.
+        extra_variance_x: Variance to add to that of the mean of arr_x, from sources of uncertainty besides the
+            sampling of its values, such as the estimate of a baseline subtracted from them.
+        extra_variance_y: Variance to add to that of the mean of arr_y, likewise.
     Returns:
         tuple: Mean of arr_x, mean of arr_y, mean difference, the confidence interval's lower bound,
                the confidence interval's upper bound, the half-width of the confidence interval,
@@ -71,9 +217,259 @@ def welch_t_test_with_confidence_interval(arr_x, arr_y, alpha=0.05):
     x_ci = descr_stats_x.tconfint_mean(alpha=alpha)
     y_ci = descr_stats_y.tconfint_mean(alpha=alpha)
 
+    # Widen the confidence intervals by any extra variance of the means, keeping the degrees of freedom of the samples,
+    # which are those of the pooled samples if neither varies
+    if extra_variance_x or extra_variance_y:
+        sample_variance = descr_stats_x.std_mean ** 2 + descr_stats_y.std_mean ** 2
+        dof = compare_means.dof_satt() if sample_variance > 0 else descr_stats_x.nobs + descr_stats_y.nobs - 2
+        diff_half_width = stats.t.ppf(1 - alpha / 2, dof) * np.sqrt(sample_variance + extra_variance_x + extra_variance_y)
+        ci_lower, ci_upper = x_mean - y_mean - diff_half_width, x_mean - y_mean + diff_half_width
+        ci_half_width = diff_half_width
+        statistically_significant = not (ci_lower <= 0 <= ci_upper)
+        x_ci = widen_mean_confidence_interval(descr_stats_x, extra_variance_x, alpha)
+        y_ci = widen_mean_confidence_interval(descr_stats_y, extra_variance_y, alpha)
+
     return x_mean, y_mean, mean_diff, ci_lower, ci_upper, ci_half_width, statistically_significant, x_ci, y_ci
 
-def initialize_aggregate_df(metric_cols, deployment_mechanisms, model, input):
+def welch_t_test_p_value(arr_x, arr_y, extra_variance_x=0, extra_variance_y=0):
+    """Calculate the p-value of Welch's t-test of the difference of the means of two samples, with the same extra 
+    variance of the means and degrees of freedom as welch_t_test_with_confidence_interval().
+
+    Args:
+        arr_x: First sample.
+        arr_y: Second sample.
+        extra_variance_x: Variance to add to that of the mean of arr_x.
+        extra_variance_y: Variance to add to that of the mean of arr_y.
+    Returns:
+        float: The two-sided p-value.
+    """
+    descr_stats_x = smw.DescrStatsW(arr_x)
+    descr_stats_y = smw.DescrStatsW(arr_y)
+    sample_variance = descr_stats_x.std_mean ** 2 + descr_stats_y.std_mean ** 2
+    variance = sample_variance + extra_variance_x + extra_variance_y
+    mean_diff = descr_stats_x.mean - descr_stats_y.mean
+    # Samples that do not vary at all differ with certainty if their means do
+    if variance == 0:
+        return 1.0 if mean_diff == 0 else 0.0
+
+    dof = smw.CompareMeans(descr_stats_x, descr_stats_y).dof_satt() if sample_variance > 0 \
+        else descr_stats_x.nobs + descr_stats_y.nobs - 2
+    return 2 * stats.t.sf(abs(mean_diff) / np.sqrt(variance), dof)
+
+def widen_mean_confidence_interval(descr_stats, extra_variance, alpha=0.05):
+    """Calculate the confidence interval of the mean of a sample, adding extra variance to that of the mean.
+
+    Args:
+        descr_stats: The descriptive statistics of the sample.
+        extra_variance: Variance to add to that of the mean.
+        alpha: Significance level for the confidence interval.
+    Returns:
+        tuple: The confidence interval's lower and upper bounds.
+    """
+    half_width = stats.t.ppf(1 - alpha / 2, descr_stats.nobs - 1) * np.sqrt(descr_stats.std_mean ** 2 + extra_variance)
+    return descr_stats.mean - half_width, descr_stats.mean + half_width
+
+def get_daemon_baseline_variance(df, metric):
+    """Get the variance of the estimate of the Docker daemon's baseline subtracted from a metric, averaged over the 
+    trials, which is 0 for the deployment mechanisms and views without a baseline subtracted.
+
+    Args:
+        df: The dataframe containing the experimental data of a single deployment mechanism.
+        metric: The name of the metric.
+    Returns:
+        float: The variance.
+    """
+    variance_column = f"{metric}{DAEMON_BASELINE_VARIANCE_COLUMN_SUFFIX}"
+    if variance_column not in df.columns or df[variance_column].isna().all():
+        return 0
+    return df[variance_column].mean()
+
+def bootstrap_percentile_confidence_intervals(values, percentiles, alpha=0.05, resamples=BOOTSTRAP_RESAMPLES, 
+    seed=BOOTSTRAP_SEED):
+    """Calculate percentiles of several metrics' samples and their percentile bootstrap confidence intervals. Every
+    resample of every metric is drawn and reduced as a single array operation, rather than looping over resamples
+    or metrics.
+
+    Args:
+        values: 2D array of samples, with a row for each trial and a column for each metric.
+        percentiles: The percentiles to calculate, between 0 and 100.
+        alpha: Significance level for the confidence intervals.
+        resamples: The number of bootstrap resamples to draw.
+        seed: The seed of the random number generator drawing the resamples, so results are reproducible.
+    Returns:
+        tuple: The percentiles of the samples, the confidence intervals' lower bounds and the confidence intervals' 
+               upper bounds, each a 2D array with a row for each percentile and a column for each metric.
+    """
+    values = np.asarray(values, dtype=float)
+    rng = np.random.default_rng(seed)
+
+    # Draw the trials of every resample at once; the same resampled trials are used for each metric, since the
+    # metrics of a trial were measured together
+    resample_indices = rng.integers(0, len(values), size=(resamples, len(values)))
+    resampled_percentiles = np.percentile(values[resample_indices], percentiles, axis=1)
+    ci_lower, ci_upper = np.percentile(resampled_percentiles, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=1)
+
+    return np.percentile(values, percentiles, axis=0), ci_lower, ci_upper
+
+def ratio_of_means_confidence_interval(numerator, denominator, alpha=0.05, method=DERIVED_METRIC_CI_DELTA, paired=True,
+    resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED):
+    """Calculate the ratio of the means of two samples, such as the instructions and cycles of each trial, and
+    its confidence interval, either from the delta method's normal approximation to the ratio's variance or from
+    the percentile bootstrap.
+
+    Args:
+        numerator: The samples of the numerator.
+        denominator: The samples of the denominator.
+        alpha: Significance level for the confidence interval.
+        method: How to calculate the confidence interval, DERIVED_METRIC_CI_DELTA or DERIVED_METRIC_CI_BOOTSTRAP.
+        paired: Whether each sample of the numerator was measured together with the denominator's at the same index,
+            or the two samples are independent.
+        resamples: The number of bootstrap resamples to draw.
+        seed: The seed of the random number generator drawing the resamples, so results are reproducible.
+    Returns:
+        tuple: The ratio of the means and its confidence interval, as a tuple of its lower and upper bounds.
+    """
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    ratio = numerator.mean() / denominator.mean()
+
+    if method == DERIVED_METRIC_CI_BOOTSTRAP:
+        resampled_ratios = bootstrap_ratio_of_means(numerator, denominator, np.random.default_rng(seed), resamples, paired)
+        ci_lower, ci_upper = np.percentile(resampled_ratios, [100 * alpha / 2, 100 * (1 - alpha / 2)])
+        return ratio, (ci_lower, ci_upper)
+
+    ci_half_width = stats.t.ppf(1 - alpha / 2, len(numerator) - 1) \
+        * np.sqrt(ratio_of_means_variance(numerator, denominator, paired))
+    return ratio, (ratio - ci_half_width, ratio + ci_half_width)
+
+def ratio_of_means_difference_confidence_interval(numerator_x, denominator_x, numerator_y, denominator_y, alpha=0.05,
+    method=DERIVED_METRIC_CI_DELTA, paired=True, resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED):
+    """Calculate the confidence interval of the difference between the ratios of the means of two pairs of samples,
+    such as the instructions per cycle of two deployment mechanisms, with the same method as the confidence interval of
+    each ratio: from the sum of the delta method's variances of the two independent ratios, with the Welch-Satterthwaite
+    degrees of freedom, or from the percentile bootstrap of each ratio resampled independently.
+
+    Args:
+        numerator_x: The samples of the first numerator.
+        denominator_x: The samples of the first denominator.
+        numerator_y: The samples of the second numerator.
+        denominator_y: The samples of the second denominator.
+        alpha: Significance level for the confidence interval.
+        method: How to calculate the confidence interval, DERIVED_METRIC_CI_DELTA or DERIVED_METRIC_CI_BOOTSTRAP.
+        paired: Whether the samples of each numerator were measured together with those of its denominator, as for
+            ratio_of_means_confidence_interval().
+        resamples: The number of bootstrap resamples to draw.
+        seed: The seed of the random number generator drawing the resamples, so results are reproducible.
+    Returns:
+        tuple: The confidence interval of the first ratio minus the second, as its lower and upper bounds.
+    """
+    numerator_x, denominator_x, numerator_y, denominator_y = (np.asarray(values, dtype=float) 
+        for values in [numerator_x, denominator_x, numerator_y, denominator_y])
+    difference = numerator_x.mean() / denominator_x.mean() - numerator_y.mean() / denominator_y.mean()
+
+    if method == DERIVED_METRIC_CI_BOOTSTRAP:
+        # The resamples of the two ratios are drawn one after the other from the same generator, so they are independent
+        rng = np.random.default_rng(seed)
+        resampled_differences = bootstrap_ratio_of_means(numerator_x, denominator_x, rng, resamples, paired) \
+            - bootstrap_ratio_of_means(numerator_y, denominator_y, rng, resamples, paired)
+        ci_lower, ci_upper = np.percentile(resampled_differences, [100 * alpha / 2, 100 * (1 - alpha / 2)])
+        return ci_lower, ci_upper
+
+    variance_x = ratio_of_means_variance(numerator_x, denominator_x, paired)
+    variance_y = ratio_of_means_variance(numerator_y, denominator_y, paired)
+    if variance_x + variance_y > 0:
+        dof = (variance_x + variance_y) ** 2 \
+            / (variance_x ** 2 / (len(numerator_x) - 1) + variance_y ** 2 / (len(numerator_y) - 1))
+    else:
+        dof = len(numerator_x) + len(numerator_y) - 2
+    ci_half_width = stats.t.ppf(1 - alpha / 2, dof) * np.sqrt(variance_x + variance_y)
+    return difference - ci_half_width, difference + ci_half_width
+
+def ratio_of_means_variance(numerator, denominator, paired=True):
+    """Approximate the variance of the ratio of the means of two samples with the delta method, linearizing the ratio
+    around the means, which accounts for the covariance of the numerator and denominator of each trial if paired.
+
+    Args:
+        numerator: The samples of the numerator, as an array.
+        denominator: The samples of the denominator, as an array.
+        paired: Whether each sample of the numerator was measured together with the denominator's at the same index,
+            or the two samples are independent.
+    Returns:
+        float: The variance of the ratio of the means.
+    """
+    ratio = numerator.mean() / denominator.mean()
+    if paired:
+        covariance = np.cov(numerator, denominator)
+        variance = (covariance[0, 0] - 2 * ratio * covariance[0, 1] + ratio ** 2 * covariance[1, 1]) \
+            / (len(numerator) * denominator.mean() ** 2)
+    else:
+        variance = (numerator.var(ddof=1) / len(numerator) + ratio ** 2 * denominator.var(ddof=1) / len(denominator)) \
+            / denominator.mean() ** 2
+    # Rounding can leave the variance of a ratio that is the same in every trial slightly below 0
+    return max(variance, 0)
+
+def bootstrap_ratio_of_means(numerator, denominator, rng, resamples=BOOTSTRAP_RESAMPLES, paired=True):
+    """Draw bootstrap resamples of the trials of two samples, all at once, and calculate the ratio of the means of
+    each.
+
+    Args:
+        numerator: The samples of the numerator, as an array.
+        denominator: The samples of the denominator, as an array.
+        rng: The random number generator drawing the resamples.
+        resamples: The number of bootstrap resamples to draw.
+        paired: Whether each sample of the numerator was measured together with the denominator's at the same index,
+            so the two are resampled as pairs, or the two samples are independent and resampled separately.
+    Returns:
+        np.ndarray: The ratio of the means of each resample.
+    """
+    resample_indices = rng.integers(0, len(numerator), size=(resamples, len(numerator)))
+    denominator_resample_indices = resample_indices if paired \
+        else rng.integers(0, len(denominator), size=(resamples, len(denominator)))
+    return numerator[resample_indices].mean(axis=1) / denominator[denominator_resample_indices].mean(axis=1)
+
+def mann_whitney_test_with_hodges_lehmann_estimate(arr_x, arr_y, alpha=0.05):
+    """Perform the Mann-Whitney U test on two samples and calculate the Hodges-Lehmann estimate of the shift between
+    them, neither of which assumes the samples are normally distributed.
+
+    Args:
+        arr_x: First sample.
+        arr_y: Second sample.
+        alpha: Significance level for the test and the confidence interval.
+    Returns:
+        tuple: The test's p-value, whether the difference is statistically significant, the rank-biserial correlation
+               (from -1, when every value of arr_y is smaller than every value of arr_x, to 1, when it is larger),
+               the Hodges-Lehmann estimate of the shift from arr_x to arr_y, and the confidence interval's lower and
+               upper bounds.
+    """
+    arr_x = np.asarray(arr_x, dtype=float)
+    arr_y = np.asarray(arr_y, dtype=float)
+    u_statistic, p_value = stats.mannwhitneyu(arr_y, arr_x, alternative="two-sided")
+    rank_biserial_correlation = 2 * u_statistic / (len(arr_x) * len(arr_y)) - 1
+
+    # The Hodges-Lehmann estimate is the median of the differences between every pair of values, and its
+    # confidence interval is bounded by the differences ranked at the normal approximation to the U test's
+    # critical value
+    differences = np.sort(np.subtract.outer(arr_y, arr_x).ravel())
+    shift = np.median(differences)
+    pairs = len(differences)
+    z = stats.norm.ppf(1 - alpha / 2)
+    k = max(int(np.floor(pairs / 2 - z * np.sqrt(pairs * (len(arr_x) + len(arr_y) + 1) / 12))), 0)
+    ci_lower, ci_upper = differences[k], differences[pairs - 1 - k]
+
+    return p_value, p_value < alpha, rank_biserial_correlation, shift, ci_lower, ci_upper
+
+def get_percentile_name(percentile):
+    """Get the name of a percentile as used in column names, e.g. "median" or "p90".
+
+    Args:
+        percentile: The percentile, between 0 and 100.
+    Returns:
+        str: The name of the percentile.
+    """
+    return "median" if percentile == 50 else f"p{percentile:g}"
+
+def initialize_aggregate_df(metric_cols, deployment_mechanisms, model, input, threads=DEFAULT_THREADS, storage=DEFAULT_STORAGE,
+    device=DEFAULT_DEVICE, resolution=DEFAULT_INPUT_RESOLUTION):
     """Initialize the aggregate dataframe storing aggregate results for each deployment mechanism.
 
     Args:
@@ -81,12 +477,17 @@ def initialize_aggregate_df(metric_cols, deployment_mechanisms, model, input):
         deployment_mechanisms: List of deployment mechanisms.
         model: The name of the model used in the experiments.
         input: The name of the input used in the experiments.
+        threads: The intra-op thread count used in the experiments.
+        storage: The storage medium the model and input were read from in the experiments.
+        device: The device profile the experiments were run under.
+        resolution: The input resolution the model was run at in the experiments.
     Returns:
         pd.DataFrame: The initialized aggregate dataframe.
     """
-    # We include the model and input in the aggregate dataframe since we will later add
-    # the data to a CSV file aggregating results from all experiments within an experiment set
-    aggregate_df = pd.DataFrame(columns=["model", "input", "deployment-mechanism"])
+    # We include the model, input, thread count, storage medium, device profile and input resolution in the aggregate
+    # dataframe since we will later add the data to a CSV file aggregating results from all experiments within an experiment set
+    aggregate_df = pd.DataFrame(columns=["model", "input", "deployment-mechanism", "threads", "storage", "device", 
+        RESOLUTION_COLUMN])
 
     for metric in metric_cols:
         # For each metric, add three columns to the aggregate dataframe: the metric's mean, its lower error bound,
@@ -102,13 +503,18 @@ def initialize_aggregate_df(metric_cols, deployment_mechanisms, model, input):
         row["model"] = model
         row["input"] = input
         row["deployment-mechanism"] = deployment_mechanism
+        row["threads"] = threads
+        row["storage"] = storage
+        row["device"] = device
+        row[RESOLUTION_COLUMN] = resolution
 
         aggregate_df.loc[len(aggregate_df)] = row
 
     return aggregate_df
 
 def analyze_data_significant_difference(df, significance_level, metrics, model, input, analyzed_results_path, 
-    include_insignificant_output, view_output, save_output):
+    include_insignificant_output, view_output, save_output, threads=DEFAULT_THREADS, storage=DEFAULT_STORAGE, device=DEFAULT_DEVICE,
+    resolution=DEFAULT_INPUT_RESOLUTION):
     """Analyze the data to determine if there are statistically significant differences between deployment mechanisms.
 
     Args:
@@ -121,6 +527,10 @@ def analyze_data_significant_difference(df, significance_level, metrics, model,
         include_insignificant_output: Whether to include output for insignificant results.
         view_output: Whether to view the output of the analysis.
         save_output: Whether to save the output of the analysis to files.
+        threads: The intra-op thread count used in the experiments.
+        storage: The storage medium the model and input were read from in the experiments.
+        device: The device profile the experiments were run under.
+        resolution: The input resolution the model was run at in the experiments.
     Returns:
         pd.DataFrame: An aggregate dataframe containing aggregate results for each deployment mechanism.
     """
@@ -133,21 +543,64 @@ def analyze_data_significant_difference(df, significance_level, metrics, model,
 
     # This new dataframe will save, for each deployment mechanism, its statistics for each metric, for further analysis
     # in other functions e.g. visualizations
-    aggregate_df = initialize_aggregate_df(metrics, deployment_mechanisms, model, input)
+    aggregate_df = initialize_aggregate_df(metrics, deployment_mechanisms, model, input, threads, storage, device, resolution)
+
+    # Bootstrap the percentiles of every metric of each deployment mechanism once, rather than for each comparison
+    percentile_stats = {deployment_mechanism: bootstrap_percentile_confidence_intervals(
+        grouped_df.get_group(deployment_mechanism).to_numpy(dtype=float), DISTRIBUTION_PERCENTILES, significance_level)
+        for deployment_mechanism in deployment_mechanisms}
+
+    # A derived metric's value for each deployment mechanism is the ratio of the means of its numerator and denominator, 
+    # rather than the mean of each trial's ratio, with the confidence interval its definition calls for
+    derived_metric_terms = {deployment_mechanism: {metric: get_derived_metric_terms(
+        df[df["deployment-mechanism"] == deployment_mechanism], metric) for metric in metrics if metric in DERIVED_METRICS}
+        for deployment_mechanism in deployment_mechanisms}
+    derived_metric_stats = {deployment_mechanism: {metric: ratio_of_means_confidence_interval(*terms, significance_level,
+        DERIVED_METRICS[metric].get("confidence-interval", DERIVED_METRIC_CI_DELTA), has_paired_trials(metric)) 
+        for metric, terms in metric_terms.items()} for deployment_mechanism, metric_terms in derived_metric_terms.items()}
+
+    baseline_variances = {deployment_mechanism: {metric: get_daemon_baseline_variance(
+        df[df["deployment-mechanism"] == deployment_mechanism], metric) for metric in metrics} 
+        for deployment_mechanism in deployment_mechanisms}
 
     for deployment_mechanism_x, deployment_mechanism_y in combinations(deployment_mechanisms, 2):
         # This new dataframe will save, for this specific comparison, the two mechanisms' values for
         # each metric, whether the difference is statistically significant for each, and the effect size
         # confidence intervals
+        percentile_columns = [f"{deployment_mechanism}-{get_percentile_name(percentile)}" 
+            for percentile in DISTRIBUTION_PERCENTILES for deployment_mechanism in [deployment_mechanism_x, deployment_mechanism_y]]
         comparison_df = pd.DataFrame(columns=["metric", f"{deployment_mechanism_x}-value", f"{deployment_mechanism_y}-value",
-            "statistically-significant", "effect-size"])
+            "statistically-significant", "effect-size"] + percentile_columns + ["mann-whitney-p-value", 
+            "mann-whitney-statistically-significant", "rank-biserial-correlation", "hodges-lehmann-shift"])
 
-        for metric in metrics:
+        for metric_index, metric in enumerate(metrics):
             arr_x = grouped_df.get_group(deployment_mechanism_x)[metric]
             arr_y = grouped_df.get_group(deployment_mechanism_y)[metric]
 
+            # The view of the Docker overhead including only the daemon's extra overhead also carries the uncertainty of
+            # the estimate of the daemon's baseline
             x_mean, y_mean, mean_diff, ci_lower, ci_upper, ci_half_width, statistically_significant, x_ci, y_ci = \
-                welch_t_test_with_confidence_interval(arr_x, arr_y, alpha=significance_level)
+                welch_t_test_with_confidence_interval(arr_x, arr_y, significance_level, 
+                    baseline_variances[deployment_mechanism_x].get(metric, 0), baseline_variances[deployment_mechanism_y].get(metric, 0))
+            # A derived metric's difference is that of the ratios of means, whose confidence interval, and so its
+            # significance and effect size, comes from the same method as each ratio's rather than from the trials' ratios
+            if metric in derived_metric_stats[deployment_mechanism_x]:
+                x_mean, x_ci = derived_metric_stats[deployment_mechanism_x][metric]
+                y_mean, y_ci = derived_metric_stats[deployment_mechanism_y][metric]
+                mean_diff = abs(y_mean - x_mean)
+                ci_lower, ci_upper = ratio_of_means_difference_confidence_interval(
+                    *derived_metric_terms[deployment_mechanism_x][metric], *derived_metric_terms[deployment_mechanism_y][metric],
+                    significance_level, DERIVED_METRICS[metric].get("confidence-interval", DERIVED_METRIC_CI_DELTA),
+                    has_paired_trials(metric))
+                ci_half_width = (ci_upper - ci_lower) / 2
+                statistically_significant = not (ci_lower <= 0 <= ci_upper)
+
+            # The per-trial values of a metric whose trials are not paired are not measurements of a single trial, so
+            # their distribution is not compared
+            paired = has_paired_trials(metric)
+            if paired:
+                mann_whitney_p_value, mann_whitney_significant, rank_biserial_correlation, shift, shift_ci_lower, shift_ci_upper = \
+                    mann_whitney_test_with_hodges_lehmann_estimate(arr_x, arr_y, alpha=significance_level)
 
             # Calculate the ratio of the means and its confidence interval
             if x_mean < y_mean:
@@ -173,13 +626,26 @@ def analyze_data_significant_difference(df, significance_level, metrics, model,
                 [y_mean, y_mean - y_ci[0], y_ci[1] - y_mean]
             
             # Add a new row to the comparison dataframe for this metric
-            comparison_df.loc[len(comparison_df)] = {
+            comparison_row = {
                 "metric": metric,
                 f"{deployment_mechanism_x}-value": f"{x_ci[0]:,.2f}-{x_ci[1]:,.2f}",
                 f"{deployment_mechanism_y}-value": f"{y_ci[0]:,.2f}-{y_ci[1]:,.2f}",
                 "statistically-significant": statistically_significant,
                 "effect-size": f"{ratio_min:.2f}x-{ratio_max:.2f}x"
             }
+            if paired:
+                comparison_row.update({
+                    "mann-whitney-p-value": mann_whitney_p_value,
+                    "mann-whitney-statistically-significant": mann_whitney_significant,
+                    "rank-biserial-correlation": f"{rank_biserial_correlation:.2f}",
+                    "hodges-lehmann-shift": f"{shift:,.2f} ({shift_ci_lower:,.2f} to {shift_ci_upper:,.2f})"
+                })
+                for percentile_index, percentile in enumerate(DISTRIBUTION_PERCENTILES):
+                    for deployment_mechanism in [deployment_mechanism_x, deployment_mechanism_y]:
+                        _, percentile_ci_lower, percentile_ci_upper = percentile_stats[deployment_mechanism]
+                        comparison_row[f"{deployment_mechanism}-{get_percentile_name(percentile)}"] = \
+                            f"{percentile_ci_lower[percentile_index, metric_index]:,.2f}-{percentile_ci_upper[percentile_index, metric_index]:,.2f}"
+            comparison_df.loc[len(comparison_df)] = comparison_row
 
             if statistically_significant:
                 # Reporting of results and calculations for ratio based on those used by the Sightglass benchmark,
@@ -195,11 +661,19 @@ def analyze_data_significant_difference(df, significance_level, metrics, model,
             print_if_true(f"{deployment_mechanism_x} average: {x_mean:.2f} (95% CI: {x_ci[0]:.2f} to {x_ci[1]:.2f})", view_output)
             print_if_true(f"{deployment_mechanism_y} average: {y_mean:.2f} (95% CI: {y_ci[0]:.2f} to {y_ci[1]:.2f})", view_output)
             print_if_true(ratio_message, view_output)
+            if paired:
+                x_median = percentile_stats[deployment_mechanism_x][0][DISTRIBUTION_PERCENTILES.index(50), metric_index]
+                y_median = percentile_stats[deployment_mechanism_y][0][DISTRIBUTION_PERCENTILES.index(50), metric_index]
+                print_if_true(f"{deployment_mechanism_x} median: {x_median:.2f}, {deployment_mechanism_y} median: {y_median:.2f}", view_output)
+                print_if_true(f"Hodges-Lehmann shift from {deployment_mechanism_x} to {deployment_mechanism_y}: {shift:.2f} "
+                    + f"({shift_ci_lower:.2f} to {shift_ci_upper:.2f}), Mann-Whitney U test p-value: {mann_whitney_p_value:.4f}, "
+                    + f"rank-biserial correlation: {rank_biserial_correlation:.2f}", view_output)
             print_if_true("", view_output)
 
         if save_output:
             # Save the comparison dataframe to a CSV file
-            comparison_csv_filename = f"{model}-{input}-{deployment_mechanism_x}-{deployment_mechanism_y}-comparison.csv"
+            comparison_csv_filename = f"{model}-{input}{get_threads_filename_suffix(threads)}{get_storage_filename_suffix(storage)}" \
+                + f"{get_device_filename_suffix(device)}-{deployment_mechanism_x}-{deployment_mechanism_y}-comparison.csv"
             comparison_csv_path = os.path.join(analyzed_results_path, comparison_csv_filename)
 
             # Enclose everything in quotes, since otherwise importing them into e.g. Excel might
@@ -208,6 +682,1025 @@ def analyze_data_significant_difference(df, significance_level, metrics, model,
         
     return aggregate_df
 
+def analyze_thread_scaling(df, significance_level, model, input, analyzed_results_path, plots_path, view_output, save_output,
+    storage=DEFAULT_STORAGE, device=DEFAULT_DEVICE):
+    """Analyze how each deployment mechanism scales with the intra-op thread count, computing the speedup of each
+    thread count's wall time over that of the lowest thread count, and the resulting parallel efficiency (the speedup
+    divided by the increase in thread count).
+
+    Args:
+        df: The dataframe containing the experimental data, across thread counts.
+        significance_level: The significance level for the confidence intervals.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        storage: The storage medium the model and input were read from in the experiments.
+        device: The device profile the experiments were run under.
+    Returns:
+        pd.DataFrame: A dataframe containing the speedup and parallel efficiency for each deployment mechanism and thread count.
+    """
+    # Trials run with the runtime's default thread count are excluded, since their actual thread count is unknown
+    df = df[df["threads"] != DEFAULT_THREADS]
+
+    scaling_df = pd.DataFrame(columns=["deployment-mechanism", "threads", f"{THREAD_SCALING_METRIC}-mean", "speedup", 
+        "speedup-lower", "speedup-upper", "parallel-efficiency", "parallel-efficiency-lower", "parallel-efficiency-upper"])
+
+    for deployment_mechanism, mechanism_df in df.groupby("deployment-mechanism"):
+        thread_counts = sorted(mechanism_df["threads"].unique())
+        base_threads = thread_counts[0]
+        arr_base = mechanism_df[mechanism_df["threads"] == base_threads][THREAD_SCALING_METRIC]
+
+        for threads in thread_counts:
+            arr_threads = mechanism_df[mechanism_df["threads"] == threads][THREAD_SCALING_METRIC]
+            base_mean, threads_mean, _, _, _, ci_half_width, _, _, _ = \
+                welch_t_test_with_confidence_interval(arr_base, arr_threads, alpha=significance_level)
+
+            # The speedup and its confidence interval are calculated in the same way as the ratios of the means
+            # when comparing deployment mechanisms
+            speedup = base_mean / threads_mean
+            speedup_ci = ci_half_width / threads_mean
+            thread_increase = threads / base_threads
+
+            scaling_df.loc[len(scaling_df)] = {
+                "deployment-mechanism": deployment_mechanism,
+                "threads": threads,
+                f"{THREAD_SCALING_METRIC}-mean": threads_mean,
+                "speedup": speedup,
+                "speedup-lower": speedup - speedup_ci,
+                "speedup-upper": speedup + speedup_ci,
+                "parallel-efficiency": speedup / thread_increase,
+                "parallel-efficiency-lower": (speedup - speedup_ci) / thread_increase,
+                "parallel-efficiency-upper": (speedup + speedup_ci) / thread_increase
+            }
+
+            if threads != base_threads:
+                print_if_true(f"{deployment_mechanism} with {threads} threads is {speedup - speedup_ci:.2f} to {speedup + speedup_ci:.2f} "
+                    + f"times faster than with {base_threads} threads, for a parallel efficiency of "
+                    + f"{(speedup - speedup_ci) / thread_increase:.2f} to {(speedup + speedup_ci) / thread_increase:.2f}", view_output)
+        print_if_true("", view_output)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        scaling_csv_path = os.path.join(analyzed_results_path, 
+            f"{model}-{input}{get_storage_filename_suffix(storage)}{get_device_filename_suffix(device)}-thread_scaling.csv")
+        scaling_df.to_csv(scaling_csv_path, index=False, quoting=csv.QUOTE_ALL)
+
+    if view_output or save_output:
+        plot_thread_scaling(scaling_df, view_output, save_output, plots_path, model, input, storage, device)
+
+    return scaling_df
+
+def plot_thread_scaling(scaling_df, view_output, save_output, plots_path, model, input, storage=DEFAULT_STORAGE, 
+    device=DEFAULT_DEVICE):
+    """Plot each deployment mechanism's speedup against the thread count, alongside the ideal linear speedup.
+
+    Args:
+        scaling_df: The dataframe containing the speedup for each deployment mechanism and thread count.
+        view_output: Whether to view the plot.
+        save_output: Whether to save the plot to a file.
+        plots_path: Path to save the plot.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        storage: The storage medium the model and input were read from in the experiments.
+        device: The device profile the experiments were run under.
+    """
+    plt.figure(f"thread-scaling-{storage}-{device}")
+
+    for deployment_mechanism, mechanism_df in scaling_df.groupby("deployment-mechanism"):
+        errors = [mechanism_df["speedup"] - mechanism_df["speedup-lower"], mechanism_df["speedup-upper"] - mechanism_df["speedup"]]
+        plt.errorbar(mechanism_df["threads"], mechanism_df["speedup"], yerr=errors, capsize=5, marker="o", label=deployment_mechanism)
+
+    # The ideal speedup is linear in the thread count, relative to the lowest thread count
+    thread_counts = np.sort(scaling_df["threads"].unique())
+    plt.plot(thread_counts, thread_counts / thread_counts[0], linestyle="--", color="gray", label="ideal")
+
+    plt.title(f"speedup by thread count\nfor model {model} and input {input}{get_storage_description(storage)}"
+        + get_device_description(device))
+    plt.ylabel("speedup")
+    plt.xlabel("threads")
+    plt.xticks(thread_counts)
+    plt.legend()
+
+    if save_output:
+        plot_filepath = os.path.join(plots_path, 
+            f"{model}-{input}{get_storage_filename_suffix(storage)}{get_device_filename_suffix(device)}-thread_scaling.png")
+        plt.savefig(plot_filepath)
+
+    if view_output:
+        plt.show()
+
+def analyze_storage(df, significance_level, model, input, analyzed_results_path, plots_path, view_output, save_output):
+    """Analyze how each deployment mechanism is affected by the storage medium its model and input are read from, 
+    comparing each storage medium's wall time, bytes read and major page faults against those of the suite's own 
+    directory, or of the first storage medium if it was not swept.
+
+    Args:
+        df: The dataframe containing the experimental data, across storage media.
+        significance_level: The significance level for statistical tests.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each deployment mechanism, thread count, storage medium and metric, 
+            the mean and its confidence interval, and the difference from the base storage medium.
+    """
+    storage_media = sorted(df["storage"].unique(), key=lambda storage: (storage != DEFAULT_STORAGE, storage))
+    base_storage = storage_media[0]
+    storage_metrics = [metric for metric in STORAGE_METRICS if metric in df.columns]
+
+    storage_rows = []
+    for (deployment_mechanism, threads), group_df in df.groupby(["deployment-mechanism", "threads"]):
+        base_df = group_df[group_df["storage"] == base_storage]
+        for storage in storage_media:
+            storage_group_df = group_df[group_df["storage"] == storage]
+            if base_df.empty or storage_group_df.empty:
+                continue
+
+            for metric in storage_metrics:
+                _, storage_mean, _, ci_lower, ci_upper, _, statistically_significant, _, storage_ci = \
+                    welch_t_test_with_confidence_interval(base_df[metric], storage_group_df[metric], alpha=significance_level)
+                # The base storage medium is not compared against itself, and the confidence interval is undefined if
+                # neither storage medium's trials vary, as for metrics such as major faults that are often all zero
+                if storage == base_storage or not np.isfinite(ci_lower):
+                    ci_lower, ci_upper, statistically_significant = None, None, False
+                storage_rows.append({
+                    "deployment-mechanism": deployment_mechanism,
+                    "threads": threads,
+                    "storage": storage,
+                    "metric": metric,
+                    "mean": storage_mean,
+                    "error-lower": storage_mean - storage_ci[0],
+                    "error-upper": storage_ci[1] - storage_mean,
+                    f"difference-from-{base_storage}-lower": ci_lower,
+                    f"difference-from-{base_storage}-upper": ci_upper,
+                    "statistically-significant": statistically_significant
+                })
+
+                if statistically_significant:
+                    print_if_true(f"{deployment_mechanism} with threads={threads} reading from {storage} storage differs from "
+                        + f"{base_storage} storage by {ci_lower:,.2f} to {ci_upper:,.2f} for {metric}", view_output)
+    print_if_true("", view_output)
+
+    storage_df = pd.DataFrame(storage_rows)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        storage_csv_path = os.path.join(analyzed_results_path, f"{model}-{input}-storage.csv")
+        storage_df.to_csv(storage_csv_path, index=False, quoting=csv.QUOTE_ALL)
+
+    if (view_output or save_output) and not storage_df.empty:
+        plot_storage(storage_df, storage_media, view_output, save_output, plots_path, model, input)
+
+    return storage_df
+
+def plot_storage(storage_df, storage_media, view_output, save_output, plots_path, model, input):
+    """Plot each metric compared between storage media as a bar chart, grouping each deployment mechanism's bars for the
+    different storage media.
+
+    Args:
+        storage_df: The dataframe containing the mean of each metric for each deployment mechanism, thread count and
+            storage medium.
+        storage_media: The storage media, in the order to plot them.
+        view_output: Whether to view the plots.
+        save_output: Whether to save the plots to files.
+        plots_path: Path to save the plots.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+    """
+    bar_width = 0.8 / len(storage_media)
+
+    for (threads, metric), metric_df in storage_df.groupby(["threads", "metric"]):
+        metric_name_without_hyphen = metric.replace("-", " ")
+        metric_with_underscores = metric.replace("-", "_")
+        threads_description = "" if threads == DEFAULT_THREADS else f" with {threads} threads"
+        deployment_mechanisms = metric_df["deployment-mechanism"].unique().tolist()
+        plt.figure(f"storage-{metric}-{threads}")
+
+        for storage_index, storage in enumerate(storage_media):
+            storage_metric_df = metric_df[metric_df["storage"] == storage].set_index("deployment-mechanism") \
+                .reindex(deployment_mechanisms)
+            positions = np.arange(len(deployment_mechanisms)) + (storage_index - (len(storage_media) - 1) / 2) * bar_width
+            errors = [storage_metric_df["error-lower"], storage_metric_df["error-upper"]]
+            plt.bar(positions, storage_metric_df["mean"], bar_width, yerr=errors, capsize=5, label=storage)
+
+        plt.title(f"{metric_name_without_hyphen} by storage medium\nfor model {model} and input {input}{threads_description}")
+        plt.ylabel(metric_name_without_hyphen)
+        plt.xlabel("deployment mechanism")
+        plt.xticks(np.arange(len(deployment_mechanisms)), deployment_mechanisms)
+        plt.legend(title="storage")
+
+        if save_output:
+            plot_filename = f"{model}-{input}{get_threads_filename_suffix(threads)}-{metric_with_underscores}-storage.png"
+            plt.savefig(os.path.join(plots_path, plot_filename))
+
+        if view_output:
+            plt.show()
+
+def analyze_throttling(df, metrics, significance_level, view_output):
+    """Analyze the effect of thermal throttling by stratifying each deployment mechanism's trials into throttled and
+    unthrottled trials, and comparing each metric between the two.
+
+    Args:
+        df: The dataframe containing the experimental data, including the throttled column.
+        metrics: List of metrics to analyze.
+        significance_level: The significance level for statistical tests.
+        view_output: Whether to view the output of the analysis.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each deployment mechanism, thread count, storage medium, device profile
+            and metric, the number of trials and the mean in each stratum, and whether they differ significantly.
+    """
+    throttling_df = pd.DataFrame(columns=["deployment-mechanism", "threads", "storage", "device", "metric", "unthrottled-trials", "throttled-trials",
+        "unthrottled-mean", "throttled-mean", "statistically-significant"])
+
+    for (deployment_mechanism, threads, storage, device), group_df in df.groupby(["deployment-mechanism"] + DIMENSION_COLUMNS):
+        unthrottled_df = group_df[group_df["throttled"] == 0]
+        throttled_df = group_df[group_df["throttled"] == 1]
+
+        for metric in metrics:
+            statistically_significant = None
+
+            # Welch's t-test needs at least two trials in each stratum
+            if len(unthrottled_df) >= 2 and len(throttled_df) >= 2:
+                unthrottled_mean, throttled_mean, mean_diff, _, _, ci_half_width, statistically_significant, _, _ = \
+                    welch_t_test_with_confidence_interval(unthrottled_df[metric], throttled_df[metric], alpha=significance_level)
+
+                if statistically_significant:
+                    print_if_true(f"Throttling significantly changes {metric} for {deployment_mechanism} with threads={threads}, "
+                        + f"storage={storage}, device={device}: "
+                        + f"{unthrottled_mean:.2f} unthrottled vs {throttled_mean:.2f} throttled (difference: {mean_diff:.2f} ± {ci_half_width:.2f})", 
+                        view_output)
+
+            throttling_df.loc[len(throttling_df)] = {
+                "deployment-mechanism": deployment_mechanism,
+                "threads": threads,
+                "storage": storage,
+                "device": device,
+                "metric": metric,
+                "unthrottled-trials": len(unthrottled_df),
+                "throttled-trials": len(throttled_df),
+                "unthrottled-mean": unthrottled_df[metric].mean() if len(unthrottled_df) > 0 else None,
+                "throttled-mean": throttled_df[metric].mean() if len(throttled_df) > 0 else None,
+                "statistically-significant": statistically_significant
+            }
+
+    return throttling_df
+
+def has_throttling_data(df):
+    """Check whether the throttling state of the trials was recorded in the dataframe.
+
+    Args:
+        df: The dataframe containing the experimental data.
+    Returns:
+        bool: True if the throttled column is present and has a value for at least one trial.
+    """
+    return "throttled" in df.columns and df["throttled"].notna().any()
+
+def exclude_throttled_trials(df):
+    """Exclude the trials that were throttled, renumbering the remaining trials so that the trial numbers of each
+    experiment are still consecutive.
+
+    Args:
+        df: The dataframe containing the experimental data.
+    Returns:
+        pd.DataFrame: The dataframe without the throttled trials.
+    """
+    if not has_throttling_data(df):
+        return df
+
+    df = df[df["throttled"] != 1].copy()
+    df["trial-number"] = df.groupby(["deployment-mechanism"] + DIMENSION_COLUMNS).cumcount() + 1
+    return df
+
+def analyze_density(density_path, deployment_mechanisms, significance_level, model, input, analyzed_results_path, plots_path, 
+    view_output, save_output, exclude_throttled):
+    """Analyze the results of the density experiments, summarizing how each deployment mechanism's latency, throughput, 
+    memory usage and CPU utilization change with the number of concurrent instances.
+
+    Args:
+        density_path: The path to the CSV file containing the results of the density experiments.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        significance_level: The significance level for the confidence intervals.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each deployment mechanism, thread count and instance count, the mean
+            and confidence interval of each density metric.
+    """
+    df = pd.read_csv(density_path)
+    df = df[df["deployment-mechanism"].isin(deployment_mechanisms)]
+    if exclude_throttled:
+        df = exclude_throttled_trials(df)
+
+    density_rows = []
+    for (deployment_mechanism, threads, instances), group_df in df.groupby(["deployment-mechanism", "threads", "instances"]):
+        density_row = {"deployment-mechanism": deployment_mechanism, "threads": threads, "instances": instances}
+
+        for metric in DENSITY_METRICS:
+            descr_stats = smw.DescrStatsW(group_df[metric])
+            ci_lower, ci_upper = descr_stats.tconfint_mean(alpha=significance_level)
+            density_row[f"{metric}-mean"] = descr_stats.mean
+            density_row[f"{metric}-error-lower"] = descr_stats.mean - ci_lower
+            density_row[f"{metric}-error-upper"] = ci_upper - descr_stats.mean
+
+        density_rows.append(density_row)
+        print_if_true(f"{deployment_mechanism} with threads={threads} and {instances} instances: "
+            + f"{density_row['mean-instance-latency-seconds-mean']:.2f} s mean latency, "
+            + f"{density_row['throughput-inferences-per-second-mean']:.2f} inferences/s, "
+            + f"{density_row['max-total-pss-bytes-mean']:,.0f} bytes peak total PSS, "
+            + f"{density_row['cpu-utilization-percentage-mean']:.2f}% CPU utilization", view_output)
+
+    density_df = pd.DataFrame(density_rows)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        density_csv_path = os.path.join(analyzed_results_path, f"{model}-{input}-density.csv")
+        density_df.to_csv(density_csv_path, index=False, quoting=csv.QUOTE_ALL)
+
+    if view_output or save_output:
+        plot_density(density_df, view_output, save_output, plots_path, model, input)
+
+    return density_df
+
+def plot_density(density_df, view_output, save_output, plots_path, model, input):
+    """Plot each density metric against the number of concurrent instances, with a line for each deployment mechanism.
+
+    Args:
+        density_df: The dataframe containing the mean and confidence interval of each density metric.
+        view_output: Whether to view the plots.
+        save_output: Whether to save the plots to files.
+        plots_path: Path to save the plots.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+    """
+    for metric in DENSITY_METRICS:
+        metric_name_without_hyphen = metric.replace("-", " ")
+        metric_with_underscores = metric.replace("-", "_")
+        plt.figure(f"density-{metric}")
+
+        for (deployment_mechanism, threads), line_df in density_df.groupby(["deployment-mechanism", "threads"]):
+            label = deployment_mechanism if threads == DEFAULT_THREADS else f"{deployment_mechanism} ({threads} threads)"
+            errors = [line_df[f"{metric}-error-lower"], line_df[f"{metric}-error-upper"]]
+            plt.errorbar(line_df["instances"], line_df[f"{metric}-mean"], yerr=errors, capsize=5, marker="o", label=label)
+
+        plt.title(f"{metric_name_without_hyphen} by concurrent instances\nfor model {model} and input {input}")
+        plt.ylabel(metric_name_without_hyphen)
+        plt.xlabel("concurrent instances")
+        plt.xticks(sorted(density_df["instances"].unique()))
+        plt.legend()
+
+        if save_output:
+            plot_filepath = os.path.join(plots_path, f"{model}-{input}-{metric_with_underscores}-density.png")
+            plt.savefig(plot_filepath)
+
+        if view_output:
+            plt.show()
+
+def analyze_memory(memory_path, memory_search_path, deployment_mechanisms, significance_level, model, input, 
+    analyzed_results_path, plots_path, view_output, save_output, exclude_throttled):
+    """Analyze the results of the memory experiments, summarizing the minimum viable memory of each deployment 
+    mechanism, and how often it completed, how much slower it ran, and how much memory the kernel reclaimed from it 
+    under each memory limit swept.
+
+    Args:
+        memory_path: The path to the CSV file containing the results of the trials under each memory limit.
+        memory_search_path: The path to the CSV file containing the results of the searches for the minimum viable memory.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        significance_level: The significance level for the confidence intervals.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each deployment mechanism, thread count and memory limit, the share of
+            the trials that completed, the mean and confidence interval of the wall time of those that did, and the 
+            mean OOM kills and reclaim.
+    """
+    search_df = pd.read_csv(memory_search_path)
+    search_df = search_df[search_df["deployment-mechanism"].isin(deployment_mechanisms)]
+    search_df["minimum-viable-memory-ratio"] = search_df["minimum-viable-memory-bytes"] / search_df["reference-peak-memory-bytes"]
+    for _, search_row in search_df.iterrows():
+        print_if_true(f"{search_row['deployment-mechanism']} with threads={search_row['threads']}: minimum viable memory of "
+            + f"{search_row['minimum-viable-memory-bytes'] / BYTES_PER_MIB:.0f} MiB, "
+            + f"{search_row['minimum-viable-memory-ratio']:.2f} times its peak memory usage without a limit", view_output)
+
+    df = pd.read_csv(memory_path)
+    df = df[df["deployment-mechanism"].isin(deployment_mechanisms)]
+    if exclude_throttled:
+        df = exclude_throttled_trials(df)
+
+    memory_rows = []
+    for (deployment_mechanism, threads), mechanism_df in df.groupby(["deployment-mechanism", "threads"]):
+        unlimited_df = mechanism_df[(mechanism_df["memory-limit-bytes"] == UNLIMITED_MEMORY) & mechanism_df["completed"]]
+        unlimited_wall_time = unlimited_df["wall-time-seconds"].mean() if not unlimited_df.empty else np.nan
+
+        for memory_limit, group_df in mechanism_df.groupby("memory-limit-bytes"):
+            completed_df = group_df[group_df["completed"]]
+            memory_row = {"deployment-mechanism": deployment_mechanism, "threads": threads, "memory-limit-bytes": memory_limit,
+                "trials": len(group_df), "completed-share": len(completed_df) / len(group_df)}
+
+            # Only the trials that completed ran for long enough to compare their wall time
+            if len(completed_df) > 1:
+                descr_stats = smw.DescrStatsW(completed_df["wall-time-seconds"])
+                ci_lower, ci_upper = descr_stats.tconfint_mean(alpha=significance_level)
+            else:
+                ci_lower = ci_upper = np.nan
+            wall_time = completed_df["wall-time-seconds"].mean() if not completed_df.empty else np.nan
+            memory_row["wall-time-seconds-mean"] = wall_time
+            memory_row["wall-time-seconds-error-lower"] = wall_time - ci_lower
+            memory_row["wall-time-seconds-error-upper"] = ci_upper - wall_time
+            memory_row["slowdown"] = wall_time / unlimited_wall_time
+
+            # The reclaim is only reported under cgroup v2, and the peak memory usage may be missed by the sampling
+            for metric in MEMORY_MEAN_METRICS:
+                memory_row[f"{metric}-mean"] = group_df[metric].mean()
+
+            memory_rows.append(memory_row)
+            limit_description = f"{memory_limit / BYTES_PER_MIB:.0f} MiB" if memory_limit != UNLIMITED_MEMORY else "no"
+            reclaim_description = "" if pd.isna(memory_row["reclaim-stolen-pages-mean"]) \
+                else f", {memory_row['reclaim-stolen-pages-mean']:,.0f} pages reclaimed"
+            slowdown_description = "" if pd.isna(memory_row["slowdown"]) else f" {memory_row['slowdown']:.2f} times slower,"
+            print_if_true(f"{deployment_mechanism} with threads={threads} and {limit_description} memory limit: "
+                + f"{memory_row['completed-share']:.0%} of trials completed,{slowdown_description} "
+                + f"{memory_row['oom-kills-mean']:.2f} OOM kills{reclaim_description} on average", view_output)
+
+    memory_df = pd.DataFrame(memory_rows)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        search_df.to_csv(os.path.join(analyzed_results_path, f"{model}-{input}-minimum_viable_memory.csv"), index=False, 
+            quoting=csv.QUOTE_ALL)
+        memory_df.to_csv(os.path.join(analyzed_results_path, f"{model}-{input}-memory.csv"), index=False, quoting=csv.QUOTE_ALL)
+
+    if view_output or save_output:
+        plot_memory(memory_df, search_df, view_output, save_output, plots_path, model, input)
+
+    return memory_df
+
+def plot_memory(memory_df, search_df, view_output, save_output, plots_path, model, input):
+    """Plot the wall time and the share of the trials that completed against the memory limit, with a line for each 
+    deployment mechanism, its wall time without a limit as a dashed line and its minimum viable memory as a dotted line.
+
+    Args:
+        memory_df: The dataframe containing the summary of the trials under each memory limit.
+        search_df: The dataframe containing the minimum viable memory of each deployment mechanism.
+        view_output: Whether to view the plots.
+        save_output: Whether to save the plots to files.
+        plots_path: Path to save the plots.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+    """
+    for metric, label in [("wall-time-seconds-mean", "wall time seconds"), ("completed-share", "share of trials completed")]:
+        plt.figure(f"memory-{metric}")
+
+        for (deployment_mechanism, threads), line_df in memory_df.groupby(["deployment-mechanism", "threads"]):
+            line_label = deployment_mechanism if threads == DEFAULT_THREADS else f"{deployment_mechanism} ({threads} threads)"
+            limited_df = line_df[line_df["memory-limit-bytes"] != UNLIMITED_MEMORY]
+            limits_mib = limited_df["memory-limit-bytes"] / BYTES_PER_MIB
+            if metric == "wall-time-seconds-mean":
+                errors = [limited_df["wall-time-seconds-error-lower"], limited_df["wall-time-seconds-error-upper"]]
+                line = plt.errorbar(limits_mib, limited_df[metric], yerr=errors, capsize=5, marker="o", label=line_label)[0]
+                unlimited_df = line_df[line_df["memory-limit-bytes"] == UNLIMITED_MEMORY]
+                if not unlimited_df.empty:
+                    plt.axhline(unlimited_df[metric].iloc[0], color=line.get_color(), linestyle="--")
+            else:
+                line = plt.plot(limits_mib, limited_df[metric], marker="o", label=line_label)[0]
+
+            mechanism_search_df = search_df[(search_df["deployment-mechanism"] == deployment_mechanism) 
+                & (search_df["threads"] == threads)]
+            if not mechanism_search_df.empty:
+                plt.axvline(mechanism_search_df["minimum-viable-memory-bytes"].iloc[0] / BYTES_PER_MIB, color=line.get_color(), 
+                    linestyle=":")
+
+        plt.title(f"{label} by memory limit\nfor model {model} and input {input}")
+        plt.ylabel(label)
+        plt.xlabel("memory limit (MiB)")
+        plt.legend()
+
+        if save_output:
+            plot_filepath = os.path.join(plots_path, f"{model}-{input}-{metric.replace('-', '_')}-memory.png")
+            plt.savefig(plot_filepath)
+
+        if view_output:
+            plt.show()
+
+def analyze_images(image_path, deployment_mechanisms, significance_level, model, input, analyzed_results_path, plots_path, 
+    view_output, save_output, exclude_throttled):
+    """Analyze the results of the image experiments, summarizing the size, layer count, load time and first-start 
+    latency of the image of each Docker mechanism.
+
+    Args:
+        image_path: The path to the CSV file containing the results of the image experiments.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        significance_level: The significance level for the confidence intervals.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each Docker mechanism and thread count, the mean and confidence 
+            interval of each image metric.
+    """
+    df = pd.read_csv(image_path)
+    df = df[df["deployment-mechanism"].isin(deployment_mechanisms)]
+    if exclude_throttled:
+        df = exclude_throttled_trials(df)
+
+    image_rows = []
+    for (deployment_mechanism, threads), group_df in df.groupby(["deployment-mechanism", "threads"]):
+        image_row = {"deployment-mechanism": deployment_mechanism, "threads": threads}
+
+        for metric in IMAGE_METRICS:
+            descr_stats = smw.DescrStatsW(group_df[metric])
+            ci_lower, ci_upper = descr_stats.tconfint_mean(alpha=significance_level)
+            image_row[f"{metric}-mean"] = descr_stats.mean
+            image_row[f"{metric}-error-lower"] = descr_stats.mean - ci_lower
+            image_row[f"{metric}-error-upper"] = ci_upper - descr_stats.mean
+
+        image_rows.append(image_row)
+        print_if_true(f"{deployment_mechanism} with threads={threads}: {image_row['image-size-bytes-mean']:,.0f} bytes in "
+            + f"{image_row['image-layers-mean']:.0f} layers, loaded in {image_row['load-seconds-mean']:.2f} s, "
+            + f"first container started in {image_row['start-latency-seconds-mean']:.2f} s "
+            + f"and finished in {image_row['first-run-seconds-mean']:.2f} s", view_output)
+
+    image_df = pd.DataFrame(image_rows)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        image_csv_path = os.path.join(analyzed_results_path, f"{model}-{input}-image.csv")
+        image_df.to_csv(image_csv_path, index=False, quoting=csv.QUOTE_ALL)
+
+    if view_output or save_output:
+        for threads, threads_image_df in image_df.groupby("threads"):
+            for metric in IMAGE_METRICS:
+                metric_name_without_hyphen = metric.replace("-", " ")
+                metric_with_underscores = metric.replace("-", "_")
+                plt.figure(f"image-{metric}-{threads}")
+
+                errors = [threads_image_df[f"{metric}-error-lower"], threads_image_df[f"{metric}-error-upper"]]
+                plt.bar(threads_image_df["deployment-mechanism"], threads_image_df[f"{metric}-mean"], yerr=errors, capsize=5)
+
+                plt.title(f"{metric_name_without_hyphen} by Docker image variant\nfor model {model} and input {input}")
+                plt.ylabel(metric_name_without_hyphen)
+                plt.xlabel("deployment mechanism")
+
+                if save_output:
+                    plot_filename = f"{model}-{input}{get_threads_filename_suffix(threads)}-{metric_with_underscores}-image.png"
+                    plt.savefig(os.path.join(plots_path, plot_filename))
+
+                if view_output:
+                    plt.show()
+
+    return image_df
+
+def analyze_aot(aot_path, time_path, deployment_mechanisms, model, input, analyzed_results_path, plots_path, view_output, 
+    save_output, exclude_throttled):
+    """Analyze the AoT compilation of each WebAssembly AoT mechanism against its inference time, quantifying the 
+    trade-off between the compilation's cost and the speed of the compiled code across optimization levels.
+
+    Args:
+        aot_path: The path to the CSV file containing the compilation results.
+        time_path: The path to the CSV file containing the results of the time experiments, or None if they were
+            not run, in which case only the compilation results are summarized.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each WebAssembly AoT mechanism and thread count, its compilation 
+            results, its mean wall time and the number of inferences after which its compilation is recouped 
+            compared to the baseline mechanism.
+    """
+    aot_df = pd.read_csv(aot_path)
+    aot_df = aot_df[aot_df["deployment-mechanism"].isin(deployment_mechanisms)]
+    aot_df = aot_df[["deployment-mechanism", "optimization-level"] + AOT_METRICS]
+
+    if time_path is not None:
+        time_df = pd.read_csv(time_path)
+        for dimension, default_value in DEFAULT_DIMENSION_VALUES.items():
+            if dimension not in time_df.columns:
+                time_df[dimension] = default_value
+        if exclude_throttled:
+            time_df = exclude_throttled_trials(time_df)
+        # The AoT files are read from the suite's own directory, so only the inference times with it are comparable, and
+        # the compilation runs with all of the device's CPUs, so only those of the default device profile are
+        time_df = time_df[(time_df["storage"] == DEFAULT_STORAGE) & (time_df["device"] == DEFAULT_DEVICE)]
+        wall_times = time_df.groupby(["deployment-mechanism", "threads"])["wall-time-seconds"].mean() \
+            .rename("wall-time-seconds-mean").reset_index()
+        baseline_wall_times = wall_times[wall_times["deployment-mechanism"] == AOT_BASELINE_MECHANISM] \
+            .drop(columns="deployment-mechanism").rename(columns={"wall-time-seconds-mean": "baseline-wall-time-seconds-mean"})
+        aot_df = aot_df.merge(wall_times, on="deployment-mechanism").merge(baseline_wall_times, on="threads", how="left")
+
+        # The compilation is only recouped if the compiled code is faster than the baseline
+        time_saved_per_inference = aot_df["baseline-wall-time-seconds-mean"] - aot_df["wall-time-seconds-mean"]
+        aot_df["break-even-inferences"] = np.where(time_saved_per_inference > 0, 
+            np.ceil(aot_df["compile-seconds"] / time_saved_per_inference.where(time_saved_per_inference > 0)), np.nan)
+
+    for _, aot_row in aot_df.iterrows():
+        message = f"{aot_row['deployment-mechanism']} (optimization level {aot_row['optimization-level']}): compiled in " \
+            + f"{aot_row['compile-seconds']:.2f} s using {aot_row['peak-compile-memory-bytes']:,.0f} bytes of memory " \
+            + f"into {aot_row['artifact-size-bytes']:,.0f} bytes"
+        if "wall-time-seconds-mean" in aot_row:
+            message += f"; with threads={aot_row['threads']}, runs in {aot_row['wall-time-seconds-mean']:.2f} s, recouping " \
+                + f"its compilation against {AOT_BASELINE_MECHANISM} after {aot_row['break-even-inferences']:,.0f} inferences"
+        print_if_true(message, view_output)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        aot_csv_path = os.path.join(analyzed_results_path, f"{model}-{input}-aot.csv")
+        aot_df.to_csv(aot_csv_path, index=False, quoting=csv.QUOTE_ALL)
+
+    if (view_output or save_output) and "wall-time-seconds-mean" in aot_df.columns:
+        for threads, threads_aot_df in aot_df.groupby("threads"):
+            plt.figure(f"aot-tradeoff-{threads}")
+            plt.scatter(threads_aot_df["compile-seconds"], threads_aot_df["wall-time-seconds-mean"])
+            for _, aot_row in threads_aot_df.iterrows():
+                plt.annotate(aot_row["deployment-mechanism"], (aot_row["compile-seconds"], aot_row["wall-time-seconds-mean"]),
+                    textcoords="offset points", xytext=(5, 5))
+
+            plt.title(f"AoT compile time against wall time by optimization level\nfor model {model} and input {input}")
+            plt.xlabel("compile seconds")
+            plt.ylabel("wall time seconds")
+
+            if save_output:
+                plot_filename = f"{model}-{input}{get_threads_filename_suffix(threads)}-aot_tradeoff.png"
+                plt.savefig(os.path.join(plots_path, plot_filename))
+
+            if view_output:
+                plt.show()
+
+    return aot_df
+
+def analyze_profiles(profile_path, deployment_mechanisms, model, input, plots_path, view_output, save_output):
+    """Render the call stacks sampled by the profile experiments as a flame graph for each deployment mechanism, and as 
+    a differential flame graph for each pair of deployment mechanisms, showing where the second spends a larger or 
+    smaller share of its samples than the first. The folded stacks are saved alongside the plots, in the formats 
+    taken by the FlameGraph project's flamegraph.pl and difffolded.pl scripts.
+
+    Args:
+        profile_path: The path to the CSV file containing the results of the profile experiments.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        plots_path: Path to save the plots and the folded stacks.
+        view_output: Whether to view the plots.
+        save_output: Whether to save the plots and the folded stacks to files.
+    """
+    df = pd.read_csv(profile_path)
+    df = df[df["deployment-mechanism"].isin(deployment_mechanisms)]
+    if not (view_output or save_output):
+        return
+
+    for threads, threads_df in df.groupby("threads"):
+        filename_prefix = f"{model}-{input}{get_threads_filename_suffix(threads)}"
+        # Keep the order the mechanisms were specified in, so each pair is compared in the same direction as elsewhere
+        profiled_mechanisms = [mechanism for mechanism in deployment_mechanisms if mechanism in threads_df["deployment-mechanism"].values]
+        stack_samples = {mechanism: threads_df[threads_df["deployment-mechanism"] == mechanism].groupby("stack")["samples"].sum()
+            for mechanism in profiled_mechanisms}
+
+        for mechanism in profiled_mechanisms:
+            title = f"Flame graph of {mechanism}\nfor model {model} and input {input}"
+            plot_flame_graph(stack_samples[mechanism], None, title, view_output, save_output,
+                os.path.join(plots_path, f"{filename_prefix}-{mechanism}-flame_graph.png"))
+            if save_output:
+                with open(os.path.join(plots_path, f"{filename_prefix}-{mechanism}.folded"), "w") as f:
+                    f.writelines(f"{stack} {samples}\n" for stack, samples in stack_samples[mechanism].items())
+
+        for mechanism_x, mechanism_y in combinations(profiled_mechanisms, 2):
+            title = f"Differential flame graph of {mechanism_y} against {mechanism_x}\nfor model {model} and input {input}"
+            plot_flame_graph(stack_samples[mechanism_y], stack_samples[mechanism_x], title, view_output, save_output,
+                os.path.join(plots_path, f"{filename_prefix}-{mechanism_x}-{mechanism_y}-differential_flame_graph.png"))
+            if save_output:
+                both_samples = pd.concat([stack_samples[mechanism_x], stack_samples[mechanism_y]], axis=1).fillna(0).astype(int)
+                with open(os.path.join(plots_path, f"{filename_prefix}-{mechanism_x}-{mechanism_y}.diff.folded"), "w") as f:
+                    f.writelines(f"{stack} {samples_x} {samples_y}\n" for stack, (samples_x, samples_y) in both_samples.iterrows())
+
+def plot_flame_graph(stack_samples, baseline_stack_samples, title, view_output, save_output, plot_filepath):
+    """Plot a flame graph of folded call stacks, in which each frame's width is its share of the samples and the 
+    frames it called are stacked on top of it. For a differential flame graph, each frame is colored by how much
+    larger (red) or smaller (blue) its share of the samples is than in the baseline; otherwise, frames are given warm 
+    colors derived from their function's name, so the same function has the same color in every flame graph.
+
+    Args:
+        stack_samples: A series of the number of samples taken in each folded call stack.
+        baseline_stack_samples: A series of the number of samples taken in each folded call stack of the baseline, or 
+            None for a flame graph that is not differential.
+        title: The title of the plot.
+        view_output: Whether to view the plot.
+        save_output: Whether to save the plot to a file.
+        plot_filepath: The path to save the plot to.
+    """
+    def get_frame_shares(samples):
+        # The share of the samples taken in each frame, keyed by the frame's path from the root, including its callees
+        shares = {}
+        total_samples = samples.sum()
+        for stack, stack_sample_count in samples.items():
+            frames = stack.split(";")
+            for depth in range(1, len(frames) + 1):
+                path = tuple(frames[:depth])
+                shares[path] = shares.get(path, 0) + stack_sample_count / total_samples
+        return shares
+
+    frame_shares = get_frame_shares(stack_samples)
+    baseline_frame_shares = get_frame_shares(baseline_stack_samples) if baseline_stack_samples is not None else None
+
+    # Lay out each frame to the right of its preceding siblings, in alphabetical order as in flamegraph.pl
+    lefts = {}
+    next_lefts = {(): 0}
+    for path in sorted(frame_shares):
+        lefts[path] = next_lefts[path[:-1]]
+        next_lefts[path[:-1]] += frame_shares[path]
+        next_lefts[path] = lefts[path]
+
+    if baseline_frame_shares is not None:
+        deltas = {path: share - baseline_frame_shares.get(path, 0) for path, share in frame_shares.items()}
+        max_delta = max(max(abs(delta) for delta in deltas.values()), np.finfo(float).eps)
+        colors = [plt.cm.bwr(0.5 + deltas[path] / max_delta / 2) for path in frame_shares]
+    else:
+        hashes = [zlib.crc32(path[-1].encode()) for path in frame_shares]
+        colors = [((205 + h % 50) / 255, (h // 50 % 230) / 255, (h // 11500 % 55) / 255) for h in hashes]
+
+    depth = max(len(path) for path in frame_shares)
+    fig, ax = plt.subplots(figsize=(16, max(4, depth * 0.3)), num=title)
+    ax.barh([len(path) - 1 for path in frame_shares], list(frame_shares.values()), left=[lefts[path] for path in frame_shares], 
+        height=0.95, color=colors, edgecolor="white", linewidth=0.2)
+    for path, share in frame_shares.items():
+        if share >= FLAME_GRAPH_LABEL_MIN_WIDTH:
+            label = path[-1][:int(share * FLAME_GRAPH_LABEL_CHARACTERS_PER_WIDTH)]
+            ax.text(lefts[path] + 0.002, len(path) - 1, label, va="center", fontsize=7, clip_on=True)
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(-0.5, depth - 0.5)
+    ax.set_yticks([])
+    ax.set_xlabel("share of samples")
+    ax.set_title(title)
+    fig.tight_layout()
+
+    if save_output:
+        fig.savefig(plot_filepath)
+
+    if view_output:
+        plt.show()
+
+    plt.close(fig)
+
+def analyze_load(load_path, deployment_mechanisms, significance_level, model, input, analyzed_results_path, plots_path, 
+    view_output, save_output, exclude_throttled):
+    """Analyze the results of the load experiments, summarizing the tail latency and achieved throughput of each 
+    deployment mechanism at each offered rate, and finding the rate at which each deployment mechanism saturates.
+
+    Args:
+        load_path: The path to the CSV file containing the results of the load experiments.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        significance_level: The significance level for the confidence intervals.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        analyzed_results_path: Path to save analyzed results.
+        plots_path: Path to save the plots.
+        view_output: Whether to view the output of the analysis.
+        save_output: Whether to save the output of the analysis to files.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each deployment mechanism, thread count, arrival process and offered
+            rate, the latency percentiles, the mean and confidence interval of the achieved throughput, and whether
+            the deployment mechanism was saturated.
+    """
+    df = pd.read_csv(load_path)
+    df = df[df["deployment-mechanism"].isin(deployment_mechanisms)]
+    if exclude_throttled:
+        # The remaining trials are not renumbered, since each trial's requests share its trial number
+        df = df[df["throttled"] != 1]
+
+    group_columns = ["deployment-mechanism", "threads", "arrival-process", "offered-rate"]
+    load_rows = []
+    distribution_dfs = []
+    for (deployment_mechanism, threads, arrival_process, offered_rate), group_df in df.groupby(group_columns):
+        succeeded_df = group_df[group_df["succeeded"] == 1]
+        load_row = {"deployment-mechanism": deployment_mechanism, "threads": threads, "arrival-process": arrival_process,
+            "offered-rate": offered_rate, "requests": len(group_df), "success-rate": len(succeeded_df) / len(group_df)}
+
+        # Pool the requests of every trial, as when merging latency histograms
+        for metric in LOAD_LATENCY_METRICS:
+            for percentile in LOAD_PERCENTILES:
+                load_row[f"{metric}-p{percentile:g}"] = np.percentile(succeeded_df[metric], percentile) \
+                    if len(succeeded_df) > 0 else np.nan
+
+        # The throughput is achieved over each trial, from its start until its last request completed
+        trials_df = group_df.groupby("trial-number").agg(succeeded=("succeeded", "sum"), 
+            elapsed=("completion-offset-seconds", "max"))
+        descr_stats = smw.DescrStatsW(trials_df["succeeded"] / trials_df["elapsed"])
+        ci_lower, ci_upper = descr_stats.tconfint_mean(alpha=significance_level)
+        load_row["achieved-throughput-mean"] = descr_stats.mean
+        load_row["achieved-throughput-error-lower"] = descr_stats.mean - ci_lower
+        load_row["achieved-throughput-error-upper"] = ci_upper - descr_stats.mean
+        load_rows.append(load_row)
+
+        distribution_df = get_percentile_distribution(succeeded_df["latency-seconds"])
+        distribution_df.insert(0, "offered-rate", offered_rate)
+        distribution_df.insert(0, "arrival-process", arrival_process)
+        distribution_df.insert(0, "threads", threads)
+        distribution_df.insert(0, "deployment-mechanism", deployment_mechanism)
+        distribution_dfs.append(distribution_df)
+
+    load_df = pd.DataFrame(load_rows)
+    if load_df.empty:
+        return load_df
+
+    # Find each deployment mechanism's saturation knee, the lowest offered rate it can no longer keep up with
+    load_df["saturated"] = 0
+    for (deployment_mechanism, threads, arrival_process), sweep_df in load_df.groupby(group_columns[:-1]):
+        sweep_df = sweep_df.sort_values("offered-rate")
+        baseline_p99_latency = sweep_df["latency-seconds-p99"].iloc[0]
+        saturated = (sweep_df["achieved-throughput-mean"] < LOAD_KNEE_THROUGHPUT_FRACTION * sweep_df["offered-rate"]) \
+            | (sweep_df["latency-seconds-p99"] > LOAD_KNEE_LATENCY_FACTOR * baseline_p99_latency)
+        # Once saturated, a deployment mechanism stays saturated at higher rates
+        saturated = saturated.cummax()
+        load_df.loc[sweep_df.index, "saturated"] = saturated.astype(int)
+
+        label = deployment_mechanism if threads == DEFAULT_THREADS else f"{deployment_mechanism} ({threads} threads)"
+        for _, row in sweep_df.iterrows():
+            print_if_true(f"{label} at {row['offered-rate']:g} requests/s ({arrival_process}): "
+                + f"p50 {row['latency-seconds-p50']:.3f} s, p90 {row['latency-seconds-p90']:.3f} s, "
+                + f"p99 {row['latency-seconds-p99']:.3f} s, p99.9 {row['latency-seconds-p99.9']:.3f} s, "
+                + f"{row['achieved-throughput-mean']:.2f} requests/s achieved", view_output)
+        if saturated.any():
+            knee_rate = sweep_df["offered-rate"][saturated].iloc[0]
+            print_if_true(f"{label} saturates at {knee_rate:g} requests/s", view_output)
+        else:
+            print_if_true(f"{label} did not saturate at up to {sweep_df['offered-rate'].max():g} requests/s", view_output)
+
+    if save_output:
+        # Enclose everything in quotes, as for the comparisons
+        load_df.to_csv(os.path.join(analyzed_results_path, f"{model}-{input}-load.csv"), index=False, quoting=csv.QUOTE_ALL)
+        pd.concat(distribution_dfs, ignore_index=True).to_csv(
+            os.path.join(analyzed_results_path, f"{model}-{input}-load_latency_distribution.csv"), index=False, 
+            quoting=csv.QUOTE_ALL)
+
+    if view_output or save_output:
+        plot_load(load_df, view_output, save_output, plots_path, model, input)
+
+    return load_df
+
+def get_percentile_distribution(latencies):
+    """Get the percentile distribution of latencies in the style of HdrHistogram's output, with percentiles that 
+    halve their distance to 100 every LOAD_PERCENTILE_TICKS_PER_HALF_DISTANCE steps, so the tail is resolved as
+    finely as the number of latencies allows.
+
+    Args:
+        latencies: The latencies to get the distribution of.
+    Returns:
+        pd.DataFrame: A dataframe containing the latency at each percentile, the number of latencies at or below it,
+            and 1 / (1 - percentile), which is how HdrHistogram's plots space percentiles.
+    """
+    latencies = np.sort(np.asarray(latencies, dtype=float))
+    distribution_rows = []
+    step = 0
+    while len(latencies) > 0:
+        fraction = 1 - 0.5 ** (step / LOAD_PERCENTILE_TICKS_PER_HALF_DISTANCE)
+        # Stop once the percentile needs more latencies than there are to be told apart from the maximum
+        if 1 / (1 - fraction) > len(latencies):
+            break
+        latency = np.percentile(latencies, 100 * fraction)
+        distribution_rows.append({"percentile": 100 * fraction, "latency-seconds": latency,
+            "total-count": int(np.searchsorted(latencies, latency, side="right")), "inverse-tail-fraction": 1 / (1 - fraction)})
+        step += 1
+
+    if len(latencies) > 0:
+        distribution_rows.append({"percentile": 100.0, "latency-seconds": latencies[-1], "total-count": len(latencies),
+            "inverse-tail-fraction": np.inf})
+    return pd.DataFrame(distribution_rows, columns=["percentile", "latency-seconds", "total-count", "inverse-tail-fraction"])
+
+def plot_load(load_df, view_output, save_output, plots_path, model, input):
+    """Plot each latency percentile and the achieved throughput against the offered rate, with a line for each 
+    deployment mechanism.
+
+    Args:
+        load_df: The dataframe containing the latency percentiles and achieved throughput at each offered rate.
+        view_output: Whether to view the plots.
+        save_output: Whether to save the plots to files.
+        plots_path: Path to save the plots.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+    """
+    line_columns = ["deployment-mechanism", "threads", "arrival-process"]
+    multiple_arrival_processes = load_df["arrival-process"].nunique() > 1
+
+    def get_label(deployment_mechanism, threads, arrival_process):
+        label = deployment_mechanism if threads == DEFAULT_THREADS else f"{deployment_mechanism} ({threads} threads)"
+        return f"{label}, {arrival_process}" if multiple_arrival_processes else label
+
+    for percentile in LOAD_PERCENTILES:
+        plt.figure(f"load-p{percentile:g}")
+        for (deployment_mechanism, threads, arrival_process), line_df in load_df.groupby(line_columns):
+            plt.plot(line_df["offered-rate"], line_df[f"latency-seconds-p{percentile:g}"], marker="o", 
+                label=get_label(deployment_mechanism, threads, arrival_process))
+
+        plt.title(f"p{percentile:g} latency by offered rate\nfor model {model} and input {input}")
+        plt.ylabel(f"p{percentile:g} latency (seconds)")
+        plt.xlabel("offered rate (requests per second)")
+        plt.legend()
+
+        if save_output:
+            plot_filepath = os.path.join(plots_path, f"{model}-{input}-p{percentile:g}_latency-load.png")
+            plt.savefig(plot_filepath)
+
+        if view_output:
+            plt.show()
+
+    plt.figure("load-throughput")
+    for (deployment_mechanism, threads, arrival_process), line_df in load_df.groupby(line_columns):
+        errors = [line_df["achieved-throughput-error-lower"], line_df["achieved-throughput-error-upper"]]
+        plt.errorbar(line_df["offered-rate"], line_df["achieved-throughput-mean"], yerr=errors, capsize=5, marker="o",
+            label=get_label(deployment_mechanism, threads, arrival_process))
+
+    # A deployment mechanism keeping up with the offered rate lies on this line
+    offered_rates = sorted(load_df["offered-rate"].unique())
+    plt.plot(offered_rates, offered_rates, linestyle="--", color="gray", label="offered rate")
+    plt.title(f"achieved throughput by offered rate\nfor model {model} and input {input}")
+    plt.ylabel("achieved throughput (requests per second)")
+    plt.xlabel("offered rate (requests per second)")
+    plt.legend()
+
+    if save_output:
+        plot_filepath = os.path.join(plots_path, f"{model}-{input}-achieved_throughput-load.png")
+        plt.savefig(plot_filepath)
+
+    if view_output:
+        plt.show()
+
+def get_threads_filename_suffix(threads):
+    """Get the suffix added to the filenames of outputs for experiments run with a given thread count, so outputs 
+    for different thread counts do not overwrite each other.
+
+    Args:
+        threads: The intra-op thread count used in the experiments.
+    Returns:
+        str: The suffix, which is empty for the runtime's default thread count.
+    """
+    return "" if threads == DEFAULT_THREADS else f"-threads{threads}"
+
+def get_storage_filename_suffix(storage):
+    """Get the suffix added to the filenames of outputs for experiments whose model and input were read from a given
+    storage medium, so outputs for different storage media do not overwrite each other.
+
+    Args:
+        storage: The storage medium the model and input were read from in the experiments.
+    Returns:
+        str: The suffix, which is empty for the suite's own directory.
+    """
+    return "" if storage == DEFAULT_STORAGE else f"-storage_{storage}"
+
+def get_storage_description(storage):
+    """Get the description of the storage medium experiments read their model and input from, as added to plot titles.
+
+    Args:
+        storage: The storage medium the model and input were read from in the experiments.
+    Returns:
+        str: The description, which is empty for the suite's own directory.
+    """
+    return "" if storage == DEFAULT_STORAGE else f" from {storage} storage"
+
+def get_device_filename_suffix(device):
+    """Get the suffix added to the filenames of outputs for experiments run under a given device profile, so outputs 
+    for different device profiles do not overwrite each other.
+
+    Args:
+        device: The device profile the experiments were run under.
+    Returns:
+        str: The suffix, which is empty for all of the device's CPUs.
+    """
+    return "" if device == DEFAULT_DEVICE else f"-device_{device}"
+
+def get_device_description(device):
+    """Get the description of the device profile experiments were run under, as added to plot titles.
+
+    Args:
+        device: The device profile the experiments were run under.
+    Returns:
+        str: The description, which is empty for all of the device's CPUs.
+    """
+    return "" if device == DEFAULT_DEVICE else f" on the {device} device profile"
+
 def add_thousand_separator(number):
     """Add a thousand separator to a number.
 
@@ -243,45 +1736,81 @@ def parse_csv_rows(results_filename, deployment_mechanisms, metrics, docker_over
 
     df = pd.read_csv(results_filename)
 
-    # Drop columns corresponding to metrics that were not specified
-    df = df.drop(df.columns.difference(NON_METRIC_COLUMNS + metrics), axis=1)
-
-    if docker_overhead_view == DOCKER_OVERHEAD_EXCLUDE_DAEMON:
-        # Rename "docker_container" as an deployment mechanism to just "docker"
-        df["deployment-mechanism"] = df["deployment-mechanism"].apply(lambda deployment_mechanism: 
-            "docker" if deployment_mechanism == "docker_container" else deployment_mechanism)
-
-        # Remove the other rows whose deployment mechanism starts with "docker_container_and_daemon"
-        df = df[~df["deployment-mechanism"].str.startswith("docker_container_and_daemon")]
-    elif docker_overhead_view == DOCKER_OVERHEAD_INCLUDE_FULL_DAEMON:
-        # Rename "docker_container_and_daemon" as an deployment mechanism to just "docker"
-        df["deployment-mechanism"] = df["deployment-mechanism"].apply(lambda deployment_mechanism: 
-            "docker" if deployment_mechanism.startswith("docker_container_and_daemon") else deployment_mechanism)
-
-        # Remove the rows whose deployment mechanism is "docker_container" and "docker_container_and_daemon_extra_overhead"
-        df = df[~df["deployment-mechanism"].str.startswith("docker_container")]
-        df = df[~df["deployment-mechanism"].str.startswith("docker_container_and_daemon_extra_overhead")]
-    elif docker_overhead_view == DOCKER_OVERHEAD_INCLUDE_ADDITIONAL_DAEMON:
-        # Rename "docker_container_and_daemon_extra_overhead" as an deployment mechanism to just "docker"
-        df["deployment-mechanism"] = df["deployment-mechanism"].apply(lambda deployment_mechanism: 
-            "docker" if deployment_mechanism.startswith("docker_container_and_daemon_extra_overhead") else deployment_mechanism)
-
-        # Remove the rows whose deployment mechanism is "docker_container" and "docker_container_and_daemon"
-        df = df[~df["deployment-mechanism"].str.startswith("docker_container")]
-        df = df[~df["deployment-mechanism"].str.startswith("docker_container_and_daemon")]   
+    # Results files collected before a dimension was recorded were all run with its default value
+    for dimension in DIMENSION_COLUMNS:
+        if dimension not in df.columns:
+            df[dimension] = DEFAULT_DIMENSION_VALUES[dimension]
+    if RESOLUTION_COLUMN not in df.columns:
+        df[RESOLUTION_COLUMN] = DEFAULT_INPUT_RESOLUTION
+
+    # Drop columns corresponding to metrics that were not specified, keeping the variances of the Docker daemon's
+    # baseline subtracted from those that were
+    df = df.drop(df.columns.difference(NON_METRIC_COLUMNS + metrics 
+        + [f"{metric}{DAEMON_BASELINE_VARIANCE_COLUMN_SUFFIX}" for metric in metrics]), axis=1)
+
+    # Keep only the perf rows of the chosen view of each Docker mechanism's overhead, renaming them to just the
+    # mechanism, e.g. "docker_container_and_daemon" to "docker" or "docker_slim_container" to "docker_slim"
+    docker_view_suffix = DOCKER_OVERHEAD_VIEW_SUFFIXES[docker_overhead_view]
+
+    def rename_docker_view(deployment_mechanism):
+        match = DOCKER_PERF_ROW_PATTERN.match(deployment_mechanism)
+        if match is None:
+            return deployment_mechanism
+        return match.group(1) if match.group(2) == docker_view_suffix else None
+
+    df["deployment-mechanism"] = df["deployment-mechanism"].apply(rename_docker_view)
+    df = df[df["deployment-mechanism"].notna()]
 
     if is_perf_file:
-        # Check if the "cpu-cycles" and "instructions" columns are present
-        if "cpu-cycles" in df.columns and "instructions" in df.columns:
-            # Add new columns for instructions-per-cycle and cycles-per-instruction
-            df["instructions-per-cycle"] = df["instructions"] / df["cpu-cycles"]
-            df["cycles-per-instruction"] = df["cpu-cycles"] / df["instructions"]
+        df = add_derived_metrics(df, metrics)
 
     # Drop rows corresponding to deployment mechanisms that were not specified
     df = df.drop(df[~df["deployment-mechanism"].isin(deployment_mechanisms)].index)
 
     return df
 
+def add_derived_metrics(df, metrics):
+    """Add a column for each of the requested DERIVED_METRICS whose columns are all in the dataframe, holding each 
+    trial's value of the metric.
+
+    Args:
+        df: The dataframe containing the experimental data.
+        metrics: List of metrics to include in subsequent analyses.
+    Returns:
+        pd.DataFrame: The dataframe with the derived metrics' columns added.
+    """
+    for metric, derived_metric in DERIVED_METRICS.items():
+        formula_columns = DERIVED_METRIC_COLUMN_PATTERN.findall(derived_metric["numerator"] + derived_metric["denominator"])
+        if metric in metrics and metric not in df.columns and all(column in df.columns for column in formula_columns):
+            numerator, denominator = get_derived_metric_terms(df, metric)
+            df[metric] = numerator / denominator
+    return df
+
+def get_derived_metric_terms(df, metric):
+    """Evaluate the numerator and denominator of a derived metric for each trial in the dataframe, over all trials at 
+    once.
+
+    Args:
+        df: The dataframe containing the experimental data.
+        metric: The name of the metric, one of DERIVED_METRICS.
+    Returns:
+        tuple: The numerator and denominator of each trial, as arrays.
+    """
+    # Expressions without columns, such as a constant denominator, evaluate to a single value
+    return tuple(np.broadcast_to(np.asarray(df.eval(DERIVED_METRICS[metric][term]), dtype=float), len(df)) 
+        for term in ["numerator", "denominator"])
+
+def has_paired_trials(metric):
+    """Check whether each trial's value of a metric was measured in a single trial, which is the case for every metric
+    but the derived metrics combining the perf and time results, whose rows merge trials that were not run together.
+
+    Args:
+        metric: The name of the metric.
+    Returns:
+        bool: Whether the metric's trials are paired.
+    """
+    return DERIVED_METRICS.get(metric, {}).get("paired-trials", True)
+
 def get_metrics_in_df(df):
     """Get the metrics present in the dataframe.
 
@@ -290,9 +1819,10 @@ def get_metrics_in_df(df):
     Returns:
         list: List of metrics present in the dataframe.
     """
-    return [col for col in df.columns if col not in NON_METRIC_COLUMNS]
+    return [col for col in df.columns if col not in NON_METRIC_COLUMNS and not col.endswith(DAEMON_BASELINE_VARIANCE_COLUMN_SUFFIX)]
 
-def plot_metrics_bar_chart(aggregate_df, metrics, view_output, save_output, plots_path, model, input):
+def plot_metrics_bar_chart(aggregate_df, metrics, view_output, save_output, plots_path, model, input, threads=DEFAULT_THREADS,
+    storage=DEFAULT_STORAGE, device=DEFAULT_DEVICE):
     """Plot the deployment mechanisms' aggregate results for each metric.
 
     Args:
@@ -303,14 +1833,19 @@ def plot_metrics_bar_chart(aggregate_df, metrics, view_output, save_output, plot
         plots_path: Path to save the plots.
         model: The name of the model used in the experiments.
         input: The name of the input used in the experiments.
+        threads: The intra-op thread count used in the experiments.
+        storage: The storage medium the model and input were read from in the experiments.
+        device: The device profile the experiments were run under.
     """
     deployment_mechanisms = aggregate_df["deployment-mechanism"].unique().tolist()
+    threads_description = ("" if threads == DEFAULT_THREADS else f" with {threads} threads") + get_storage_description(storage) \
+        + get_device_description(device)
 
     # For each metric, plot the mean and confidence interval for each deployment mechanism
     for metric in metrics:
         metric_name_without_hyphen = metric.replace("-", " ")
         metric_with_underscores = metric.replace("-", "_")
-        plt.figure(metric)
+        plt.figure(f"{metric}-{threads}-{storage}-{device}")
 
         # Plot the mean and confidence interval for each deployment mechanism
         means = aggregate_df[f"{metric}-mean"].tolist()
@@ -318,18 +1853,82 @@ def plot_metrics_bar_chart(aggregate_df, metrics, view_output, save_output, plot
         plt.bar(deployment_mechanisms, means, yerr=errors, capsize=5)
 
         # Set title and labels
-        plt.title(f"{metric_name_without_hyphen} by deployment mechanism\nfor model {model} and input {input}") 
+        plt.title(f"{metric_name_without_hyphen} by deployment mechanism\nfor model {model} and input {input}{threads_description}") 
         plt.ylabel(metric_name_without_hyphen)
         plt.xlabel("deployment mechanism")
 
         if save_output:
-            plot_filename = f"{model}-{input}-{metric_with_underscores}-bar_chart.png"
+            plot_filename = f"{model}-{input}{get_threads_filename_suffix(threads)}{get_storage_filename_suffix(storage)}" \
+                + f"{get_device_filename_suffix(device)}-{metric_with_underscores}-bar_chart.png"
             plot_filepath = os.path.join(plots_path, plot_filename)
             plt.savefig(plot_filepath)
         
         if view_output:
             plt.show()
 
+        # Close each figure once done, since there is one for every metric, thread count, storage medium and device profile
+        plt.close()
+
+def plot_metrics_distribution(df, metrics, view_output, save_output, plots_path, model, input, threads=DEFAULT_THREADS,
+    storage=DEFAULT_STORAGE, device=DEFAULT_DEVICE):
+    """Plot the distribution of the deployment mechanisms' trials for each metric, as a box plot and a violin plot.
+
+    Args:
+        df: The dataframe containing the experimental data.
+        metrics: List of metrics to plot.
+        view_output: Whether to view the plots.
+        save_output: Whether to save the plots to files.
+        plots_path: Path to save the plots.
+        model: The name of the model used in the experiments.
+        input: The name of the input used in the experiments.
+        threads: The intra-op thread count used in the experiments.
+        storage: The storage medium the model and input were read from in the experiments.
+        device: The device profile the experiments were run under.
+    """
+    deployment_mechanisms = df["deployment-mechanism"].unique().tolist()
+    grouped_df = df.groupby("deployment-mechanism")
+    threads_description = ("" if threads == DEFAULT_THREADS else f" with {threads} threads") + get_storage_description(storage) \
+        + get_device_description(device)
+
+    # The per-trial values of metrics whose trials are not paired are not measurements of a single trial
+    for metric in [metric for metric in metrics if has_paired_trials(metric)]:
+        metric_name_without_hyphen = metric.replace("-", " ")
+        metric_with_underscores = metric.replace("-", "_")
+        samples = [grouped_df.get_group(deployment_mechanism)[metric].dropna().to_numpy() 
+            for deployment_mechanism in deployment_mechanisms]
+        positions = range(1, len(deployment_mechanisms) + 1)
+
+        fig, (box_ax, violin_ax) = plt.subplots(1, 2, figsize=(12, 5), num=f"{metric}-distribution", sharey=True)
+        box_ax.boxplot(samples, positions=positions)
+        box_ax.set_title("box plot")
+        box_ax.set_ylabel(metric_name_without_hyphen)
+
+        # The density estimate of a violin cannot be calculated for samples without any spread
+        violin_positions = [position for position, sample in zip(positions, samples) if len(sample) > 0 and np.ptp(sample) > 0]
+        if violin_positions:
+            violin_ax.violinplot([samples[position - 1] for position in violin_positions], positions=violin_positions, 
+                showmedians=True)
+        violin_ax.set_title("violin plot")
+
+        for ax in [box_ax, violin_ax]:
+            ax.set_xticks(positions, deployment_mechanisms)
+            ax.set_xlabel("deployment mechanism")
+
+        fig.suptitle(f"{metric_name_without_hyphen} distribution by deployment mechanism\nfor model {model} and input {input}{threads_description}")
+        fig.tight_layout()
+
+        if save_output:
+            plot_filename = f"{model}-{input}{get_threads_filename_suffix(threads)}{get_storage_filename_suffix(storage)}" \
+                + f"{get_device_filename_suffix(device)}-{metric_with_underscores}-distribution.png"
+            plot_filepath = os.path.join(plots_path, plot_filename)
+            fig.savefig(plot_filepath)
+
+        if view_output:
+            plt.show()
+
+        # Close each figure once done, since there are two plots for every metric
+        plt.close(fig)
+
 def create_or_update_aggregate_csv(aggregate_df, aggregate_csv_path):
     """Create or update the aggregate results CSV file for this set of experiments, which for each experiment contains each 
     deployment mechanism's aggregate results for each metric.
@@ -364,26 +1963,40 @@ def main():
     parser.add_argument("--experiment-set", type=str, required=True, help="The experiment set that the given experiment to analyze is from.")
     parser.add_argument("--model", type=str, required=True, help="The model used in the experiment to analyze.")
     parser.add_argument("--input", type=str, required=True, help="The input used in the experiment to analyze.")
+    parser.add_argument("--input-mode", type=str, choices=list(INPUT_MODE_FILENAME_SUFFIXES), default="raw",
+        help="Whether the inputs were passed to the binaries as raw images or as pre-decoded tensors in the experiment to analyze.")
     parser.add_argument("--significance-level", type=float, default=0.05, help="The significance level to use (e.g., 0.05).")
     parser.add_argument("--docker-overhead-view", type=int, default=2, help="The view of the Docker overhead to use (0: exclude daemon overhead, 1: include full daemon overhead, 2: include only additional docker overhead).")
     parser.add_argument("--include-insignificant-output", action="store_true", help="Include statistical comparisons when they are not statistically significant.")
     parser.add_argument("--mechanisms", type=str, default="docker,wasm_interpreted,wasm_aot,native",
-                    help="Comma-separated list of mechanisms to include (choose from docker, wasm_interpreted, wasm_aot, native)")
+                    help="Comma-separated list of mechanisms to include (choose from docker, wasm_interpreted, wasm_aot, native, "
+                    + "or the Docker image variants docker_no_models, docker_slim, docker_stripped, docker_distroless, "
+                    + "or the WebAssembly AoT optimization levels wasm_aot_o0, wasm_aot_o1, wasm_aot_o2, wasm_aot_o3, wasm_aot_os, wasm_aot_oz)")
     parser.add_argument("--metrics", type=str, required=True, help="Comma-separated list of metrics to include.")
     parser.add_argument("--view-output", action="store_true", help="View the output of the analysis.")
     parser.add_argument("--save-output", action="store_true", 
         help="Save the output of the analysis to files. Note that the aggregate CSV will always be saved, since it is required for aggregate analysis.")
     parser.add_argument("--analyzed-results-dir", type=str, default="analyzed_results",
         help="The name of the directory to save the analyzed results in.")
+    parser.add_argument("--exclude-throttled-trials", action="store_true",
+        help="Exclude trials during which the device was thermally throttled from the comparisons.")
     args = parser.parse_args()
 
     model = args.model
-    input = args.input
+    # The results of each input mode are stored, and therefore analyzed, under their own filenames
+    input = args.input + INPUT_MODE_FILENAME_SUFFIXES[args.input_mode]
     deployment_mechanisms = [mechanism.strip() for mechanism in args.mechanisms.split(",")]
     metrics = [metric.strip() for metric in args.metrics.split(",")] + COMPUTED_COLUMNS
 
     perf_filename = f"{model}-{input}-perf_results.csv"
     time_filename = f"{model}-{input}-time_results.csv"
+    density_filename = f"{model}-{input}-density_results.csv"
+    load_filename = f"{model}-{input}-load_results.csv"
+    image_filename = f"{model}-{input}-image_results.csv"
+    aot_filename = f"{model}-{input}-aot_results.csv"
+    profile_filename = f"{model}-{input}-profile_results.csv"
+    memory_filename = f"{model}-{input}-memory_results.csv"
+    memory_search_filename = f"{model}-{input}-memory_search_results.csv"
     
     # The paths to the experiment's set directory within the results directory
     # the analyzed results directory within the experiment's set directory
@@ -400,26 +2013,102 @@ def main():
 
     perf_path = os.path.join(experiments_set_path, perf_filename)
     time_path = os.path.join(experiments_set_path, time_filename)
+    density_path = os.path.join(experiments_set_path, density_filename)
+    load_path = os.path.join(experiments_set_path, load_filename)
+    image_path = os.path.join(experiments_set_path, image_filename)
+    aot_path = os.path.join(experiments_set_path, aot_filename)
+    profile_path = os.path.join(experiments_set_path, profile_filename)
+    memory_path = os.path.join(experiments_set_path, memory_filename)
+    memory_search_path = os.path.join(experiments_set_path, memory_search_filename)
+
+    # Density, load, image, profile and memory experiments are analyzed separately, and may have been run without the standard experiments
+    if os.path.exists(density_path):
+        analyze_density(density_path, deployment_mechanisms, args.significance_level, model, input, comparisons_path, plots_path,
+            args.view_output, args.save_output, args.exclude_throttled_trials)
+    if os.path.exists(load_path):
+        analyze_load(load_path, deployment_mechanisms, args.significance_level, model, input, comparisons_path, plots_path,
+            args.view_output, args.save_output, args.exclude_throttled_trials)
+    if os.path.exists(image_path):
+        analyze_images(image_path, deployment_mechanisms, args.significance_level, model, input, comparisons_path, plots_path,
+            args.view_output, args.save_output, args.exclude_throttled_trials)
+    if os.path.exists(aot_path):
+        analyze_aot(aot_path, time_path if os.path.exists(time_path) else None, deployment_mechanisms, model, input, 
+            comparisons_path, plots_path, args.view_output, args.save_output, args.exclude_throttled_trials)
+    if os.path.exists(profile_path):
+        analyze_profiles(profile_path, deployment_mechanisms, model, input, plots_path, args.view_output, args.save_output)
+    if os.path.exists(memory_path) and os.path.exists(memory_search_path):
+        analyze_memory(memory_path, memory_search_path, deployment_mechanisms, args.significance_level, model, input, 
+            comparisons_path, plots_path, args.view_output, args.save_output, args.exclude_throttled_trials)
+    if not (os.path.exists(perf_path) and os.path.exists(time_path)):
+        return
 
     perf_df = parse_csv_rows(perf_path, deployment_mechanisms, metrics, args.docker_overhead_view)
     time_df = parse_csv_rows(time_path, deployment_mechanisms, metrics, args.docker_overhead_view, is_perf_file=False)
+
+    # Energy is only measured directly when the device exposes RAPL, so flag comparisons relying on estimates
+    if ENERGY_ESTIMATED_COLUMN in time_df.columns and (time_df[ENERGY_ESTIMATED_COLUMN] == 1).any():
+        print("Warning: the energy metrics of some trials were estimated from their CPU time and the CPU's thermal design power, "
+            + "rather than measured using RAPL")
+    time_df = time_df.drop(columns=[ENERGY_ESTIMATED_COLUMN], errors="ignore")
+
+    # Compare throttled and unthrottled trials before they are possibly excluded
+    throttling_dfs = [results_df for results_df in [perf_df, time_df] if has_throttling_data(results_df)]
+    if throttling_dfs and (args.view_output or args.save_output):
+        throttled_trials = sum((results_df["throttled"] == 1).sum() for results_df in throttling_dfs)
+        print_if_true(f"{throttled_trials} trials were thermally throttled", args.view_output)
+        throttling_df = pd.concat([analyze_throttling(results_df, get_metrics_in_df(results_df), args.significance_level, 
+            args.view_output) for results_df in throttling_dfs], ignore_index=True)
+        if args.save_output:
+            # Enclose everything in quotes, as for the comparisons
+            throttling_df.to_csv(os.path.join(comparisons_path, f"{model}-{input}-throttling.csv"), index=False, 
+                quoting=csv.QUOTE_ALL)
+
+    if args.exclude_throttled_trials:
+        perf_df = exclude_throttled_trials(perf_df)
+        time_df = exclude_throttled_trials(time_df)
+
+    # The thermal state was sampled separately for the perf and time trials, so it cannot be merged
+    perf_df = perf_df.drop(columns=THERMAL_COLUMNS, errors="ignore")
+    time_df = time_df.drop(columns=THERMAL_COLUMNS, errors="ignore")
     
     # Note that merging the dataframes in this way might suggest that trial number 1 of the
     # perf experiments corresponds to trial number 1 of the time experiments; this is not
     # actually true, but it is not important since trial number is not relevant for the analysis,
     # and doing this would produce the exact same results as if we had called the analyze_data_significant_difference
     # function on the two dataframes separately
-    df = pd.merge(perf_df, time_df, on=["deployment-mechanism", "trial-number"])
+    df = pd.merge(perf_df, time_df, on=["deployment-mechanism"] + DIMENSION_COLUMNS + [RESOLUTION_COLUMN, "trial-number"])
+    # Some metrics are derived from both perf and time metrics; since the trials merged into a row were not run together,
+    # their perf and time terms are estimated independently rather than as pairs (see DERIVED_METRICS)
+    df = add_derived_metrics(df, metrics)
     metrics = get_metrics_in_df(df)
-    aggregate_df = analyze_data_significant_difference(df, args.significance_level, metrics, model,
-        input, comparisons_path, args.include_insignificant_output,
-        args.view_output, args.save_output)
     aggregate_csv_filepath = os.path.join(analyzed_results_path, AGGREGATE_CSV_FILENAME)
-    create_or_update_aggregate_csv(aggregate_df, aggregate_csv_filepath)
+
+    # Compare the deployment mechanisms separately for each thread count, storage medium and device profile that was swept;
+    # the aggregate results are compared across device profiles by analyze_aggregate_data.py
+    for (threads, storage, device, resolution), dimensions_df in df.groupby(DIMENSION_COLUMNS + [RESOLUTION_COLUMN]):
+        aggregate_df = analyze_data_significant_difference(dimensions_df, args.significance_level, metrics, model,
+            input, comparisons_path, args.include_insignificant_output,
+            args.view_output, args.save_output, threads, storage, device, resolution)
+        create_or_update_aggregate_csv(aggregate_df, aggregate_csv_filepath)
     
-    if args.view_output or args.save_output:
-        plot_metrics_bar_chart(aggregate_df, metrics, args.view_output, args.save_output, plots_path,
-            model, input)
+        if args.view_output or args.save_output:
+            plot_metrics_bar_chart(aggregate_df, metrics, args.view_output, args.save_output, plots_path,
+                model, input, threads, storage, device)
+            plot_metrics_distribution(dimensions_df, metrics, args.view_output, args.save_output, plots_path,
+                model, input, threads, storage, device)
+
+    # Then compare each deployment mechanism against itself across thread counts, for each storage medium and device profile
+    for (storage, device), storage_df in df.groupby(["storage", "device"]):
+        explicit_thread_counts = [threads for threads in storage_df["threads"].unique() if threads != DEFAULT_THREADS]
+        if len(explicit_thread_counts) > 1 and THREAD_SCALING_METRIC in metrics:
+            analyze_thread_scaling(storage_df, args.significance_level, model, input, comparisons_path, plots_path,
+                args.view_output, args.save_output, storage, device)
+
+    # And across storage media, with all of the device's CPUs
+    default_device_df = df[df["device"] == DEFAULT_DEVICE]
+    if default_device_df["storage"].nunique() > 1:
+        analyze_storage(default_device_df, args.significance_level, model, input, comparisons_path, plots_path, 
+            args.view_output, args.save_output)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,370 @@
+"""This script microbenchmarks the Python code paths of the data collection and analysis that run thousands of times
+per sweep, e.g. parsing the output of every Prometheus query and analyzing every pair of deployment mechanisms, on
+synthetic results scaled by the number of trials, metrics, mechanisms and models. Since it needs no target device,
+it can be run on the host after changing the harness or the analysis, comparing each path's time against the baseline
+stored for the same scale, host and CPU model, and exiting with a non-zero status if any got slower than a threshold.
+"""
+import numpy as np
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timezone
+
+from analyze_data import analyze_data_significant_difference, parse_csv_rows, create_or_update_aggregate_csv, \
+    SCRIPTS_DIR, BENCHMARK_DIR, DOCKER_OVERHEAD_VIEW_SUFFIXES, DEFAULT_THREADS
+
+# The path of the file storing the baseline time of each benchmark, for each scale, host and CPU model it was run at
+BASELINES_PATH = os.path.join(SCRIPTS_DIR, "benchmark_baselines.json")
+
+# The paths of the data collection script and the perf config it reads when imported, which are staged in a
+# temporary directory laid out as the suite directory on the target devices
+COLLECT_DATA_SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "collect_data.py")
+PERF_CONFIG_PATH = os.path.join(BENCHMARK_DIR, "cadvisor", "perf_config.json")
+
+# The base deployment mechanisms the synthetic mechanisms are drawn from in turn, with each mechanism after the first
+# few being a variant of one of them, as with the Docker image variants and WebAssembly AoT optimization levels
+SYNTHETIC_BASE_MECHANISMS = ["docker", "wasm_interpreted", "wasm_aot", "native"]
+
+# The Docker overhead views of the perf results of a Docker mechanism, each of which is written as its own row
+DOCKER_OVERHEAD_VIEW_IDENTIFIERS = ["_" + suffix for suffix in DOCKER_OVERHEAD_VIEW_SUFFIXES.values()]
+
+# The seed of the synthetic results, so every run benchmarks the same data
+SYNTHETIC_SEED = 0
+
+# The default scale of the synthetic results, which is that of a typical experiment set
+DEFAULT_TRIALS = 30
+DEFAULT_METRICS = 10
+DEFAULT_MECHANISMS = 4
+DEFAULT_MODELS = 5
+
+# The number of times each benchmark is timed, with the fastest time taken as its time since slower ones were slowed
+# down by other processes, and the fewest timings that are compared against or stored as a baseline, since the
+# fastest of fewer is still mostly noise
+DEFAULT_REPEATS = 5
+MIN_REPEATS = 3
+
+# The path of the file describing the host's CPUs and the fields of its entries naming their model, which are
+# "model name" on x86 and "Model" on e.g. the Raspberry Pi
+CPUINFO_PATH = "/proc/cpuinfo"
+CPU_MODEL_FIELDS = ["model name", "Model"]
+
+# The relative slowdown of a benchmark, e.g. 0.2 for 20%, beyond which it is flagged as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+# The exit status when at least one regression was found
+REGRESSION_EXIT_STATUS = 1
+
+def load_collect_data_module(suite_dir):
+    """Load the data collection script as a module, staging it with the perf config it reads when imported in a
+    directory laid out as the suite directory on the target devices.
+
+    Args:
+        suite_dir: The directory to stage the script in.
+    Returns:
+        module: The data collection script's module.
+    """
+    shutil.copy(COLLECT_DATA_SCRIPT_PATH, suite_dir)
+    os.makedirs(os.path.join(suite_dir, "cadvisor"), exist_ok=True)
+    shutil.copy(PERF_CONFIG_PATH, os.path.join(suite_dir, "cadvisor"))
+
+    spec = importlib.util.spec_from_file_location("collect_data", os.path.join(suite_dir, "collect_data.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def get_synthetic_mechanisms(mechanisms):
+    """Get the names of the synthetic deployment mechanisms.
+
+    Args:
+        mechanisms: The number of mechanisms.
+    Returns:
+        list: The names of the mechanisms, the base mechanisms first and then variants of each in turn.
+    """
+    names = []
+    for index in range(mechanisms):
+        base_mechanism = SYNTHETIC_BASE_MECHANISMS[index % len(SYNTHETIC_BASE_MECHANISMS)]
+        variant = index // len(SYNTHETIC_BASE_MECHANISMS)
+        names.append(base_mechanism if variant == 0 else f"{base_mechanism}_variant{variant}")
+    return names
+
+def get_synthetic_metrics(collect_data, metrics):
+    """Get the names of the synthetic perf metrics, which are the configured perf events followed by made-up ones.
+
+    Args:
+        collect_data: The data collection script's module.
+        metrics: The number of metrics.
+    Returns:
+        list: The names of the metrics.
+    """
+    perf_events = collect_data.PERF_EVENTS[:metrics]
+    return perf_events + [f"synthetic-event-{index}" for index in range(metrics - len(perf_events))]
+
+def generate_synthetic_trial_metrics(rng, metric_names, mechanism_index):
+    """Generate the metrics of a synthetic trial, which are log-normally distributed around a mean that differs
+    between mechanisms, so the analysis finds both significant and insignificant differences.
+
+    Args:
+        rng: The random number generator.
+        metric_names: The names of the metrics.
+        mechanism_index: The index of the trial's mechanism.
+    Returns:
+        dict: The trial's metrics, keyed by their names.
+    """
+    return {metric: round(float(rng.lognormal(np.log(1e6 * (1 + metric_index) * (1 + 0.1 * mechanism_index)), 0.1)), 2)
+        for metric_index, metric in enumerate(metric_names)}
+
+def generate_synthetic_results(collect_data, results_path, trials, metric_names, mechanisms, rng):
+    """Generate a synthetic perf results file in the format written by the data collection, with a row for each
+    Docker overhead view of the Docker mechanisms' trials.
+
+    Args:
+        collect_data: The data collection script's module.
+        results_path: The path to write the results file to.
+        trials: The number of trials of each mechanism.
+        metric_names: The names of the metrics.
+        mechanisms: The names of the mechanisms.
+        rng: The random number generator.
+    """
+    start_time = datetime.now(timezone.utc)
+    rows = []
+    dimensions = (DEFAULT_THREADS, collect_data.DEFAULT_STORAGE, collect_data.DEFAULT_DEVICE,
+        collect_data.DEFAULT_INPUT_RESOLUTION)
+    for mechanism_index, mechanism in enumerate(mechanisms):
+        for trial in range(1, trials + 1):
+            trial_metrics = generate_synthetic_trial_metrics(rng, metric_names, mechanism_index)
+            identifiers = DOCKER_OVERHEAD_VIEW_IDENTIFIERS if mechanism.startswith("docker") else [""]
+            rows.extend(collect_data.prepare_trial_data_as_csv_rows(mechanism, dimensions, trial, start_time,
+                get_synthetic_thermal_conditions(collect_data), [(identifier, trial_metrics) for identifier in identifiers],
+                metric_names))
+
+    field_names = collect_data.CSV_BASIC_FIELD_NAMES + collect_data.DIMENSION_FIELD_NAMES \
+        + collect_data.THERMAL_FIELD_NAMES + metric_names
+    with open(results_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=field_names)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def get_synthetic_thermal_conditions(collect_data):
+    """Get the thermal conditions of a synthetic trial, which are those of a device that was not throttled.
+
+    Args:
+        collect_data: The data collection script's module.
+    Returns:
+        dict: The thermal conditions, keyed by their field names.
+    """
+    thermal_state = {"temperature": 50.0, "frequency": 1500.0, "throttled-flags": None, "throttle-count": 0}
+    return collect_data.get_trial_thermal_conditions(thermal_state, thermal_state)
+
+def generate_synthetic_prometheus_output(metric_names, rng):
+    """Generate the output of a synthetic Prometheus query of perf events, as returned by the Prometheus API.
+
+    Args:
+        metric_names: The names of the perf events.
+        rng: The random number generator.
+    Returns:
+        list: The results of the query, one per event.
+    """
+    timestamp = datetime.now(timezone.utc).timestamp()
+    return [{"metric": {"event": metric}, "value": [timestamp, f"{rng.lognormal(np.log(1e6), 0.1):.6f}"]}
+        for metric in metric_names]
+
+def generate_synthetic_time_output():
+    """Generate the output of a synthetic run under the time command, in the format of GNU time's verbose output.
+
+    Returns:
+        str: The output.
+    """
+    return "\n".join([
+        '\tCommand being timed: "./torch_image_classification models/model.pt inputs/input.jpg"',
+        "\tUser time (seconds): 1.23",
+        "\tSystem time (seconds): 0.45",
+        "\tPercent of CPU this job got: 98%",
+        "\tElapsed (wall clock) time (h:mm:ss or m:ss): 0:01.71",
+        "\tMaximum resident set size (kbytes): 123456",
+        "\tMajor (requiring I/O) page faults: 0",
+        "\tMinor (reclaiming a frame) page faults: 12345",
+        "\tVoluntary context switches: 123",
+        "\tInvoluntary context switches: 45",
+        "\tFile system inputs: 0",
+        "\tFile system outputs: 8",
+        "\tPage size (bytes): 4096",
+        "\tExit status: 0"
+    ])
+
+def get_benchmarks(collect_data, work_dir, trials, metrics, mechanisms, models):
+    """Get the benchmarks, generating the synthetic data each runs on.
+
+    Args:
+        collect_data: The data collection script's module.
+        work_dir: The directory to write the synthetic results and the aggregate results to.
+        trials: The number of trials of each mechanism.
+        metrics: The number of metrics.
+        mechanisms: The number of mechanisms.
+        models: The number of models, i.e. the number of experiments aggregated in the aggregate results.
+    Returns:
+        dict: The function running each benchmark, keyed by its name.
+    """
+    rng = np.random.default_rng(SYNTHETIC_SEED)
+    metric_names = get_synthetic_metrics(collect_data, metrics)
+    mechanism_names = get_synthetic_mechanisms(mechanisms)
+
+    results_path = os.path.join(work_dir, "synthetic-perf_results.csv")
+    generate_synthetic_results(collect_data, results_path, trials, metric_names, mechanism_names, rng)
+
+    prometheus_output = generate_synthetic_prometheus_output(metric_names, rng)
+    time_output = generate_synthetic_time_output()
+    trial_metrics = generate_synthetic_trial_metrics(rng, metric_names, 0)
+    trial_metrics_sets = [(identifier, trial_metrics) for identifier in DOCKER_OVERHEAD_VIEW_IDENTIFIERS]
+    thermal_conditions = get_synthetic_thermal_conditions(collect_data)
+    dimensions = (DEFAULT_THREADS, collect_data.DEFAULT_STORAGE, collect_data.DEFAULT_DEVICE,
+        collect_data.DEFAULT_INPUT_RESOLUTION)
+    start_time = datetime.now(timezone.utc)
+
+    df = parse_csv_rows(results_path, mechanism_names, metric_names, 0)
+    aggregate_df = analyze_data_significant_difference(df, 0.05, metric_names, "model", "input", work_dir, False, False, False)
+    aggregate_csv_path = os.path.join(work_dir, "aggregate_results.csv")
+
+    def update_aggregate_csv_for_every_model():
+        if os.path.exists(aggregate_csv_path):
+            os.remove(aggregate_csv_path)
+        for model in range(models):
+            create_or_update_aggregate_csv(aggregate_df.assign(model=f"model-{model}"), aggregate_csv_path)
+
+    benchmarks = {
+        "parse_prometheus_output": lambda: collect_data.parse_prometheus_output(prometheus_output),
+        "parse_time_output": lambda: collect_data.parse_time_output(time_output),
+        "prepare_trial_data_as_csv_rows": lambda: collect_data.prepare_trial_data_as_csv_rows("docker", dimensions, 1,
+            start_time, thermal_conditions, trial_metrics_sets, metric_names)
+    }
+    for docker_overhead_view in DOCKER_OVERHEAD_VIEW_SUFFIXES:
+        benchmarks[f"parse_csv_rows-view{docker_overhead_view}"] = \
+            lambda view=docker_overhead_view: parse_csv_rows(results_path, mechanism_names, metric_names, view)
+    benchmarks["analyze_data_significant_difference"] = lambda: analyze_data_significant_difference(df, 0.05,
+        metric_names, "model", "input", work_dir, False, False, False)
+    benchmarks["create_or_update_aggregate_csv"] = update_aggregate_csv_for_every_model
+    return benchmarks
+
+def time_benchmark(benchmark, repeats):
+    """Time a benchmark, calling it enough times for each timing to take at least 0.2 seconds.
+
+    Args:
+        benchmark: The function running the benchmark.
+        repeats: The number of timings.
+    Returns:
+        float: The fastest time of a single call in seconds.
+    """
+    timer = timeit.Timer(benchmark)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+def get_cpu_model():
+    """Get the model of the host's CPU, as named in /proc/cpuinfo, falling back to the machine's architecture where it
+    is not available.
+
+    Returns:
+        str: The CPU model.
+    """
+    if os.path.exists(CPUINFO_PATH):
+        with open(CPUINFO_PATH, "r") as f:
+            for line in f:
+                field, _, value = line.partition(":")
+                if field.strip() in CPU_MODEL_FIELDS and value.strip():
+                    return " ".join(value.split())
+    return os.uname().machine
+
+def get_baseline_key(trials, metrics, mechanisms, models):
+    """Get the key the baselines of a scale on this host and CPU model are stored under, since the times of different
+    scales, hosts and CPUs are not comparable, even between hosts of the same architecture.
+
+    Args:
+        trials: The number of trials of each mechanism.
+        metrics: The number of metrics.
+        mechanisms: The number of mechanisms.
+        models: The number of models.
+    Returns:
+        str: The key.
+    """
+    return f"{os.uname().nodename}-{get_cpu_model()}-trials{trials}-metrics{metrics}-mechanisms{mechanisms}-models{models}"
+
+def load_baselines():
+    """Load the stored baselines.
+
+    Returns:
+        dict: The baselines of each scale, host and CPU model, keyed as by get_baseline_key().
+    """
+    if not os.path.exists(BASELINES_PATH):
+        return {}
+    with open(BASELINES_PATH, "r") as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark the hot paths of the data collection and analysis on synthetic results.")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="The number of trials of each mechanism.")
+    parser.add_argument("--metrics", type=int, default=DEFAULT_METRICS, help="The number of perf metrics.")
+    parser.add_argument("--mechanisms", type=int, default=DEFAULT_MECHANISMS, help="The number of deployment mechanisms.")
+    parser.add_argument("--models", type=int, default=DEFAULT_MODELS,
+        help="The number of models, i.e. of experiments aggregated into the aggregate results.")
+    parser.add_argument("--benchmarks", type=str, help="Comma-separated list of benchmarks to run; by default, all of them.")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+        help=f"The number of times to time each benchmark, whose fastest is taken as its time (at least {MIN_REPEATS}).")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+        help="The relative slowdown (e.g., 0.2 for 20%%) beyond which a benchmark is flagged as a regression.")
+    parser.add_argument("--save-baseline", action="store_true",
+        help="Store the times as the baselines of this scale, host and CPU model instead of comparing against them.")
+    args = parser.parse_args()
+
+    if min(args.trials, args.metrics, args.mechanisms, args.models) < 1 or args.trials < 2 or args.mechanisms < 2:
+        print("Error: at least 2 trials and 2 mechanisms, and at least 1 metric and model, are needed")
+        sys.exit(2)
+    if args.repeats < MIN_REPEATS:
+        print(f"Error: each benchmark must be timed at least {MIN_REPEATS} times to compare its fastest time")
+        sys.exit(2)
+
+    baseline_key = get_baseline_key(args.trials, args.metrics, args.mechanisms, args.models)
+    baselines = load_baselines()
+    baseline = baselines.get(baseline_key, {})
+
+    regressions = 0
+    times = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        collect_data = load_collect_data_module(work_dir)
+        benchmarks = get_benchmarks(collect_data, work_dir, args.trials, args.metrics, args.mechanisms, args.models)
+        if args.benchmarks:
+            selected_benchmarks = [benchmark.strip() for benchmark in args.benchmarks.split(",")]
+            unknown_benchmarks = [benchmark for benchmark in selected_benchmarks if benchmark not in benchmarks]
+            if unknown_benchmarks:
+                print(f"Error: unknown benchmarks {', '.join(unknown_benchmarks)} (choose from {', '.join(benchmarks)})")
+                sys.exit(2)
+            benchmarks = {benchmark: benchmarks[benchmark] for benchmark in selected_benchmarks}
+
+        print(f"Benchmarking at {baseline_key}")
+        for name, benchmark in benchmarks.items():
+            times[name] = time_benchmark(benchmark, args.repeats)
+            message = f"{name}: {times[name] * 1e6:,.1f} us"
+            if not args.save_baseline and name in baseline:
+                relative_change = times[name] / baseline[name] - 1
+                message += f" ({relative_change * 100:+.1f}% against the baseline)"
+                if relative_change > args.threshold:
+                    message += " REGRESSION"
+                    regressions += 1
+            print(message)
+
+    if args.save_baseline:
+        baselines[baseline_key] = {**baseline, **times}
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(baselines, f, indent=4, sort_keys=True)
+        print(f"Stored the baselines of {baseline_key} in {BASELINES_PATH}")
+    elif not baseline:
+        print(f"No baselines are stored for {baseline_key}; store them with --save-baseline")
+    elif regressions > 0:
+        print(f"{regressions} benchmarks are more than {args.threshold * 100:g}% slower than their baselines")
+        sys.exit(REGRESSION_EXIT_STATUS)
+
+if __name__ == "__main__":
+    main()
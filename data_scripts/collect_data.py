@@ -2,13 +2,27 @@
    specified files.
 """
 import requests
+import asyncio
+import functools
+import hashlib
+import http.server
 import json
+import re
 import subprocess
 import csv
 import random
 import os
 import argparse
 import time
+import glob
+import shutil
+import threading
+import itertools
+import math
+import statistics
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from sys import platform
 
@@ -21,20 +35,57 @@ RESULTS_DIR = os.path.join(SUITE_DIR, "results")
 # Path to the WebAssembly binary
 WASM_BINARY_PATH = os.path.expanduser("~/.wasmedge/bin/wasmedge")
 
+# Paths to the directories of WasmEdge's shared libraries and of its plugins, including the WASI-NN plugin running the
+# models, and of the libtorch libraries the native binary and that plugin load dynamically
+WASMEDGE_LIB_DIR = os.path.expanduser("~/.wasmedge/lib64")
+WASMEDGE_PLUGIN_DIR = os.path.expanduser("~/.wasmedge/plugin")
+LIBTORCH_LIB_DIR = f"{SUITE_DIR}/libtorch/lib"
+
 # Path to the WebAssembly files
 INTERPRETED_WASM_FILE_PATH = f"{SUITE_DIR}/wasm/interpreted.wasm"
-AOT_WASM_FILE_PATH_TEMPLATE = f"{SUITE_DIR}/wasm/aot.{{extension}}"
+
+# Path to the directory caching the AoT-compiled WebAssembly files, each named after the key it is cached under,
+# alongside a record of how its compilation went
+AOT_CACHE_DIR = f"{SUITE_DIR}/wasm/aot_cache"
+AOT_CACHE_FILENAME_TEMPLATE = "aot-{cache_key}.{extension}"
+AOT_CACHE_RECORD_FILENAME_TEMPLATE = "aot-{cache_key}.json"
 
 # Path to cAdvisor perf events config file
 CADVISOR_PERF_CONFIG_PATH = f"{SUITE_DIR}/cadvisor/perf_config.json"
 
-# The list of perf events to measure
+# The perf events to measure, as the groups of events the config lists, where a single event is a group of its own
+# and the events of a group are always scheduled together, followed by the list of all the events
 def read_perf_config(config_path):
     with open(config_path, "r") as f:
         config = json.load(f)
-        return config.get("core").get("events")
+        return [event if isinstance(event, list) else [event] for event in config.get("core").get("events")]
+
+PERF_EVENT_CONFIG_GROUPS = read_perf_config(CADVISOR_PERF_CONFIG_PATH)
+PERF_EVENTS = [event for group in PERF_EVENT_CONFIG_GROUPS for event in group]
+
+# The pairs of perf events whose ratios are analyzed, e.g. instructions per cycle, which are always scheduled together 
+# so both are counted over the same time
+PERF_EVENT_RATIO_PAIRS = [("cpu-cycles", "instructions"), ("cache-references", "cache-misses"), 
+    ("branch-instructions", "branch-misses")]
 
-PERF_EVENTS = read_perf_config(CADVISOR_PERF_CONFIG_PATH)
+# The perf events counted by the kernel rather than by the CPU's programmable counters, which hence never contend
+# with other events for counters
+PERF_SOFTWARE_EVENTS = ["page-faults", "major-faults", "minor-faults", "context-switches", "cpu-migrations", 
+    "cpu-clock", "task-clock", "alignment-faults", "emulation-faults"]
+
+# The default number of programmable counters assumed to be available for perf events; most cores have 4 to 6, so 
+# this is conservative
+DEFAULT_PERF_COUNTERS = 4
+
+# The ways the groups of perf events can be scheduled when they do not all fit in the counters at once: in passes,
+# running the perf experiments once per group with cAdvisor only measuring that group, so no event is multiplexed, 
+# or all in one pass, letting the kernel multiplex the groups and scale their counts by the share of the time they 
+# were counted for
+PERF_SCHEDULING_PASSES = "passes"
+PERF_SCHEDULING_MULTIPLEX = "multiplex"
+
+# The cAdvisor perf events config generated for each pass, with the groups of events measured in it
+CADVISOR_PASS_PERF_CONFIG_PATH_TEMPLATE = f"{SUITE_DIR}/cadvisor/perf_config-pass{{pass_number}}.json"
 
 # Path to the cAdvisor, Prometheus binaries
 CADVISOR_BINARY_PATH = f"{SUITE_DIR}/cadvisor/cadvisor"
@@ -48,20 +99,107 @@ NATIVE_BINARY_PATH = f"{SUITE_DIR}/native/{NATIVE_BINARY_NAME}"
 MODELS_PATH = f"{SUITE_DIR}/models"
 INPUTS_PATH = f"{SUITE_DIR}/inputs"
 
+# Path to the manifest describing the models generated by the suite
+MODEL_MANIFEST_PATH = f"{SUITE_DIR}/model_manifest.json"
+
+# The input resolution assumed for models that are neither in the manifest nor have their
+# resolution in their filename, and the pattern of the latter, e.g. efficientnet_b3_res300.pt
+DEFAULT_INPUT_RESOLUTION = 224
+MODEL_RESOLUTION_PATTERN = re.compile(r"_res(\d+)\.[^.]+$")
+
+# The ways inputs can be passed to the binaries: as the raw image, which the binaries decode, resize and
+# normalize on every trial, or as a tensor that was pre-decoded once on the host
+INPUT_MODE_RAW = "raw"
+INPUT_MODE_PRE_DECODED = "pre_decoded"
+
+# The component appended to the names of the results files for each input mode, so that the results of raw and
+# pre-decoded runs in the same set are kept apart; the raw mode keeps the original filenames
+INPUT_MODE_FILENAME_SUFFIXES = {INPUT_MODE_RAW: "", INPUT_MODE_PRE_DECODED: "-pre_decoded"}
+
+# Name of the directory within the inputs directory storing pre-decoded input tensors, and the template of 
+# their filenames
+PRE_DECODED_INPUTS_DIR_NAME = "tensors"
+PRE_DECODED_INPUT_FILENAME_TEMPLATE = "{input_file}.{resolution}.bin"
+
+# The deployment mechanisms that can be benchmarked
+DEPLOYMENT_MECHANISMS = ["docker", "wasm_interpreted", "wasm_aot", "native"]
+
+# The variants of the Docker image that can be run as separate Docker mechanisms, mapped to the name of each
+# variant's build target in the Dockerfile: without the models and inputs baked in, on a slim base, on a slim 
+# base with only the stripped libtorch libraries the binary needs, and on a distroless base with those libraries
+DOCKER_VARIANT_MECHANISMS = {
+    "docker_no_models": "no_models",
+    "docker_slim": "slim",
+    "docker_stripped": "stripped",
+    "docker_distroless": "distroless"
+}
+
+# The optimization levels the WebAssembly code can be AoT-compiled at as separate WebAssembly AoT mechanisms, mapped
+# to the value of WasmEdge's --optimize option; the wasm_aot mechanism is compiled at WasmEdge's default level
+WASM_AOT_VARIANT_MECHANISMS = {
+    "wasm_aot_o0": "0",
+    "wasm_aot_o1": "1",
+    "wasm_aot_o2": "2",
+    "wasm_aot_o3": "3",
+    "wasm_aot_os": "s",
+    "wasm_aot_oz": "z"
+}
+WASM_AOT_DEFAULT_OPTIMIZATION_LEVEL = "default"
+
+# The thread count recorded when the binaries are left to pick their own number of intra-op threads
+DEFAULT_THREADS = 0
+
+# The environment variable that the libtorch inside WasmEdge's WASI-NN plugin reads its intra-op thread
+# count from, since the WebAssembly binary cannot set it itself
+PLUGIN_THREADS_ENV_VAR = "OMP_NUM_THREADS"
+
 # Container and image names
 CONTAINER_NAME="benchmarked-container"
 IMG_NAME_TEMPLATE="image-classification:{arch}"         
+VARIANT_IMG_NAME_TEMPLATE="image-classification-{variant}:{arch}"
+
+# The tar files the images are loaded from
+IMG_TAR_PATH_TEMPLATE = f"{SUITE_DIR}/docker/image-classification-{{arch}}.tar"
+VARIANT_IMG_TAR_PATH_TEMPLATE = f"{SUITE_DIR}/docker/image-classification-{{variant}}-{{arch}}.tar"
 
 # Commands to start, stop, remove, inspect container
-CONTAINER_START_CMD_TEMPLATE = f"sudo docker run --privileged --name {CONTAINER_NAME} -v {MODELS_PATH}:/models -v {INPUTS_PATH}:/inputs {{img_name}}"
+CONTAINER_START_CMD_TEMPLATE = f"sudo docker run --privileged --name {CONTAINER_NAME} -v {{models_path}}:/models -v {{inputs_path}}:/inputs {{img_name}}"
 CONTAINER_STOP_CMD = "sudo docker stop {container_name}"
 CONTAINER_REMOVE_CMD = "sudo docker rm {container_name}"
 CONTAINER_INSPECT_ID_CMD = "sudo docker inspect -f '{{{{.Id}}}}' {container_name}"
+CONTAINER_INSPECT_STARTED_AT_CMD = "sudo docker inspect -f '{{{{.State.StartedAt}}}}' {container_name}"
+CONTAINER_INSPECT_OOM_KILLED_CMD = "sudo docker inspect -f '{{{{.State.OOMKilled}}}}' {container_name}"
+
+# The options limiting the memory of a container without letting it swap, since its limit on memory and swap 
+# combined is the same as its limit on memory
+CONTAINER_MEMORY_LIMIT_OPTIONS_TEMPLATE = "--memory {memory_limit} --memory-swap {memory_limit}"
+
+# The options restricting a container to the CPU quota and the set of CPUs of a device profile
+CONTAINER_CPUS_OPTION_TEMPLATE = "--cpus {cpus}"
+CONTAINER_CPUSET_OPTION_TEMPLATE = "--cpuset-cpus {cpuset}"
+
+# Commands to remove, load and inspect the ID, size and layers of an image
+DOCKER_IMAGE_INSPECT_ID_CMD = "sudo docker image inspect -f '{{{{.Id}}}}' {img_name}"
+DOCKER_IMAGE_REMOVE_CMD = "sudo docker rmi -f {img_name}"
+DOCKER_IMAGE_LOAD_CMD = "sudo docker load -i {tar_path}"
+DOCKER_IMAGE_INSPECT_SIZE_CMD = "sudo docker image inspect -f '{{{{.Size}}}}' {img_name}"
+# The format of the number of layers contains a space, so this command is given as a list rather than split
+DOCKER_IMAGE_INSPECT_LAYERS_CMD = ["sudo", "docker", "image", "inspect", "-f", "{{len .RootFS.Layers}}"]
+
+# Command to drop the page cache, so that files are read from storage again
+DROP_PAGE_CACHE_CMD = ["sudo", "sh", "-c", "sync && echo 3 > /proc/sys/vm/drop_caches"]
+
+# Commands to get the version of WasmEdge and to AoT compile the WebAssembly code with it
+WASMEDGE_VERSION_CMD = f"{WASM_BINARY_PATH} --version"
+AOT_COMPILE_CMD_TEMPLATE = f"{WASM_BINARY_PATH} compile{{optimize_option}} {INTERPRETED_WASM_FILE_PATH} {{aot_wasm_file_path}}"
+
+# The line of the time command's output reporting the peak memory usage of the command it ran, in kilobytes
+TIME_MAX_RSS_PATTERN = re.compile(r"Maximum resident set size \(kbytes\): (\d+)")
 
 # Commands to start and stop Prometheus, cAdvisor
 PROMETHEUS_START_CMD = f"sudo {PROMETHEUS_BINARY_PATH} --config.file={SUITE_DIR}/prometheus/prometheus.yml --web.enable-admin-api" 
 PROMETHEUS_STOP_CMD = f"sudo pkill -f {PROMETHEUS_BINARY_PATH}"
-CADVISOR_START_CMD = f"sudo {CADVISOR_BINARY_PATH} -perf_events_config={CADVISOR_PERF_CONFIG_PATH}"
+CADVISOR_START_CMD_TEMPLATE = f"sudo {CADVISOR_BINARY_PATH} -perf_events_config={{perf_config_path}}"
 CADVISOR_STOP_CMD = f"sudo pkill -f {CADVISOR_BINARY_PATH}"
 
 # Values for the PATH and LD_LIBRARY_PATH environment variables
@@ -75,36 +213,294 @@ TIME_CMD_PREFIX="/usr/bin/time -v"
 # new name of the metric as it will be written in the results file
 TIME_METRICS = [("Elapsed (wall clock) time", "wall-time-seconds")]
 
+# Field names for the energy consumed during each time experiment, and whether it was estimated from the CPU time
+# rather than measured using RAPL
+ENERGY_FIELD_NAMES = ["energy-joules", "energy-per-inference", "energy-estimated"]
+
+# The number of inferences run in each trial, which the energy consumed is divided by
+INFERENCES_PER_TRIAL = 1
+
+# Paths of the powercap zones exposing RAPL energy counters, and the pattern of the names of the zones that are
+# measured: the package zones, which include the cores and uncore, and the DRAM zones, which are not included in
+# the former
+POWERCAP_RAPL_ZONE_GLOB = "/sys/class/powercap/intel-rapl:*"
+RAPL_MEASURED_ZONE_NAME_PATTERN = re.compile(r"^(package-\d+|dram)$")
+
+# Path of the file reporting the time all CPUs spent in each state, in clock ticks, used to estimate the energy
+# consumed when RAPL is not available
+PROC_STAT_PATH = "/proc/stat"
+CLOCK_TICKS_PER_SECOND = os.sysconf("SC_CLK_TCK")
+
 # The endpoint that Prometheus is listening on
 PROMETHEUS_URL="http://localhost:9090"
 
 # The suffixes of the filenames to store results in
 PERF_RESULTS_FILENAME_SUFFIX = "-perf_results.csv"
 TIME_RESULTS_FILENAME_SUFFIX = "-time_results.csv"
+DENSITY_RESULTS_FILENAME_SUFFIX = "-density_results.csv"
+LOAD_RESULTS_FILENAME_SUFFIX = "-load_results.csv"
+IMAGE_RESULTS_FILENAME_SUFFIX = "-image_results.csv"
+AOT_RESULTS_FILENAME_SUFFIX = "-aot_results.csv"
+PROFILE_RESULTS_FILENAME_SUFFIX = "-profile_results.csv"
+MEMORY_RESULTS_FILENAME_SUFFIX = "-memory_results.csv"
+MEMORY_SEARCH_RESULTS_FILENAME_SUFFIX = "-memory_search_results.csv"
+
+# The suffix of the filenames of the fingerprints of each mode's results, stored alongside them
+FINGERPRINT_FILENAME_SUFFIX_TEMPLATE = "-{mode}_fingerprint.json"
+
+# The modes experiments can be run in: the standard mode runs one instance of each mechanism's command at a time to 
+# collect perf and time metrics, the density mode runs several instances of it concurrently, the load mode 
+# invokes it open-loop at a target arrival rate, the image mode characterizes the images of the Docker mechanisms, 
+# the profile mode samples the call stacks of a designated trial of each mechanism, and the memory mode searches the
+# minimum viable memory of each mechanism and sweeps the memory limit it runs under
+MODE_STANDARD = "standard"
+MODE_DENSITY = "density"
+MODE_LOAD = "load"
+MODE_IMAGE = "image"
+MODE_PROFILE = "profile"
+MODE_MEMORY = "memory"
+
+# The suffixes of the results files written in each mode
+MODE_RESULTS_FILENAME_SUFFIXES = {
+    MODE_STANDARD: [PERF_RESULTS_FILENAME_SUFFIX, TIME_RESULTS_FILENAME_SUFFIX],
+    MODE_DENSITY: [DENSITY_RESULTS_FILENAME_SUFFIX],
+    MODE_LOAD: [LOAD_RESULTS_FILENAME_SUFFIX],
+    MODE_IMAGE: [IMAGE_RESULTS_FILENAME_SUFFIX],
+    MODE_PROFILE: [PROFILE_RESULTS_FILENAME_SUFFIX],
+    MODE_MEMORY: [MEMORY_SEARCH_RESULTS_FILENAME_SUFFIX, MEMORY_RESULTS_FILENAME_SUFFIX]
+}
+
+# The arguments of this script that cannot change its results, and are hence left out of the fingerprint of the results
+UNFINGERPRINTED_ARGS = ["force"]
+
+# Field names for the metrics of density experiments
+DENSITY_FIELD_NAMES = ["min-instance-latency-seconds", "mean-instance-latency-seconds", "max-instance-latency-seconds",
+    "makespan-seconds", "throughput-inferences-per-second", "max-total-rss-bytes", "max-total-pss-bytes", 
+    "max-pss-per-instance-bytes", "cpu-utilization-percentage", "max-cpu-utilization-percentage"]
+
+# The default numbers of concurrent instances to run in density experiments
+DEFAULT_INSTANCE_COUNTS = "1,2,4"
+
+# Field names for the metrics of memory experiments, in which the workload runs under a memory limit without swap: 
+# whether it completed, i.e. exited successfully without any of its processes being OOM-killed, its wall time, the 
+# peak memory usage of its cgroup, the number of its processes that were OOM-killed, and the pages the kernel scanned 
+# and reclaimed from its cgroup, mostly to keep it under the limit, which are only reported under cgroup v2
+MEMORY_LIMIT_FIELD_NAMES = ["completed", "wall-time-seconds", "peak-memory-bytes", "oom-kills", "reclaim-scanned-pages", 
+    "reclaim-stolen-pages"]
+
+# Field names for the search for the minimum viable memory of each experiment: the smallest memory limit found it to be
+# viable under, the median wall time and the maximum peak memory usage of its reference runs without a limit, and the 
+# number of limits probed
+MEMORY_SEARCH_FIELD_NAMES = ["minimum-viable-memory-bytes", "reference-wall-time-seconds", "reference-peak-memory-bytes", 
+    "probes"]
+
+# The memory limit recorded for runs without one, like the thread count leaving it to the runtime's default
+UNLIMITED_MEMORY = 0
+
+# The number of bytes in a mebibyte, the unit memory limits are given in on the command line
+BYTES_PER_MIB = 2 ** 20
+
+# The number of runs without a memory limit the minimum viable memory of each experiment is searched relative to, 
+# the smallest limit the search probes, the default resolution it stops at in mebibytes, and the default factor by 
+# which the workload may slow down relative to its reference runs while still counting as viable
+MEMORY_SEARCH_REFERENCE_RUNS = 3
+MEMORY_SEARCH_MIN_BYTES = 16 * BYTES_PER_MIB
+DEFAULT_MEMORY_SEARCH_RESOLUTION_MIB = 8
+DEFAULT_MEMORY_MAX_SLOWDOWN = 1.5
+
+# The multiples of each experiment's minimum viable memory swept by default in memory experiments, alongside no limit
+MEMORY_SWEEP_FACTORS = [1, 1.25, 1.5, 2]
+
+# The file reporting the memory of the device, whose total bounds the memory limits probed
+PROC_MEMINFO_PATH = "/proc/meminfo"
+
+# Field names for the timing of each request of load experiments, each of which is written as its own row; the start
+# delay is how long a request waited after its arrival to start, and its latency also includes its service time
+LOAD_FIELD_NAMES = ["request-number", "arrival-offset-seconds", "start-delay-seconds", "service-time-seconds", 
+    "latency-seconds", "completion-offset-seconds", "succeeded"]
+
+# Field names for the characteristics of each Docker mechanism's image recorded by image experiments: its size and 
+# number of layers, how long it takes to load from its tar file, and once loaded, how long its first container takes
+# to start running and to finish its workload
+IMAGE_FIELD_NAMES = ["image-size-bytes", "image-layers", "load-seconds", "start-latency-seconds", "first-run-seconds"]
+
+# Field names for the AoT compilation of each WebAssembly AoT mechanism's file, written once per mechanism rather than
+# per trial: what it was compiled from and with, and how long it took, how large the file is and the peak memory usage 
+# of the compiler, which are those of the compilation that populated the cache; whether the file was already cached
+# is recorded too
+AOT_FIELD_NAMES = ["deployment-mechanism", "optimization-level", "wasmedge-version", "arch", "wasm-sha256", "compiled-at",
+    "compile-seconds", "artifact-size-bytes", "peak-compile-memory-bytes", "cache-hit"]
+
+# Field names for the call stacks sampled by profile experiments, each of which is written as its own row in the 
+# folded format: the stack's frames from the process's name down to the sampled function, separated by semicolons, 
+# and the number of samples taken in it
+PROFILE_FIELD_NAMES = ["stack", "samples"]
+
+# The default number of times per second perf samples the call stacks in profile experiments; it is not a round
+# number, so the samples are not taken in lockstep with periodic activity
+DEFAULT_PROFILE_FREQUENCY = 999
+
+# The number of unprofiled runs of each experiment before its designated trial is profiled, so the trial does not
+# sample one-time costs such as reading the model from storage
+PROFILE_WARMUP_RUNS = 1
+
+# The commands recording the call stacks of a command and the processes it starts, or of the whole system while the 
+# command runs, which is used for Docker mechanisms since their workload is started by the daemon rather than the 
+# command, and the command printing the recorded samples, one line per frame from the sampled function up
+PERF_RECORD_CMD_TEMPLATE = f"sudo LD_LIBRARY_PATH={LD_LIBRARY_PATH} PATH={PATH} perf record -g -F {{frequency}} -o {{output_path}} --"
+PERF_RECORD_SYSTEM_WIDE_CMD_TEMPLATE = "sudo perf record -a -g -F {frequency} -o {output_path} --"
+PERF_SCRIPT_CMD_TEMPLATE = "sudo perf script -F comm,ip,sym -i {input_path}"
+
+# The path perf records the samples of a profile experiment to
+PERF_DATA_PATH = f"{SUITE_DIR}/profile.data"
+
+# The names of the processes whose samples are left out of system-wide profiles, which are those of idle CPUs
+PROFILE_IGNORED_PROCESS_NAMES = ["swapper"]
+
+# The processes that can generate the arrival times of requests in load experiments
+ARRIVAL_POISSON = "poisson"
+ARRIVAL_CONSTANT = "constant"
+
+# The defaults for the arrival rates to sweep in requests per second, the number of seconds to issue requests for, 
+# and the maximum number of requests running at once in load experiments
+DEFAULT_RATES = "0.5,1,2"
+DEFAULT_LOAD_DURATION = 60
+DEFAULT_LOAD_POOL_SIZE = 64
+
+# How often the memory attribution of the workload's processes is sampled during perf experiments, in seconds
+MEMORY_ATTRIBUTION_SAMPLE_INTERVAL = 0.1
+
+# The pattern of the header line of each mapping in a process's smaps file, the pattern of the paths of shared 
+# libraries, and the prefixes of the paths of model files on the host and in containers, where the models directory
+# is mounted; note that libtorch reads TorchScript models into anonymous memory rather than mapping them
+SMAPS_MAPPING_HEADER_PATTERN = re.compile(r"^[0-9a-f]+-[0-9a-f]+ ")
+SHARED_LIBRARY_PATH_PATTERN = re.compile(r"\.so(\.[0-9]+)*( \(deleted\))?$")
+MODEL_MAPPING_PATH_PREFIXES = (f"{MODELS_PATH}/", "/models/")
+
+# How often the memory usage and CPU utilization are sampled during density experiments, in seconds
+DENSITY_SAMPLE_INTERVAL = 0.25
+
+# How often the memory usage, reclaim and OOM kills of the workload's cgroup are sampled during memory experiments, 
+# in seconds
+MEMORY_LIMIT_SAMPLE_INTERVAL = 0.1
+
+# Paths of the files listing the processes in each container's cgroup, and the name of the processes that each 
+# container is managed by outside of its cgroup
+DOCKER_CGROUP_PROCS_GLOB_V2 = "/sys/fs/cgroup/system.slice/docker-*.scope/cgroup.procs"
+DOCKER_CGROUP_PROCS_GLOB_V1 = "/sys/fs/cgroup/memory/docker/*/cgroup.procs"
+DOCKER_SHIM_PROCESS_NAME_PREFIX = "containerd-shim"
 
 # Basic field names to include in every CSV file storing experiment results
 CSV_BASIC_FIELD_NAMES = ["deployment-mechanism", "trial-number", "start-time"] 
 
+# Field names for the dimensions that are swept in every set of experiments alongside the deployment
+# mechanism, written after the basic field names; each experiment is identified by its deployment
+# mechanism and a tuple of values for these dimensions. The input resolution is the same for every
+# experiment of a run, but is recorded alongside the others so the analysis need not parse it from the
+# model's filename
+DIMENSION_FIELD_NAMES = ["threads", "storage", "device", "resolution"]
+
+# The name of the storage medium of the suite's own directory, which the models and inputs are read from unless they
+# are staged on other storage media, and the directory they are staged in on each of those
+DEFAULT_STORAGE = "default"
+STORAGE_STAGING_DIR_NAME = "benchmark_staging"
+
+# The name of the device profile giving the workloads all of the device's CPUs, which the other device profiles restrict
+# to a CPU quota and/or a set of CPUs to emulate smaller edge devices, and the file in each set's results directory 
+# recording the device profiles its experiments were run under
+DEFAULT_DEVICE = "default"
+DEVICE_PROFILES_FILENAME = "device_profiles.json"
+
+# The period in microseconds over which the CPU quota of a device profile is enforced, which is the kernel's default
+CPU_QUOTA_PERIOD_US = 100000
+
+# Field names for the thermal state of the device sampled at the start and end of each trial, written after
+# the dimensions; these are not metrics, but allow throttled trials to be excluded or analyzed separately
+THERMAL_FIELD_NAMES = ["start-temperature-celsius", "end-temperature-celsius", "start-cpu-frequency-mhz", 
+    "end-cpu-frequency-mhz", "throttled"]
+
 # Field names for memory metrics
 MEMORY_FIELD_NAMES = ["avg-memory-over-time-in-bytes", "max-memory-over-time-in-bytes"]
 
+# Field names for the block I/O of the workload's cgroup, summed over the devices: the bytes it read, the number of 
+# reads it issued and the bytes it wrote, each mapped to its key in the cgroup's io.stat file
+IO_FIELD_NAMES = ["io-read-bytes", "io-read-operations", "io-write-bytes"]
+IO_STAT_KEYS = {"rbytes": "io-read-bytes", "rios": "io-read-operations", "wbytes": "io-write-bytes"}
+
 # Field names for CPU metrics
 CPU_FIELD_NAMES = ["cpu-total-utilization-percentage", "cpu-user-utilization-percentage", "cpu-system-utilization-percentage"]
 
+# Field name for the CPU time the workload's cgroup used during the trial, in seconds, which is computed from its total
+# CPU utilization, an average over all of the device's cores, and the trial's duration
+CPU_USAGE_SECONDS_FIELD_NAME = "cpu-usage-seconds"
+
+# The categories of memory regions that the memory of the workload's processes is attributed to, and the field names 
+# of each category's proportional and unique set size at the trial's peak total proportional set size, followed by 
+# the totals and the size of the clean file-backed pages, which could be shared with further instances
+MEMORY_REGION_CATEGORIES = ["shared-library", "model-file", "other-file", "heap", "anonymous", "other"]
+FILE_BACKED_MEMORY_REGION_CATEGORIES = ["shared-library", "model-file", "other-file"]
+MEMORY_ATTRIBUTION_FIELD_NAMES = [f"peak-{category}-pss-bytes" for category in MEMORY_REGION_CATEGORIES] \
+    + [f"peak-{category}-uss-bytes" for category in MEMORY_REGION_CATEGORIES] \
+    + ["peak-total-pss-bytes", "peak-total-uss-bytes", "peak-shareable-bytes"]
+
+# Field names for the share of the time each perf event was enabled during which it was actually counted, i.e. its 
+# time_running divided by its time_enabled, by which its count was scaled; this is 1 unless it was multiplexed
+PERF_SCALING_RATIO_FIELD_NAMES = [f"{event}-scaling-ratio" for event in PERF_EVENTS]
+
+# Field names for the variance of the estimate of the Docker daemon's baseline subtracted from each metric, which only
+# the rows of the Docker mechanisms' view including just the daemon's extra overhead have, so analyses can account for
+# the uncertainty of the baseline in that view's confidence intervals
+DAEMON_BASELINE_VARIANCE_FIELD_NAMES = [f"{metric}-baseline-variance" for metric in PERF_EVENTS + MEMORY_FIELD_NAMES 
+    + CPU_FIELD_NAMES + [CPU_USAGE_SECONDS_FIELD_NAME]]
+# The same field names as a set, since every metric of every row written is checked against them
+DAEMON_BASELINE_VARIANCE_FIELD_NAME_SET = frozenset(DAEMON_BASELINE_VARIANCE_FIELD_NAMES)
+
 # Field names for events that might be missing/not available for cAdvisor and Prometheus
 # depending on the system
-POSSIBLE_MISSING_METRICS = PERF_EVENTS + CPU_FIELD_NAMES
+POSSIBLE_MISSING_METRICS = PERF_EVENTS + PERF_SCALING_RATIO_FIELD_NAMES + CPU_FIELD_NAMES + [CPU_USAGE_SECONDS_FIELD_NAME] \
+    + IO_FIELD_NAMES
 
 # Number of CPU cores 
 NUM_CORES = os.cpu_count()
 
+# Paths of the files reporting each thermal zone's temperature in millidegrees Celsius, each CPU's current
+# frequency in kHz, and on x86 the number of times each core was thermally throttled
+THERMAL_ZONE_TEMP_GLOB = "/sys/class/thermal/thermal_zone*/temp"
+CPU_FREQ_GLOB = "/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq"
+CORE_THROTTLE_COUNT_GLOB = "/sys/devices/system/cpu/cpu[0-9]*/thermal_throttle/core_throttle_count"
+
+# The command reporting the Raspberry Pi's throttling flags, and the masks of its bits that are set while the 
+# SoC is under-voltage, frequency capped, throttled or at its soft temperature limit, and that are set once
+# any of those has occurred since boot
+VCGENCMD_GET_THROTTLED_CMD = "vcgencmd get_throttled"
+THROTTLED_NOW_MASK = 0xF
+THROTTLED_OCCURRED_MASK = 0xF0000
+
+# How often the temperature is polled, and for how long at most, when waiting for the device to cool down
+# before a trial
+COOLDOWN_POLL_INTERVAL = 1
+DEFAULT_COOLDOWN_TIMEOUT = 300
+
 # Name of custom cgroup we will execute non-container processes in, so cAdvisor and Prometheus can track
 # their metrics
 CUSTOM_CGROUP_NAME = "custom"
 
-# How long we measure the Docker daemon's metrics for, as a baseline, before the 
-# container experiment is started
-DAEMON_MEASUREMENT_TIME = 10
+# How long each window the Docker daemon's metrics are measured over, as a baseline, lasts; the windows are sampled
+# in the background throughout the perf experiments whenever no Docker trial is running, and the baseline is 
+# estimated from the most recent of them rather than measured before each container experiment, so it follows the
+# daemon's drift over the session
+DAEMON_BASELINE_WINDOW_TIME = 10
+DAEMON_BASELINE_MAX_WINDOWS = 30
+
+# The number of windows the Docker daemon's baseline must have been measured over since the current pass of the perf
+# experiments started before a Docker trial is run, which needs at least two for the variance of the estimate of the
+# pass's perf events, and how often to check whether they have been
+DAEMON_BASELINE_MIN_WINDOWS = 2
+DAEMON_BASELINE_POLL_INTERVAL = 1
+
+# The maximum number of seconds to wait for the Docker daemon's baseline to be measured before a Docker trial, beyond
+# which the trial fails, e.g. if Prometheus cannot be queried
+DAEMON_BASELINE_WAIT_TIMEOUT = 120
 
 # How long we wait after cAdvisor & Prometheus are started before starting an experiment
 CADVISOR_PROMETHEUS_WAIT_TIME = 20
@@ -135,359 +531,2582 @@ PROMETHEUS_PERF_QUERIES_RATE = """sum by (event) (rate(container_perf_events_tot
 PROMETHEUS_PERF_QUERIES_INCREASE = """sum by (event) (increase(container_perf_events_total{{id='{name_or_id}'}}[{container_duration_ms}ms]
     @ {end_container_timestamp:.2f}))"""
 
+# The share of the time each perf event was enabled during which it was counted, over the CPUs it was counted on; the
+# smallest share is taken, since that is where the event's count was scaled up the most
+PROMETHEUS_PERF_SCALING_RATIO_QUERY = "min by (event) (container_perf_events_scaling_ratio{{id='{name_or_id}'}})"
+
+# The block I/O of a container, which cAdvisor reads from the io.stat file of its cgroup; unlike the custom cgroup of
+# the other mechanisms, the container's cgroup is removed as soon as its workload exits, so cannot be read afterwards
+PROMETHEUS_IO_QUERIES = {
+    "io-read-bytes": "sum(container_fs_reads_bytes_total{{id='{name_or_id}'}})",
+    "io-read-operations": "sum(container_fs_reads_total{{id='{name_or_id}'}})",
+    "io-write-bytes": "sum(container_fs_writes_bytes_total{{id='{name_or_id}'}})"
+}
+
+# The file reporting the block I/O of a cgroup on each device, under cgroup v2
+CGROUP_IO_STAT_PATH_TEMPLATE = "/sys/fs/cgroup/{cgroup_name}/io.stat"
+
+# The path of a file of a cgroup, given the path of the cgroup's directory relative to the root of the hierarchy
+CGROUP_FILE_PATH_TEMPLATE = "/sys/fs/cgroup/{cgroup_path}/{filename}"
+
+# The files of the memory controller under cgroup v2 and v1 respectively: the memory limit, the limit on swap (under
+# v1, on memory and swap combined), the current and peak memory usage, the events including OOM kills, and the
+# statistics including the pages scanned and reclaimed; memory.peak is only available from Linux 5.19
+CGROUP_V2_MEMORY_FILES = {"limit": "memory.max", "swap-limit": "memory.swap.max", "current": "memory.current", 
+    "peak": "memory.peak", "events": "memory.events", "stat": "memory.stat"}
+CGROUP_V1_MEMORY_FILES = {"limit": "memory.limit_in_bytes", "swap-limit": "memory.memsw.limit_in_bytes", 
+    "current": "memory.usage_in_bytes", "peak": "memory.max_usage_in_bytes", "events": "memory.oom_control", 
+    "stat": "memory.stat"}
+
+# The values of the limit files that lift the limit under cgroup v2 and v1 respectively
+CGROUP_V2_UNLIMITED_VALUE = "max"
+CGROUP_V1_UNLIMITED_VALUE = "-1"
+
+# The keys of the OOM kills in the events file, and of the pages scanned and reclaimed in the statistics file
+CGROUP_OOM_KILL_KEY = "oom_kill"
+CGROUP_MEMORY_STAT_KEYS = {"pgscan": "reclaim-scanned-pages", "pgsteal": "reclaim-stolen-pages"}
+
 # Queries for the Docker daemon's overhead when measuring its baseline state
 PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_BASELINE = [PROMETHEUS_PERF_QUERIES_RATE.replace("{name_or_id}", DAEMON_ID)]
 for query in PROMETHEUS_PERF_AND_MEMORY_QUERIES[1:]:
     PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_BASELINE.append(query.replace("{name_or_id}", DAEMON_ID))
 
-# Queries for the Docker daemon's overhead when measuring it during the container experiment
-PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_DURING_CONTAINER = [PROMETHEUS_PERF_QUERIES_INCREASE.replace("{name_or_id}", DAEMON_ID)]
-for query in PROMETHEUS_PERF_AND_MEMORY_QUERIES[1:]:
-    PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_DURING_CONTAINER.append(query.replace("{name_or_id}", DAEMON_ID))
+# Queries for the Docker daemon's overhead when measuring it during the container experiment
+PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_DURING_CONTAINER = [PROMETHEUS_PERF_QUERIES_INCREASE.replace("{name_or_id}", DAEMON_ID)]
+for query in PROMETHEUS_PERF_AND_MEMORY_QUERIES[1:]:
+    PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_DURING_CONTAINER.append(query.replace("{name_or_id}", DAEMON_ID))
+
+# The commands used to start a custom cgroup under the given controllers and execute a command in it, and to delete it;
+# the non-container workloads are measured in a cgroup under the memory controller only, unless a device profile adds
+# the controllers restricting their CPUs
+CREATE_CGROUP_WITH_CONTROLLERS_CMD_TEMPLATE="sudo cgcreate -g {controllers}:{cgroup_name}"
+EXEC_IN_CGROUP_WITH_CONTROLLERS_CMD_PREFIX_TEMPLATE=f"sudo LD_LIBRARY_PATH={LD_LIBRARY_PATH} PATH={PATH} cgexec -g {{controllers}}:{{cgroup_name}}"
+DELETE_CGROUP_WITH_CONTROLLERS_CMD_TEMPLATE="sudo cgdelete -g {controllers}:{cgroup_name}"
+MEASUREMENT_CGROUP_CONTROLLERS = ["memory"]
+CREATE_CGROUP_CMD_TEMPLATE=CREATE_CGROUP_WITH_CONTROLLERS_CMD_TEMPLATE.replace("{controllers}", "memory")
+EXEC_IN_CGROUP_CMD_PREFIX_TEMPLATE=EXEC_IN_CGROUP_WITH_CONTROLLERS_CMD_PREFIX_TEMPLATE.replace("{controllers}", "memory")
+DELETE_CGROUP_CMD_TEMPLATE=DELETE_CGROUP_WITH_CONTROLLERS_CMD_TEMPLATE.replace("{controllers}", "memory")
+CREATE_CGROUP_CMD=CREATE_CGROUP_CMD_TEMPLATE.format(cgroup_name=CUSTOM_CGROUP_NAME)
+EXEC_IN_CGROUP_CMD_PREFIX=EXEC_IN_CGROUP_CMD_PREFIX_TEMPLATE.format(cgroup_name=CUSTOM_CGROUP_NAME)
+DELETE_CGROUP_CMD=DELETE_CGROUP_CMD_TEMPLATE.format(cgroup_name=CUSTOM_CGROUP_NAME)
+
+# The command to set a parameter of a custom cgroup, such as its memory limit
+SET_CGROUP_PARAMETER_CMD_TEMPLATE="sudo cgset -r {parameter}={value} {cgroup_name}"
+
+# The name of the cgroup that non-container workloads run in under a device profile when they are not measured in a 
+# cgroup of their own, such as in the time experiments
+DEVICE_CGROUP_NAME = "device"
+
+# The controllers restricting the CPU quota and the set of CPUs of a cgroup, and the files of the cgroup they are 
+# restricted through under cgroup v2 and v1 respectively; under cgroup v1, the memory nodes of a cpuset must also
+# be set before any process can join it, which are copied from the root cpuset's
+CPU_QUOTA_CGROUP_CONTROLLER = "cpu"
+CPUSET_CGROUP_CONTROLLER = "cpuset"
+CGROUP_V2_CPU_QUOTA_FILE = "cpu.max"
+CGROUP_V1_CPU_PERIOD_FILE = "cpu.cfs_period_us"
+CGROUP_V1_CPU_QUOTA_FILE = "cpu.cfs_quota_us"
+CGROUP_CPUSET_CPUS_FILE = "cpuset.cpus"
+CGROUP_CPUSET_MEMS_FILE = "cpuset.mems"
+
+# The number of times to retry an experiment before giving up
+MAX_RETRIES = 15
+
+# Variable tracking whether cAdvisor and Prometheus are currently running or not
+cadvisor_and_prometheus_running = False
+
+# The perf events config cAdvisor is started with, which is replaced by that of each pass of the perf experiments
+cadvisor_perf_config_path = CADVISOR_PERF_CONFIG_PATH
+
+# The suffix of the filename of the trace of the harness's own phases during each mode's run, stored alongside its
+# results in the Chrome trace event format, so it can be opened in chrome://tracing or Perfetto
+TRACE_FILENAME_SUFFIX_TEMPLATE = "-{mode}_trace.json"
+
+# The phase of the trial attempts, which span everything done for a trial, and the phase they are renamed to if
+# they fail and are retried or given up on
+TRIAL_ATTEMPT_PHASE = "trial-attempt"
+FAILED_TRIAL_ATTEMPT_PHASE = "failed-trial-attempt"
+
+# The content type of the harness's metrics, served in the OpenMetrics text format
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# The state of the harness's instrumentation of its own phases: when the run started, the open trace file and the
+# events of the spans that ended before it was opened, how many spans of each phase were recorded on the main thread
+# and on the background threads, e.g. those of density and load experiments and the sampler of the Docker daemon's
+# baseline, and the seconds spent in them excluding the spans nested in them, the seconds spent in failed trial 
+# attempts including their nested spans, and how many trials are expected and were completed. Spans are recorded
+# from several threads, hence the lock, while the stack of open spans is kept per thread; the spans of the
+# background threads overlap those of the main thread, so only the latter account for the run's wall time
+harness_trace = {"start": None, "file": None, "pending-events": [], "phases": {}, "background-phases": {}, 
+    "failed-attempt-seconds": 0, "trials-total": 0, "trials-completed": 0}
+harness_trace_lock = threading.Lock()
+harness_span_stacks = threading.local()
+
+# The state of the estimate of the Docker daemon's baseline, sampled in the background during the perf experiments
+# and kept for the whole session: the daemon's metrics over each of the last DAEMON_BASELINE_MAX_WINDOWS windows
+# sampled, and how many windows were sampled since the current pass started; whether sampling is paused, e.g. while
+# a Docker trial runs, and how many times it was, so a window overlapping a pause is discarded
+daemon_baseline = {"windows": deque(maxlen=DAEMON_BASELINE_MAX_WINDOWS), "pass-windows": 0, "paused": False, "pauses": 0}
+daemon_baseline_lock = threading.Lock()
+
+def start_harness_trace():
+    """Starts instrumenting the harness's phases, keeping the events of their spans until the trace file is opened."""
+    harness_trace["start"] = time.monotonic()
+
+def open_harness_trace_file(trace_path):
+    """Opens the file the spans of the harness's phases are traced to, writing the events of those that already ended.
+
+    Args:
+        trace_path: The path of the trace file
+    """
+    with harness_trace_lock:
+        # The trace is written as a JSON array with an event per line as the spans end, which the trace viewers accept
+        # without its closing bracket, so the trace of a run that crashed can still be opened
+        harness_trace["file"] = open(trace_path, "w")
+        harness_trace["file"].write("[\n")
+        for event in harness_trace["pending-events"]:
+            write_harness_trace_event(event)
+        harness_trace["pending-events"] = []
+
+def write_harness_trace_event(event):
+    """Writes the event of a span to the trace file.
+
+    Args:
+        event: The event, in the Chrome trace event format
+    """
+    harness_trace["file"].write(json.dumps(event, default=str) + ",\n")
+    harness_trace["file"].flush()
+
+def stop_harness_trace():
+    """Stops tracing the harness's phases, closing the trace file."""
+    with harness_trace_lock:
+        if harness_trace["file"] is not None:
+            harness_trace["file"].close()
+            harness_trace["file"] = None
+
+@contextmanager
+def harness_span(phase, **span_args):
+    """Accounts for the time spent in a phase of the harness, e.g. waiting for cAdvisor and Prometheus or deleting a 
+    cgroup, and traces it as a span. The time spent in spans nested in it is only accounted to those.
+
+    Args:
+        phase: The name of the phase
+        span_args: Details of the span to add to its trace, e.g. the trial it was in
+    Yields:
+        dict: The span, whose phase can be changed before it ends, e.g. if the trial attempt it spans failed
+    """
+    span = {"phase": phase, "args": span_args, "nested-seconds": 0}
+    stack = getattr(harness_span_stacks, "stack", None)
+    if stack is None:
+        stack = harness_span_stacks.stack = []
+    stack.append(span)
+    span_start = time.monotonic()
+    try:
+        yield span
+    finally:
+        duration = time.monotonic() - span_start
+        stack.pop()
+        if stack:
+            stack[-1]["nested-seconds"] += duration
+        record_harness_span(span, span_start, duration)
+
+def harness_phase(phase):
+    """Decorates a function to account for each call of it as a span of a phase of the harness.
+
+    Args:
+        phase: The name of the phase
+    Returns:
+        function: The decorator
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with harness_span(phase):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_harness_span(span, span_start, duration):
+    """Accounts for a span that ended and writes it to the trace file, if the harness is being instrumented.
+
+    Args:
+        span: The span
+        span_start: The monotonic time the span started at
+        duration: The duration of the span in seconds
+    """
+    if harness_trace["start"] is None:
+        return
+
+    with harness_trace_lock:
+        phases = harness_trace["phases" if threading.current_thread() is threading.main_thread() else "background-phases"]
+        spans, self_seconds = phases.get(span["phase"], (0, 0))
+        phases[span["phase"]] = (spans + 1, self_seconds + duration - span["nested-seconds"])
+        if span["phase"] == FAILED_TRIAL_ATTEMPT_PHASE:
+            harness_trace["failed-attempt-seconds"] += duration
+        event = {"name": span["phase"], "cat": "harness", "ph": "X", "ts": round((span_start - harness_trace["start"]) * 1e6), 
+            "dur": round(duration * 1e6), "pid": os.getpid(), "tid": threading.get_ident(), "args": span["args"]}
+        if harness_trace["file"] is not None:
+            write_harness_trace_event(event)
+        else:
+            harness_trace["pending-events"].append(event)
+
+def add_expected_harness_trials(trials):
+    """Adds to the number of trials the run is expected to complete, from which its progress is estimated.
+
+    Args:
+        trials: The number of trials
+    """
+    with harness_trace_lock:
+        harness_trace["trials-total"] += trials
+
+def complete_harness_trial():
+    """Counts a trial as completed, whether it succeeded or was given up on, and prints the run's progress."""
+    with harness_trace_lock:
+        harness_trace["trials-completed"] += 1
+    progress = get_harness_progress()
+    eta = f", about {format_duration(progress['eta-seconds'])} left" if progress["eta-seconds"] is not None else ""
+    print(f"Completed {progress['trials-completed']}/{progress['trials-total']} trials{eta}")
+
+def get_harness_progress():
+    """Gets the progress of the run, estimating the time it has left from the mean time its completed trials took.
+
+    Returns:
+        dict: The numbers of trials expected and completed, the seconds elapsed and the estimated seconds left, 
+            or None if no trial was completed yet
+    """
+    with harness_trace_lock:
+        trials_total = harness_trace["trials-total"]
+        trials_completed = harness_trace["trials-completed"]
+    elapsed_seconds = time.monotonic() - harness_trace["start"]
+    eta_seconds = None
+    if trials_completed > 0:
+        eta_seconds = max(trials_total - trials_completed, 0) * elapsed_seconds / trials_completed
+    return {"trials-total": trials_total, "trials-completed": trials_completed, "elapsed-seconds": elapsed_seconds, 
+        "eta-seconds": eta_seconds}
+
+def format_duration(seconds):
+    """Formats a number of seconds as hours, minutes and seconds.
+
+    Args:
+        seconds: The number of seconds
+    Returns:
+        str: The formatted duration, e.g. 1h02m03s
+    """
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+def get_harness_metrics():
+    """Gets the harness's progress and the time spent in each of its phases in the OpenMetrics text format.
+
+    Returns:
+        str: The metrics
+    """
+    progress = get_harness_progress()
+    with harness_trace_lock:
+        phases = dict(harness_trace["phases"])
+        background_phases = dict(harness_trace["background-phases"])
+        failed_attempt_seconds = harness_trace["failed-attempt-seconds"]
+
+    lines = ["# TYPE collect_data_trials gauge", "# HELP collect_data_trials The number of trials expected in the run.",
+        f"collect_data_trials {progress['trials-total']}",
+        "# TYPE collect_data_trials_completed counter", "# HELP collect_data_trials_completed The number of trials completed.",
+        f"collect_data_trials_completed_total {progress['trials-completed']}",
+        "# TYPE collect_data_elapsed_seconds gauge", "# HELP collect_data_elapsed_seconds The seconds elapsed since the run started.",
+        f"collect_data_elapsed_seconds {progress['elapsed-seconds']:.3f}",
+        "# TYPE collect_data_eta_seconds gauge", "# HELP collect_data_eta_seconds The estimated seconds left in the run.",
+        f"collect_data_eta_seconds {progress['eta-seconds'] if progress['eta-seconds'] is not None else 'NaN'}",
+        "# TYPE collect_data_retries counter", "# HELP collect_data_retries The number of failed trial attempts.",
+        f"collect_data_retries_total {phases.get(FAILED_TRIAL_ATTEMPT_PHASE, (0, 0))[0]}",
+        "# TYPE collect_data_retry_seconds counter", "# HELP collect_data_retry_seconds The seconds spent in failed trial attempts.",
+        f"collect_data_retry_seconds_total {failed_attempt_seconds:.6f}",
+        "# TYPE collect_data_phase_spans counter", "# HELP collect_data_phase_spans The number of spans of each phase."]
+    lines.extend(f'collect_data_phase_spans_total{{phase="{phase}"}} {spans}' for phase, (spans, _) in sorted(phases.items()))
+    lines.extend(["# TYPE collect_data_phase_seconds counter", 
+        "# HELP collect_data_phase_seconds The seconds spent in each phase, excluding the phases nested in it."])
+    lines.extend(f'collect_data_phase_seconds_total{{phase="{phase}"}} {seconds:.6f}' for phase, (_, seconds) in sorted(phases.items()))
+    lines.extend(["# TYPE collect_data_background_phase_seconds counter", 
+        "# HELP collect_data_background_phase_seconds The seconds spent in each phase on background threads, overlapping the other phases."])
+    lines.extend(f'collect_data_background_phase_seconds_total{{phase="{phase}"}} {seconds:.6f}' 
+        for phase, (_, seconds) in sorted(background_phases.items()))
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+def start_harness_metrics_server(port):
+    """Starts serving the harness's metrics over HTTP on a daemon thread, so the progress of a long run can be 
+    scraped by Prometheus or checked with curl.
+
+    Args:
+        port: The port to serve the metrics on
+    """
+    class HarnessMetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = get_harness_metrics().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("", port), HarnessMetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving the progress of the run at http://localhost:{port}/metrics")
+
+def print_harness_summary():
+    """Prints how the run's time was spent across the harness's phases on the main thread, excluding the phases 
+    nested in each, then the phases on background threads, which overlap them, and what failed trial attempts cost."""
+    wall_seconds = time.monotonic() - harness_trace["start"]
+    with harness_trace_lock:
+        phases = dict(harness_trace["phases"])
+        background_phases = dict(harness_trace["background-phases"])
+        failed_attempt_seconds = harness_trace["failed-attempt-seconds"]
+    if wall_seconds <= 0 or not phases:
+        return
+
+    print(f"\nHarness time over {format_duration(wall_seconds)}:")
+    print(f"{'phase':<28}{'spans':>8}{'seconds':>12}{'mean':>10}{'share':>9}")
+    untraced_seconds = wall_seconds - sum(seconds for _, seconds in phases.values())
+    for phase, (spans, seconds) in sorted(phases.items(), key=lambda item: -item[1][1]):
+        print(f"{phase:<28}{spans:>8}{seconds:>12.2f}{seconds / spans:>10.2f}{seconds / wall_seconds:>9.1%}")
+    print(f"{'untraced':<28}{'':>8}{untraced_seconds:>12.2f}{'':>10}{untraced_seconds / wall_seconds:>9.1%}")
+
+    if background_phases:
+        print("Background threads, overlapping the phases above:")
+        for phase, (spans, seconds) in sorted(background_phases.items(), key=lambda item: -item[1][1]):
+            print(f"{phase:<28}{spans:>8}{seconds:>12.2f}{seconds / spans:>10.2f}{seconds / wall_seconds:>9.1%}")
+
+    failed_attempts = phases.get(FAILED_TRIAL_ATTEMPT_PHASE, (0, 0))[0]
+    print(f"Retries: {failed_attempts} failed trial attempts, costing {format_duration(failed_attempt_seconds)} "
+        + f"({failed_attempt_seconds / wall_seconds:.1%} of the run)")
+
+def is_cgroup_v2():
+    """Checks if the system is using cgroup v2
+    
+    Returns:
+        bool: True if the system is using cgroup v2, False otherwise
+    """
+    return os.path.isfile("/sys/fs/cgroup/cgroup.controllers")
+
+def parse_storage_media(storage_media_list):
+    """Parses the storage media to read the models and inputs from, each given as its name and the path of a directory
+    on it, e.g. "tmpfs=/mnt/tmpfs", or as just DEFAULT_STORAGE for the suite's own directory.
+
+    Args:
+        storage_media_list: The comma-separated list of the storage media
+    Returns:
+        dict: The path of each storage medium keyed by its name, which is None for DEFAULT_STORAGE
+    """
+    storage_media = {}
+    for storage_medium in storage_media_list.split(","):
+        name, _, path = storage_medium.strip().partition("=")
+        if not name:
+            continue
+        if (name == DEFAULT_STORAGE) != (not path):
+            raise ValueError(f"Storage medium {storage_medium} must be {DEFAULT_STORAGE} or given as name=path")
+        storage_media[name] = os.path.abspath(path) if path else None
+    return storage_media
+
+def stage_on_storage(storage_path, relative_paths):
+    """Stages files of the suite on another storage medium, copying each to the staging directory on it under the same
+    relative path, unless an identical copy is already there.
+
+    Args:
+        storage_path: The path of a directory on the storage medium
+        relative_paths: The paths of the files to stage, relative to the suite directory
+    Returns:
+        str: The path of the staging directory on the storage medium
+    """
+    staging_path = os.path.join(storage_path, STORAGE_STAGING_DIR_NAME)
+    for relative_path in relative_paths:
+        source_path = os.path.join(SUITE_DIR, relative_path)
+        staged_path = os.path.join(staging_path, relative_path)
+        if os.path.exists(staged_path) and hash_file(staged_path) == hash_file(source_path):
+            continue
+        print(f"Staging {relative_path} in {staging_path}")
+        os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+        shutil.copyfile(source_path, staged_path)
+    return staging_path
+
+def parse_device_profiles(device_profiles_list):
+    """Parses the device profiles to emulate smaller edge devices with, each given as its name, the number of CPUs 
+    its CPU quota amounts to and the set of CPUs it is restricted to, either of which may be omitted, e.g. 
+    "small=1.5:0-1", "quota=2" or "pinned=:0,2", or as just DEFAULT_DEVICE for all of the device's CPUs.
+
+    Args:
+        device_profiles_list: The comma-separated list of the device profiles, within which the sets of CPUs are
+            separated by semicolons rather than commas if they list several ranges, e.g. "pinned=:0;2"
+    Returns:
+        dict: The CPU quota, as a number of CPUs, and the set of CPUs of each device profile keyed by its name, either 
+            of which is None if it is not restricted, or None itself for DEFAULT_DEVICE
+    """
+    device_profiles = {}
+    for device_profile in device_profiles_list.split(","):
+        name, _, restrictions = device_profile.strip().partition("=")
+        if not name:
+            continue
+        cpus, _, cpuset = restrictions.partition(":")
+        if (name == DEFAULT_DEVICE) != (not cpus and not cpuset):
+            raise ValueError(f"Device profile {device_profile} must be {DEFAULT_DEVICE} or given as name=cpus, "
+                + "name=cpus:cpuset or name=:cpuset")
+        if cpus and float(cpus) <= 0:
+            raise ValueError(f"The CPU quota of device profile {name} must be positive")
+        device_profiles[name] = None if name == DEFAULT_DEVICE else \
+            {"cpus": float(cpus) if cpus else None, "cpuset": cpuset.replace(";", ",") if cpuset else None}
+    return device_profiles
+
+def count_cpus_in_list(cpu_list):
+    """Counts the CPUs in a list of CPUs in the kernel's format, e.g. "0-1,3".
+
+    Args:
+        cpu_list: The list of CPUs
+    Returns:
+        int: The number of CPUs in the list
+    """
+    cpus = 0
+    for cpu_range in cpu_list.split(","):
+        first, _, last = cpu_range.strip().partition("-")
+        cpus += int(last) - int(first) + 1 if last else 1
+    return cpus
+
+def get_device_available_cpus(device_profile):
+    """Gets the number of CPUs a device profile leaves the workloads, which is the lower of its CPU quota and the
+    number of CPUs in its set of CPUs.
+
+    Args:
+        device_profile: The device profile, as returned by parse_device_profiles(), or None for all of the device's CPUs
+    Returns:
+        float: The number of CPUs available to the workloads
+    """
+    available_cpus = os.cpu_count()
+    if device_profile is not None:
+        if device_profile["cpuset"] is not None:
+            available_cpus = count_cpus_in_list(device_profile["cpuset"])
+        if device_profile["cpus"] is not None:
+            available_cpus = min(available_cpus, device_profile["cpus"])
+    return float(available_cpus)
+
+def write_device_profiles(device_profiles_path, device_profiles):
+    """Records the device profiles experiments were run under, alongside the number of CPUs each leaves the workloads,
+    so the results can be analyzed against it. The device profiles already recorded for the set are kept, unless
+    they are redefined.
+
+    Args:
+        device_profiles_path: The path of the file recording the set's device profiles
+        device_profiles: The device profiles, as returned by parse_device_profiles()
+    """
+    recorded_device_profiles = {}
+    if os.path.exists(device_profiles_path):
+        with open(device_profiles_path, "r") as f:
+            recorded_device_profiles = json.load(f)
+    for name, device_profile in device_profiles.items():
+        recorded_device_profiles[name] = {**(device_profile or {"cpus": None, "cpuset": None}), 
+            "available-cpus": get_device_available_cpus(device_profile)}
+    with open(device_profiles_path, "w") as f:
+        json.dump(recorded_device_profiles, f, indent=4)
+
+def get_experiment_device_profile(dimensions, device_profiles):
+    """Gets the device profile an experiment is run under.
+
+    Args:
+        dimensions: The values of the experiment's dimensions, one for each of DIMENSION_FIELD_NAMES
+        device_profiles: The device profiles, as returned by parse_device_profiles(), or None if only the default 
+            device profile is used
+    Returns:
+        dict: The device profile, or None for all of the device's CPUs
+    """
+    if device_profiles is None:
+        return None
+    return device_profiles[dict(zip(DIMENSION_FIELD_NAMES, dimensions))["device"]]
+
+def get_model_resolution(model):
+    """Gets the input resolution a model expects, first from the model manifest and otherwise from
+    the model's filename.
+
+    Args:
+        model: The filename of the model
+    Returns:
+        int: The height and width of the input the model expects
+    """
+    if os.path.exists(MODEL_MANIFEST_PATH):
+        with open(MODEL_MANIFEST_PATH, "r") as f:
+            manifest_entry = json.load(f).get("models", {}).get(model)
+        if manifest_entry is not None:
+            return manifest_entry["input_shape"][-1]
+
+    match = MODEL_RESOLUTION_PATTERN.search(model)
+    if match:
+        return int(match.group(1))
+
+    return DEFAULT_INPUT_RESOLUTION
+
+@harness_phase("thermal-read")
+def read_thermal_state():
+    """Reads the device's current thermal state, i.e. its temperature, CPU frequency and throttling state.
+
+    Returns:
+        dict: The hottest thermal zone's temperature in degrees Celsius, the mean CPU frequency in MHz, the
+            Raspberry Pi's throttling flags and the total number of times cores were throttled on x86; each 
+            is None if the device does not expose it
+    """
+    temperatures = [value / 1000 for value in read_ints_from_files(THERMAL_ZONE_TEMP_GLOB)]
+    frequencies = [value / 1000 for value in read_ints_from_files(CPU_FREQ_GLOB)]
+    throttle_counts = read_ints_from_files(CORE_THROTTLE_COUNT_GLOB)
+
+    return {
+        "temperature": max(temperatures) if temperatures else None,
+        "frequency": round(sum(frequencies) / len(frequencies), 2) if frequencies else None,
+        "throttled-flags": read_throttled_flags(),
+        "throttle-count": sum(throttle_counts) if throttle_counts else None
+    }
+
+def read_ints_from_files(path_pattern):
+    """Reads the integers in the files matching a pattern, each containing a single integer as in sysfs.
+
+    Args:
+        path_pattern: The glob pattern of the files' paths
+    Returns:
+        list: The integers in the files, skipping files that cannot be read, e.g. thermal zones whose sensor 
+            is disabled
+    """
+    values = []
+    for path in glob.glob(path_pattern):
+        try:
+            with open(path, "r") as f:
+                values.append(int(f.read().strip()))
+        except (OSError, ValueError):
+            continue
+    return values
+
+def read_throttled_flags():
+    """Reads the Raspberry Pi's throttling flags using vcgencmd.
+
+    Returns:
+        int: The throttling flags, or None if vcgencmd is not available
+    """
+    if shutil.which("vcgencmd") is None:
+        return None
+
+    try:
+        output = run_shell_cmd_and_get_stdout(VCGENCMD_GET_THROTTLED_CMD.split())
+    except subprocess.CalledProcessError:
+        return None
+
+    # The output is in the format "throttled=0x50000"
+    return int(output.strip().split("=")[1], 16)
+
+def get_trial_thermal_conditions(start_thermal_state, end_thermal_state):
+    """Gets the thermal conditions a trial ran under from the thermal states sampled at its start and end, as
+    they will be written in the results file.
+
+    Args:
+        start_thermal_state: The thermal state sampled at the start of the trial
+        end_thermal_state: The thermal state sampled at the end of the trial
+    Returns:
+        dict: The values of the THERMAL_FIELD_NAMES fields; throttled is 1 if the device was throttled at the
+            start or end of the trial or was throttled in between, 0 if not and None if this is unknown
+    """
+    start_flags = start_thermal_state["throttled-flags"]
+    end_flags = end_thermal_state["throttled-flags"]
+    start_count = start_thermal_state["throttle-count"]
+    end_count = end_thermal_state["throttle-count"]
+
+    if start_flags is not None and end_flags is not None:
+        # Bits that only became set during the trial indicate throttling that occurred in between samples
+        newly_occurred_flags = (end_flags & ~start_flags) & THROTTLED_OCCURRED_MASK
+        throttled = int(bool((start_flags | end_flags) & THROTTLED_NOW_MASK or newly_occurred_flags))
+    elif start_count is not None and end_count is not None:
+        throttled = int(end_count > start_count)
+    else:
+        throttled = None
+
+    return {
+        "start-temperature-celsius": start_thermal_state["temperature"],
+        "end-temperature-celsius": end_thermal_state["temperature"],
+        "start-cpu-frequency-mhz": start_thermal_state["frequency"],
+        "end-cpu-frequency-mhz": end_thermal_state["frequency"],
+        "throttled": throttled
+    }
+
+@harness_phase("cooldown-wait")
+def wait_for_cooldown(cooldown_temperature, cooldown_timeout):
+    """Waits until the device's temperature falls below a threshold, so a trial does not start while the device 
+    is still hot from the previous one.
+
+    Args:
+        cooldown_temperature: The temperature in degrees Celsius to wait for the device to fall below, or None
+            to not wait at all
+        cooldown_timeout: The maximum number of seconds to wait for, after which the trial is started anyway
+    """
+    if cooldown_temperature is None:
+        return
+
+    temperature = read_thermal_state()["temperature"]
+    if temperature is None or temperature < cooldown_temperature:
+        return
+
+    print(f"Waiting for the temperature to fall below {cooldown_temperature} C (currently {temperature} C)")
+    waited_time = 0
+    while temperature >= cooldown_temperature:
+        if waited_time >= cooldown_timeout:
+            print(f"Temperature still {temperature} C after {cooldown_timeout} seconds, starting the trial anyway")
+            return
+        time.sleep(COOLDOWN_POLL_INTERVAL)
+        waited_time += COOLDOWN_POLL_INTERVAL
+        temperature = read_thermal_state()["temperature"]
+
+def get_shuffled_experiments(n, experiment_cmds):
+    """Gets the experiments to run, with n trials of each experiment randomly interspersed.
+
+    Args:
+        n: The number of trials to run for each experiment
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple where
+            dimensions holds a value for each of DIMENSION_FIELD_NAMES, to the command(s) running it
+    Returns:
+        list: The experiments in the order they will be run
+    """
+    experiments = [experiment for experiment in experiment_cmds for _ in range(n)]
+    random.shuffle(experiments)
+    return experiments
+
+def describe_experiment(experiment):
+    """Describes an experiment in a human-readable way, for logging.
+
+    Args:
+        experiment: The experiment, as a (deployment_mechanism, dimensions) tuple
+    Returns:
+        str: The description of the experiment
+    """
+    deployment_mechanism, dimensions = experiment
+    dimensions_description = ", ".join(f"{name}={value}" for name, value in zip(DIMENSION_FIELD_NAMES, dimensions))
+    return f"{deployment_mechanism} ({dimensions_description})"
+
+def collect_time_data(n, results_filename, experiment_cmds, cooldown_temperature=None, cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT,
+    tdp_watts=None, drop_page_cache=False, device_profiles=None):
+    """Runs the time experiments and collects the relevant data from the output, storing it in the specified file.
+
+    Args:
+        n: The number of trials to run for each experiment
+        results_filename: The name of the file to store the results in
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+        tdp_watts: The thermal design power of the CPU in watts, used to estimate the energy consumed if RAPL is 
+            not available
+        drop_page_cache: Whether to drop the page cache before each trial
+        device_profiles: The device profiles the experiments' device dimension refers to, as returned by 
+            parse_device_profiles(), which the non-container mechanisms are run under; the Docker mechanisms' commands
+            restrict the container's CPUs themselves
+    """
+    time_metrics_short_names = [time_metric[1] for time_metric in TIME_METRICS] + ENERGY_FIELD_NAMES
+
+    # Randomly intersperse experiments of each type
+    experiments = get_shuffled_experiments(n, experiment_cmds)
+
+    # Keep track of trial number for each experiment
+    trial_numbers = {experiment: 1 for experiment in experiment_cmds}
+
+    metrics = []
+
+    # Noting that experiments contains experiments in the order they will be run
+    for experiment in experiments:
+        deployment_mechanism, dimensions = experiment
+        print(f"Starting {describe_experiment(experiment)} experiment")
+        start_time = datetime.now(timezone.utc)
+        trial_metrics = {}
+
+        trial = trial_numbers[experiment]
+        print(f"Trial {trial}")
+        trial_numbers[experiment] += 1
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=trial, attempt=attempt + 1) as attempt_span:
+                try:
+                    wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+                    if drop_page_cache:
+                        run_shell_cmd(DROP_PAGE_CACHE_CMD)
+                    start_thermal_state = read_thermal_state()
+                    if is_docker_mechanism(deployment_mechanism):
+                        container_exec_cmd, container_start_cmd = experiment_cmds[experiment]
+                        trial_metrics = run_time_experiment(container_start_cmd + " " + container_exec_cmd, tdp_watts)
+                        end_thermal_state = read_thermal_state()
+                        remove_container(CONTAINER_NAME)
+                    else:
+                        trial_metrics = run_time_experiment(experiment_cmds[experiment], tdp_watts, 
+                            get_experiment_device_profile(dimensions, device_profiles))
+                        end_thermal_state = read_thermal_state()
+                    trial_conditions = get_trial_thermal_conditions(start_thermal_state, end_thermal_state)
+                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, 
+                        trial_conditions, trial_metrics, time_metrics_short_names)
+                    metrics.extend(trial_metrics_rows)
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} trial {trial}, attempt {attempt + 1}: {e}")
+                    if is_docker_mechanism(deployment_mechanism):
+                        remove_container(CONTAINER_NAME)
+                    if attempt == MAX_RETRIES - 1:
+                        complete_harness_trial()
+                        break
+    
+    # Write the results into a CSV
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + THERMAL_FIELD_NAMES + time_metrics_short_names
+    write_metrics_to_csv(results_filename, field_names, metrics)
+
+def prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, trial_conditions, trial_metrics_sets, 
+    metric_names, allow_missing_metrics=False):
+    """Prepares the data of a trial, formatting it in a way allowing it to be written as a CSV row later.
+
+    Args:
+        deployment_mechanism: The deployment mechanism used for the trial
+        dimensions: The values of the experiment dimensions used for the trial, one for each of DIMENSION_FIELD_NAMES
+        trial: The trial number
+        start_time: The start time of the trial
+        trial_conditions: A dictionary of the conditions the trial ran under that are not metrics, such as the 
+            thermal state of the device, keyed by their field names
+        trial_metrics_sets: A list of tuples in format ("special_identifier", trial_metrics_set)
+            where trial_metrics_set is a list consisting of the trial metrics themselves. This format
+            is used so we can store different types of metrics for the same experiment type, e.g. for
+            container perf experiment we want to store one set of metrics for the container and another
+            for the Docker overhead
+        metric_names: The names of the metrics to include in the CSV row
+        allow_missing_metrics: Whether to allow missing metrics or not
+    Returns:
+        A list of dictionaries, each dictionary representing a row in the CSV file
+    """
+    trial_metrics_rows = []
+
+    for trial_metrics_set in trial_metrics_sets:
+        identifier = trial_metrics_set[0]
+        trial_metrics = trial_metrics_set[1]
+    
+        trial_metrics_row = {
+            "deployment-mechanism": deployment_mechanism + identifier,
+            "trial-number": trial,
+            "start-time": start_time.isoformat(),
+        }
+        trial_metrics_row.update(zip(DIMENSION_FIELD_NAMES, dimensions))
+        trial_metrics_row.update(trial_conditions)
+
+        for metric_name in metric_names:
+            # Only the Docker mechanisms' view including just the daemon's extra overhead has a baseline subtracted
+            if metric_name in DAEMON_BASELINE_VARIANCE_FIELD_NAME_SET:
+                trial_metrics_row[metric_name] = trial_metrics.get(metric_name)
+                continue
+            try:
+                trial_metrics_row[metric_name] = trial_metrics[metric_name]
+            except KeyError:
+                if not (metric_name in POSSIBLE_MISSING_METRICS and allow_missing_metrics):
+                    raise
+
+        trial_metrics_rows.append(trial_metrics_row)
+
+    return trial_metrics_rows
+
+@harness_phase("results-write")
+def write_metrics_to_csv(results_filename, field_names, metrics):
+    """Writes the metrics collected from the experiments to a CSV file.
+
+    Args:
+        results_filename: The name of the file to store the results in
+        field_names: The names of the fields to include in the CSV file
+        metrics: The metrics to write to the CSV file
+    """
+    with open(results_filename, "w", newline="") as csv_file:
+        print(f"Writing results to {results_filename}")
+        writer = csv.DictWriter(csv_file, fieldnames = field_names)
+        writer.writeheader()
+        writer.writerows(metrics)
+
+def run_time_experiment(cmd, tdp_watts=None, device_profile=None):
+    """Runs the time command on a given command and collects the time metrics from the output, as well as the
+    energy consumed while it ran.
+    
+    Args:
+        cmd: The command to run
+        tdp_watts: The thermal design power of the CPU in watts, used to estimate the energy consumed if RAPL is 
+            not available
+        device_profile: The device profile to run the command under, or None for all of the device's CPUs
+    Returns:
+        A list of tuples in format ("special_identifier", trial_metrics_set), where trial_metrics_set is a dictionary
+            containing the trial metrics themselves. This format is used and expected by other functions so we can store different types 
+            of metrics for the same experiment type, e.g. for container perf experiment we want to store one set of metrics for the 
+            container and another for the Docker overhead. However, in this case, the Docker mechanism's execution time is the same 
+            regardless of whether we consider the Docker overhead or not, so we will only have one set of metrics for each mechanism 
+            and no special identifier differentiating them
+    """
+    stop_cadvisor_and_prometheus_if_running()
+
+    # The time command runs inside the device profile's cgroup, so it only times the workload
+    with device_cgroup(device_profile) as exec_under_device_profile_cmd_prefix:
+        cmd = exec_under_device_profile_cmd_prefix + TIME_CMD_PREFIX.split() + cmd.split()
+        start_energy_counters = read_energy_counters()
+        with harness_span("workload"):
+            time_output = run_shell_cmd_and_get_stderr(cmd)
+        end_energy_counters = read_energy_counters()
+
+    metrics = parse_time_output(time_output)
+    metrics.update(get_energy_metrics(start_energy_counters, end_energy_counters, tdp_watts))
+
+    return [("", metrics)]
+
+def read_energy_counters():
+    """Reads the counters used to measure the energy consumed by the device: the RAPL energy counters of the
+    measured zones if available, and the total time the CPUs were busy for.
+
+    Returns:
+        dict: The energy in microjoules of each measured RAPL zone keyed by the zone's path, which is empty if
+            RAPL is not available, and the CPU seconds spent busy
+    """
+    return {
+        "rapl-energy-uj": dict(zip(get_rapl_zones(), read_sysfs_ints(
+            [os.path.join(zone, "energy_uj") for zone in get_rapl_zones()]))),
+        "busy-cpu-seconds": read_busy_cpu_seconds()
+    }
+
+def get_rapl_zones():
+    """Gets the RAPL powercap zones whose energy is measured, i.e. the package and DRAM zones.
+
+    Returns:
+        list: The paths of the zones' directories, which is empty if RAPL is not available
+    """
+    zones = []
+    for zone in sorted(glob.glob(POWERCAP_RAPL_ZONE_GLOB)):
+        try:
+            with open(os.path.join(zone, "name"), "r") as f:
+                name = f.read().strip()
+        except OSError:
+            continue
+        if RAPL_MEASURED_ZONE_NAME_PATTERN.match(name):
+            zones.append(zone)
+    return zones
+
+def read_sysfs_ints(paths):
+    """Reads the integers in the given sysfs files, using sudo if they are only readable by root, as is the
+    case for RAPL energy counters on recent kernels.
+
+    Args:
+        paths: The paths of the files
+    Returns:
+        list: The integers in the files, in the same order
+    """
+    if not paths:
+        return []
+
+    try:
+        values = []
+        for path in paths:
+            with open(path, "r") as f:
+                values.append(int(f.read().strip()))
+        return values
+    except PermissionError:
+        # Read all the files in a single command, so as little time as possible passes between reading each
+        output = run_shell_cmd_and_get_stdout(["sudo", "cat"] + paths)
+        return [int(value) for value in output.split()]
+
+def read_busy_cpu_seconds():
+    """Reads the total time all CPUs have spent busy, i.e. in any state besides idle and waiting for I/O.
+
+    Returns:
+        float: The busy time in CPU seconds
+    """
+    busy_ticks, _ = read_cpu_ticks()
+    return busy_ticks / CLOCK_TICKS_PER_SECOND
+
+def read_cpu_ticks():
+    """Reads the time all CPUs have spent busy and in total, in clock ticks.
+
+    Returns:
+        tuple: The busy and total clock ticks
+    """
+    with open(PROC_STAT_PATH, "r") as f:
+        # The first line aggregates all CPUs, in the format "cpu user nice system idle iowait irq softirq steal guest 
+        # guest_nice"; guest time is already included in user time, so it is not counted again
+        cpu_times = [int(value) for value in f.readline().split()[1:9]]
+
+    idle_ticks = cpu_times[3] + cpu_times[4]
+    return sum(cpu_times) - idle_ticks, sum(cpu_times)
+
+def get_energy_metrics(start_energy_counters, end_energy_counters, tdp_watts):
+    """Gets the energy consumed between two readings of the energy counters. This is measured using RAPL if available,
+    handling the counters wrapping around; otherwise, it is estimated by scaling the CPU's thermal design power by the
+    fraction of CPU time spent busy.
+
+    Args:
+        start_energy_counters: The energy counters read before the experiment
+        end_energy_counters: The energy counters read after the experiment
+        tdp_watts: The thermal design power of the CPU in watts, or None if it is not known
+    Returns:
+        dict: The values of the ENERGY_FIELD_NAMES fields, which are None if RAPL is not available and no thermal 
+            design power was given
+    """
+    start_rapl_energy = start_energy_counters["rapl-energy-uj"]
+    end_rapl_energy = end_energy_counters["rapl-energy-uj"]
+
+    if start_rapl_energy and start_rapl_energy.keys() == end_rapl_energy.keys():
+        max_energy_ranges = read_sysfs_ints([os.path.join(zone, "max_energy_range_uj") for zone in start_rapl_energy])
+        energy_uj = 0
+        for zone, max_energy_range in zip(start_rapl_energy, max_energy_ranges):
+            zone_energy_uj = end_rapl_energy[zone] - start_rapl_energy[zone]
+            # The counter wraps around to zero once it exceeds its maximum range
+            if zone_energy_uj < 0:
+                zone_energy_uj += max_energy_range + 1
+            energy_uj += zone_energy_uj
+        energy_joules = energy_uj / 1e6
+        energy_estimated = 0
+    elif tdp_watts is not None:
+        busy_cpu_seconds = end_energy_counters["busy-cpu-seconds"] - start_energy_counters["busy-cpu-seconds"]
+        energy_joules = busy_cpu_seconds / NUM_CORES * tdp_watts
+        energy_estimated = 1
+    else:
+        return {field_name: None for field_name in ENERGY_FIELD_NAMES}
+
+    return {
+        "energy-joules": round(energy_joules, 6),
+        "energy-per-inference": round(energy_joules / INFERENCES_PER_TRIAL, 6),
+        "energy-estimated": energy_estimated
+    }
+
+def parse_time_output(output):
+    """Parses the output of the time command and collects the time metrics from it.
+
+    Args:
+        output: The output of the time command
+    Returns:
+        A dictionary containing the time metrics
+    """
+    metrics = {}
+    for line in output.split("\n"):
+        for metric in TIME_METRICS:
+            metric_actual_name = metric[0]
+            metric_new_name = metric[1]
+
+            if metric_actual_name in line:
+                words = line.strip().split()
+                raw_value = words[-1]
+                
+                if metric_new_name == "wall-time-seconds":
+                    time_parts = raw_value.split(":")
+                    float_time_parts = [float(time_part) for time_part in time_parts]
+                    if len(time_parts) == 2: # m:ss format
+                        mins, seconds = float_time_parts
+                        value = mins * 60 + seconds
+                    elif len(time_parts) == 3: # h:mm:ss format
+                        hours, mins, seconds = float_time_parts
+                        value = hours * 3600 + mins * 60 + seconds
+
+                metrics[metric_new_name] = value
+
+    return metrics
+
+def collect_perf_data(n, results_filename, experiment_cmds, allow_missing_metrics, cooldown_temperature=None, 
+    cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT, memory_attribution=False, perf_counters=DEFAULT_PERF_COUNTERS,
+    perf_scheduling=PERF_SCHEDULING_PASSES, drop_page_cache=False, device_profiles=None):
+    """Runs the performance experiments (measuring performance metrics besides time) and collects the relevant data from Prometheus, 
+    storing it in the specified file. If the perf events do not all fit in the counters at once, the experiments are run in
+    passes, one per group of events, and the events each trial measured in every pass are merged into its row.
+
+    Args:
+        n: The number of trials to run for each experiment
+        results_filename: The name of the file to store the results in
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        allow_missing_metrics: Whether to allow missing metrics or not
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+        memory_attribution: Whether to also sample the memory attribution of the workload's processes
+        perf_counters: The number of programmable counters available for perf events
+        perf_scheduling: Whether to schedule groups of perf events that do not fit in the counters at once in passes or
+            to multiplex them, as one of PERF_SCHEDULING_PASSES and PERF_SCHEDULING_MULTIPLEX
+        drop_page_cache: Whether to drop the page cache before each trial
+        device_profiles: The device profiles the experiments' device dimension refers to, as returned by 
+            parse_device_profiles(), which the non-container mechanisms are run under; the Docker mechanisms' commands
+            restrict the container's CPUs themselves
+    """
+    metric_names = PERF_EVENTS + MEMORY_FIELD_NAMES + CPU_FIELD_NAMES + [CPU_USAGE_SECONDS_FIELD_NAME] + IO_FIELD_NAMES
+    if memory_attribution:
+        metric_names = metric_names + MEMORY_ATTRIBUTION_FIELD_NAMES
+    metric_names = metric_names + PERF_SCALING_RATIO_FIELD_NAMES + DAEMON_BASELINE_VARIANCE_FIELD_NAMES
+
+    perf_passes = get_perf_passes(perf_counters, perf_scheduling)
+    # The run only expects the trials of a single pass
+    add_expected_harness_trials((len(perf_passes) - 1) * n * len(experiment_cmds))
+
+    # The Docker daemon's baseline is sampled in the background between the Docker trials of every pass, which is 
+    # only needed if there are any
+    sample_daemon_baseline = any(is_docker_mechanism(experiment[0]) for experiment in experiment_cmds)
+
+    metrics = []
+    with daemon_baseline_sampling(sample_daemon_baseline):
+        for pass_number, perf_pass in enumerate(perf_passes, start=1):
+            pass_events = [event for group in perf_pass for event in group]
+            print(f"Starting perf pass {pass_number} of {len(perf_passes)}, measuring {'; '.join(', '.join(group) for group in perf_pass)}")
+            # The daemon's baseline is not sampled while cAdvisor restarts with the pass's config, and only the windows
+            # sampled since count towards the pass's perf events
+            with daemon_baseline_paused():
+                use_perf_pass_config(pass_number, perf_pass)
+                if sample_daemon_baseline:
+                    start_cadvisor_and_prometheus_if_not_running()
+                    start_daemon_baseline_pass()
+
+            # The metrics besides the perf events are only measured in the first pass, which the later ones add their events to
+            pass_metric_names = pass_events + [f"{event}-scaling-ratio" for event in pass_events] \
+                + [f"{event}-baseline-variance" for event in pass_events]
+            if pass_number == 1:
+                pass_metric_names = [metric_name for metric_name in metric_names if metric_name not in PERF_EVENTS 
+                    + PERF_SCALING_RATIO_FIELD_NAMES + [f"{event}-baseline-variance" for event in PERF_EVENTS]] + pass_metric_names
+                metrics = run_perf_pass(n, experiment_cmds, pass_metric_names, allow_missing_metrics, cooldown_temperature, 
+                    cooldown_timeout, memory_attribution, drop_page_cache, device_profiles)
+            else:
+                pass_metrics = run_perf_pass(n, experiment_cmds, pass_metric_names, allow_missing_metrics, cooldown_temperature, 
+                    cooldown_timeout, drop_page_cache=drop_page_cache, device_profiles=device_profiles)
+                merge_perf_pass_metrics(metrics, pass_metrics, pass_metric_names)
+
+    # Write the results into a CSV
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + THERMAL_FIELD_NAMES + metric_names
+    write_metrics_to_csv(results_filename, field_names, metrics)
+
+    stop_cadvisor_and_prometheus_if_running()
+
+def run_perf_pass(n, experiment_cmds, metric_names, allow_missing_metrics, cooldown_temperature=None, 
+    cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT, memory_attribution=False, drop_page_cache=False, device_profiles=None):
+    """Runs a pass of the performance experiments, with cAdvisor measuring the perf events of the pass.
+
+    Args:
+        n: The number of trials to run for each experiment
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        metric_names: The names of the metrics measured in the pass
+        allow_missing_metrics: Whether to allow missing metrics or not
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+        memory_attribution: Whether to also sample the memory attribution of the workload's processes
+        drop_page_cache: Whether to drop the page cache before each trial
+        device_profiles: The device profiles the experiments' device dimension refers to, as returned by 
+            parse_device_profiles(), which the non-container mechanisms are run under
+    Returns:
+        A list of dictionaries, each representing a row in the CSV file
+    """
+    # Randomly intersperse experiments of each type
+    experiments = get_shuffled_experiments(n, experiment_cmds)
+
+    # Keep track of trial number for each experiment
+    trial_numbers = {experiment: 1 for experiment in experiment_cmds}
+
+    metrics = []
+
+    # The device is cooled down and its thermal state sampled just before each workload starts, after the waits for 
+    # cAdvisor, Prometheus and the daemon's baseline, so they describe the device as the workload found it
+    thermal_states = {}
+    def prepare_workload():
+        wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+        if drop_page_cache:
+            run_shell_cmd(DROP_PAGE_CACHE_CMD)
+        thermal_states["start"] = read_thermal_state()
+
+    for experiment in experiments:
+        deployment_mechanism, dimensions = experiment
+        print(f"Starting {describe_experiment(experiment)} experiment")
+        start_time = datetime.now(timezone.utc)
+        trial_metrics = {}
+
+        trial = trial_numbers[experiment]
+        print(f"Trial {trial}")
+        trial_numbers[experiment] += 1
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=trial, attempt=attempt + 1) as attempt_span:
+                try:
+                    if is_docker_mechanism(deployment_mechanism):
+                        container_exec_cmd, container_start_cmd = experiment_cmds[experiment]
+                        wait_for_daemon_baseline()
+                        with daemon_baseline_paused():
+                            trial_metrics = run_container_perf_experiment(container_exec_cmd, container_start_cmd, 
+                                memory_attribution, prepare_workload)
+                            end_thermal_state = read_thermal_state()
+                            remove_container_and_its_prometheus_data(CONTAINER_NAME)
+                    else:
+                        trial_metrics = run_non_container_perf_experiment(experiment_cmds[experiment], memory_attribution,
+                            get_experiment_device_profile(dimensions, device_profiles), prepare_workload)
+                        end_thermal_state = read_thermal_state()
+                    trial_conditions = get_trial_thermal_conditions(thermal_states["start"], end_thermal_state)
+                    trial_metrics_row = prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, 
+                        trial_conditions, trial_metrics, metric_names, allow_missing_metrics)
+                    metrics.extend(trial_metrics_row)
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} trial {trial}, attempt {attempt + 1}: {e}")
+                    if is_docker_mechanism(deployment_mechanism):
+                        with daemon_baseline_paused():
+                            remove_container(CONTAINER_NAME)
+                    else:
+                        cleanup_custom_cgroup(get_experiment_device_profile(dimensions, device_profiles))
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+    
+    return metrics
+
+def get_perf_event_groups(perf_counters):
+    """Partitions the perf events counted by the CPU's programmable counters into as few groups as possible that each 
+    fit in the counters, keeping the groups the config lists and the events of each ratio pair together.
+
+    Args:
+        perf_counters: The number of programmable counters available
+    Returns:
+        list: The groups, each a list of events
+    """
+    def count_counters(events):
+        return sum(event not in PERF_SOFTWARE_EVENTS for event in events)
+
+    units = [list(group) for group in PERF_EVENT_CONFIG_GROUPS if count_counters(group) > 0]
+    for ratio_pair in PERF_EVENT_RATIO_PAIRS:
+        pair_units = [unit for unit in units if any(event in unit for event in ratio_pair)]
+        if len(pair_units) == 2 and count_counters(pair_units[0] + pair_units[1]) <= perf_counters:
+            units[units.index(pair_units[0])] = pair_units[0] + pair_units[1]
+            units.remove(pair_units[1])
+
+    # Place the largest units first, each in the first group it fits in, which keeps the order of the config otherwise
+    groups = []
+    for unit in sorted(units, key=count_counters, reverse=True):
+        if count_counters(unit) > perf_counters:
+            print(f"Warning: the perf events {', '.join(unit)} need more than {perf_counters} counters, so will be multiplexed")
+        for group in groups:
+            if count_counters(group + unit) <= perf_counters:
+                group.extend(unit)
+                break
+        else:
+            groups.append(unit)
+    return groups
+
+def get_perf_passes(perf_counters, perf_scheduling):
+    """Gets the passes the perf experiments are run in, each measuring some groups of perf events. The events counted by
+    the kernel are measured in the first pass, since they never contend for counters.
+
+    Args:
+        perf_counters: The number of programmable counters available
+        perf_scheduling: Whether to schedule groups of perf events that do not fit in the counters at once in passes or
+            to multiplex them, as one of PERF_SCHEDULING_PASSES and PERF_SCHEDULING_MULTIPLEX
+    Returns:
+        list: The passes, each a list of the groups of events it measures
+    """
+    hardware_groups = get_perf_event_groups(perf_counters)
+    software_events = [event for group in PERF_EVENT_CONFIG_GROUPS if all(event in PERF_SOFTWARE_EVENTS for event in group) 
+        for event in group]
+    software_groups = [software_events] if software_events else []
+
+    if perf_scheduling == PERF_SCHEDULING_MULTIPLEX or len(hardware_groups) <= 1:
+        return [hardware_groups + software_groups]
+    return [[group] + (software_groups if index == 0 else []) for index, group in enumerate(hardware_groups)]
+
+def use_perf_pass_config(pass_number, perf_pass):
+    """Writes the cAdvisor perf events config of a pass, with its groups of events, and has cAdvisor use it, restarting
+    it if it is running with another config.
+
+    Args:
+        pass_number: The number of the pass
+        perf_pass: The groups of events the pass measures
+    """
+    global cadvisor_perf_config_path
+    with open(CADVISOR_PERF_CONFIG_PATH, "r") as f:
+        config = json.load(f)
+    config["core"]["events"] = perf_pass
+
+    pass_config_path = CADVISOR_PASS_PERF_CONFIG_PATH_TEMPLATE.format(pass_number=pass_number)
+    with open(pass_config_path, "w") as f:
+        json.dump(config, f, indent=4)
+
+    if pass_config_path != cadvisor_perf_config_path:
+        stop_cadvisor_and_prometheus_if_running()
+        cadvisor_perf_config_path = pass_config_path
+
+def merge_perf_pass_metrics(metrics, pass_metrics, pass_metric_names):
+    """Merges the perf events measured by each trial in a later pass into the trial's row from the first pass.
+
+    Args:
+        metrics: The rows of the first pass, which are updated
+        pass_metrics: The rows of the later pass
+        pass_metric_names: The names of the metrics measured in the later pass
+    """
+    def get_row_key(row):
+        return (row["deployment-mechanism"], tuple(row[dimension] for dimension in DIMENSION_FIELD_NAMES), row["trial-number"])
+
+    rows = {get_row_key(row): row for row in metrics}
+    for pass_row in pass_metrics:
+        rows[get_row_key(pass_row)].update({metric_name: pass_row[metric_name] for metric_name in pass_metric_names 
+            if metric_name in pass_row})
+
+def collect_density_data(n, results_filename, experiment_cmds, instance_counts, cooldown_temperature=None, 
+    cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT):
+    """Runs the density experiments, in which several instances of an experiment's command are run concurrently, and
+    collects the latency, throughput, memory and CPU metrics of each trial, storing them in the specified file.
+
+    Args:
+        n: The number of trials to run for each experiment and instance count
+        results_filename: The name of the file to store the results in
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        instance_counts: The numbers of concurrent instances to run
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+    """
+    # Randomly intersperse experiments of each type and instance count
+    experiments = [(experiment, instances) for experiment in experiment_cmds for instances in instance_counts for _ in range(n)]
+    random.shuffle(experiments)
+
+    # Keep track of trial number for each experiment and instance count
+    trial_numbers = {density_experiment: 1 for density_experiment in set(experiments)}
+
+    metrics = []
+
+    for density_experiment in experiments:
+        experiment, instances = density_experiment
+        deployment_mechanism, dimensions = experiment
+        print(f"Starting {describe_experiment(experiment)} experiment with {instances} instances")
+        start_time = datetime.now(timezone.utc)
+
+        trial = trial_numbers[density_experiment]
+        print(f"Trial {trial}")
+        trial_numbers[density_experiment] += 1
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=trial, attempt=attempt + 1) as attempt_span:
+                try:
+                    wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+                    start_thermal_state = read_thermal_state()
+                    trial_metrics = run_density_experiment(deployment_mechanism, experiment_cmds[experiment], instances)
+                    end_thermal_state = read_thermal_state()
+                    trial_conditions = {"instances": instances}
+                    trial_conditions.update(get_trial_thermal_conditions(start_thermal_state, end_thermal_state))
+                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, 
+                        trial_conditions, trial_metrics, DENSITY_FIELD_NAMES)
+                    metrics.extend(trial_metrics_rows)
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} trial {trial} with {instances} instances, attempt {attempt + 1}: {e}")
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+
+    # Write the results into a CSV
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + ["instances"] + THERMAL_FIELD_NAMES + DENSITY_FIELD_NAMES
+    write_metrics_to_csv(results_filename, field_names, metrics)
+
+@harness_phase("workload")
+def run_density_experiment(deployment_mechanism, cmd, instances):
+    """Runs a density experiment, starting several instances of a deployment mechanism's command at the same time, each
+    in its own container or cgroup, and sampling their memory usage and the CPU utilization until they all finish.
+
+    Args:
+        deployment_mechanism: The deployment mechanism used for the experiment
+        cmd: The command running the workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        instances: The number of instances to run concurrently
+    Returns:
+        A list of tuples in format ("special_identifier", trial_metrics_set), where trial_metrics_set is a dictionary
+            containing the trial metrics themselves, as expected by prepare_trial_data_as_csv_rows(). There is only one 
+            set of metrics, since the Docker daemon's overhead is not separated in density experiments
+    """
+    stop_cadvisor_and_prometheus_if_running()
+
+    if is_docker_mechanism(deployment_mechanism):
+        container_exec_cmd, container_start_cmd = cmd
+        container_names = [f"{CONTAINER_NAME}-{instance}" for instance in range(instances)]
+        cgroup_names = []
+        instance_cmds = [get_container_start_cmd_with_name(container_start_cmd, container_name).split() + container_exec_cmd.split()
+            for container_name in container_names]
+    else:
+        container_names = []
+        cgroup_names = [f"{CUSTOM_CGROUP_NAME}-{instance}" for instance in range(instances)]
+        for cgroup_name in cgroup_names:
+            with harness_span("cgroup-create"):
+                run_shell_cmd(CREATE_CGROUP_CMD_TEMPLATE.format(cgroup_name=cgroup_name).split())
+        instance_cmds = [EXEC_IN_CGROUP_CMD_PREFIX_TEMPLATE.format(cgroup_name=cgroup_name).split() + cmd.split()
+            for cgroup_name in cgroup_names]
+
+    try:
+        max_total_rss = 0
+        max_total_pss = 0
+        max_cpu_utilization = 0
+
+        # Every instance waits on the barrier before starting, so they all start as close together as possible
+        barrier = threading.Barrier(instances)
+        start_busy_ticks, start_total_ticks = read_cpu_ticks()
+        previous_busy_ticks, previous_total_ticks = start_busy_ticks, start_total_ticks
+
+        with ThreadPoolExecutor(max_workers=instances) as executor:
+            futures = [executor.submit(run_instance, instance_cmd, barrier) for instance_cmd in instance_cmds]
+
+            # Sample until every instance has finished; note that peaks between samples may be missed
+            while not all(future.done() for future in futures):
+                time.sleep(DENSITY_SAMPLE_INTERVAL)
+
+                total_rss, total_pss = read_memory_of_pids(get_density_instance_pids(deployment_mechanism, cgroup_names))
+                max_total_rss = max(max_total_rss, total_rss)
+                max_total_pss = max(max_total_pss, total_pss)
+
+                busy_ticks, total_ticks = read_cpu_ticks()
+                if total_ticks > previous_total_ticks:
+                    cpu_utilization = 100 * (busy_ticks - previous_busy_ticks) / (total_ticks - previous_total_ticks)
+                    max_cpu_utilization = max(max_cpu_utilization, cpu_utilization)
+                previous_busy_ticks, previous_total_ticks = busy_ticks, total_ticks
+
+            # This raises the exception of any instance that failed
+            instance_times = [future.result() for future in futures]
+
+        end_busy_ticks, end_total_ticks = read_cpu_ticks()
+    finally:
+        for container_name in container_names:
+            remove_container(container_name)
+        for cgroup_name in cgroup_names:
+            if cgroup_exists(cgroup_name):
+                with harness_span("cgroup-delete"):
+                    run_shell_cmd(DELETE_CGROUP_CMD_TEMPLATE.format(cgroup_name=cgroup_name).split())
+
+    latencies = [end - start for start, end in instance_times]
+    makespan = max(end for _, end in instance_times) - min(start for start, _ in instance_times)
+
+    metrics = {
+        "min-instance-latency-seconds": round(min(latencies), 4),
+        "mean-instance-latency-seconds": round(sum(latencies) / instances, 4),
+        "max-instance-latency-seconds": round(max(latencies), 4),
+        "makespan-seconds": round(makespan, 4),
+        "throughput-inferences-per-second": round(instances * INFERENCES_PER_TRIAL / makespan, 4),
+        "max-total-rss-bytes": max_total_rss,
+        "max-total-pss-bytes": max_total_pss,
+        "max-pss-per-instance-bytes": round(max_total_pss / instances),
+        "cpu-utilization-percentage": round(100 * (end_busy_ticks - start_busy_ticks) / max(1, end_total_ticks - start_total_ticks), 2),
+        "max-cpu-utilization-percentage": round(max_cpu_utilization, 2)
+    }
+
+    return [("", metrics)]
+
+def run_instance(cmd, barrier):
+    """Runs a single instance of a density experiment once every other instance is ready to start.
+
+    Args:
+        cmd: The command to run, as a list
+        barrier: The barrier shared by all the instances of the experiment
+    Returns:
+        tuple: The monotonic times at which the instance started and finished
+    """
+    barrier.wait()
+    start = time.monotonic()
+    run_shell_cmd(cmd)
+    return start, time.monotonic()
+
+def get_container_start_cmd_with_name(container_start_cmd, container_name):
+    """Gets the command to start a container under a different name than the one used for standard experiments.
+
+    Args:
+        container_start_cmd: The command to start the container, under the name CONTAINER_NAME
+        container_name: The name to give the container instead
+    Returns:
+        str: The command to start the container under the given name
+    """
+    return container_start_cmd.replace(f"--name {CONTAINER_NAME}", f"--name {container_name}")
+
+def get_density_instance_pids(deployment_mechanism, cgroup_names):
+    """Gets the IDs of the processes belonging to the instances of a density experiment that are currently running.
+
+    Args:
+        deployment_mechanism: The deployment mechanism used for the experiment
+        cgroup_names: The names of the instances' cgroups, for non-container mechanisms
+    Returns:
+        list: The process IDs
+    """
+    if is_docker_mechanism(deployment_mechanism):
+        # Only the benchmarked containers are expected to be running, so include the processes of every container 
+        # as well as each container's shim, which is part of the per-container overhead
+        procs_paths = glob.glob(DOCKER_CGROUP_PROCS_GLOB_V2 if is_cgroup_v2() else DOCKER_CGROUP_PROCS_GLOB_V1)
+        pids = get_pids_by_process_name_prefix(DOCKER_SHIM_PROCESS_NAME_PREFIX)
+    else:
+        procs_paths = [f"/sys/fs/cgroup/{cgroup_name}/cgroup.procs" if is_cgroup_v2() else f"/sys/fs/cgroup/memory/{cgroup_name}/cgroup.procs"
+            for cgroup_name in cgroup_names]
+        pids = []
+
+    for procs_path in procs_paths:
+        try:
+            with open(procs_path, "r") as f:
+                pids.extend(int(pid) for pid in f.read().split())
+        except OSError:
+            # The cgroup may be removed as soon as its instance finishes
+            continue
+
+    return pids
+
+def get_pids_by_process_name_prefix(prefix):
+    """Gets the IDs of the processes whose name starts with a given prefix.
+
+    Args:
+        prefix: The prefix of the processes' names
+    Returns:
+        list: The process IDs
+    """
+    pids = []
+    for comm_path in glob.glob("/proc/[0-9]*/comm"):
+        try:
+            with open(comm_path, "r") as f:
+                if f.read().startswith(prefix):
+                    pids.append(int(comm_path.split("/")[2]))
+        except OSError:
+            continue
+    return pids
+
+def read_memory_of_pids(pids):
+    """Reads the total resident set size and proportional set size of the given processes from their smaps_rollup files.
+    Unlike the resident set size, the proportional set size divides each page shared between processes among them, so 
+    its total across processes counts shared pages, such as those of shared libraries, only once.
+
+    Args:
+        pids: The process IDs
+    Returns:
+        tuple: The total resident set size and proportional set size in bytes
+    """
+    if not pids:
+        return 0, 0
+
+    # The processes may be owned by root, so read the files using sudo; the exit code is ignored since processes
+    # may exit before their files are read
+    cmd = ["sudo", "grep", "-H", "-s", "-E", "^(Rss|Pss):"] + [f"/proc/{pid}/smaps_rollup" for pid in pids]
+    output = subprocess.run(cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout
+
+    totals = {"Rss": 0, "Pss": 0}
+    for line in output.splitlines():
+        # Each line is in the format "/proc/<pid>/smaps_rollup:Rss:    1234 kB"
+        _, key, value = line.split(":", 2)
+        totals[key] += int(value.split()[0]) * 1024
+
+    return totals["Rss"], totals["Pss"]
+
+def collect_image_data(n, results_filename, experiment_cmds, arch, cooldown_temperature=None, 
+    cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT):
+    """Runs the image experiments, which characterize the image of each Docker mechanism by reloading it from its
+    tar file and starting its first container, storing the results in the specified file. Experiments of
+    non-container mechanisms are skipped.
+
+    Args:
+        n: The number of trials to run for each experiment
+        results_filename: The name of the file to store the results in
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for Docker mechanisms, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        arch: The architecture of the target device, which the images were built for
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+    """
+    image_experiment_cmds = {experiment: cmd for experiment, cmd in experiment_cmds.items() if is_docker_mechanism(experiment[0])}
+    experiments = get_shuffled_experiments(n, image_experiment_cmds)
+    trial_numbers = {experiment: 1 for experiment in image_experiment_cmds}
+
+    metrics = []
+
+    for experiment in experiments:
+        deployment_mechanism, dimensions = experiment
+        print(f"Starting {describe_experiment(experiment)} image experiment")
+        start_time = datetime.now(timezone.utc)
+
+        trial = trial_numbers[experiment]
+        print(f"Trial {trial}")
+        trial_numbers[experiment] += 1
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=trial, attempt=attempt + 1) as attempt_span:
+                try:
+                    wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+                    start_thermal_state = read_thermal_state()
+                    trial_metrics = run_image_experiment(deployment_mechanism, image_experiment_cmds[experiment], arch)
+                    end_thermal_state = read_thermal_state()
+                    trial_conditions = get_trial_thermal_conditions(start_thermal_state, end_thermal_state)
+                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, 
+                        trial_conditions, trial_metrics, IMAGE_FIELD_NAMES)
+                    metrics.extend(trial_metrics_rows)
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} trial {trial}, attempt {attempt + 1}: {e}")
+                    remove_container(CONTAINER_NAME)
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+
+    # Write the results into a CSV
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + THERMAL_FIELD_NAMES + IMAGE_FIELD_NAMES
+    write_metrics_to_csv(results_filename, field_names, metrics)
+
+@harness_phase("workload")
+def run_image_experiment(deployment_mechanism, cmd, arch):
+    """Runs an image experiment, removing a Docker mechanism's image and loading it again from its tar file, then
+    dropping the page cache and running its workload in a first container, so its layers are read from storage.
+
+    Args:
+        deployment_mechanism: The Docker mechanism used for the experiment
+        cmd: A tuple of the command to execute the workload in the container and the command to start the container
+        arch: The architecture of the target device, which the image was built for
+    Returns:
+        A list of tuples in format ("special_identifier", trial_metrics_set), as expected by prepare_trial_data_as_csv_rows(),
+            with only one set of metrics
+    """
+    stop_cadvisor_and_prometheus_if_running()
+
+    container_exec_cmd, container_start_cmd = cmd
+    img_name = get_docker_image_name(deployment_mechanism, arch)
+
+    run_shell_cmd(DOCKER_IMAGE_REMOVE_CMD.format(img_name=img_name).split())
+    load_start = time.monotonic()
+    run_shell_cmd(DOCKER_IMAGE_LOAD_CMD.format(tar_path=get_docker_image_tar_path(deployment_mechanism, arch)).split())
+    load_seconds = time.monotonic() - load_start
+
+    # As for the container's ID, strip the single quotes from the output
+    image_size = int(run_shell_cmd_and_get_stdout(DOCKER_IMAGE_INSPECT_SIZE_CMD.format(img_name=img_name).split()).strip().strip("'"))
+    image_layers = int(run_shell_cmd_and_get_stdout(DOCKER_IMAGE_INSPECT_LAYERS_CMD + [img_name]).strip())
+
+    run_shell_cmd(DROP_PAGE_CACHE_CMD)
+    run_start_time = datetime.now(timezone.utc)
+    run_start = time.monotonic()
+    run_shell_cmd(container_start_cmd.split() + container_exec_cmd.split())
+    first_run_seconds = time.monotonic() - run_start
+
+    # The time the container started running is recorded by Docker in RFC 3339 format with nanoseconds, which
+    # is truncated to microseconds so it can be parsed
+    started_at = run_shell_cmd_and_get_stdout(
+        CONTAINER_INSPECT_STARTED_AT_CMD.format(container_name=CONTAINER_NAME).split()).strip().strip("'")
+    started_at = re.sub(r"(\.\d{6})\d*", r"\1", started_at).replace("Z", "+00:00")
+    start_latency_seconds = (datetime.fromisoformat(started_at) - run_start_time).total_seconds()
+    remove_container(CONTAINER_NAME)
+
+    metrics = {
+        "image-size-bytes": image_size,
+        "image-layers": image_layers,
+        "load-seconds": round(load_seconds, 4),
+        "start-latency-seconds": round(start_latency_seconds, 4),
+        "first-run-seconds": round(first_run_seconds, 4)
+    }
+
+    return [("", metrics)]
+
+def collect_profile_data(results_filename, experiment_cmds, frequency=DEFAULT_PROFILE_FREQUENCY, cooldown_temperature=None, 
+    cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT):
+    """Runs the profile experiments, which sample the call stacks of a designated trial of each experiment with perf,
+    after PROFILE_WARMUP_RUNS unprofiled runs, and stores the folded call stacks in the specified file.
+
+    Args:
+        results_filename: The name of the file to store the results in
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for Docker mechanisms, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        frequency: The number of times per second to sample the call stacks
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+    """
+    stop_cadvisor_and_prometheus_if_running()
+    experiments = get_shuffled_experiments(1, experiment_cmds)
+
+    metrics = []
+
+    for experiment in experiments:
+        deployment_mechanism, dimensions = experiment
+        print(f"Starting {describe_experiment(experiment)} profile experiment")
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=1, attempt=attempt + 1) as attempt_span:
+                try:
+                    cmd = experiment_cmds[experiment]
+                    for _ in range(PROFILE_WARMUP_RUNS):
+                        if is_docker_mechanism(deployment_mechanism):
+                            container_exec_cmd, container_start_cmd = cmd
+                            run_shell_cmd(container_start_cmd.split() + container_exec_cmd.split())
+                            remove_container(CONTAINER_NAME)
+                        else:
+                            run_shell_cmd(cmd.split())
+
+                    wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+                    start_time = datetime.now(timezone.utc)
+                    stack_samples = run_profile_experiment(deployment_mechanism, cmd, frequency)
+                    for stack, samples in sorted(stack_samples.items()):
+                        row = {"deployment-mechanism": deployment_mechanism, "trial-number": 1, 
+                            "start-time": start_time.isoformat(), "stack": stack, "samples": samples}
+                        row.update(zip(DIMENSION_FIELD_NAMES, dimensions))
+                        metrics.append(row)
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} profile, attempt {attempt + 1}: {e}")
+                    if is_docker_mechanism(deployment_mechanism):
+                        remove_container(CONTAINER_NAME)
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+
+    # Write the results into a CSV
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + PROFILE_FIELD_NAMES
+    write_metrics_to_csv(results_filename, field_names, metrics)
+
+@harness_phase("workload")
+def run_profile_experiment(deployment_mechanism, cmd, frequency):
+    """Runs a profile experiment, recording the call stacks of the workload with perf. For Docker mechanisms, the whole
+    system is profiled while the container runs, so the samples of the daemon and the container's shim are included.
+
+    Args:
+        deployment_mechanism: The deployment mechanism used for the experiment
+        cmd: The command to run for the experiment; for Docker mechanisms, a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        frequency: The number of times per second to sample the call stacks
+    Returns:
+        dict: The number of samples taken in each call stack, keyed by the stack in the folded format
+    """
+    if is_docker_mechanism(deployment_mechanism):
+        container_exec_cmd, container_start_cmd = cmd
+        run_shell_cmd(PERF_RECORD_SYSTEM_WIDE_CMD_TEMPLATE.format(frequency=frequency, output_path=PERF_DATA_PATH).split()
+            + container_start_cmd.split() + container_exec_cmd.split())
+        remove_container(CONTAINER_NAME)
+    else:
+        run_shell_cmd(PERF_RECORD_CMD_TEMPLATE.format(frequency=frequency, output_path=PERF_DATA_PATH).split() + cmd.split())
+
+    output = run_shell_cmd_and_get_stdout(PERF_SCRIPT_CMD_TEMPLATE.format(input_path=PERF_DATA_PATH).split())
+    run_shell_cmd(["sudo", "rm", "-f", PERF_DATA_PATH])
+    return parse_perf_script_output(output)
+
+def parse_perf_script_output(output):
+    """Parses the samples printed by perf script into folded call stacks, as done by the stackcollapse-perf.pl script 
+    of the FlameGraph project (https://github.com/brendangregg/FlameGraph).
+
+    Args:
+        output: The output of perf script, with each sample's process name on a line of its own followed by a line
+            for each frame of its call stack, from the sampled function up, and a blank line
+    Returns:
+        dict: The number of samples taken in each call stack, keyed by the stack in the folded format
+    """
+    stack_samples = {}
+    process_name = None
+    frames = []
+
+    for line in output.splitlines() + [""]:
+        if not line.strip():
+            # The end of a sample; samples of idle CPUs are left out
+            if process_name is not None and process_name not in PROFILE_IGNORED_PROCESS_NAMES:
+                # Semicolons separate the frames, so they cannot appear within a frame
+                stack = ";".join([process_name] + [frame.replace(";", ":") for frame in reversed(frames)])
+                stack_samples[stack] = stack_samples.get(stack, 0) + 1
+            process_name = None
+            frames = []
+        elif process_name is None:
+            process_name = line.strip().replace(" ", "_")
+        else:
+            # Each frame is the address of the instruction followed by the function, or "[unknown]" if it has no symbol
+            fields = line.strip().split(maxsplit=1)
+            frames.append(fields[1] if len(fields) > 1 else fields[0])
+
+    return stack_samples
+
+def collect_memory_data(n, results_filename, search_results_filename, experiment_cmds, memory_limits=None, 
+    search_resolution=DEFAULT_MEMORY_SEARCH_RESOLUTION_MIB * BYTES_PER_MIB, max_slowdown=DEFAULT_MEMORY_MAX_SLOWDOWN,
+    cooldown_temperature=None, cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT):
+    """Runs the memory experiments, which first search the minimum viable memory of each experiment and then run its
+    workload under each of a set of memory limits, storing the results of the searches and of the trials under each
+    limit in the specified files.
+
+    Args:
+        n: The number of trials to run for each experiment and memory limit
+        results_filename: The name of the file to store the results of the trials under each limit in
+        search_results_filename: The name of the file to store the results of the searches in
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for Docker mechanisms, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        memory_limits: The memory limits to sweep in bytes, where UNLIMITED_MEMORY runs without a limit, or None to 
+            sweep the MEMORY_SWEEP_FACTORS multiples of each experiment's minimum viable memory and no limit
+        search_resolution: The resolution in bytes to search the minimum viable memory to
+        max_slowdown: The factor by which the workload may slow down relative to running without a limit while still
+            counting as viable
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
+    """
+    stop_cadvisor_and_prometheus_if_running()
+
+    search_metrics = []
+    experiment_memory_limits = {}
+
+    for experiment in get_shuffled_experiments(1, experiment_cmds):
+        deployment_mechanism, dimensions = experiment
+        print(f"Searching the minimum viable memory of the {describe_experiment(experiment)} experiment")
+        start_time = datetime.now(timezone.utc)
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=1, attempt=attempt + 1) as attempt_span:
+                try:
+                    search = search_minimum_viable_memory(deployment_mechanism, experiment_cmds[experiment], search_resolution, 
+                        max_slowdown, cooldown_temperature, cooldown_timeout)
+                    search_metrics.extend(prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, 1, start_time, {},
+                        [("", search)], MEMORY_SEARCH_FIELD_NAMES))
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} memory search, attempt {attempt + 1}: {e}")
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+
+        minimum_viable_memory = search["minimum-viable-memory-bytes"]
+        print(f"Minimum viable memory of the {describe_experiment(experiment)} experiment: "
+            + f"{minimum_viable_memory / BYTES_PER_MIB:.0f} MiB")
+        if memory_limits is not None:
+            experiment_memory_limits[experiment] = memory_limits
+        else:
+            experiment_memory_limits[experiment] = [UNLIMITED_MEMORY] + sorted(set(
+                math.ceil(factor * minimum_viable_memory / search_resolution) * search_resolution 
+                for factor in MEMORY_SWEEP_FACTORS))
+
+    write_metrics_to_csv(search_results_filename, CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + MEMORY_SEARCH_FIELD_NAMES,
+        search_metrics)
+
+    # Randomly intersperse experiments of each type and memory limit; the limits swept by default are only known once
+    # each experiment's search finished, so their trials are only counted towards the run's progress now
+    experiments = [(experiment, memory_limit) for experiment, limits in experiment_memory_limits.items() 
+        for memory_limit in limits for _ in range(n)]
+    random.shuffle(experiments)
+    add_expected_harness_trials(len(experiments))
+
+    # Keep track of trial number for each experiment and memory limit
+    trial_numbers = {memory_experiment: 1 for memory_experiment in set(experiments)}
+
+    metrics = []
+
+    for memory_experiment in experiments:
+        experiment, memory_limit = memory_experiment
+        deployment_mechanism, dimensions = experiment
+        limit_description = f"{memory_limit / BYTES_PER_MIB:.0f} MiB" if memory_limit != UNLIMITED_MEMORY else "no"
+        print(f"Starting {describe_experiment(experiment)} experiment with {limit_description} memory limit")
+        start_time = datetime.now(timezone.utc)
+
+        trial = trial_numbers[memory_experiment]
+        print(f"Trial {trial}")
+        trial_numbers[memory_experiment] += 1
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=trial, attempt=attempt + 1) as attempt_span:
+                try:
+                    wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+                    start_thermal_state = read_thermal_state()
+                    trial_metrics = run_memory_limit_experiment(deployment_mechanism, experiment_cmds[experiment], memory_limit)
+                    end_thermal_state = read_thermal_state()
+                    trial_conditions = {"memory-limit-bytes": memory_limit}
+                    trial_conditions.update(get_trial_thermal_conditions(start_thermal_state, end_thermal_state))
+                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, 
+                        trial_conditions, [("", trial_metrics)], MEMORY_LIMIT_FIELD_NAMES)
+                    metrics.extend(trial_metrics_rows)
+                    complete_harness_trial()
+                    break
+                except Exception as e:
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} trial {trial} with {limit_description} memory limit, attempt {attempt + 1}: {e}")
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+
+    # Write the results into a CSV
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + ["memory-limit-bytes"] + THERMAL_FIELD_NAMES + MEMORY_LIMIT_FIELD_NAMES
+    write_metrics_to_csv(results_filename, field_names, metrics)
+
+def search_minimum_viable_memory(deployment_mechanism, cmd, resolution, max_slowdown, cooldown_temperature=None, 
+    cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT):
+    """Searches the minimum viable memory of an experiment, i.e. the smallest memory limit under which its workload 
+    completes without slowing down by more than max_slowdown relative to running without a limit. The search is a 
+    binary search over multiples of the resolution, so it assumes the workload remains viable under any limit larger
+    than one it is viable under; since reclaim makes the wall time near the threshold noisy, the result is an estimate.
+
+    Args:
+        deployment_mechanism: The deployment mechanism used for the experiment
+        cmd: The command running the workload; for Docker mechanisms, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        resolution: The resolution in bytes to search the minimum viable memory to
+        max_slowdown: The factor by which the workload may slow down while still counting as viable
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each run, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each run
+    Returns:
+        dict: The MEMORY_SEARCH_FIELD_NAMES metrics
+    """
+    reference_runs = []
+    for _ in range(MEMORY_SEARCH_REFERENCE_RUNS):
+        wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+        reference_runs.append(run_memory_limit_experiment(deployment_mechanism, cmd, UNLIMITED_MEMORY))
+    if not all(run["completed"] for run in reference_runs):
+        raise Exception("The workload did not complete even without a memory limit")
+
+    reference_wall_time = statistics.median(run["wall-time-seconds"] for run in reference_runs)
+    reference_peak_memory = max(run["peak-memory-bytes"] or 0 for run in reference_runs)
+    probes = 0
+
+    def is_viable(units):
+        nonlocal probes
+        probes += 1
+        wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+        run = run_memory_limit_experiment(deployment_mechanism, cmd, units * resolution)
+        viable = run["completed"] and run["wall-time-seconds"] <= max_slowdown * reference_wall_time
+        print(f"Probed {units * resolution / BYTES_PER_MIB:.0f} MiB memory limit: {'viable' if viable else 'not viable'}")
+        return viable
+
+    # Start the search from a limit the workload is viable under, beginning with twice its peak memory usage without
+    # a limit and doubling it up to the device's memory
+    lower_units = math.ceil(MEMORY_SEARCH_MIN_BYTES / resolution)
+    max_units = max(lower_units, read_total_memory() // resolution)
+    upper_units = min(max(lower_units, math.ceil(2 * reference_peak_memory / resolution)), max_units)
+    while not is_viable(upper_units):
+        if upper_units == max_units:
+            raise Exception("The workload is not viable under any memory limit up to the device's memory")
+        upper_units = min(2 * upper_units, max_units)
+
+    # Narrow the search down to the resolution, keeping a limit the workload is viable under as its upper bound; the
+    # smallest limit is only probed if the upper bound reaches it
+    if upper_units > lower_units and is_viable(lower_units):
+        upper_units = lower_units
+    while upper_units - lower_units > 1:
+        middle_units = (lower_units + upper_units) // 2
+        if is_viable(middle_units):
+            upper_units = middle_units
+        else:
+            lower_units = middle_units
+
+    return {
+        "minimum-viable-memory-bytes": upper_units * resolution,
+        "reference-wall-time-seconds": round(reference_wall_time, 4),
+        "reference-peak-memory-bytes": reference_peak_memory,
+        "probes": probes
+    }
+
+def read_total_memory():
+    """Reads the total memory of the device.
+
+    Returns:
+        int: The total memory in bytes
+    """
+    with open(PROC_MEMINFO_PATH, "r") as f:
+        for line in f:
+            # The line is in the format "MemTotal:       1234 kB"
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) * 1024
+    raise Exception(f"No total memory found in {PROC_MEMINFO_PATH}")
+
+@harness_phase("workload")
+def run_memory_limit_experiment(deployment_mechanism, cmd, memory_limit):
+    """Runs the workload of an experiment once under a memory limit without swap, in its own container or custom 
+    cgroup, sampling the memory usage, reclaim and OOM kills of its cgroup until it finishes. A container's cgroup is 
+    removed as soon as it exits, so its final counters are those of the last sample, while whether it was OOM-killed
+    is read from Docker.
+
+    Args:
+        deployment_mechanism: The deployment mechanism used for the experiment
+        cmd: The command running the workload; for Docker mechanisms, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        memory_limit: The memory limit in bytes, or UNLIMITED_MEMORY to run without a limit
+    Returns:
+        dict: The MEMORY_LIMIT_FIELD_NAMES metrics
+    """
+    if is_docker_mechanism(deployment_mechanism):
+        container_exec_cmd, container_start_cmd = cmd
+        if memory_limit != UNLIMITED_MEMORY:
+            container_start_cmd = get_container_start_cmd_with_memory_limit(container_start_cmd, memory_limit)
+        run_cmd = container_start_cmd.split() + container_exec_cmd.split()
+        get_cgroup_name = lambda: get_container_cgroup_name(CONTAINER_NAME)
+    else:
+        with harness_span("cgroup-create"):
+            run_shell_cmd(CREATE_CGROUP_CMD.split())
+        run_cmd = EXEC_IN_CGROUP_CMD_PREFIX.split() + cmd.split()
+        get_cgroup_name = lambda: CUSTOM_CGROUP_NAME
+
+    try:
+        if not is_docker_mechanism(deployment_mechanism):
+            set_cgroup_memory_limit(CUSTOM_CGROUP_NAME, memory_limit)
+
+        memory_state = {}
+        stop_event = threading.Event()
+        sampler = threading.Thread(target=sample_cgroup_memory_state, args=(get_cgroup_name, stop_event, memory_state))
+        sampler.start()
+        try:
+            # The workload failing is a result rather than an error here, so its exit code is not checked
+            start = time.monotonic()
+            returncode = subprocess.run(run_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+            wall_time = time.monotonic() - start
+        finally:
+            stop_event.set()
+            sampler.join()
+
+        if is_docker_mechanism(deployment_mechanism):
+            output = run_shell_cmd_and_get_stdout(CONTAINER_INSPECT_OOM_KILLED_CMD.format(container_name=CONTAINER_NAME).split())
+            if output.strip().strip("'") == "true":
+                memory_state["oom-kills"] = max(memory_state.get("oom-kills") or 0, 1)
+        else:
+            update_cgroup_memory_state(memory_state, read_cgroup_memory_state(CUSTOM_CGROUP_NAME))
+    finally:
+        if is_docker_mechanism(deployment_mechanism):
+            remove_container(CONTAINER_NAME)
+        elif cgroup_exists(CUSTOM_CGROUP_NAME):
+            with harness_span("cgroup-delete"):
+                run_shell_cmd(DELETE_CGROUP_CMD.split())
+
+    oom_kills = memory_state.get("oom-kills") or 0
+    return {
+        "completed": returncode == 0 and oom_kills == 0,
+        "wall-time-seconds": round(wall_time, 4),
+        "peak-memory-bytes": memory_state.get("peak-memory-bytes"),
+        "oom-kills": oom_kills,
+        "reclaim-scanned-pages": memory_state.get("reclaim-scanned-pages"),
+        "reclaim-stolen-pages": memory_state.get("reclaim-stolen-pages")
+    }
+
+def get_container_start_cmd_with_memory_limit(container_start_cmd, memory_limit):
+    """Gets the command to start a container under a memory limit without swap.
+
+    Args:
+        container_start_cmd: The command to start the container, under the name CONTAINER_NAME
+        memory_limit: The memory limit in bytes
+    Returns:
+        str: The command to start the container under the memory limit
+    """
+    memory_limit_options = CONTAINER_MEMORY_LIMIT_OPTIONS_TEMPLATE.format(memory_limit=memory_limit)
+    return container_start_cmd.replace(f"--name {CONTAINER_NAME}", f"--name {CONTAINER_NAME} {memory_limit_options}")
+
+def get_container_start_cmd_with_device_profile(container_start_cmd, device_profile):
+    """Gets the command to start a container restricted to the CPU quota and the set of CPUs of a device profile.
+
+    Args:
+        container_start_cmd: The command to start the container, under the name CONTAINER_NAME
+        device_profile: The device profile, as returned by parse_device_profiles(), or None for all of the device's CPUs
+    Returns:
+        str: The command to start the container under the device profile
+    """
+    if device_profile is None:
+        return container_start_cmd
+    device_options = []
+    if device_profile["cpus"] is not None:
+        device_options.append(CONTAINER_CPUS_OPTION_TEMPLATE.format(cpus=device_profile["cpus"]))
+    if device_profile["cpuset"] is not None:
+        device_options.append(CONTAINER_CPUSET_OPTION_TEMPLATE.format(cpuset=device_profile["cpuset"]))
+    return container_start_cmd.replace(f"--name {CONTAINER_NAME}", f"--name {CONTAINER_NAME} {' '.join(device_options)}")
+
+def get_container_cgroup_name(container_name):
+    """Gets the name of the cgroup of a running container, relative to the root of the memory controller's hierarchy.
+    Unlike get_cgroup_id_for_container(), this is expected to be called before the container starts, so a container
+    that does not exist yet is not an error.
+
+    Args:
+        container_name: The name of the container
+    Returns:
+        str: The name of the container's cgroup, or None if the container does not exist yet
+    """
+    cmd = CONTAINER_INSPECT_ID_CMD.format(container_name=container_name).split()
+    result = subprocess.run(cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    if result.returncode != 0:
+        return None
+
+    container_id = result.stdout.strip().strip("'")
+    if is_cgroup_v2():
+        return f"system.slice/docker-{container_id}.scope"
+    else:
+        return f"docker/{container_id}"
+
+def get_cgroup_memory_file_path(cgroup_name, file_key):
+    """Gets the path of a file of the memory controller of a cgroup.
+
+    Args:
+        cgroup_name: The name of the cgroup, relative to the root of the memory controller's hierarchy
+        file_key: The key of the file in CGROUP_V2_MEMORY_FILES and CGROUP_V1_MEMORY_FILES
+    Returns:
+        str: The path of the file
+    """
+    if is_cgroup_v2():
+        return CGROUP_FILE_PATH_TEMPLATE.format(cgroup_path=cgroup_name, filename=CGROUP_V2_MEMORY_FILES[file_key])
+    else:
+        return CGROUP_FILE_PATH_TEMPLATE.format(cgroup_path=f"memory/{cgroup_name}", filename=CGROUP_V1_MEMORY_FILES[file_key])
+
+def set_cgroup_memory_limit(cgroup_name, memory_limit):
+    """Sets the memory limit of a custom cgroup, and prevents it from swapping if it is limited and swap is accounted 
+    for. The limit is set even when lifting it, so the cgroup does not keep one set previously.
+
+    Args:
+        cgroup_name: The name of the cgroup
+        memory_limit: The memory limit in bytes, or UNLIMITED_MEMORY to lift the limit
+    """
+    files = CGROUP_V2_MEMORY_FILES if is_cgroup_v2() else CGROUP_V1_MEMORY_FILES
+    unlimited_value = CGROUP_V2_UNLIMITED_VALUE if is_cgroup_v2() else CGROUP_V1_UNLIMITED_VALUE
+    limit_value = str(memory_limit) if memory_limit != UNLIMITED_MEMORY else unlimited_value
+
+    # Under cgroup v1, the limit on memory and swap combined must be set after the limit on memory, which it may not
+    # be smaller than, and matching them leaves no room for swap
+    if is_cgroup_v2():
+        swap_limit_value = "0" if memory_limit != UNLIMITED_MEMORY else unlimited_value
+    else:
+        swap_limit_value = limit_value
+    parameters = [(files["limit"], limit_value)]
+    if os.path.exists(get_cgroup_memory_file_path(cgroup_name, "swap-limit")):
+        parameters.append((files["swap-limit"], swap_limit_value))
+
+    for parameter, value in parameters:
+        run_shell_cmd(SET_CGROUP_PARAMETER_CMD_TEMPLATE.format(parameter=parameter, value=value, cgroup_name=cgroup_name).split())
+
+def sample_cgroup_memory_state(get_cgroup_name, stop_event, memory_state):
+    """Samples the memory usage, reclaim and OOM kills of a cgroup until stopped.
+
+    Args:
+        get_cgroup_name: A function returning the name of the cgroup, or None if it does not exist yet
+        stop_event: The event set once the workload has finished
+        memory_state: The dictionary to update with the state of the cgroup, as returned by read_cgroup_memory_state()
+    """
+    cgroup_name = None
+    while not stop_event.wait(MEMORY_LIMIT_SAMPLE_INTERVAL):
+        if cgroup_name is None:
+            cgroup_name = get_cgroup_name()
+            if cgroup_name is None:
+                continue
+        update_cgroup_memory_state(memory_state, read_cgroup_memory_state(cgroup_name))
+
+def update_cgroup_memory_state(memory_state, new_memory_state):
+    """Updates the state of a cgroup with a newer reading, keeping the peak memory usage across readings; its other
+    counters only increase over the cgroup's lifetime, so the newer reading supersedes them.
+
+    Args:
+        memory_state: The dictionary to update
+        new_memory_state: The newer reading, or None if the cgroup no longer existed
+    """
+    if new_memory_state is None:
+        return
+    peak_memory = max(memory_state.get("peak-memory-bytes") or 0, new_memory_state["peak-memory-bytes"])
+    memory_state.update(new_memory_state)
+    memory_state["peak-memory-bytes"] = peak_memory
+
+def read_cgroup_memory_state(cgroup_name):
+    """Reads the memory usage, reclaim and OOM kills of a cgroup since it was created.
+
+    Args:
+        cgroup_name: The name of the cgroup, relative to the root of the memory controller's hierarchy
+    Returns:
+        dict: The peak memory usage, OOM kills and pages scanned and reclaimed, keyed by their MEMORY_LIMIT_FIELD_NAMES,
+            where the latter are None under cgroup v1, or None if the cgroup no longer exists
+    """
+    try:
+        with open(get_cgroup_memory_file_path(cgroup_name, "current"), "r") as f:
+            peak_memory = int(f.read())
+        peak_path = get_cgroup_memory_file_path(cgroup_name, "peak")
+        if os.path.exists(peak_path):
+            with open(peak_path, "r") as f:
+                peak_memory = max(peak_memory, int(f.read()))
+        events = read_cgroup_flat_keyed_file(get_cgroup_memory_file_path(cgroup_name, "events"))
+        stat = read_cgroup_flat_keyed_file(get_cgroup_memory_file_path(cgroup_name, "stat"))
+    except (OSError, ValueError):
+        # The cgroup may be removed as soon as its workload finishes
+        return None
+
+    memory_state = {"peak-memory-bytes": peak_memory, "oom-kills": events.get(CGROUP_OOM_KILL_KEY, 0)}
+    for key, field_name in CGROUP_MEMORY_STAT_KEYS.items():
+        memory_state[field_name] = stat.get(key)
+    return memory_state
+
+def read_cgroup_flat_keyed_file(path):
+    """Reads a cgroup file consisting of a key and an integer value on each line, such as memory.stat.
+
+    Args:
+        path: The path of the file
+    Returns:
+        dict: The values, keyed by their keys
+    """
+    values = {}
+    with open(path, "r") as f:
+        for line in f:
+            key, value = line.split()
+            values[key] = int(value)
+    return values
+
+def prepare_aot_wasm_files(mechanisms, arch, is_mac):
+    """Gets the AoT-compiled WebAssembly file of each WebAssembly AoT mechanism to run from the AoT cache, compiling
+    the files that are not cached yet, along with how each file's compilation went. Files are cached under a key
+    derived from everything the compiled file depends on, so they are only compiled again once the WebAssembly code,
+    WasmEdge version, architecture or optimization level changes.
+
+    Args:
+        mechanisms: The deployment mechanisms to run
+        arch: The architecture of the target device
+        is_mac: Whether the target device is a Mac, on which the AoT-compiled file must have the .so extension
+    Returns:
+        tuple: A mapping of each WebAssembly AoT mechanism to run to the path of its AoT-compiled file, and the
+            compilation results of each file as rows of AOT_FIELD_NAMES, including whether it was cached
+    """
+    wasm_aot_mechanisms = [mechanism for mechanism in ["wasm_aot"] + list(WASM_AOT_VARIANT_MECHANISMS) if mechanism in mechanisms]
+    if not wasm_aot_mechanisms:
+        return {}, []
+
+    os.makedirs(AOT_CACHE_DIR, exist_ok=True)
+    wasm_sha256 = hash_file(INTERPRETED_WASM_FILE_PATH)
+    wasmedge_version = run_shell_cmd_and_get_stdout(WASMEDGE_VERSION_CMD.split()).strip().split()[-1]
+    extension = "so" if is_mac else "wasm"
+
+    aot_wasm_file_paths = {}
+    compilation_rows = []
+    for wasm_aot_mechanism in wasm_aot_mechanisms:
+        optimization_level = WASM_AOT_VARIANT_MECHANISMS.get(wasm_aot_mechanism, WASM_AOT_DEFAULT_OPTIMIZATION_LEVEL)
+        cache_key = hashlib.sha256(f"{wasm_sha256}|{wasmedge_version}|{arch}|{optimization_level}".encode()).hexdigest()[:16]
+        aot_wasm_file_path = os.path.join(AOT_CACHE_DIR, AOT_CACHE_FILENAME_TEMPLATE.format(cache_key=cache_key, extension=extension))
+        record_path = os.path.join(AOT_CACHE_DIR, AOT_CACHE_RECORD_FILENAME_TEMPLATE.format(cache_key=cache_key))
+
+        cache_hit = os.path.exists(aot_wasm_file_path) and os.path.exists(record_path)
+        if cache_hit:
+            print(f"Using cached AoT-compiled file {aot_wasm_file_path} for {wasm_aot_mechanism}")
+            with open(record_path, "r") as f:
+                record = json.load(f)
+        else:
+            print(f"AoT compiling the WebAssembly code for {wasm_aot_mechanism} at optimization level {optimization_level}")
+            record = compile_aot_wasm_file(optimization_level, aot_wasm_file_path)
+            with open(record_path, "w") as f:
+                json.dump(record, f, indent=4)
+
+        aot_wasm_file_paths[wasm_aot_mechanism] = aot_wasm_file_path
+        compilation_rows.append({"deployment-mechanism": wasm_aot_mechanism, "optimization-level": optimization_level,
+            "wasmedge-version": wasmedge_version, "arch": arch, "wasm-sha256": wasm_sha256, **record, "cache-hit": int(cache_hit)})
+
+    return aot_wasm_file_paths, compilation_rows
+
+@harness_phase("aot-compile")
+def compile_aot_wasm_file(optimization_level, aot_wasm_file_path):
+    """AoT compiles the WebAssembly code at an optimization level, measuring how long the compilation takes and the 
+    compiler's peak memory usage. The file is compiled under a temporary name and only renamed once complete, so an 
+    interrupted compilation is never cached.
+
+    Args:
+        optimization_level: The value of WasmEdge's --optimize option, or WASM_AOT_DEFAULT_OPTIMIZATION_LEVEL to leave 
+            it to WasmEdge's default
+        aot_wasm_file_path: The path to save the AoT-compiled file to
+    Returns:
+        dict: When the compilation started, how many seconds it took, the size of the compiled file in bytes and the
+            compiler's peak memory usage in bytes
+    """
+    optimize_option = f" --optimize {optimization_level}" if optimization_level != WASM_AOT_DEFAULT_OPTIMIZATION_LEVEL else ""
+    # Keep the extension of the temporary file, since WasmEdge picks the output format based on it
+    root, extension = os.path.splitext(aot_wasm_file_path)
+    partial_aot_wasm_file_path = f"{root}.partial{extension}"
+    cmd = TIME_CMD_PREFIX.split() + AOT_COMPILE_CMD_TEMPLATE.format(optimize_option=optimize_option, 
+        aot_wasm_file_path=partial_aot_wasm_file_path).split()
+
+    compiled_at = datetime.now(timezone.utc)
+    time_output = run_shell_cmd_and_get_stderr(cmd)
+    os.replace(partial_aot_wasm_file_path, aot_wasm_file_path)
+
+    max_rss_match = TIME_MAX_RSS_PATTERN.search(time_output)
+    return {
+        "compiled-at": compiled_at.isoformat(),
+        "compile-seconds": parse_time_output(time_output)["wall-time-seconds"],
+        "artifact-size-bytes": os.path.getsize(aot_wasm_file_path),
+        "peak-compile-memory-bytes": int(max_rss_match.group(1)) * 1024 if max_rss_match else None
+    }
+
+@harness_phase("fingerprint")
+def get_results_fingerprint(args, model_path, input_path, experiment_cmds, aot_wasm_file_paths):
+    """Gets the fingerprint of the results of running the experiments, made up of the hashes of everything they
+    depend on: the model and input, the binaries, compiled files and images run by each mechanism, the WasmEdge
+    runtime, its plugins and the libtorch libraries they load, the perf events measured, this script, its arguments
+    (including the number of trials) and the host running it.
+
+    Args:
+        args: The parsed arguments of this script
+        model_path: The path of the model relative to the suite directory
+        input_path: The path of the input, or of its pre-decoded tensor, relative to the suite directory
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload
+        aot_wasm_file_paths: A mapping of each WebAssembly AoT mechanism to the path of its AoT-compiled file
+    Returns:
+        dict: The hash of every component, and the digest of all of them
+    """
+    deployment_mechanisms = sorted(set(deployment_mechanism for deployment_mechanism, _ in experiment_cmds))
+    host = os.uname()
+    components = {
+        "model": hash_file(os.path.join(SUITE_DIR, model_path)),
+        "input": hash_file(os.path.join(SUITE_DIR, input_path)),
+        "perf-config": hash_file(CADVISOR_PERF_CONFIG_PATH),
+        "collect-data-script": hash_file(os.path.abspath(__file__)),
+        "arguments": {arg: value for arg, value in sorted(vars(args).items()) if arg not in UNFINGERPRINTED_ARGS},
+        "host": {"name": host.nodename, "kernel": host.release, "machine": host.machine}
+    }
+
+    for deployment_mechanism in deployment_mechanisms:
+        if is_docker_mechanism(deployment_mechanism):
+            img_name = get_docker_image_name(deployment_mechanism, args.arch)
+            # As for the container's ID, strip the single quotes from the output
+            components[deployment_mechanism] = run_shell_cmd_and_get_stdout(
+                DOCKER_IMAGE_INSPECT_ID_CMD.format(img_name=img_name).split()).strip().strip("'")
+        elif deployment_mechanism == "native":
+            components[deployment_mechanism] = hash_file(NATIVE_BINARY_PATH)
+        elif deployment_mechanism == "wasm_interpreted":
+            components[deployment_mechanism] = hash_file(INTERPRETED_WASM_FILE_PATH)
+        elif deployment_mechanism in aot_wasm_file_paths:
+            components[deployment_mechanism] = hash_file(aot_wasm_file_paths[deployment_mechanism])
+
+    # The mechanisms outside containers load the runtime and libraries installed on the host when they run, so an 
+    # upgrade of either changes their results without changing the files above
+    if any(deployment_mechanism.startswith("wasm") for deployment_mechanism in deployment_mechanisms):
+        components["wasmedge"] = {
+            "version": run_shell_cmd_and_get_stdout(WASMEDGE_VERSION_CMD.split()).strip(),
+            "libraries": hash_shared_libraries(WASMEDGE_LIB_DIR),
+            "plugins": hash_shared_libraries(WASMEDGE_PLUGIN_DIR)
+        }
+    if any(not is_docker_mechanism(deployment_mechanism) for deployment_mechanism in deployment_mechanisms):
+        components["libtorch"] = hash_shared_libraries(LIBTORCH_LIB_DIR)
+
+    digest = hashlib.sha256(json.dumps(components, sort_keys=True).encode()).hexdigest()
+    return {"digest": digest, "components": components}
+
+def are_results_up_to_date(fingerprint, fingerprint_filename, results_filename_prefix, mode):
+    """Checks whether the results of a mode were already collected with the same fingerprint, printing which 
+    components of the fingerprint changed otherwise.
+
+    Args:
+        fingerprint: The fingerprint of the results to collect
+        fingerprint_filename: The name of the file storing the fingerprint of the existing results
+        results_filename_prefix: The prefix of the names of the results files, including their path
+        mode: The mode the experiments are run in
+    Returns:
+        bool: Whether every results file of the mode exists and was collected with the same fingerprint
+    """
+    if not os.path.exists(fingerprint_filename):
+        return False
+    if not all(os.path.exists(results_filename_prefix + suffix) for suffix in MODE_RESULTS_FILENAME_SUFFIXES[mode]):
+        return False
+
+    with open(fingerprint_filename, "r") as f:
+        existing_fingerprint = json.load(f)
+    if existing_fingerprint.get("digest") == fingerprint["digest"]:
+        return True
+
+    existing_components = existing_fingerprint.get("components", {})
+    changed_components = [component for component in sorted(set(existing_components) | set(fingerprint["components"]))
+        if existing_components.get(component) != fingerprint["components"].get(component)]
+    print(f"The existing results are out of date since these changed: {', '.join(changed_components)}")
+    return False
+
+def hash_file(path):
+    """Hashes the contents of a file.
+
+    Args:
+        path: The path of the file
+    Returns:
+        str: The SHA-256 hash of the file's contents
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+def hash_shared_libraries(directory):
+    """Hashes the shared libraries in a directory, skipping the symbolic links to them, which are hashed under the
+    name of the file they point to.
+
+    Args:
+        directory: The path of the directory, which may not exist
+    Returns:
+        dict: The SHA-256 hash of each library's contents, keyed by its filename
+    """
+    if not os.path.isdir(directory):
+        return {}
+    return {filename: hash_file(os.path.join(directory, filename)) for filename in sorted(os.listdir(directory))
+        if ".so" in filename and not os.path.islink(os.path.join(directory, filename))}
+
+def is_docker_mechanism(deployment_mechanism):
+    """Checks whether a deployment mechanism is the standard Docker mechanism or one of its image variants.
 
-# The commands used to start a custom cgroup and execute a command in it, and to delete it
-CREATE_CGROUP_CMD=f"sudo cgcreate -g memory:{CUSTOM_CGROUP_NAME}"
-EXEC_IN_CGROUP_CMD_PREFIX=f"sudo LD_LIBRARY_PATH={LD_LIBRARY_PATH} PATH={PATH} cgexec -g memory:{CUSTOM_CGROUP_NAME}"
-DELETE_CGROUP_CMD=f"sudo cgdelete -g memory:{CUSTOM_CGROUP_NAME}"
+    Args:
+        deployment_mechanism: The deployment mechanism
+    Returns:
+        bool: Whether the deployment mechanism runs its workload in a Docker container
+    """
+    return deployment_mechanism == "docker" or deployment_mechanism in DOCKER_VARIANT_MECHANISMS
 
-# The number of times to retry an experiment before giving up
-MAX_RETRIES = 15
+def get_docker_image_name(deployment_mechanism, arch):
+    """Gets the name of the image a Docker mechanism runs its containers from.
 
-# Variable tracking whether cAdvisor and Prometheus are currently running or not
-cadvisor_and_prometheus_running = False
+    Args:
+        deployment_mechanism: The Docker mechanism
+        arch: The architecture of the target device
+    Returns:
+        str: The name of the image
+    """
+    if deployment_mechanism == "docker":
+        return IMG_NAME_TEMPLATE.format(arch=arch)
+    return VARIANT_IMG_NAME_TEMPLATE.format(variant=DOCKER_VARIANT_MECHANISMS[deployment_mechanism], arch=arch)
 
-def is_cgroup_v2():
-    """Checks if the system is using cgroup v2
-    
+def get_docker_image_tar_path(deployment_mechanism, arch):
+    """Gets the path of the tar file the image of a Docker mechanism is loaded from.
+
+    Args:
+        deployment_mechanism: The Docker mechanism
+        arch: The architecture of the target device
     Returns:
-        bool: True if the system is using cgroup v2, False otherwise
+        str: The path of the tar file
     """
-    return os.path.isfile("/sys/fs/cgroup/cgroup.controllers")
+    if deployment_mechanism == "docker":
+        return IMG_TAR_PATH_TEMPLATE.format(arch=arch)
+    return VARIANT_IMG_TAR_PATH_TEMPLATE.format(variant=DOCKER_VARIANT_MECHANISMS[deployment_mechanism], arch=arch)
 
-def collect_time_data(n, results_filename, container_exec_cmd, container_start_cmd, wasm_interpreted_cmd, wasm_aot_cmd, native_cmd,
-    deployment_mechanisms):
-    """Runs the time experiments and collects the relevant data from the output, storing it in the specified file.
+def collect_load_data(n, results_filename, experiment_cmds, rates, duration, arrival_process, pool_size, 
+    cooldown_temperature=None, cooldown_timeout=DEFAULT_COOLDOWN_TIMEOUT):
+    """Runs the load experiments, in which an experiment's command is invoked open-loop at a target arrival rate for
+    a fixed duration, and collects the timing of every request, storing them in the specified file.
 
     Args:
-        n: The number of trials to run for each deployment mechanism
+        n: The number of trials to run for each experiment and rate
         results_filename: The name of the file to store the results in
-        container_exec_cmd: The command to execute the workload in the container, for the Docker mechanism
-        container_start_cmd: The command to start the container, for the Docker mechanism
-        wasm_interpreted_cmd: The command to run the workload for the WebAssembly interpreted mechanism
-        wasm_aot_cmd: The command to run the workload for the WebAssembly AOT mechanism
-        native_cmd: The command to run the workload as a standalone native binary, for the native mechanism
-        deployment_mechanisms: The list of deployment mechanisms to use
+        experiment_cmds: A dictionary mapping each experiment, as a (deployment_mechanism, dimensions) tuple, to the
+            command running its workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        rates: The target arrival rates to sweep, in requests per second
+        duration: The number of seconds to issue requests for in each trial
+        arrival_process: The process generating the requests' arrival times, either ARRIVAL_POISSON or ARRIVAL_CONSTANT
+        pool_size: The maximum number of requests running at once; later requests are delayed until one finishes
+        cooldown_temperature: The temperature in degrees Celsius the device must fall below before each trial, or None
+        cooldown_timeout: The maximum number of seconds to wait for the device to cool down before each trial
     """
-    time_metrics_short_names = [time_metric[1] for time_metric in TIME_METRICS]
-
-    # Randomly intersperse experiments of each type
-    experiments = []
-    if "docker" in deployment_mechanisms:
-        experiments += ["docker"] * n
-    if "wasm_interpreted" in deployment_mechanisms:
-        experiments += ["wasm_interpreted"] * n
-    if "wasm_aot" in deployment_mechanisms:
-        experiments += ["wasm_aot"] * n
-    if "native" in deployment_mechanisms:
-        experiments += ["native"] * n
+    # Randomly intersperse experiments of each type and rate
+    experiments = [(experiment, rate) for experiment in experiment_cmds for rate in rates for _ in range(n)]
     random.shuffle(experiments)
 
-    # Keep track of trial number for each deployment mechanism
-    docker_trial = 1
-    wasm_interpreted_trial = 1
-    wasm_aot_trial = 1
-    native_trial = 1
+    # Keep track of trial number for each experiment and rate
+    trial_numbers = {load_experiment: 1 for load_experiment in set(experiments)}
 
     metrics = []
 
-    # Noting that experiments contains deployment mechanisms in the order they will be run
-    for deployment_mechanism in experiments:
-        print(f"Starting {deployment_mechanism} experiment")
+    for load_experiment in experiments:
+        experiment, rate = load_experiment
+        deployment_mechanism, dimensions = experiment
+        print(f"Starting {describe_experiment(experiment)} experiment at {rate} requests per second")
         start_time = datetime.now(timezone.utc)
-        trial_metrics = {}
 
-        if deployment_mechanism == "docker":
-            trial = docker_trial
-            print(f"Trial {trial}")
-            docker_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_time_experiment(container_start_cmd + " " + container_exec_cmd)
-                    remove_container(CONTAINER_NAME)
-                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, trial, start_time, trial_metrics, time_metrics_short_names)
-                    metrics.extend(trial_metrics_rows)
-                    break
-                except Exception as e:
-                    print(f"Error during docker trial {trial}, attempt {attempt + 1}: {e}")
-                    remove_container(CONTAINER_NAME)
-                    if attempt == MAX_RETRIES - 1:
-                        break
-        elif deployment_mechanism == "wasm_interpreted":
-            trial = wasm_interpreted_trial
-            print(f"Trial {trial}")
-            wasm_interpreted_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_time_experiment(wasm_interpreted_cmd)
-                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, trial, start_time, trial_metrics, time_metrics_short_names)
-                    metrics.extend(trial_metrics_rows)
-                    break
-                except Exception as e:
-                    print(f"Error during wasm_interpreted trial {trial}, attempt {attempt + 1}: {e}")
-                    if attempt == MAX_RETRIES - 1:
-                        break
-        elif deployment_mechanism == "wasm_aot":
-            trial = wasm_aot_trial
-            print(f"Trial {trial}")
-            wasm_aot_trial += 1
-            for attempt in range(MAX_RETRIES):
+        trial = trial_numbers[load_experiment]
+        print(f"Trial {trial}")
+        trial_numbers[load_experiment] += 1
+        for attempt in range(MAX_RETRIES):
+            with harness_span(TRIAL_ATTEMPT_PHASE, mechanism=deployment_mechanism, trial=trial, attempt=attempt + 1) as attempt_span:
                 try:
-                    trial_metrics = run_time_experiment(wasm_aot_cmd)
-                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, trial, start_time, trial_metrics, time_metrics_short_names)
+                    wait_for_cooldown(cooldown_temperature, cooldown_timeout)
+                    start_thermal_state = read_thermal_state()
+                    trial_metrics = run_load_experiment(deployment_mechanism, experiment_cmds[experiment], rate, duration, 
+                        arrival_process, pool_size)
+                    end_thermal_state = read_thermal_state()
+                    trial_conditions = {"offered-rate": rate, "arrival-process": arrival_process}
+                    trial_conditions.update(get_trial_thermal_conditions(start_thermal_state, end_thermal_state))
+                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, dimensions, trial, start_time, 
+                        trial_conditions, trial_metrics, LOAD_FIELD_NAMES)
                     metrics.extend(trial_metrics_rows)
+                    complete_harness_trial()
                     break
                 except Exception as e:
-                    print(f"Error during wasm_aot trial {trial}, attempt {attempt + 1}: {e}")
+                    attempt_span["phase"] = FAILED_TRIAL_ATTEMPT_PHASE
+                    print(f"Error during {deployment_mechanism} trial {trial} at {rate} requests per second, attempt {attempt + 1}: {e}")
                     if attempt == MAX_RETRIES - 1:
-                        break
-        elif deployment_mechanism == "native":
-            trial = native_trial
-            print(f"Trial {trial}")
-            native_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_time_experiment(native_cmd)
-                    trial_metrics_rows = prepare_trial_data_as_csv_rows(deployment_mechanism, trial, start_time, trial_metrics, time_metrics_short_names)
-                    metrics.extend(trial_metrics_rows)
-                    break
-                except Exception as e:
-                    print(f"Error during native trial {trial}, attempt {attempt + 1}: {e}")
-                    if attempt == MAX_RETRIES - 1:
-                        break
-    
+                        raise
+
     # Write the results into a CSV
-    field_names = CSV_BASIC_FIELD_NAMES + time_metrics_short_names
+    field_names = CSV_BASIC_FIELD_NAMES + DIMENSION_FIELD_NAMES + ["offered-rate", "arrival-process"] + THERMAL_FIELD_NAMES \
+        + LOAD_FIELD_NAMES
     write_metrics_to_csv(results_filename, field_names, metrics)
 
-def prepare_trial_data_as_csv_rows(deployment_mechanism, trial, start_time, trial_metrics_sets, metric_names, allow_missing_metrics=False):
-    """Prepares the data of a trial, formatting it in a way allowing it to be written as a CSV row later.
+@harness_phase("workload")
+def run_load_experiment(deployment_mechanism, cmd, rate, duration, arrival_process, pool_size):
+    """Runs a load experiment, invoking a deployment mechanism's command at the times generated by the arrival process
+    regardless of whether previous requests have finished, i.e. open-loop.
 
     Args:
-        deployment_mechanism: The deployment mechanism used for the trial
-        trial: The trial number
-        start_time: The start time of the trial
-        trial_metrics_sets: A list of tuples in format ("special_identifier", trial_metrics_set)
-            where trial_metrics_set is a list consisting of the trial metrics themselves. This format
-            is used so we can store different types of metrics for the same experiment type, e.g. for
-            container perf experiment we want to store one set of metrics for the container and another
-            for the Docker overhead
-        metric_names: The names of the metrics to include in the CSV row
-        allow_missing_metrics: Whether to allow missing metrics or not
+        deployment_mechanism: The deployment mechanism used for the experiment
+        cmd: The command running the workload; for the Docker mechanism, this is a tuple of the command to execute the 
+            workload in the container and the command to start the container
+        rate: The target arrival rate, in requests per second
+        duration: The number of seconds to issue requests for
+        arrival_process: The process generating the requests' arrival times, either ARRIVAL_POISSON or ARRIVAL_CONSTANT
+        pool_size: The maximum number of requests running at once
     Returns:
-        A list of dictionaries, each dictionary representing a row in the CSV file
+        A list of tuples in format ("special_identifier", trial_metrics_set), as expected by prepare_trial_data_as_csv_rows(),
+            with one set of metrics for each request so each is written as its own row
     """
-    trial_metrics_rows = []
+    stop_cadvisor_and_prometheus_if_running()
 
-    for trial_metrics_set in trial_metrics_sets:
-        identifier = trial_metrics_set[0]
-        trial_metrics = trial_metrics_set[1]
-    
-        trial_metrics_row = {
-            "deployment-mechanism": deployment_mechanism + identifier,
-            "trial-number": trial,
-            "start-time": start_time.isoformat(),
-        }
+    arrival_offsets = get_arrival_offsets(rate, duration, arrival_process)
+    if is_docker_mechanism(deployment_mechanism):
+        # Each request needs its own container, which is removed as soon as it exits so requests do not pay for
+        # removing containers
+        container_exec_cmd, container_start_cmd = cmd
+        request_cmds = [get_container_start_cmd_with_name(container_start_cmd, f"{CONTAINER_NAME}-load-{request}")
+            .replace("docker run", "docker run --rm", 1).split() + container_exec_cmd.split() for request in range(len(arrival_offsets))]
+    else:
+        request_cmds = [cmd.split()] * len(arrival_offsets)
 
-        for metric_name in metric_names:
-            try:
-                trial_metrics_row[metric_name] = trial_metrics[metric_name]
-            except KeyError:
-                if not (metric_name in POSSIBLE_MISSING_METRICS and allow_missing_metrics):
-                    raise
+    request_metrics = asyncio.run(run_requests_open_loop(request_cmds, arrival_offsets, pool_size))
 
-        trial_metrics_rows.append(trial_metrics_row)
+    failed_requests = sum(1 for metrics in request_metrics if not metrics["succeeded"])
+    if failed_requests > 0:
+        print(f"{failed_requests} of {len(request_metrics)} requests failed")
 
-    return trial_metrics_rows
+    return [("", metrics) for metrics in request_metrics]
 
-def write_metrics_to_csv(results_filename, field_names, metrics):
-    """Writes the metrics collected from the experiments to a CSV file.
+def get_arrival_offsets(rate, duration, arrival_process):
+    """Gets the times at which requests arrive, relative to the start of a load experiment.
 
     Args:
-        results_filename: The name of the file to store the results in
-        field_names: The names of the fields to include in the CSV file
-        metrics: The metrics to write to the CSV file
+        rate: The target arrival rate, in requests per second
+        duration: The number of seconds to issue requests for
+        arrival_process: The process generating the arrival times; ARRIVAL_POISSON spaces requests by exponentially 
+            distributed gaps, while ARRIVAL_CONSTANT spaces them evenly
+    Returns:
+        list: The arrival times in seconds, all of which are less than the duration
     """
-    with open(results_filename, "w", newline="") as csv_file:
-        print(f"Writing results to {results_filename}")
-        writer = csv.DictWriter(csv_file, fieldnames = field_names)
-        writer.writeheader()
-        writer.writerows(metrics)
+    arrival_offsets = []
+    offset = 0.0 if arrival_process == ARRIVAL_CONSTANT else random.expovariate(rate)
+    while offset < duration:
+        arrival_offsets.append(offset)
+        offset += 1 / rate if arrival_process == ARRIVAL_CONSTANT else random.expovariate(rate)
+    return arrival_offsets
+
+async def run_requests_open_loop(request_cmds, arrival_offsets, pool_size):
+    """Runs each request's command as a subprocess at its arrival time, with at most pool_size running at once.
 
-def run_time_experiment(cmd):
-    """Runs the time command on a given command and collects the time metrics from the output.
-    
     Args:
-        cmd: The command to run
+        request_cmds: The command of each request, as a list
+        arrival_offsets: The arrival time of each request in seconds, relative to the start
+        pool_size: The maximum number of requests running at once
     Returns:
-        A list of tuples in format ("special_identifier", trial_metrics_set), where trial_metrics_set is a dictionary
-            containing the trial metrics themselves. This format is used and expected by other functions so we can store different types 
-            of metrics for the same experiment type, e.g. for container perf experiment we want to store one set of metrics for the 
-            container and another for the Docker overhead. However, in this case, the Docker mechanism's execution time is the same 
-            regardless of whether we consider the Docker overhead or not, so we will only have one set of metrics for each mechanism 
-            and no special identifier differentiating them
+        list: A dictionary of the LOAD_FIELD_NAMES metrics for each request, in order of arrival
     """
-    stop_cadvisor_and_prometheus_if_running()
-    cmd = TIME_CMD_PREFIX.split() + cmd.split()
-    time_output = run_shell_cmd_and_get_stderr(cmd)
+    semaphore = asyncio.Semaphore(pool_size)
+    loop_start = time.monotonic()
+
+    async def run_request(request, request_cmd, arrival_offset):
+        scheduled = loop_start + arrival_offset
+        await asyncio.sleep(max(0, scheduled - time.monotonic()))
+
+        # A request that arrives when the pool is full waits for a slot, which counts towards its start delay
+        async with semaphore:
+            start = time.monotonic()
+            process = await asyncio.create_subprocess_exec(*request_cmd, stdout=asyncio.subprocess.DEVNULL, 
+                stderr=asyncio.subprocess.DEVNULL)
+            return_code = await process.wait()
+            end = time.monotonic()
+
+        return {
+            "request-number": request + 1,
+            "arrival-offset-seconds": round(arrival_offset, 6),
+            "start-delay-seconds": round(start - scheduled, 6),
+            "service-time-seconds": round(end - start, 6),
+            "latency-seconds": round(end - scheduled, 6),
+            "completion-offset-seconds": round(end - loop_start, 6),
+            "succeeded": int(return_code == 0)
+        }
 
-    return [("", parse_time_output(time_output))]
+    return await asyncio.gather(*(run_request(request, request_cmd, arrival_offset) 
+        for request, (request_cmd, arrival_offset) in enumerate(zip(request_cmds, arrival_offsets))))
 
-def parse_time_output(output):
-    """Parses the output of the time command and collects the time metrics from it.
+def run_shell_cmd_with_memory_attribution(cmd, get_pids):
+    """Runs a command while sampling the memory attribution of its processes in the background.
 
     Args:
-        output: The output of the time command
+        cmd: The command to run, as a list
+        get_pids: A function returning the IDs of the command's processes that are currently running
     Returns:
-        A dictionary containing the time metrics
+        dict: The MEMORY_ATTRIBUTION_FIELD_NAMES metrics, all of which are None if no sample was taken
     """
-    metrics = {}
-    for line in output.split("\n"):
-        for metric in TIME_METRICS:
-            metric_actual_name = metric[0]
-            metric_new_name = metric[1]
-
-            if metric_actual_name in line:
-                words = line.strip().split()
-                raw_value = words[-1]
-                
-                if metric_new_name == "wall-time-seconds":
-                    time_parts = raw_value.split(":")
-                    float_time_parts = [float(time_part) for time_part in time_parts]
-                    if len(time_parts) == 2: # m:ss format
-                        mins, seconds = float_time_parts
-                        value = mins * 60 + seconds
-                    elif len(time_parts) == 3: # h:mm:ss format
-                        hours, mins, seconds = float_time_parts
-                        value = hours * 3600 + mins * 60 + seconds
-
-                metrics[metric_new_name] = value
+    attribution = {field_name: None for field_name in MEMORY_ATTRIBUTION_FIELD_NAMES}
+    stop_event = threading.Event()
+    sampler = threading.Thread(target=sample_memory_attribution, args=(get_pids, stop_event, attribution))
+    sampler.start()
+    try:
+        run_shell_cmd(cmd)
+    finally:
+        stop_event.set()
+        sampler.join()
 
-    return metrics
+    return attribution
 
-def collect_perf_data(n, results_filename, container_exec_cmd, container_start_cmd, wasm_interpreted_cmd, wasm_aot_cmd, native_cmd, 
-    allow_missing_metrics, deployment_mechanisms):
-    """Runs the performance experiments (measuring performance metrics besides time) and collects the relevant data from Prometheus, 
-    storing it in the specified file.
+def sample_memory_attribution(get_pids, stop_event, attribution):
+    """Samples the total proportional set size of the given processes from their smaps_rollup files until stopped, 
+    and whenever it reaches a new peak, breaks it down by memory region from their smaps files. Only breaking down
+    the peaks keeps the sampling cheap, since the smaps files list every mapping of each process.
 
     Args:
-        n: The number of trials to run for each deployment mechanism
-        results_filename: The name of the file to store the results in
-        container_exec_cmd: The command to execute the workload in the container, for the Docker mechanism
-        container_start_cmd: The command to start the container, for the Docker mechanism
-        wasm_interpreted_cmd: The command to run the workload for the WebAssembly interpreted mechanism
-        wasm_aot_cmd: The command to run the workload for the WebAssembly AOT mechanism
-        native_cmd: The command to run the workload as a standalone native binary, for the native mechanism
-        allow_missing_metrics: Whether to allow missing metrics or not
-        deployment_mechanisms: The list of deployment mechanisms to use
+        get_pids: A function returning the IDs of the processes to sample
+        stop_event: The event set once the processes have finished
+        attribution: The dictionary to update with the breakdown of the peak, keyed by MEMORY_ATTRIBUTION_FIELD_NAMES
     """
+    peak_total_pss = 0
+    while not stop_event.wait(MEMORY_ATTRIBUTION_SAMPLE_INTERVAL):
+        pids = get_pids()
+        _, total_pss = read_memory_of_pids(pids)
+        if total_pss <= peak_total_pss:
+            continue
+
+        breakdown = read_memory_attribution_of_pids(pids)
+        if breakdown["peak-total-pss-bytes"] > 0:
+            peak_total_pss = total_pss
+            attribution.update(breakdown)
+
+def read_memory_attribution_of_pids(pids):
+    """Reads the proportional set size and unique set size of the given processes from their smaps files, broken down
+    by the category of memory region each mapping belongs to (see classify_memory_region()). The unique set size only
+    counts pages private to a process, while the shareable size counts the clean file-backed pages, which further
+    instances mapping the same files could share.
 
-    # Randomly intersperse experiments of each type
-    experiments = []
-    if "docker" in deployment_mechanisms:
-        experiments += ["docker"] * n
-    if "wasm_interpreted" in deployment_mechanisms:
-        experiments += ["wasm_interpreted"] * n
-    if "wasm_aot" in deployment_mechanisms:
-        experiments += ["wasm_aot"] * n
-    if "native" in deployment_mechanisms:
-        experiments += ["native"] * n
-    random.shuffle(experiments)
-
-    # Keep track of trial number for each deployment mechanism
-    docker_trial = 1
-    wasm_interpreted_trial = 1
-    wasm_aot_trial = 1
-    native_trial = 1
-
-    metrics = []
-
-    for experiment in experiments:
-        print(f"Starting {experiment} experiment")
-        start_time = datetime.now(timezone.utc)
-        trial_metrics = {}
-        
-        if experiment == "docker":
-            trial = docker_trial
-            print(f"Trial {trial}")
-            docker_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_container_perf_experiment(container_exec_cmd, container_start_cmd)
-                    remove_container_and_its_prometheus_data(CONTAINER_NAME)
-                    trial_metrics_row = prepare_trial_data_as_csv_rows(experiment, trial, start_time, trial_metrics, 
-                        PERF_EVENTS + MEMORY_FIELD_NAMES + CPU_FIELD_NAMES, allow_missing_metrics)
-                    metrics.extend(trial_metrics_row)
-                    break
-                except Exception as e:
-                    print(f"Error during docker trial {trial}, attempt {attempt + 1}: {e}")
-                    remove_container(CONTAINER_NAME)
-                    if attempt == MAX_RETRIES - 1:
-                        raise
-        elif experiment == "wasm_interpreted":
-            trial = wasm_interpreted_trial
-            print(f"Trial {trial}")
-            wasm_interpreted_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_non_container_perf_experiment(wasm_interpreted_cmd)
-                    trial_metrics_row = prepare_trial_data_as_csv_rows(experiment, trial, start_time, trial_metrics, 
-                        PERF_EVENTS + MEMORY_FIELD_NAMES + CPU_FIELD_NAMES, allow_missing_metrics)
-                    metrics.extend(trial_metrics_row)
-                    break
-                except Exception as e:
-                    print(f"Error during wasm_interpreted trial {trial}, attempt {attempt + 1}: {e}")
-                    cleanup_custom_cgroup()
-                    if attempt == MAX_RETRIES - 1:
-                        raise
-        elif experiment == "wasm_aot":
-            trial = wasm_aot_trial
-            print(f"Trial {trial}")
-            wasm_aot_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_non_container_perf_experiment(wasm_aot_cmd)
-                    trial_metrics_row = prepare_trial_data_as_csv_rows(experiment, trial, start_time, trial_metrics, 
-                        PERF_EVENTS + MEMORY_FIELD_NAMES + CPU_FIELD_NAMES, allow_missing_metrics)
-                    metrics.extend(trial_metrics_row)
-                    break
-                except Exception as e:
-                    print(f"Error during wasm_aot trial {trial}, attempt {attempt + 1}: {e}")
-                    cleanup_custom_cgroup()
-                    if attempt == MAX_RETRIES - 1:
-                        raise
-        elif experiment == "native":
-            trial = native_trial
-            print(f"Trial {trial}")
-            native_trial += 1
-            for attempt in range(MAX_RETRIES):
-                try:
-                    trial_metrics = run_non_container_perf_experiment(native_cmd)
-                    trial_metrics_row = prepare_trial_data_as_csv_rows(experiment, trial, start_time, trial_metrics, 
-                        PERF_EVENTS + MEMORY_FIELD_NAMES + CPU_FIELD_NAMES, allow_missing_metrics)
-                    metrics.extend(trial_metrics_row)
-                    break
-                except Exception as e:
-                    print(f"Error during native trial {trial}, attempt {attempt + 1}: {e}")
-                    cleanup_custom_cgroup()
-                    if attempt == MAX_RETRIES - 1:
-                        raise
-    
-    # Write the results into a CSV
-    field_names = CSV_BASIC_FIELD_NAMES + PERF_EVENTS + MEMORY_FIELD_NAMES + CPU_FIELD_NAMES
-    write_metrics_to_csv(results_filename, field_names, metrics)
-
-    stop_cadvisor_and_prometheus_if_running()
+    Args:
+        pids: The process IDs
+    Returns:
+        dict: The MEMORY_ATTRIBUTION_FIELD_NAMES metrics, in bytes
+    """
+    attribution = {field_name: 0 for field_name in MEMORY_ATTRIBUTION_FIELD_NAMES}
+    if not pids:
+        return attribution
+
+    # Only keep the header line of each mapping and the fields needed, since the files are long
+    cmd = ["sudo", "grep", "-h", "-s", "-E", r"^([0-9a-f]+-[0-9a-f]+ |(Pss|Private_Clean|Private_Dirty|Shared_Clean):)"] \
+        + [f"/proc/{pid}/smaps" for pid in pids]
+    output = subprocess.run(cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout
+
+    category = None
+    for line in output.splitlines():
+        if SMAPS_MAPPING_HEADER_PATTERN.match(line):
+            # Each header is in the format "<start>-<end> <perms> <offset> <dev> <inode> [<pathname>]"
+            fields = line.split(maxsplit=5)
+            category = classify_memory_region(fields[5] if len(fields) > 5 else "")
+            continue
+
+        # Each field is in the format "Pss:    1234 kB"
+        key, value = line.split(":", 1)
+        size = int(value.split()[0]) * 1024
+        if key == "Pss":
+            attribution[f"peak-{category}-pss-bytes"] += size
+            attribution["peak-total-pss-bytes"] += size
+        elif key.startswith("Private_"):
+            attribution[f"peak-{category}-uss-bytes"] += size
+            attribution["peak-total-uss-bytes"] += size
+        if key in ("Private_Clean", "Shared_Clean") and category in FILE_BACKED_MEMORY_REGION_CATEGORIES:
+            attribution["peak-shareable-bytes"] += size
+
+    return attribution
+
+def classify_memory_region(pathname):
+    """Classifies a memory mapping by what backs it, as one of MEMORY_REGION_CATEGORIES.
 
+    Args:
+        pathname: The pathname of the mapping in the smaps file, which is empty for anonymous mappings
+    Returns:
+        str: The category of the mapping
+    """
+    if pathname == "" or pathname.startswith("[anon"):
+        # Anonymous mappings hold large allocations, such as tensors and WebAssembly linear memory
+        return "anonymous"
+    if pathname == "[heap]":
+        return "heap"
+    if pathname.startswith("["):
+        # The stack and kernel-provided mappings such as [vdso]
+        return "other"
+    if SHARED_LIBRARY_PATH_PATTERN.search(pathname):
+        return "shared-library"
+    if pathname.startswith(MODEL_MAPPING_PATH_PREFIXES):
+        return "model-file"
+    return "other-file"
+
+@harness_phase("cadvisor-prometheus-start")
 def start_cadvisor_and_prometheus():
     """Starts cAdvisor and Prometheus in the background."""
     start_cadvisor()
@@ -500,8 +3119,8 @@ def start_prometheus():
     run_shell_cmd_in_background(PROMETHEUS_START_CMD.split())
 
 def start_cadvisor():
-    """Starts cAdvisor in the background."""
-    run_shell_cmd_in_background(CADVISOR_START_CMD.split())
+    """Starts cAdvisor in the background, measuring the perf events of the current perf events config."""
+    run_shell_cmd_in_background(CADVISOR_START_CMD_TEMPLATE.format(perf_config_path=cadvisor_perf_config_path).split())
 
 def start_cadvisor_and_prometheus_if_not_running():
     """Starts cAdvisor and Prometheus if they are not already running."""
@@ -510,8 +3129,10 @@ def start_cadvisor_and_prometheus_if_not_running():
         start_cadvisor_and_prometheus()
 
     # Give cAdvisor and Prometheus time to start up
-    time.sleep(CADVISOR_PROMETHEUS_WAIT_TIME)
+    with harness_span("cadvisor-prometheus-wait"):
+        time.sleep(CADVISOR_PROMETHEUS_WAIT_TIME)
 
+@harness_phase("cadvisor-prometheus-stop")
 def stop_cadvisor_and_prometheus():
     """Stops cAdvisor and Prometheus."""
     stop_cadvisor()
@@ -533,12 +3154,16 @@ def stop_cadvisor_and_prometheus_if_running():
     if cadvisor_and_prometheus_running:
         stop_cadvisor_and_prometheus()
 
-def run_non_container_perf_experiment(cmd): 
+def run_non_container_perf_experiment(cmd, memory_attribution=False, device_profile=None, before_workload=None): 
     """Run a performance experiment for a non-container deployment mechanism, such as WebAssembly or native, 
     and collect the relevant data from Prometheus.
 
     Args:
         cmd: The command to run for the experiment
+        memory_attribution: Whether to also sample the memory attribution of the workload's processes
+        device_profile: The device profile to run the workload under, or None for all of the device's CPUs
+        before_workload: A function to call just before the workload starts, after waiting for cAdvisor and 
+            Prometheus, such as one waiting for the device to cool down and sampling its thermal state
     Returns:
         A list of tuples in format ("special_identifier", trial_metrics_set), where trial_metrics_set is a dictionary
             containing the trial metrics themselves. This format is used and expected by other functions so we can store different types 
@@ -548,14 +3173,23 @@ def run_non_container_perf_experiment(cmd):
     """
     start_cadvisor_and_prometheus_if_not_running()
 
-    # Create the cgroup that the process will be assigned to
-    run_shell_cmd(CREATE_CGROUP_CMD.split())
+    # Create the cgroup that the process will be assigned to, which also restricts its CPUs under a device profile
+    exec_in_cgroup_cmd_prefix = create_cgroup_under_device_profile(CUSTOM_CGROUP_NAME, device_profile)
+
+    if before_workload is not None:
+        before_workload()
 
     start_time = datetime.now(timezone.utc)
     start_timestamp = start_time.timestamp()
 
-    run_in_cgroup_cmd = EXEC_IN_CGROUP_CMD_PREFIX.split() + cmd.split()
-    run_shell_cmd(run_in_cgroup_cmd)
+    run_in_cgroup_cmd = exec_in_cgroup_cmd_prefix + cmd.split()
+    with harness_span("workload"):
+        if memory_attribution:
+            attribution_metrics = run_shell_cmd_with_memory_attribution(run_in_cgroup_cmd, 
+                lambda: get_density_instance_pids("native", [CUSTOM_CGROUP_NAME]))
+        else:
+            attribution_metrics = {}
+            run_shell_cmd(run_in_cgroup_cmd)
 
     end_time = datetime.now(timezone.utc)
     end_timestamp = end_time.timestamp()
@@ -568,18 +3202,155 @@ def run_non_container_perf_experiment(cmd):
         formatted_query = query.format(name_or_id=f"/{CUSTOM_CGROUP_NAME}", 
             container_duration_ms=execution_duration_ms, end_container_timestamp=end_timestamp)
         metrics.update(get_parsed_prometheus_query_results(formatted_query, label))
+    add_cpu_usage_seconds(metrics, execution_duration_ms / 1000)
+    metrics.update(get_perf_scaling_ratios(f"/{CUSTOM_CGROUP_NAME}"))
+    metrics.update(read_cgroup_io_stat(CUSTOM_CGROUP_NAME))
+    metrics.update(attribution_metrics)
 
-    cleanup_custom_cgroup()
+    cleanup_custom_cgroup(device_profile)
 
     return [("", metrics)]
 
-def run_container_perf_experiment(container_exec_cmd, container_start_cmd):
+def add_cpu_usage_seconds(metrics, duration_seconds):
+    """Adds the CPU time used during a trial to its metrics, from its total CPU utilization, which is averaged over all 
+    of the device's cores, along with the variance of the estimate of the Docker daemon's baseline subtracted from it.
+
+    Args:
+        metrics: The metrics of the trial, which are updated in place
+        duration_seconds: The duration of the trial in seconds, over which the CPU utilization was measured
+    """
+    utilization_field_name = CPU_FIELD_NAMES[0]
+    cpu_seconds_per_percentage = NUM_CORES * duration_seconds / 100
+    if utilization_field_name in metrics:
+        metrics[CPU_USAGE_SECONDS_FIELD_NAME] = metrics[utilization_field_name] * cpu_seconds_per_percentage
+    if f"{utilization_field_name}-baseline-variance" in metrics:
+        metrics[f"{CPU_USAGE_SECONDS_FIELD_NAME}-baseline-variance"] = \
+            metrics[f"{utilization_field_name}-baseline-variance"] * cpu_seconds_per_percentage ** 2
+
+@contextmanager
+def daemon_baseline_sampling(enabled):
+    """Samples the Docker daemon's baseline in the background while in the context, adding to the windows kept from
+    earlier in the session.
+
+    Args:
+        enabled: Whether to sample the daemon's baseline, which is only needed if Docker trials are run
+    """
+    if not enabled:
+        yield
+        return
+
+    stop_event = threading.Event()
+    sampler = threading.Thread(target=sample_daemon_baseline, args=(stop_event,), daemon=True)
+    sampler.start()
+    try:
+        yield
+    finally:
+        stop_event.set()
+        sampler.join()
+
+def start_daemon_baseline_pass():
+    """Starts counting the windows the Docker daemon's baseline was sampled over afresh for a new pass of the perf 
+    experiments, since the earlier windows did not measure its perf events."""
+    with daemon_baseline_lock:
+        daemon_baseline["pass-windows"] = 0
+
+def sample_daemon_baseline(stop_event):
+    """Samples the Docker daemon's metrics over consecutive windows of DAEMON_BASELINE_WINDOW_TIME seconds until 
+    stopped, discarding those that overlapped a pause of the sampling, and keeps each for the estimate of its baseline.
+    The queries are made without holding daemon_baseline_lock, so a Docker trial does not wait for them.
+
+    Args:
+        stop_event: The event set once the perf experiments have finished
+    """
+    while not stop_event.is_set():
+        with daemon_baseline_lock:
+            paused = daemon_baseline["paused"]
+            pauses = daemon_baseline["pauses"]
+        if paused:
+            stop_event.wait(DAEMON_BASELINE_POLL_INTERVAL)
+            continue
+        if stop_event.wait(DAEMON_BASELINE_WINDOW_TIME):
+            return
+
+        end_window_timestamp = datetime.now(timezone.utc).timestamp()
+        with daemon_baseline_lock:
+            if daemon_baseline["paused"] or daemon_baseline["pauses"] != pauses:
+                continue
+
+        window_metrics = {}
+        try:
+            for query, label in zip(PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_BASELINE, PROMETHEUS_QUERIES_LABELS):
+                formatted_query = query.format(container_duration_ms=round(DAEMON_BASELINE_WINDOW_TIME * 1000), 
+                    end_container_timestamp=end_window_timestamp)
+                window_metrics.update(get_parsed_prometheus_query_results(formatted_query, label))
+        except Exception as e:
+            print(f"Warning: could not sample the Docker daemon's baseline: {e}")
+            continue
+
+        # A Docker trial that started during the queries deletes the daemon's series, which they may have missed
+        with daemon_baseline_lock:
+            if daemon_baseline["pauses"] == pauses:
+                daemon_baseline["windows"].append(window_metrics)
+                daemon_baseline["pass-windows"] += 1
+
+def get_daemon_baseline_estimate():
+    """Gets the estimate of the Docker daemon's baseline from the windows kept.
+
+    Returns:
+        tuple: The mean of each metric over the windows it was measured in, with its perf events as rates per second,
+            and the variance of each mean, i.e. the variance of the metric's values over the windows divided by their
+            number
+    """
+    with daemon_baseline_lock:
+        windows = list(daemon_baseline["windows"])
+
+    values = {}
+    for window_metrics in windows:
+        for key, value in window_metrics.items():
+            values.setdefault(key, []).append(value)
+    means = {key: statistics.fmean(key_values) for key, key_values in values.items()}
+    variances = {key: statistics.variance(key_values) / len(key_values) if len(key_values) > 1 else 0 
+        for key, key_values in values.items()}
+    return means, variances
+
+def wait_for_daemon_baseline():
+    """Waits until the Docker daemon's baseline has been sampled over at least DAEMON_BASELINE_MIN_WINDOWS windows
+    since the current pass started, which only takes time before the first Docker trial of a pass. The trial fails if it has not been within 
+    DAEMON_BASELINE_WAIT_TIMEOUT seconds."""
+    deadline = time.monotonic() + DAEMON_BASELINE_WAIT_TIMEOUT
+    with harness_span("daemon-baseline-wait"):
+        while True:
+            with daemon_baseline_lock:
+                if daemon_baseline["pass-windows"] >= DAEMON_BASELINE_MIN_WINDOWS:
+                    return
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"The Docker daemon's baseline was not measured within {DAEMON_BASELINE_WAIT_TIMEOUT} seconds")
+            time.sleep(DAEMON_BASELINE_POLL_INTERVAL)
+
+@contextmanager
+def daemon_baseline_paused():
+    """Pauses sampling the Docker daemon's baseline while in the context, for a Docker trial or anything else making 
+    the daemon busy; a window overlapping the context is discarded."""
+    with daemon_baseline_lock:
+        daemon_baseline["paused"] = True
+        daemon_baseline["pauses"] += 1
+    try:
+        yield
+    finally:
+        with daemon_baseline_lock:
+            daemon_baseline["paused"] = False
+
+def run_container_perf_experiment(container_exec_cmd, container_start_cmd, memory_attribution=False, before_workload=None):
     """Run a performance experiment for the Docker deployment mechanism,
     and collect the relevant data from Prometheus.
 
     Args:
         container_exec_cmd: The command to execute the workload in the container
         container_start_cmd: The command to start the container
+        memory_attribution: Whether to also sample the memory attribution of the container's processes, including
+            its shim
+        before_workload: A function to call just before the container starts, after waiting for cAdvisor and 
+            Prometheus, such as one waiting for the device to cool down and sampling its thermal state
     Returns:
         A list of tuples in format ("special_identifier", trial_metrics_set), where trial_metrics_set is a dictionary
             containing the trial metrics themselves. This format is used and expected by other functions so we can store different types 
@@ -592,24 +3363,24 @@ def run_container_perf_experiment(container_exec_cmd, container_start_cmd):
     # usage that occured before the experiment
     cleanup_daemon_cgroup()
 
-    # Get the daemon's baseline metrics
-    daemon_metrics_baseline = {}
-    time.sleep(DAEMON_MEASUREMENT_TIME)
-
-    curr_time = datetime.now(timezone.utc)
-    curr_timestamp = curr_time.timestamp()
+    # Get the estimate of the daemon's baseline metrics sampled in the background so far, and its variance
+    daemon_metrics_baseline, daemon_baseline_variances = get_daemon_baseline_estimate()
 
-    for query, label in zip(PROMETHEUS_PERF_AND_MEMORY_QUERIES_DAEMON_BASELINE, PROMETHEUS_QUERIES_LABELS):
-        formatted_query = query.format(container_duration_ms=DAEMON_MEASUREMENT_TIME * 1000, 
-            end_container_timestamp=curr_timestamp)
-        daemon_metrics_baseline.update(get_parsed_prometheus_query_results(formatted_query, label))
+    if before_workload is not None:
+        before_workload()
 
     # Run the container and time the execution
     start_container_time = datetime.now(timezone.utc)
     start_container_timestamp = start_container_time.timestamp()
 
     container_cmd = container_start_cmd.split() + container_exec_cmd.split()
-    run_shell_cmd(container_cmd)
+    with harness_span("workload"):
+        if memory_attribution:
+            attribution_metrics = run_shell_cmd_with_memory_attribution(container_cmd, 
+                lambda: get_density_instance_pids("docker", []))
+        else:
+            attribution_metrics = {}
+            run_shell_cmd(container_cmd)
 
     end_container_time = datetime.now(timezone.utc)
     end_container_timestamp = end_container_time.timestamp()
@@ -638,10 +3409,11 @@ def run_container_perf_experiment(container_exec_cmd, container_start_cmd):
         for key in container_metrics}
 
     # Multiply the perf events part of the daemon's baseline metrics by the container's execution time in
-    # seconds, since the former was obtained using rate
+    # seconds, since the former was obtained using rate, and their variances by its square
     for perf_event in PERF_EVENTS:
         if perf_event in daemon_metrics_baseline:
             daemon_metrics_baseline[perf_event] = round(daemon_metrics_baseline[perf_event] * (container_duration_ms / 1000))
+            daemon_baseline_variances[perf_event] *= (container_duration_ms / 1000) ** 2
 
     # Subtract the daemon's baseline metrics from the daemon's metrics during the container's execution
     daemon_extra_overhead_metrics = {key: max(0, daemon_metrics_during_container[key] - daemon_metrics_baseline.get(key, 0))
@@ -650,6 +3422,21 @@ def run_container_perf_experiment(container_exec_cmd, container_start_cmd):
     # Sum the metrics for the container and only the extra overhead for the daemon during the container's execution
     container_and_daemon_extra_overhead_metrics = {key: container_metrics[key] + daemon_extra_overhead_metrics.get(key, 0)
         for key in container_metrics}
+    container_and_daemon_extra_overhead_metrics.update({f"{key}-baseline-variance": variance 
+        for key, variance in daemon_baseline_variances.items() if key in container_metrics})
+
+    # The memory attribution only covers the container's processes, so is the same for each view of the daemon's overhead,
+    # as are the perf events' scaling ratios, which are those of the container's events the daemon's are added to, and
+    # the block I/O, which is charged to the container reading the model and input rather than the daemon
+    scaling_ratios = get_perf_scaling_ratios(container_cgroup_id)
+    io_metrics = {}
+    for field_name, query in PROMETHEUS_IO_QUERIES.items():
+        io_metrics.update(get_parsed_prometheus_query_results(query.format(name_or_id=container_cgroup_id), field_name))
+    for view_metrics in [container_metrics, container_and_daemon_metrics, container_and_daemon_extra_overhead_metrics]:
+        add_cpu_usage_seconds(view_metrics, container_duration_ms / 1000)
+        view_metrics.update(attribution_metrics)
+        view_metrics.update(scaling_ratios)
+        view_metrics.update(io_metrics)
 
     return [("_container", container_metrics), ("_container_and_daemon", container_and_daemon_metrics),
         ("_container_and_daemon_extra_overhead", container_and_daemon_extra_overhead_metrics)]
@@ -663,6 +3450,7 @@ def stop_container(container_name):
     cmd = CONTAINER_STOP_CMD.format(container_name=container_name).split()
     run_shell_cmd(cmd)
 
+@harness_phase("container-remove")
 def remove_container(container_name):
     """Removes a container with the given name.
 
@@ -689,6 +3477,7 @@ def remove_container_and_its_prometheus_data(container_name):
     remove_container(container_name)
     delete_prometheus_series_given_name(container_name)
 
+@harness_phase("container-inspect")
 def get_cgroup_id_for_container(container_name):
     """Gets the cgroup ID for a container with the given name.
 
@@ -787,6 +3576,7 @@ def query_prometheus(query):
     params = {"query": query}
     return query_prometheus_with_params(params)
 
+@harness_phase("prometheus-query")
 def query_prometheus_with_params(params):
     """Queries Prometheus with given parameters.
     Args:
@@ -810,22 +3600,144 @@ def delete_prometheus_series_given_name(name):
     match = f"{{name='{name}'}}"
     delete_prometheus_series(match)
 
-def cleanup_custom_cgroup():
-    """Cleans up the custom cgroup created for non-Docker experiments."""
-    if cgroup_exists(CUSTOM_CGROUP_NAME):
-        run_shell_cmd(DELETE_CGROUP_CMD.split())
+def read_cgroup_io_stat(cgroup_name):
+    """Reads the block I/O of a cgroup since it was created from its io.stat file, summed over the devices.
+
+    Args:
+        cgroup_name: The name of the cgroup
+    Returns:
+        dict: The values of the IO_FIELD_NAMES fields, which is empty if the cgroup has no io.stat file, as under cgroup
+            v1 or if the io controller is not enabled for it
+    """
+    io_stat_path = CGROUP_IO_STAT_PATH_TEMPLATE.format(cgroup_name=cgroup_name)
+    if not os.path.exists(io_stat_path):
+        return {}
+
+    # Each line is a device's major and minor numbers followed by its statistics, e.g. "179:0 rbytes=1024 wbytes=0 ..."
+    io_metrics = {field_name: 0 for field_name in IO_FIELD_NAMES}
+    with open(io_stat_path, "r") as f:
+        for line in f:
+            for statistic in line.split()[1:]:
+                key, value = statistic.split("=")
+                if key in IO_STAT_KEYS:
+                    io_metrics[IO_STAT_KEYS[key]] += int(value)
+    return io_metrics
+
+def cleanup_custom_cgroup(device_profile=None):
+    """Cleans up the custom cgroup created for non-Docker experiments.
+
+    Args:
+        device_profile: The device profile the cgroup was created under, or None for all of the device's CPUs
+    """
+    delete_cgroup_under_device_profile(CUSTOM_CGROUP_NAME, device_profile)
     delete_prometheus_series_given_id(CUSTOM_CGROUP_NAME)
 
-def cgroup_exists(cgroup_name):
+def get_cgroup_controllers(device_profile, controllers=MEASUREMENT_CGROUP_CONTROLLERS):
+    """Gets the controllers a cgroup is created under, adding those restricting its CPUs under a device profile.
+
+    Args:
+        device_profile: The device profile, as returned by parse_device_profiles(), or None for all of the device's CPUs
+        controllers: The controllers the cgroup needs regardless of the device profile
+    Returns:
+        str: The comma-separated controllers, as cgcreate, cgexec and cgdelete take them
+    """
+    controllers = list(controllers)
+    if device_profile is not None and device_profile["cpus"] is not None:
+        controllers.append(CPU_QUOTA_CGROUP_CONTROLLER)
+    if device_profile is not None and device_profile["cpuset"] is not None:
+        controllers.append(CPUSET_CGROUP_CONTROLLER)
+    return ",".join(controllers)
+
+def create_cgroup_under_device_profile(cgroup_name, device_profile, controllers=MEASUREMENT_CGROUP_CONTROLLERS):
+    """Creates a custom cgroup restricted to the CPU quota and the set of CPUs of a device profile.
+
+    Args:
+        cgroup_name: The name of the cgroup
+        device_profile: The device profile, as returned by parse_device_profiles(), or None for all of the device's CPUs
+        controllers: The controllers the cgroup needs regardless of the device profile
+    Returns:
+        list: The prefix of a command executing a command in the cgroup
+    """
+    cgroup_controllers = get_cgroup_controllers(device_profile, controllers)
+    with harness_span("cgroup-create"):
+        run_shell_cmd(CREATE_CGROUP_WITH_CONTROLLERS_CMD_TEMPLATE.format(controllers=cgroup_controllers, 
+            cgroup_name=cgroup_name).split())
+        if device_profile is not None:
+            set_cgroup_device_profile(cgroup_name, device_profile)
+    return EXEC_IN_CGROUP_WITH_CONTROLLERS_CMD_PREFIX_TEMPLATE.format(controllers=cgroup_controllers, 
+        cgroup_name=cgroup_name).split()
+
+def set_cgroup_device_profile(cgroup_name, device_profile):
+    """Restricts a custom cgroup to the CPU quota and the set of CPUs of a device profile.
+
+    Args:
+        cgroup_name: The name of the cgroup
+        device_profile: The device profile, as returned by parse_device_profiles()
+    """
+    parameters = {}
+    if device_profile["cpus"] is not None:
+        quota = round(device_profile["cpus"] * CPU_QUOTA_PERIOD_US)
+        if is_cgroup_v2():
+            parameters[CGROUP_V2_CPU_QUOTA_FILE] = f"{quota} {CPU_QUOTA_PERIOD_US}"
+        else:
+            parameters[CGROUP_V1_CPU_PERIOD_FILE] = CPU_QUOTA_PERIOD_US
+            parameters[CGROUP_V1_CPU_QUOTA_FILE] = quota
+    if device_profile["cpuset"] is not None:
+        parameters[CGROUP_CPUSET_CPUS_FILE] = device_profile["cpuset"]
+        if not is_cgroup_v2():
+            root_mems_path = CGROUP_FILE_PATH_TEMPLATE.format(cgroup_path=CPUSET_CGROUP_CONTROLLER, filename=CGROUP_CPUSET_MEMS_FILE)
+            with open(root_mems_path, "r") as f:
+                parameters[CGROUP_CPUSET_MEMS_FILE] = f.read().strip()
+
+    for parameter, value in parameters.items():
+        # The template is split before it is filled in, since the CPU quota under cgroup v2 contains a space
+        run_shell_cmd([part.format(parameter=parameter, value=value, cgroup_name=cgroup_name) 
+            for part in SET_CGROUP_PARAMETER_CMD_TEMPLATE.split()])
+
+def delete_cgroup_under_device_profile(cgroup_name, device_profile, controllers=MEASUREMENT_CGROUP_CONTROLLERS):
+    """Deletes a custom cgroup created by create_cgroup_under_device_profile(), if it exists.
+
+    Args:
+        cgroup_name: The name of the cgroup
+        device_profile: The device profile the cgroup was created under
+        controllers: The controllers the cgroup needs regardless of the device profile
+    """
+    cgroup_controllers = get_cgroup_controllers(device_profile, controllers)
+    if cgroup_exists(cgroup_name, cgroup_controllers.split(",")[0]):
+        with harness_span("cgroup-delete"):
+            run_shell_cmd(DELETE_CGROUP_WITH_CONTROLLERS_CMD_TEMPLATE.format(controllers=cgroup_controllers, 
+                cgroup_name=cgroup_name).split())
+
+@contextmanager
+def device_cgroup(device_profile):
+    """Runs the enclosed workload under a device profile, in a cgroup of its own if it is not measured in one, such
+    as in the time experiments.
+
+    Args:
+        device_profile: The device profile, as returned by parse_device_profiles(), or None for all of the device's CPUs
+    Yields:
+        list: The prefix of a command executing a command under the device profile, which is empty for all of the
+            device's CPUs
+    """
+    if device_profile is None:
+        yield []
+        return
+    try:
+        yield create_cgroup_under_device_profile(DEVICE_CGROUP_NAME, device_profile, controllers=[])
+    finally:
+        delete_cgroup_under_device_profile(DEVICE_CGROUP_NAME, device_profile, controllers=[])
+
+def cgroup_exists(cgroup_name, controller="memory"):
     """Checks if a cgroup with the given name exists.
 
     Args:
         cgroup_name: The name of the cgroup to check
+        controller: The controller whose hierarchy to check under cgroup v1
     Returns:
         True if the cgroup exists, False otherwise
     """
-    # For cgroup v1, check in /sys/fs/cgroup/memory/cgroup_name
-    path_v1 = f"/sys/fs/cgroup/memory/{cgroup_name}"
+    # For cgroup v1, check in /sys/fs/cgroup/controller/cgroup_name
+    path_v1 = f"/sys/fs/cgroup/{controller}/{cgroup_name}"
     # For cgroup v2, typically the unified hierarchy is mounted at /sys/fs/cgroup
     path_v2 = f"/sys/fs/cgroup/{cgroup_name}"
     
@@ -845,6 +3757,7 @@ def delete_prometheus_series_given_id(id):
     match = f"{{id='{id}'}}"
     delete_prometheus_series(match)
 
+@harness_phase("prometheus-series-delete")
 def delete_prometheus_series(match):
     """Deletes Prometheus data for series matching a given match string.
 
@@ -856,6 +3769,17 @@ def delete_prometheus_series(match):
     if response.status_code != 204:
         raise Exception("Error: Prometheus series deletion failed")
 
+def get_perf_scaling_ratios(name_or_id):
+    """Gets the share of the time each perf event of a cgroup was enabled during which it was counted.
+
+    Args:
+        name_or_id: The ID of the cgroup as expected by Prometheus
+    Returns:
+        A dictionary containing the scaling ratio of each perf event, keyed by its field name
+    """
+    scaling_ratios = get_parsed_prometheus_query_results(PROMETHEUS_PERF_SCALING_RATIO_QUERY.format(name_or_id=name_or_id))
+    return {f"{event}-scaling-ratio": scaling_ratio for event, scaling_ratio in scaling_ratios.items()}
+
 def get_parsed_prometheus_query_results(query, label=None):
     """Queries Prometheus with a given query string and parses the output.
 
@@ -901,14 +3825,86 @@ def main():
     parser.add_argument("--model", type=str, required=True, help="The ML model to use")
     parser.add_argument("--input", type=str, required=True, help="The input file to run ML inference on")
     parser.add_argument("--trials", type=int, required=True, help="The number of trials to run for each experiment type")
-    parser.add_argument("--mechanisms", type=str, default="docker,wasm_interpreted,wasm_aot,native",
-                        help="Comma-separated list of mechanisms to include (choose from docker, wasm_interpreted, wasm_aot, native)")
+    parser.add_argument("--mechanisms", type=str, default=",".join(DEPLOYMENT_MECHANISMS),
+                        help=f"Comma-separated list of mechanisms to include (choose from {', '.join(DEPLOYMENT_MECHANISMS + list(DOCKER_VARIANT_MECHANISMS) + list(WASM_AOT_VARIANT_MECHANISMS))})")
     parser.add_argument("--arch", type=str, required=True, help="The architecture of the target device this is being run on")
     parser.add_argument("--set_name", type=str, required=True, help="The name of the set of experiments being run")
     parser.add_argument("--allow_missing_metrics", action="store_true", help="Allow missing events in the results")
     parser.add_argument("--is_mac", action="store_true", help="Set to true if running on MacOS as the underlying hardware")
+    parser.add_argument("--resolution", type=int, 
+                        help="The height and width to resize the input to; by default this is read from the model manifest or the model's filename")
+    parser.add_argument("--input_mode", type=str, choices=[INPUT_MODE_RAW, INPUT_MODE_PRE_DECODED], default=INPUT_MODE_RAW,
+                        help="Whether the binaries decode the raw image on every trial, or load the tensor pre-decoded on the host; "
+                        + f"the results of the pre-decoded mode are stored with '{INPUT_MODE_FILENAME_SUFFIXES[INPUT_MODE_PRE_DECODED]}' "
+                        + "after the input in their filenames")
+    parser.add_argument("--threads", type=str, default=str(DEFAULT_THREADS),
+                        help="Comma-separated list of intra-op thread counts to sweep for each mechanism, "
+                        + f"where {DEFAULT_THREADS} leaves the thread count to the runtime's default")
+    parser.add_argument("--mode", type=str, choices=[MODE_STANDARD, MODE_DENSITY, MODE_LOAD, MODE_IMAGE, MODE_PROFILE, MODE_MEMORY], 
+                        default=MODE_STANDARD,
+                        help="Whether to run the standard experiments, one instance at a time, the density experiments, "
+                        + "running several instances concurrently, the load experiments, invoking instances open-loop at a target rate, "
+                        + "the image experiments, characterizing the image of each Docker mechanism, the profile experiments, "
+                        + "sampling the call stacks of a designated trial of each mechanism with perf, or the memory experiments, "
+                        + "searching the minimum viable memory of each mechanism and sweeping the memory limit it runs under")
+    parser.add_argument("--instances", type=str, default=DEFAULT_INSTANCE_COUNTS,
+                        help="Comma-separated list of the numbers of concurrent instances to sweep in density experiments")
+    parser.add_argument("--rates", type=str, default=DEFAULT_RATES,
+                        help="Comma-separated list of the arrival rates to sweep in load experiments, in requests per second")
+    parser.add_argument("--duration", type=float, default=DEFAULT_LOAD_DURATION,
+                        help="The number of seconds to issue requests for in each trial of load experiments")
+    parser.add_argument("--arrival", type=str, choices=[ARRIVAL_POISSON, ARRIVAL_CONSTANT], default=ARRIVAL_POISSON,
+                        help="Whether requests arrive as a Poisson process or at constant intervals in load experiments")
+    parser.add_argument("--pool_size", type=int, default=DEFAULT_LOAD_POOL_SIZE,
+                        help="The maximum number of requests running at once in load experiments")
+    parser.add_argument("--storage", type=str, default=DEFAULT_STORAGE,
+                        help="Comma-separated list of the storage media to sweep, from which the models and inputs are read, each "
+                        + f"given as name=path of a directory on it to stage them in (e.g. tmpfs=/mnt/tmpfs), or as {DEFAULT_STORAGE} "
+                        + "for the suite's own directory")
+    parser.add_argument("--devices", type=str, default=DEFAULT_DEVICE,
+                        help="Comma-separated list of the device profiles to sweep, emulating smaller edge devices by restricting "
+                        + "every mechanism to a CPU quota and/or a set of CPUs, each given as name=cpus:cpuset where either may be "
+                        + f"omitted (e.g. small=1.5:0-1, quota=2 or pinned=:0;2), or as {DEFAULT_DEVICE} for all of the device's CPUs")
+    parser.add_argument("--drop_page_cache", action="store_true",
+                        help="Drop the page cache before each trial of the standard experiments, so the model and input are read "
+                        + "from storage in every trial rather than only the first")
+    parser.add_argument("--memory_limits", type=str,
+                        help="Comma-separated list of the memory limits to sweep in memory experiments, in MiB, where "
+                        + f"{UNLIMITED_MEMORY} runs without a limit; by default, {', '.join(str(factor) for factor in MEMORY_SWEEP_FACTORS)} "
+                        + "times each mechanism's minimum viable memory and no limit are swept")
+    parser.add_argument("--memory_search_resolution", type=int, default=DEFAULT_MEMORY_SEARCH_RESOLUTION_MIB,
+                        help="The resolution in MiB to search the minimum viable memory of each mechanism to in memory experiments")
+    parser.add_argument("--memory_max_slowdown", type=float, default=DEFAULT_MEMORY_MAX_SLOWDOWN,
+                        help="The factor by which a mechanism may slow down under a memory limit, relative to running without one, "
+                        + "while the limit still counts as viable in memory experiments")
+    parser.add_argument("--profile_frequency", type=int, default=DEFAULT_PROFILE_FREQUENCY,
+                        help="The number of times per second to sample the call stacks in profile experiments")
+    parser.add_argument("--memory_attribution", action="store_true",
+                        help="Sample the workload's memory during perf experiments, attributing it to shared libraries, model files, heap and anonymous memory")
+    parser.add_argument("--perf_counters", type=int, default=DEFAULT_PERF_COUNTERS,
+                        help="The number of programmable counters the CPU has for perf events, which each group of events must fit in")
+    parser.add_argument("--perf_scheduling", type=str, choices=[PERF_SCHEDULING_PASSES, PERF_SCHEDULING_MULTIPLEX], 
+                        default=PERF_SCHEDULING_PASSES,
+                        help="Whether to measure groups of perf events that do not fit in the counters at once in separate passes "
+                        + "of the perf experiments or to let the kernel multiplex them")
+    parser.add_argument("--cooldown_temperature", type=float,
+                        help="If given, wait before each trial until the device's temperature falls below this many degrees Celsius")
+    parser.add_argument("--tdp_watts", type=float,
+                        help="The thermal design power of the CPU in watts, used to estimate the energy consumed by each trial "
+                        + "from its CPU time if RAPL is not available")
+    parser.add_argument("--cooldown_timeout", type=float, default=DEFAULT_COOLDOWN_TIMEOUT,
+                        help="The maximum number of seconds to wait for the device to cool down before each trial")
+    parser.add_argument("--force", action="store_true",
+                        help="Run the experiments even if the fingerprint of their existing results shows nothing they depend on changed")
+    parser.add_argument("--metrics_port", type=int,
+                        help="If given, serve the run's progress and the time spent in each of the harness's phases in the "
+                        + "OpenMetrics format on this port")
 
     args = parser.parse_args()
+    start_harness_trace()
+    if args.metrics_port is not None:
+        start_harness_metrics_server(args.metrics_port)
+
     model = args.model
     input_file = args.input
     trials = args.trials
@@ -916,40 +3912,164 @@ def main():
     arch = args.arch
     set_name = args.set_name
     allow_missing_metrics = args.allow_missing_metrics
+    resolution = args.resolution if args.resolution is not None else get_model_resolution(model)
+    thread_counts = sorted(set(int(threads.strip()) for threads in args.threads.split(",") if threads.strip()))
+
+    if any(threads < 0 for threads in thread_counts):
+        raise ValueError("Thread counts must be non-negative")
+
+    instance_counts = sorted(set(int(instances.strip()) for instances in args.instances.split(",") if instances.strip()))
+    if any(instances <= 0 for instances in instance_counts):
+        raise ValueError("Instance counts must be positive")
+
+    if args.memory_search_resolution <= 0 or args.memory_max_slowdown < 1:
+        raise ValueError("The memory search resolution must be positive and the maximum slowdown at least 1")
+
+    storage_media = parse_storage_media(args.storage)
+    # Only the standard experiments are analyzed per storage medium
+    if len(storage_media) > 1 and args.mode != MODE_STANDARD:
+        raise ValueError("Several storage media can only be swept in the standard mode")
+
+    device_profiles = parse_device_profiles(args.devices)
+    # Likewise, only the standard experiments are run under device profiles, which would otherwise restrict each 
+    # concurrent instance on its own rather than the emulated device as a whole
+    if any(device_profile is not None for device_profile in device_profiles.values()) and args.mode != MODE_STANDARD:
+        raise ValueError("Device profiles can only be applied in the standard mode")
 
     # Path to the model and input
     model_path = f"models/{model}"
     input_path = f"inputs/{input_file}"
 
-    # The name of the Docker image to use
-    img_name = IMG_NAME_TEMPLATE.format(arch=arch)
+    # The options passed to the binaries after the model and input
+    binary_options = f"--size {resolution}"
 
-    # The command to execute the workload inside the container
-    container_start_cmd = CONTAINER_START_CMD_TEMPLATE.format(img_name=img_name)
-    container_exec_cmd = f"./{NATIVE_BINARY_NAME} /{model_path} /{input_path}"
-    
-    # For Macs, the AoT Wasm file must have the .so extension
-    if args.is_mac:
-        aot_wasm_file_path = AOT_WASM_FILE_PATH_TEMPLATE.format(extension="so")
-    else:
-        aot_wasm_file_path = AOT_WASM_FILE_PATH_TEMPLATE.format(extension="wasm")
-
-    # The commands to execute for the WebAssembly deployment mechanisms
-    wasm_interpreted_cmd =f"{WASM_BINARY_PATH} --dir .:. {INTERPRETED_WASM_FILE_PATH} {model_path} {input_path}"
-    wasm_aot_cmd = f"{WASM_BINARY_PATH} --dir .:. {aot_wasm_file_path} {model_path} {input_path}"
-
-    # The command to execute for the native deployment mechanism
-    native_cmd = f"{NATIVE_BINARY_PATH} {model_path} {input_path}"
+    # When using pre-decoded inputs, pass the binaries the input's tensor at the model's resolution instead
+    if args.input_mode == INPUT_MODE_PRE_DECODED:
+        pre_decoded_input_filename = PRE_DECODED_INPUT_FILENAME_TEMPLATE.format(input_file=input_file, resolution=resolution)
+        input_path = f"inputs/{PRE_DECODED_INPUTS_DIR_NAME}/{pre_decoded_input_filename}"
+        if not os.path.exists(os.path.join(SUITE_DIR, input_path)):
+            raise FileNotFoundError(f"No pre-decoded tensor found at {input_path}; generate it on the host first")
+        binary_options += " --tensor"
 
+    # The command to execute the workload inside the container, which is the same for every image variant and storage
+    # medium, since the directory the models and inputs are read from is mounted in the same place
+    container_exec_cmd = f"./{NATIVE_BINARY_NAME} /{model_path} /{input_path} {binary_options}"
+    
     # The name of the file to store the results in
-    results_filename_prefix = f"{model}-{input_file}"
+    results_filename_prefix = f"{model}-{input_file}{INPUT_MODE_FILENAME_SUFFIXES[args.input_mode]}"
     results_filename_prefix_with_path = os.path.join(RESULTS_DIR, set_name, results_filename_prefix)
 
+    # Get the AoT-compiled file of each WebAssembly AoT mechanism, compiling it if it is not cached yet
+    aot_wasm_file_paths, aot_compilation_rows = prepare_aot_wasm_files(mechanisms, arch, args.is_mac)
+
+    # The commands to execute for each experiment, i.e. each combination of mechanism, thread count, storage medium and 
+    # device profile; the native binary sets its thread count itself, while the WebAssembly mechanisms pass it to the 
+    # plugin through the environment of the wasmedge process. Containers are restricted to the CPUs of a device profile
+    # by their start command, while the other mechanisms are restricted by the cgroup they run in
+    experiment_cmds = {}
+    for storage, storage_path in storage_media.items():
+        # On other storage media than the suite's own, the model and input are read from where they are staged, which
+        # WebAssembly mechanisms are given access to alongside the suite's directory
+        if storage_path is None:
+            storage_model_path, storage_input_path, storage_dir_option = model_path, input_path, ""
+            models_path, inputs_path = MODELS_PATH, INPUTS_PATH
+        else:
+            staging_path = stage_on_storage(storage_path, [model_path, input_path])
+            storage_model_path = os.path.join(staging_path, model_path)
+            storage_input_path = os.path.join(staging_path, input_path)
+            storage_dir_option = f" --dir {staging_path}:{staging_path}"
+            models_path, inputs_path = os.path.join(staging_path, "models"), os.path.join(staging_path, "inputs")
+
+        # The commands to execute for the WebAssembly deployment mechanisms
+        wasm_interpreted_cmd = f"{WASM_BINARY_PATH} --dir .:.{storage_dir_option} {INTERPRETED_WASM_FILE_PATH} " \
+            + f"{storage_model_path} {storage_input_path} {binary_options}"
+        wasm_aot_cmds = {wasm_aot_mechanism: f"{WASM_BINARY_PATH} --dir .:.{storage_dir_option} {aot_wasm_file_path} " 
+            + f"{storage_model_path} {storage_input_path} {binary_options}"
+            for wasm_aot_mechanism, aot_wasm_file_path in aot_wasm_file_paths.items()}
+
+        # The command to execute for the native deployment mechanism
+        native_cmd = f"{NATIVE_BINARY_PATH} {storage_model_path} {storage_input_path} {binary_options}"
+
+        for threads, (device, device_profile) in itertools.product(thread_counts, device_profiles.items()):
+            dimensions = (threads, storage, device, resolution)
+            threads_option = f" --threads {threads}" if threads != DEFAULT_THREADS else ""
+            threads_env_prefix = f"env {PLUGIN_THREADS_ENV_VAR}={threads} " if threads != DEFAULT_THREADS else ""
+
+            for docker_mechanism in ["docker"] + list(DOCKER_VARIANT_MECHANISMS):
+                if docker_mechanism in mechanisms:
+                    container_start_cmd = CONTAINER_START_CMD_TEMPLATE.format(models_path=models_path, inputs_path=inputs_path,
+                        img_name=get_docker_image_name(docker_mechanism, arch))
+                    experiment_cmds[(docker_mechanism, dimensions)] = (container_exec_cmd + threads_option, 
+                        get_container_start_cmd_with_device_profile(container_start_cmd, device_profile))
+            if "wasm_interpreted" in mechanisms:
+                experiment_cmds[("wasm_interpreted", dimensions)] = threads_env_prefix + wasm_interpreted_cmd
+            for wasm_aot_mechanism, wasm_aot_cmd in wasm_aot_cmds.items():
+                experiment_cmds[(wasm_aot_mechanism, dimensions)] = threads_env_prefix + wasm_aot_cmd
+            if "native" in mechanisms:
+                experiment_cmds[("native", dimensions)] = native_cmd + threads_option
+
+    # Skip the experiments if they were already run with exactly the same files, options and host
+    fingerprint = get_results_fingerprint(args, model_path, input_path, experiment_cmds, aot_wasm_file_paths)
+    fingerprint_filename = results_filename_prefix_with_path + FINGERPRINT_FILENAME_SUFFIX_TEMPLATE.format(mode=args.mode)
+    if not args.force and are_results_up_to_date(fingerprint, fingerprint_filename, results_filename_prefix_with_path, args.mode):
+        print(f"Skipping {args.mode} experiments for {model} and {input_file} since their results are up to date")
+        return
+    if os.path.exists(fingerprint_filename):
+        os.remove(fingerprint_filename)
+
+    # Only store how the AoT-compiled files were obtained once the experiments run with them, so skipped runs do not
+    # overwrite the results of the compilations the existing results were collected with
+    if aot_compilation_rows:
+        write_metrics_to_csv(results_filename_prefix_with_path + AOT_RESULTS_FILENAME_SUFFIX, AOT_FIELD_NAMES, 
+            aot_compilation_rows)
+
+    open_harness_trace_file(results_filename_prefix_with_path + TRACE_FILENAME_SUFFIX_TEMPLATE.format(mode=args.mode))
     try:
-        collect_perf_data(trials, results_filename_prefix_with_path + PERF_RESULTS_FILENAME_SUFFIX, container_exec_cmd, container_start_cmd, wasm_interpreted_cmd, wasm_aot_cmd, native_cmd, allow_missing_metrics, mechanisms)
-        collect_time_data(trials, results_filename_prefix_with_path + TIME_RESULTS_FILENAME_SUFFIX, container_exec_cmd, container_start_cmd, wasm_interpreted_cmd, wasm_aot_cmd, native_cmd, mechanisms)
+        if args.mode == MODE_DENSITY:
+            add_expected_harness_trials(trials * len(experiment_cmds) * len(instance_counts))
+            collect_density_data(trials, results_filename_prefix_with_path + DENSITY_RESULTS_FILENAME_SUFFIX, experiment_cmds,
+                instance_counts, args.cooldown_temperature, args.cooldown_timeout)
+        elif args.mode == MODE_LOAD:
+            rates = sorted(set(float(rate.strip()) for rate in args.rates.split(",") if rate.strip()))
+            add_expected_harness_trials(trials * len(experiment_cmds) * len(rates))
+            collect_load_data(trials, results_filename_prefix_with_path + LOAD_RESULTS_FILENAME_SUFFIX, experiment_cmds, rates,
+                args.duration, args.arrival, args.pool_size, args.cooldown_temperature, args.cooldown_timeout)
+        elif args.mode == MODE_PROFILE:
+            add_expected_harness_trials(len(experiment_cmds))
+            collect_profile_data(results_filename_prefix_with_path + PROFILE_RESULTS_FILENAME_SUFFIX, experiment_cmds,
+                args.profile_frequency, args.cooldown_temperature, args.cooldown_timeout)
+        elif args.mode == MODE_MEMORY:
+            memory_limits = None
+            if args.memory_limits is not None:
+                memory_limits = sorted(set(int(float(memory_limit.strip()) * BYTES_PER_MIB) 
+                    for memory_limit in args.memory_limits.split(",") if memory_limit.strip()))
+            # Only the searches are counted here, since the limits swept by default depend on their results
+            add_expected_harness_trials(len(experiment_cmds))
+            collect_memory_data(trials, results_filename_prefix_with_path + MEMORY_RESULTS_FILENAME_SUFFIX,
+                results_filename_prefix_with_path + MEMORY_SEARCH_RESULTS_FILENAME_SUFFIX, experiment_cmds, memory_limits,
+                args.memory_search_resolution * BYTES_PER_MIB, args.memory_max_slowdown, args.cooldown_temperature, 
+                args.cooldown_timeout)
+        elif args.mode == MODE_IMAGE:
+            add_expected_harness_trials(trials * sum(is_docker_mechanism(mechanism) for mechanism, _ in experiment_cmds))
+            collect_image_data(trials, results_filename_prefix_with_path + IMAGE_RESULTS_FILENAME_SUFFIX, experiment_cmds, arch,
+                args.cooldown_temperature, args.cooldown_timeout)
+        else:
+            # Each experiment is run both under perf and under time
+            add_expected_harness_trials(2 * trials * len(experiment_cmds))
+            collect_perf_data(trials, results_filename_prefix_with_path + PERF_RESULTS_FILENAME_SUFFIX, experiment_cmds, allow_missing_metrics,
+                args.cooldown_temperature, args.cooldown_timeout, args.memory_attribution, args.perf_counters, args.perf_scheduling,
+                args.drop_page_cache, device_profiles)
+            collect_time_data(trials, results_filename_prefix_with_path + TIME_RESULTS_FILENAME_SUFFIX, experiment_cmds,
+                args.cooldown_temperature, args.cooldown_timeout, args.tdp_watts, args.drop_page_cache, device_profiles)
+            write_device_profiles(os.path.join(RESULTS_DIR, set_name, DEVICE_PROFILES_FILENAME), device_profiles)
     finally:
         stop_cadvisor_and_prometheus_if_running()
+        stop_harness_trace()
+        print_harness_summary()
+
+    # Only write the fingerprint once every results file was written
+    with open(fingerprint_filename, "w") as f:
+        json.dump(fingerprint, f, indent=4)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
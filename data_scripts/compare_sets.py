@@ -0,0 +1,268 @@
+"""This script compares the results of two experiment sets, e.g. a baseline and one run with a new runtime build,
+or one run on a VM and one run on a Raspberry Pi. It matches the results of each model, input, deployment mechanism,
+thread count, storage medium, device profile and metric present in both sets, and flags statistically significant 
+regressions and improvements larger than a threshold. Since every metric of every experiment is tested, the p-values
+are adjusted for the number of tests before flagging any, so identical configurations are not flagged by chance. It 
+exits with a non-zero status if there are any regressions, so it can gate upgrades.
+"""
+import pandas as pd
+from statsmodels.stats.multitest import multipletests
+import argparse
+import os
+import csv
+import sys
+
+from analyze_data import welch_t_test_with_confidence_interval, welch_t_test_p_value, mann_whitney_test_with_hodges_lehmann_estimate, \
+    parse_csv_rows, exclude_throttled_trials, get_metrics_in_df, create_directory_if_not_exists, print_if_true, \
+    get_daemon_baseline_variance, RESULTS_DIR, DIMENSION_COLUMNS, THERMAL_COLUMNS, ENERGY_ESTIMATED_COLUMN, NON_METRIC_COLUMNS, COMPUTED_COLUMNS, \
+    DERIVED_METRICS, DAEMON_BASELINE_VARIANCE_COLUMN_SUFFIX
+
+# The suffixes of the results files compared between the sets, and whether each contains perf data
+RESULTS_FILENAME_SUFFIXES = {"-perf_results.csv": True, "-time_results.csv": False}
+
+# The metrics for which a larger value is better, as flagged in their definitions; for every other metric, such as times, memory usage, page faults
+# and energy, a smaller value is better
+HIGHER_IS_BETTER_METRICS = [metric for metric, derived_metric in DERIVED_METRICS.items() 
+    if derived_metric.get("higher-is-better", False)]
+
+# The suffix of the columns of the share of the time each perf event was counted for, which describe how a
+# trial was measured rather than the trial itself, so are not compared by default
+SCALING_RATIO_COLUMN_SUFFIX = "-scaling-ratio"
+
+# The columns describing how a trial was collected rather than the trial itself, besides the non-metric columns
+# of the analysis: its start time and, for sets collected across a fleet, the target it ran on
+COLLECTION_COLUMNS = ["start-time", "target"]
+
+# The methods of adjusting the p-values of every test of a comparison for their number, as named by statsmodels'
+# multipletests, which are Holm's, controlling the probability of flagging any change by chance, and Benjamini and
+# Hochberg's, controlling the expected share of flagged changes that are flagged by chance; the former is the default
+P_VALUE_ADJUSTMENT_METHODS = ["holm", "fdr_bh"]
+DEFAULT_P_VALUE_ADJUSTMENT_METHOD = "holm"
+
+# The exit status when at least one regression was found
+REGRESSION_EXIT_STATUS = 1
+
+# The name of the CSV file within the candidate set's analyzed results directory where the comparison is saved,
+# given the name of the baseline set
+COMPARISON_CSV_FILENAME_TEMPLATE = "set_comparison-{baseline_set}.csv"
+
+def compare_sets(baseline_set, candidate_set, deployment_mechanisms, metrics, significance_level, threshold,
+    docker_overhead_view, exclude_throttled, view_output, p_value_adjustment_method=DEFAULT_P_VALUE_ADJUSTMENT_METHOD):
+    """Compare the results of every experiment present in both sets, adjusting the p-values of the tests for their
+    number before flagging any change.
+
+    Args:
+        baseline_set: The name of the experiment set to compare against.
+        candidate_set: The name of the experiment set to compare.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        metrics: List of metrics to include, or None to include every metric present in both sets.
+        significance_level: The significance level for statistical tests.
+        threshold: The relative change of a metric's mean, e.g. 0.05 for 5%, beyond which a statistically
+            significant change is flagged.
+        docker_overhead_view: The view of the Docker overhead to use.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+        view_output: Whether to view the output of the comparison.
+        p_value_adjustment_method: How to adjust the p-values for the number of tests, one of P_VALUE_ADJUSTMENT_METHODS.
+    Returns:
+        pd.DataFrame: A dataframe containing, for each model, input, deployment mechanism, thread count, storage medium, 
+            device profile and metric, the means in both sets, the relative change and its confidence interval, the outcome of the statistical
+            tests, their p-values before and after adjustment, and whether the change is flagged as a regression or an improvement.
+    """
+    baseline_path = os.path.join(RESULTS_DIR, baseline_set)
+    candidate_path = os.path.join(RESULTS_DIR, candidate_set)
+
+    comparison_rows = []
+    for results_filename in sorted(os.listdir(candidate_path)):
+        results_filename_suffix = next((suffix for suffix in RESULTS_FILENAME_SUFFIXES if results_filename.endswith(suffix)), None)
+        if results_filename_suffix is None or not os.path.exists(os.path.join(baseline_path, results_filename)):
+            continue
+
+        experiment = results_filename[:-len(results_filename_suffix)]
+        model, input = experiment.split("-", 1)
+        is_perf_file = RESULTS_FILENAME_SUFFIXES[results_filename_suffix]
+        baseline_df = parse_results_file(os.path.join(baseline_path, results_filename), deployment_mechanisms, metrics,
+            docker_overhead_view, is_perf_file, exclude_throttled)
+        candidate_df = parse_results_file(os.path.join(candidate_path, results_filename), deployment_mechanisms, metrics,
+            docker_overhead_view, is_perf_file, exclude_throttled)
+
+        experiment_metrics = [metric for metric in get_metrics_in_df(candidate_df) if metric in baseline_df.columns]
+        group_columns = ["deployment-mechanism"] + DIMENSION_COLUMNS
+        baseline_groups = baseline_df.groupby(group_columns)
+        for group, candidate_group_df in candidate_df.groupby(group_columns):
+            if group not in baseline_groups.groups:
+                continue
+            baseline_group_df = baseline_groups.get_group(group)
+            deployment_mechanism, threads, storage, device = group
+
+            for metric in experiment_metrics:
+                comparison_row = compare_metric(baseline_group_df[metric].dropna(), candidate_group_df[metric].dropna(),
+                    significance_level, get_daemon_baseline_variance(baseline_group_df, metric),
+                    get_daemon_baseline_variance(candidate_group_df, metric))
+                if comparison_row is None:
+                    continue
+                comparison_rows.append({"model": model, "input": input, "deployment-mechanism": deployment_mechanism,
+                    "threads": threads, "storage": storage, "device": device, "metric": metric, **comparison_row})
+
+    comparison_df = pd.DataFrame(comparison_rows)
+    if comparison_df.empty:
+        return comparison_df
+    comparison_df = assign_verdicts(comparison_df, significance_level, threshold, p_value_adjustment_method)
+
+    for _, comparison_row in comparison_df[comparison_df["verdict"] != "unchanged"].iterrows():
+        print_if_true(f"{comparison_row['verdict'].capitalize()}: {comparison_row['deployment-mechanism']} with threads={comparison_row['threads']}, "
+            + f"storage={comparison_row['storage']}, device={comparison_row['device']} for {comparison_row['model']} and {comparison_row['input']}, "
+            + f"{comparison_row['metric']} changed by {comparison_row['relative-change'] * 100:+.2f}% "
+            + f"({comparison_row['relative-change-lower'] * 100:+.2f}% to {comparison_row['relative-change-upper'] * 100:+.2f}%, "
+            + f"adjusted p-value {comparison_row['adjusted-p-value']:.4f})", view_output)
+
+    return comparison_df
+
+def parse_results_file(results_path, deployment_mechanisms, metrics, docker_overhead_view, is_perf_file, exclude_throttled):
+    """Parse a results file of either set in the same way as analyze_data.py, keeping only the metrics and the
+    experiment dimensions.
+
+    Args:
+        results_path: The path to the results file.
+        deployment_mechanisms: List of deployment mechanisms to include.
+        metrics: List of metrics to include, or None to include every metric in the file.
+        docker_overhead_view: The view of the Docker overhead to use.
+        is_perf_file: Whether the results file contains performance data (besides time data) or time data.
+        exclude_throttled: Whether to exclude trials during which the device was thermally throttled.
+    Returns:
+        pd.DataFrame: The parsed dataframe.
+    """
+    if metrics is None:
+        metrics = [column for column in pd.read_csv(results_path, nrows=0).columns
+            if column not in NON_METRIC_COLUMNS + COLLECTION_COLUMNS and not column.endswith(SCALING_RATIO_COLUMN_SUFFIX)
+            and not column.endswith(DAEMON_BASELINE_VARIANCE_COLUMN_SUFFIX)] \
+            + COMPUTED_COLUMNS
+
+    df = parse_csv_rows(results_path, deployment_mechanisms, metrics, docker_overhead_view, is_perf_file)
+    if exclude_throttled and "throttled" in df.columns:
+        df = exclude_throttled_trials(df)
+    return df.drop(columns=THERMAL_COLUMNS + [ENERGY_ESTIMATED_COLUMN], errors="ignore")
+
+def compare_metric(baseline_values, candidate_values, significance_level, baseline_extra_variance=0, candidate_extra_variance=0):
+    """Compare a metric's values in the baseline and candidate sets, testing the change of its mean and of its
+    distribution.
+
+    Args:
+        baseline_values: The metric's values in the baseline set.
+        candidate_values: The metric's values in the candidate set.
+        significance_level: The significance level for the confidence interval of the change.
+        baseline_extra_variance: Variance to add to that of the baseline set's mean, such as that of the estimate of 
+            the Docker daemon's baseline subtracted from its values.
+        candidate_extra_variance: Variance to add to that of the candidate set's mean, likewise.
+    Returns:
+        dict: The means, the relative change of the mean and its confidence interval, and the unadjusted p-values of
+            Welch's t-test and the Mann-Whitney U test; or None if either set has too few values to compare.
+    """
+    if len(baseline_values) < 2 or len(candidate_values) < 2:
+        return None
+
+    baseline_mean, candidate_mean, _, ci_lower, ci_upper, _, _, _, _ = \
+        welch_t_test_with_confidence_interval(baseline_values, candidate_values, significance_level, baseline_extra_variance,
+            candidate_extra_variance)
+    p_value = welch_t_test_p_value(baseline_values, candidate_values, baseline_extra_variance, candidate_extra_variance)
+    mann_whitney_p_value, _, _, _, _, _ = \
+        mann_whitney_test_with_hodges_lehmann_estimate(baseline_values, candidate_values, alpha=significance_level)
+
+    # The confidence interval is of the baseline's mean minus the candidate's, so negate it to get that of the change,
+    # and express it relative to the baseline's mean as for the effect sizes of the comparisons
+    relative_change = (candidate_mean - baseline_mean) / baseline_mean if baseline_mean != 0 else float("nan")
+    relative_change_lower = -ci_upper / baseline_mean if baseline_mean != 0 else float("nan")
+    relative_change_upper = -ci_lower / baseline_mean if baseline_mean != 0 else float("nan")
+
+    return {
+        "baseline-mean": baseline_mean,
+        "candidate-mean": candidate_mean,
+        "relative-change": relative_change,
+        "relative-change-lower": relative_change_lower,
+        "relative-change-upper": relative_change_upper,
+        "p-value": p_value,
+        "mann-whitney-p-value": mann_whitney_p_value
+    }
+
+def assign_verdicts(comparison_df, significance_level, threshold, p_value_adjustment_method=DEFAULT_P_VALUE_ADJUSTMENT_METHOD):
+    """Adjust the p-values of every comparison for their number, and flag each statistically significant change of a 
+    metric's mean larger than the threshold as a regression or an improvement.
+
+    Args:
+        comparison_df: The comparisons, as rows returned by compare_metric() along with the metric's name.
+        significance_level: The significance level the adjusted p-values are compared against.
+        threshold: The relative change of the mean beyond which a statistically significant change is flagged.
+        p_value_adjustment_method: How to adjust the p-values for the number of tests, one of P_VALUE_ADJUSTMENT_METHODS.
+    Returns:
+        pd.DataFrame: The comparisons, with the adjusted p-values of both tests, whether each is statistically 
+            significant and the verdict, which is "regression", "improvement" or "unchanged".
+    """
+    comparison_df = comparison_df.copy()
+    for p_value_column, prefix in [("p-value", ""), ("mann-whitney-p-value", "mann-whitney-")]:
+        statistically_significant, adjusted_p_values, _, _ = multipletests(comparison_df[p_value_column].fillna(1),
+            alpha=significance_level, method=p_value_adjustment_method)
+        comparison_df[f"{prefix}adjusted-p-value"] = adjusted_p_values
+        comparison_df[f"{prefix}statistically-significant"] = statistically_significant
+
+    got_worse = comparison_df["relative-change"].where(comparison_df["metric"].isin(HIGHER_IS_BETTER_METRICS),
+        -comparison_df["relative-change"]) < 0
+    flagged = comparison_df["statistically-significant"] & (comparison_df["relative-change"].abs() > threshold)
+    comparison_df["verdict"] = "unchanged"
+    comparison_df.loc[flagged & got_worse, "verdict"] = "regression"
+    comparison_df.loc[flagged & ~got_worse, "verdict"] = "improvement"
+    return comparison_df
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the results of two experiment sets and flag regressions.")
+    parser.add_argument("--baseline-set", type=str, required=True, help="The experiment set to compare against.")
+    parser.add_argument("--candidate-set", type=str, required=True, help="The experiment set to compare.")
+    parser.add_argument("--significance-level", type=float, default=0.05, help="The significance level to use (e.g., 0.05).")
+    parser.add_argument("--p-value-adjustment", type=str, default=DEFAULT_P_VALUE_ADJUSTMENT_METHOD, choices=P_VALUE_ADJUSTMENT_METHODS,
+        help="How to adjust the p-values for the number of tests: holm (Holm-Bonferroni) or fdr_bh (Benjamini-Hochberg).")
+    parser.add_argument("--threshold", type=float, default=0.05,
+        help="The relative change of a metric's mean (e.g., 0.05 for 5%%) beyond which a statistically significant change is flagged.")
+    parser.add_argument("--docker-overhead-view", type=int, default=2, help="The view of the Docker overhead to use (0: exclude daemon overhead, 1: include full daemon overhead, 2: include only additional docker overhead).")
+    parser.add_argument("--mechanisms", type=str, default="docker,wasm_interpreted,wasm_aot,native",
+                    help="Comma-separated list of mechanisms to include (choose from docker, wasm_interpreted, wasm_aot, native)")
+    parser.add_argument("--metrics", type=str, help="Comma-separated list of metrics to include; by default, every metric present in both sets.")
+    parser.add_argument("--exclude-throttled-trials", action="store_true",
+        help="Exclude trials during which the device was thermally throttled from the comparison.")
+    parser.add_argument("--view-output", action="store_true", help="View the output of the comparison.")
+    parser.add_argument("--save-output", action="store_true", help="Save the output of the comparison to a file.")
+    parser.add_argument("--analyzed-results-dir", type=str, default="analyzed_results",
+        help="The name of the directory within the candidate set to save the comparison in.")
+    args = parser.parse_args()
+
+    deployment_mechanisms = [mechanism.strip() for mechanism in args.mechanisms.split(",")]
+    metrics = [metric.strip() for metric in args.metrics.split(",")] + COMPUTED_COLUMNS if args.metrics else None
+
+    for set_name in [args.baseline_set, args.candidate_set]:
+        if not os.path.isdir(os.path.join(RESULTS_DIR, set_name)):
+            print(f"Error: experiment set {set_name} does not exist in {RESULTS_DIR}")
+            sys.exit(2)
+
+    comparison_df = compare_sets(args.baseline_set, args.candidate_set, deployment_mechanisms, metrics,
+        args.significance_level, args.threshold, args.docker_overhead_view, args.exclude_throttled_trials, args.view_output,
+        args.p_value_adjustment)
+    if comparison_df.empty:
+        print(f"No experiments are present in both {args.baseline_set} and {args.candidate_set}")
+        return
+
+    if args.save_output:
+        analyzed_results_path = os.path.join(RESULTS_DIR, args.candidate_set, args.analyzed_results_dir)
+        create_directory_if_not_exists(analyzed_results_path)
+        comparison_csv_path = os.path.join(analyzed_results_path,
+            COMPARISON_CSV_FILENAME_TEMPLATE.format(baseline_set=args.baseline_set))
+
+        # Enclose everything in quotes, as for the comparisons of analyze_data.py
+        comparison_df.to_csv(comparison_csv_path, index=False, quoting=csv.QUOTE_ALL)
+
+    regressions = (comparison_df["verdict"] == "regression").sum()
+    improvements = (comparison_df["verdict"] == "improvement").sum()
+    print(f"Compared {len(comparison_df)} metrics of {args.candidate_set} against {args.baseline_set}: "
+        + f"{regressions} regressions and {improvements} improvements beyond {args.threshold * 100:g}%")
+
+    if regressions > 0:
+        sys.exit(REGRESSION_EXIT_STATUS)
+
+if __name__ == "__main__":
+    main()
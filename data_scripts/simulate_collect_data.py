@@ -0,0 +1,883 @@
+"""This script runs the data collection script hermetically, without sudo, Docker, cgroups, cAdvisor, Prometheus,
+WasmEdge or libtorch, so the harness itself can be load-tested and profiled on any machine. It stages the data
+collection script in a temporary suite directory alongside stand-ins for everything it runs: the workloads of
+each deployment mechanism, which sleep for a latency and allocate an amount of memory drawn from a simulation
+profile, the Docker CLI, WasmEdge, the time command and the cgroup tools, as well as a local HTTP server answering
+the Prometheus queries and series deletions of the data collection with metrics consistent with the workloads that
+ran. The results are copied into the results directory like those of a target device, so they can be analyzed too.
+
+When invoked with STUB_ARG as its first argument, this script acts as one of the stand-ins instead.
+"""
+import argparse
+import hashlib
+import http.server
+import importlib.util
+import json
+import os
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+
+# The directory of this script, the root of the suite and the directory storing results
+SCRIPTS_DIR = os.path.abspath(os.path.dirname(__file__))
+BENCHMARK_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+
+# The paths of the data collection script and the perf config it reads, which are staged in the simulated suite
+COLLECT_DATA_SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "collect_data.py")
+PERF_CONFIG_PATH = os.path.join(BENCHMARK_DIR, "cadvisor", "perf_config.json")
+
+# The argument this script is invoked with to act as a stand-in, followed by the stand-in's name
+STUB_ARG = "--stub"
+
+# The environment variable pointing the stand-ins at the directory holding the state of the simulation: the
+# simulation profile, the containers the fake Docker CLI created and the ledger of the workloads that ran,
+# which the Prometheus stand-in answers queries from
+SIMULATION_STATE_DIR_ENV_VAR = "SIMULATION_STATE_DIR"
+
+# The environment variable the fake cgexec and Docker CLI pass the ID of the cgroup a workload runs in through,
+# under which it is recorded in the ledger
+SIMULATION_CGROUP_ID_ENV_VAR = "SIMULATION_CGROUP_ID"
+
+# The environment variables the perf stand-in passes the file to record the call stacks of a workload to, and how many
+# times per second to sample them, through
+SIMULATION_PERF_DATA_PATH_ENV_VAR = "SIMULATION_PERF_DATA_PATH"
+SIMULATION_PERF_FREQUENCY_ENV_VAR = "SIMULATION_PERF_FREQUENCY"
+
+# The files and directories within the simulation's state directory
+PROFILE_FILENAME = "profile.json"
+CONTAINERS_DIR_NAME = "containers"
+LEDGER_DIR_NAME = "ledger"
+CGROUPS_DIR_NAME = "cgroups"
+CADVISOR_PERF_CONFIG_STATE_FILENAME = "cadvisor_perf_config_path"
+
+# The option the data collection passes cAdvisor its perf events config with
+CADVISOR_PERF_CONFIG_ARG_PREFIX = "-perf_events_config="
+
+# The shell commands setting the directory of the simulated cgroup whose name the variable name holds, within the
+# memory controller's hierarchy, which under cgroup v1 is a directory of its own
+SIMULATED_CGROUP_DIR_SHELL_CMD = (f'dir="${SIMULATION_STATE_DIR_ENV_VAR}/{CGROUPS_DIR_NAME}/$name"\n'
+    f'[ -f /sys/fs/cgroup/cgroup.controllers ] || dir="${SIMULATION_STATE_DIR_ENV_VAR}/{CGROUPS_DIR_NAME}/memory/$name"')
+
+# The stand-ins that only need to succeed, run the rest of their command, or keep the parameters of the simulated 
+# cgroups, which are shell scripts so they start quickly; sudo keeps the environment assignments it is given, as the 
+# data collection passes LD_LIBRARY_PATH and PATH, and cgcreate clears any parameters a cgroup of the same name kept
+SHELL_STUBS = {
+    "sudo": 'exec env "$@"',
+    "cgcreate": f'name="${{2#*:}}"\n{SIMULATED_CGROUP_DIR_SHELL_CMD}\nrm -rf "$dir"',
+    "cgdelete": "exit 0",
+    "cgset": f'name="$3"\n{SIMULATED_CGROUP_DIR_SHELL_CMD}\nmkdir -p "$dir"\nprintf "%s\\n" "${{2#*=}}" > "$dir/${{2%%=*}}"',
+    "pkill": "exit 0",
+    "cgexec": f'cgroup_id="/${{2#*:}}"\nshift 2\n{SIMULATION_CGROUP_ID_ENV_VAR}="$cgroup_id" exec "$@"'
+}
+
+# The stand-ins implemented by this script, each mapped to where it is installed in the simulated suite, relative
+# to the suite directory, or to None for its directory of stand-ins on the PATH
+PYTHON_STUBS = {
+    "docker": None,
+    "time": None,
+    "wasmedge": ".wasmedge/bin/wasmedge",
+    "native": "native/torch_image_classification",
+    "cadvisor": "cadvisor/cadvisor",
+    "prometheus": "prometheus/prometheus",
+    "perf": None
+}
+
+# The directory of the stand-ins on the PATH, relative to the suite directory
+STUBS_DIR_NAME = "simulation_bin"
+
+# The default profile of the simulation: for each deployment mechanism, the medians and the sigmas of the log-normal
+# distributions of its workload's latency in seconds and of the memory it allocates, and its CPU utilization;
+# a mechanism not in the profile is simulated as its longest prefix in it, e.g. docker_slim as docker. The Docker
+# daemon's share of those and how much it varies between queries, the rate of each perf event per second of a 
+# workload, the block I/O of a workload, the share of a workload's samples taken in each folded call stack when it is
+# profiled, and the characteristics of the Docker images and of the AoT compilation are simulated too, as is the memory pressure of a workload under a memory
+# limit: above the given share of the limit, the kernel reclaims an increasing share of its memory, slowing it down
+# by up to the given factor, and above the limit it is OOM-killed. Restricted to fewer CPUs than the host has, a 
+# workload slows down as Amdahl's law predicts, with the given share of it parallel
+DEFAULT_SIMULATION_PROFILE = {
+    "mechanisms": {
+        "docker": {"latency-seconds": 0.012, "latency-sigma": 0.1, "memory-bytes": 24 * 2**20, "memory-sigma": 0.05,
+            "cpu-utilization-percentage": 90},
+        "wasm_interpreted": {"latency-seconds": 0.04, "latency-sigma": 0.1, "memory-bytes": 32 * 2**20, "memory-sigma": 0.05,
+            "cpu-utilization-percentage": 98},
+        "wasm_aot": {"latency-seconds": 0.011, "latency-sigma": 0.1, "memory-bytes": 20 * 2**20, "memory-sigma": 0.05,
+            "cpu-utilization-percentage": 96},
+        "native": {"latency-seconds": 0.01, "latency-sigma": 0.1, "memory-bytes": 16 * 2**20, "memory-sigma": 0.05,
+            "cpu-utilization-percentage": 95}
+    },
+    "daemon": {"memory-bytes": 64 * 2**20, "cpu-utilization-percentage": 1, "perf-events-scale": 0.02, "sigma": 0.1},
+    "io": {"read-bytes": 48 * 2**20, "read-operations": 1500, "write-bytes": 0, "sigma": 0.05},
+    "memory-pressure": {"reclaim-threshold-share": 0.8, "max-slowdown": 3},
+    "cpu-scaling": {"parallel-share": 0.7},
+    "perf-events-per-second": {
+        "cpu-cycles": 1.5e9, "instructions": 2.4e9, "cache-misses": 2e6, "cache-references": 4e7, "bus-cycles": 5e7,
+        "page-faults": 4e3, "branch-instructions": 4e8, "branch-misses": 4e6, "major-faults": 1, "minor-faults": 4e3
+    },
+    "call-stacks": {
+        "docker": {"torch_image_classification;main;torch::jit::Module::forward;at::native::conv2d": 0.7,
+            "torch_image_classification;main;torch::jit::load": 0.2, "containerd-shim;runtime.main;syscall.Syscall": 0.05,
+            "dockerd;runtime.main;net/http.(*conn).serve": 0.05},
+        "wasm_interpreted": {"wasmedge;main;WasmEdge::Executor::execute": 0.6,
+            "wasmedge;main;WasmEdge::Executor::execute;wasi_nn::compute;at::native::conv2d": 0.3,
+            "wasmedge;main;WasmEdge::Executor::execute;wasi_nn::set_input;memcpy": 0.1},
+        "wasm_aot": {"wasmedge;main;WasmEdge::Executor::execute;wasi_nn::compute;at::native::conv2d": 0.75,
+            "wasmedge;main;WasmEdge::Executor::execute;wasi_nn::set_input;memcpy": 0.15, "wasmedge;main;WasmEdge::Loader::loadModule": 0.1},
+        "native": {"torch_image_classification;main;torch::jit::Module::forward;at::native::conv2d": 0.8,
+            "torch_image_classification;main;torch::jit::load": 0.2}
+    },
+    "image": {"size-bytes": 512 * 2**20, "layers": 8, "load-seconds": 0.05},
+    "aot-compile-seconds": 0.05
+}
+
+# The rate of a perf event missing from the profile, per second of a workload
+DEFAULT_PERF_EVENT_RATE = 1e6
+
+# The shares of a workload's CPU utilization spent in user and system mode, and its mean memory usage relative to
+# its peak memory usage, as reported by the Prometheus stand-in
+CPU_USER_SHARE = 0.8
+CPU_SYSTEM_SHARE = 0.2
+MEAN_MEMORY_SHARE = 0.8
+
+# The files of a simulated cgroup's memory controller under cgroup v2 and v1, all of which the workloads write so the
+# simulation does not depend on the host's version: the limits, the current and peak memory usage, the events and 
+# the statistics; the values of the limits lifting them; and the size of the pages reclaim is counted in
+SIMULATED_MEMORY_LIMIT_FILENAMES = ["memory.max", "memory.limit_in_bytes"]
+SIMULATED_MEMORY_CURRENT_FILENAMES = ["memory.current", "memory.usage_in_bytes"]
+SIMULATED_MEMORY_PEAK_FILENAMES = ["memory.peak", "memory.max_usage_in_bytes"]
+SIMULATED_MEMORY_EVENTS_FILENAMES = ["memory.events", "memory.oom_control"]
+SIMULATED_MEMORY_STAT_FILENAME = "memory.stat"
+UNLIMITED_MEMORY_VALUES = ["max", "-1"]
+PAGE_SIZE = 4096
+
+# The files restricting the CPUs of a simulated cgroup, which the cgset stand-in and the Docker CLI stand-in write
+# alongside its memory controller's files: its CPU quota under cgroup v2, its CPU quota and period under cgroup v1,
+# and its set of CPUs; the period of the CPU quota the Docker CLI stand-in sets; and the memory nodes of the root 
+# cpuset, which the data collection copies to a cpuset under cgroup v1
+SIMULATED_CPU_MAX_FILENAME = "cpu.max"
+SIMULATED_CPU_QUOTA_FILENAME = "cpu.cfs_quota_us"
+SIMULATED_CPU_PERIOD_FILENAME = "cpu.cfs_period_us"
+SIMULATED_CPUSET_CPUS_FILENAME = "cpuset.cpus"
+SIMULATED_CPU_QUOTA_PERIOD_US = 100000
+SIMULATED_ROOT_CPUSET_MEMS_PATH = "cpuset/cpuset.mems"
+
+# The exit status of a workload that was OOM-killed, i.e. killed by SIGKILL
+OOM_KILLED_EXIT_STATUS = 137
+
+# The patterns of the cgroup ID and the range of a PromQL query of the data collection
+QUERY_ID_PATTERN = re.compile(r"id='([^']*)'")
+QUERY_RANGE_PATTERN = re.compile(r"\[(\d+)ms\]")
+
+# The patterns of the cgroup IDs of a container under cgroup v2 and v1
+CONTAINER_CGROUP_ID_PATTERNS = [re.compile(r"^/system\.slice/docker-([0-9a-f]+)\.scope$"), re.compile(r"^memory/docker/([0-9a-f]+)$")]
+
+# The cgroup ID of the Docker daemon, as queried by the data collection
+DAEMON_ID = "/system.slice/docker.service"
+
+# How long each window the data collection samples the Docker daemon's baseline over lasts, and how often it checks
+# whether enough windows were sampled, which are shortened so the simulation does not wait for them
+SIMULATED_DAEMON_BASELINE_WINDOW_TIME = 0.25
+SIMULATED_DAEMON_BASELINE_POLL_INTERVAL = 0.01
+
+# The defaults of the simulated sweep
+DEFAULT_SET_NAME = "simulated"
+DEFAULT_TRIALS = 100
+DEFAULT_MODELS = 1
+DEFAULT_MECHANISMS = "docker,wasm_interpreted,wasm_aot,native"
+
+# The filenames of the simulated models and input, which are placeholders since the workloads ignore them
+SIMULATED_MODEL_FILENAME_TEMPLATE = "simulated_model_{index}.pt"
+SIMULATED_INPUT_FILENAME = "simulated_input.jpg"
+
+def stage_simulated_suite(suite_dir, profile, arch):
+    """Stage the simulated suite, laid out as the suite directory on the target devices, with the stand-ins in place
+    of the binaries, placeholder models, inputs, WebAssembly code and Docker image tar files, and the simulation's state.
+
+    Args:
+        suite_dir: The directory to stage the suite in.
+        profile: The simulation profile.
+        arch: The architecture the Docker images are named after.
+    """
+    for directory in ["cadvisor", "prometheus", "native", "wasm", "docker", "models", "inputs", "results",
+        ".wasmedge/bin", STUBS_DIR_NAME, CONTAINERS_DIR_NAME, LEDGER_DIR_NAME, CGROUPS_DIR_NAME,
+        os.path.join(CGROUPS_DIR_NAME, os.path.dirname(SIMULATED_ROOT_CPUSET_MEMS_PATH))]:
+        os.makedirs(os.path.join(suite_dir, directory), exist_ok=True)
+    with open(os.path.join(suite_dir, CGROUPS_DIR_NAME, SIMULATED_ROOT_CPUSET_MEMS_PATH), "w") as f:
+        f.write("0\n")
+
+    shutil.copy(COLLECT_DATA_SCRIPT_PATH, suite_dir)
+    shutil.copy(PERF_CONFIG_PATH, os.path.join(suite_dir, "cadvisor"))
+    with open(os.path.join(suite_dir, PROFILE_FILENAME), "w") as f:
+        json.dump(profile, f, indent=4)
+
+    for placeholder_path in ["wasm/interpreted.wasm", f"inputs/{SIMULATED_INPUT_FILENAME}", f"docker/image-classification-{arch}.tar"] \
+        + [f"docker/image-classification-{variant}-{arch}.tar" for variant in ["no_models", "slim", "stripped", "distroless"]]:
+        with open(os.path.join(suite_dir, placeholder_path), "w") as f:
+            f.write(f"simulated {placeholder_path}\n")
+
+    for name, command in SHELL_STUBS.items():
+        write_executable(os.path.join(suite_dir, STUBS_DIR_NAME, name), f"#!/bin/sh\n{command}\n")
+    for name, relative_path in PYTHON_STUBS.items():
+        stub_path = os.path.join(suite_dir, relative_path if relative_path is not None else os.path.join(STUBS_DIR_NAME, name))
+        # Skip the site packages, which the stand-ins do not need, so they start faster
+        write_executable(stub_path, f'#!/bin/sh\nexec "{sys.executable}" -S "{os.path.abspath(__file__)}" {STUB_ARG} {name} "$@"\n')
+
+def write_executable(path, content):
+    """Write an executable script.
+
+    Args:
+        path: The path of the script.
+        content: The content of the script.
+    """
+    with open(path, "w") as f:
+        f.write(content)
+    os.chmod(path, 0o755)
+
+def stage_simulated_models(suite_dir, models):
+    """Stage the placeholder models, each with different content so each has its own fingerprint.
+
+    Args:
+        suite_dir: The directory of the simulated suite.
+        models: The number of models.
+    Returns:
+        list: The filenames of the models.
+    """
+    model_filenames = [SIMULATED_MODEL_FILENAME_TEMPLATE.format(index=index) for index in range(models)]
+    for model_filename in model_filenames:
+        with open(os.path.join(suite_dir, "models", model_filename), "w") as f:
+            f.write(f"simulated {model_filename}\n")
+    return model_filenames
+
+def load_profile(profile_path):
+    """Load the simulation profile, with each entry of the given profile replacing that of the default profile.
+
+    Args:
+        profile_path: The path of the JSON file with the profile, or None to use the default profile.
+    Returns:
+        dict: The profile.
+    """
+    profile = json.loads(json.dumps(DEFAULT_SIMULATION_PROFILE))
+    if profile_path is not None:
+        with open(profile_path, "r") as f:
+            custom_profile = json.load(f)
+        for key, value in custom_profile.items():
+            if isinstance(value, dict) and isinstance(profile.get(key), dict):
+                profile[key].update(value)
+            else:
+                profile[key] = value
+    return profile
+
+def get_mechanism_profile(profile, deployment_mechanism, section="mechanisms"):
+    """Get the profile of a deployment mechanism, which is that of its longest prefix in the profile.
+
+    Args:
+        profile: The simulation profile.
+        deployment_mechanism: The deployment mechanism.
+        section: The section of the profile keyed by mechanism to get the mechanism's profile from.
+    Returns:
+        dict: The mechanism's profile.
+    """
+    prefixes = [mechanism for mechanism in profile[section] if deployment_mechanism.startswith(mechanism)]
+    if not prefixes:
+        raise ValueError(f"No mechanism in the simulation profile matches {deployment_mechanism}")
+    return profile[section][max(prefixes, key=len)]
+
+class PrometheusStandInHandler(http.server.BaseHTTPRequestHandler):
+    """Answers the Prometheus queries and series deletions of the data collection from the ledger of the workloads
+    that ran, which the server's state_dir attribute points to."""
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query).get("query", [""])[0]
+        result = answer_prometheus_query(self.server.state_dir, query)
+        self.send_json({"status": "success", "data": {"resultType": "vector", "result": result}})
+
+    def do_POST(self):
+        url = urllib.parse.urlparse(self.path)
+        for match in urllib.parse.parse_qs(url.query).get("match[]", []):
+            id_match = QUERY_ID_PATTERN.search(match)
+            if id_match is not None:
+                ledger_path = get_ledger_path(self.server.state_dir, id_match.group(1))
+                if os.path.exists(ledger_path):
+                    os.remove(ledger_path)
+        self.send_response(204)
+        self.end_headers()
+
+    def send_json(self, content):
+        body = json.dumps(content).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_prometheus_stand_in(state_dir):
+    """Start the Prometheus stand-in on a free local port, serving on a daemon thread.
+
+    Args:
+        state_dir: The directory of the simulation's state.
+    Returns:
+        str: The URL of the stand-in.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PrometheusStandInHandler)
+    server.state_dir = state_dir
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+def answer_prometheus_query(state_dir, query):
+    """Answer a PromQL query of the data collection, for the workload that last ran in the queried cgroup or for
+    the Docker daemon.
+
+    Args:
+        state_dir: The directory of the simulation's state.
+        query: The query.
+    Returns:
+        list: The results of the query, as returned by the Prometheus API; empty if nothing ran in the cgroup.
+    """
+    with open(os.path.join(state_dir, PROFILE_FILENAME), "r") as f:
+        profile = json.load(f)
+
+    id_match = QUERY_ID_PATTERN.search(query)
+    if id_match is None:
+        return []
+    if id_match.group(1) == DAEMON_ID:
+        range_match = QUERY_RANGE_PATTERN.search(query)
+        run = dict(profile["daemon"], seconds=int(range_match.group(1)) / 1000 if range_match else 0)
+        # The daemon's background activity varies, so its baseline is estimated with a variance
+        noise = random.lognormvariate(0, profile["daemon"].get("sigma", 0))
+        for key in ["memory-bytes", "cpu-utilization-percentage", "perf-events-scale"]:
+            run[key] *= noise
+    else:
+        ledger_path = get_ledger_path(state_dir, id_match.group(1))
+        if not os.path.exists(ledger_path):
+            return []
+        with open(ledger_path, "r") as f:
+            run = json.load(f)
+        run["perf-events-scale"] = 1
+
+    timestamp = datetime.now(timezone.utc).timestamp()
+    if "container_perf_events_scaling_ratio" in query:
+        # The stand-in counts every event for the whole run, as if none were multiplexed
+        return [{"metric": {"event": event}, "value": [timestamp, "1"]} for event in get_perf_events(state_dir)]
+    elif "container_perf_events_total" in query:
+        # Rates are per second, while every other perf query is of the total over the workload's run
+        seconds = 1 if "rate(" in query else run["seconds"]
+        return [{"metric": {"event": event},
+            "value": [timestamp, str(profile["perf-events-per-second"].get(event, DEFAULT_PERF_EVENT_RATE) * run["perf-events-scale"] * seconds)]}
+            for event in get_perf_events(state_dir)]
+    elif "container_memory_usage_bytes" in query:
+        value = run["memory-bytes"] * MEAN_MEMORY_SHARE
+    elif "container_memory_max_usage_bytes" in query:
+        value = run["memory-bytes"]
+    elif "container_cpu_user_seconds_total" in query:
+        value = run["cpu-utilization-percentage"] * CPU_USER_SHARE
+    elif "container_cpu_system_seconds_total" in query:
+        value = run["cpu-utilization-percentage"] * CPU_SYSTEM_SHARE
+    elif "container_cpu_usage_seconds_total" in query:
+        value = run["cpu-utilization-percentage"]
+    elif "container_fs_reads_bytes_total" in query:
+        value = run.get("io-read-bytes", 0)
+    elif "container_fs_reads_total" in query:
+        value = run.get("io-read-operations", 0)
+    elif "container_fs_writes_bytes_total" in query:
+        value = run.get("io-write-bytes", 0)
+    else:
+        return []
+    return [{"metric": {"id": id_match.group(1)}, "value": [timestamp, str(value)]}]
+
+def get_perf_events(state_dir):
+    """Get the perf events measured by the data collection, from the perf config the cAdvisor stand-in was last
+    started with, or else the one staged in the simulated suite.
+
+    Args:
+        state_dir: The directory of the simulation's state, which is the simulated suite.
+    Returns:
+        list: The perf events.
+    """
+    config_path = os.path.join(state_dir, "cadvisor", "perf_config.json")
+    config_state_path = os.path.join(state_dir, CADVISOR_PERF_CONFIG_STATE_FILENAME)
+    if os.path.exists(config_state_path):
+        with open(config_state_path, "r") as f:
+            config_path = f.read().strip()
+    with open(config_path, "r") as f:
+        events = json.load(f)["core"]["events"]
+    # Events in a group are listed together
+    return [event for group in events for event in ([group] if isinstance(group, str) else group)]
+
+def get_ledger_path(state_dir, cgroup_id):
+    """Get the path of the ledger entry of the workload that last ran in a cgroup, under which the cgroup IDs of a
+    container under cgroup v2 and v1 are the same.
+
+    Args:
+        state_dir: The directory of the simulation's state.
+        cgroup_id: The ID of the cgroup.
+    Returns:
+        str: The path of the ledger entry.
+    """
+    for pattern in CONTAINER_CGROUP_ID_PATTERNS:
+        match = pattern.match(cgroup_id)
+        if match is not None:
+            cgroup_id = match.group(1)
+            break
+    return os.path.join(state_dir, LEDGER_DIR_NAME, hashlib.sha256(cgroup_id.strip("/").encode()).hexdigest()[:16] + ".json")
+
+def get_simulated_memory_cgroup_dir(state_dir, cgroup_id):
+    """Get the directory of a simulated cgroup within the memory controller's hierarchy, laid out as the data 
+    collection expects under the host's cgroup version.
+
+    Args:
+        state_dir: The directory of the simulation's state.
+        cgroup_id: The ID of the cgroup, which is the container's ID for containers.
+    Returns:
+        str: The directory.
+    """
+    is_cgroup_v2 = os.path.isfile("/sys/fs/cgroup/cgroup.controllers")
+    if cgroup_id.startswith("/"):
+        cgroup_name = cgroup_id.strip("/")
+    else:
+        cgroup_name = f"system.slice/docker-{cgroup_id}.scope" if is_cgroup_v2 else f"docker/{cgroup_id}"
+    return os.path.join(state_dir, CGROUPS_DIR_NAME, cgroup_name if is_cgroup_v2 else os.path.join("memory", cgroup_name))
+
+def read_simulated_memory_limit(memory_cgroup_dir):
+    """Read the memory limit of a simulated cgroup, as set by the cgset stand-in or the Docker CLI stand-in.
+
+    Args:
+        memory_cgroup_dir: The directory of the cgroup within the memory controller's hierarchy.
+    Returns:
+        int: The memory limit in bytes, or None if the cgroup has none.
+    """
+    for filename in SIMULATED_MEMORY_LIMIT_FILENAMES:
+        path = os.path.join(memory_cgroup_dir, filename)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                value = f.read().strip()
+            if value not in UNLIMITED_MEMORY_VALUES:
+                return int(value)
+    return None
+
+def read_simulated_available_cpus(cgroup_dir):
+    """Read the number of CPUs a simulated cgroup is restricted to, as the lower of its CPU quota and the number of
+    CPUs in its set of CPUs, as set by the cgset stand-in or the Docker CLI stand-in.
+
+    Args:
+        cgroup_dir: The directory of the cgroup, which holds its CPU controllers' files alongside its memory controller's.
+    Returns:
+        float: The number of CPUs, or None if the cgroup is not restricted to fewer CPUs than the host has.
+    """
+    def read_value(filename):
+        path = os.path.join(cgroup_dir, filename)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return f.read().strip()
+
+    available_cpus = []
+    cpu_max = read_value(SIMULATED_CPU_MAX_FILENAME)
+    cpu_quota = read_value(SIMULATED_CPU_QUOTA_FILENAME)
+    if cpu_max is not None and not cpu_max.startswith("max"):
+        quota, _, period = cpu_max.partition(" ")
+        available_cpus.append(int(quota) / int(period or SIMULATED_CPU_QUOTA_PERIOD_US))
+    elif cpu_quota is not None and cpu_quota != "-1":
+        available_cpus.append(int(cpu_quota) / int(read_value(SIMULATED_CPU_PERIOD_FILENAME) or SIMULATED_CPU_QUOTA_PERIOD_US))
+    cpuset = read_value(SIMULATED_CPUSET_CPUS_FILENAME)
+    if cpuset:
+        available_cpus.append(sum(int(last) - int(first) + 1 if last else 1 
+            for first, _, last in (cpu_range.partition("-") for cpu_range in cpuset.split(","))))
+
+    if not available_cpus or min(available_cpus) >= os.cpu_count():
+        return None
+    return min(available_cpus)
+
+def write_simulated_memory_state(memory_cgroup_dir, memory_bytes, oom_kills, reclaimed_pages):
+    """Write the memory usage, OOM kills and reclaim of a simulated cgroup to its memory controller's files.
+
+    Args:
+        memory_cgroup_dir: The directory of the cgroup within the memory controller's hierarchy.
+        memory_bytes: The memory usage of the cgroup's workload.
+        oom_kills: The number of the cgroup's processes that were OOM-killed.
+        reclaimed_pages: The number of pages reclaimed from the cgroup, each of which is scanned twice on average.
+    """
+    os.makedirs(memory_cgroup_dir, exist_ok=True)
+    for filename in SIMULATED_MEMORY_CURRENT_FILENAMES + SIMULATED_MEMORY_PEAK_FILENAMES:
+        with open(os.path.join(memory_cgroup_dir, filename), "w") as f:
+            f.write(f"{memory_bytes}\n")
+    for filename in SIMULATED_MEMORY_EVENTS_FILENAMES:
+        with open(os.path.join(memory_cgroup_dir, filename), "w") as f:
+            f.write(f"oom {oom_kills}\noom_kill {oom_kills}\n")
+    with open(os.path.join(memory_cgroup_dir, SIMULATED_MEMORY_STAT_FILENAME), "w") as f:
+        f.write(f"anon {memory_bytes}\npgscan {2 * reclaimed_pages}\npgsteal {reclaimed_pages}\n")
+
+def run_simulated_workload(deployment_mechanism):
+    """Run the workload of a deployment mechanism, sleeping for a latency and allocating an amount of memory drawn
+    from its profile, and record it in the ledger and its block I/O in the cgroup's io.stat file if it ran in a cgroup.
+    If its cgroup has a memory limit, the workload slows down under memory pressure, or is OOM-killed if it needs more
+    memory than the limit, which its cgroup's memory controller files record. If its cgroup is restricted to fewer CPUs
+    than the host has, its latency is scaled as Amdahl's law predicts.
+
+    Args:
+        deployment_mechanism: The deployment mechanism.
+    Returns:
+        int: The exit status.
+    """
+    state_dir = os.environ[SIMULATION_STATE_DIR_ENV_VAR]
+    with open(os.path.join(state_dir, PROFILE_FILENAME), "r") as f:
+        profile = json.load(f)
+    mechanism_profile = get_mechanism_profile(profile, deployment_mechanism)
+    cgroup_id = os.environ.get(SIMULATION_CGROUP_ID_ENV_VAR)
+
+    start = time.monotonic()
+    latency = random.lognormvariate(0, mechanism_profile["latency-sigma"]) * mechanism_profile["latency-seconds"]
+    memory_bytes = int(random.lognormvariate(0, mechanism_profile["memory-sigma"]) * mechanism_profile["memory-bytes"])
+
+    # Under a memory limit, the share of the memory reclaimed grows from none at the threshold to all of it at the limit
+    memory_cgroup_dir = get_simulated_memory_cgroup_dir(state_dir, cgroup_id) if cgroup_id is not None else None
+    memory_limit = read_simulated_memory_limit(memory_cgroup_dir) if memory_cgroup_dir is not None else None
+    oom_killed = memory_limit is not None and memory_bytes > memory_limit
+    available_cpus = read_simulated_available_cpus(memory_cgroup_dir) if memory_cgroup_dir is not None else None
+    if available_cpus is not None:
+        # The profile's latency is that of the workload with all of the host's CPUs
+        parallel_share = profile["cpu-scaling"]["parallel-share"]
+        latency *= ((1 - parallel_share) + parallel_share / available_cpus) / ((1 - parallel_share) + parallel_share / os.cpu_count())
+    pressure = 0
+    if memory_limit is not None:
+        threshold_share = profile["memory-pressure"]["reclaim-threshold-share"]
+        pressure = min(1, max(0, (memory_bytes / memory_limit - threshold_share) / (1 - threshold_share)))
+        latency *= 1 + pressure * (profile["memory-pressure"]["max-slowdown"] - 1)
+    if oom_killed:
+        # The workload is killed once its memory reaches the limit, partway through
+        latency *= memory_limit / memory_bytes
+        memory_bytes = memory_limit
+    if memory_cgroup_dir is not None:
+        write_simulated_memory_state(memory_cgroup_dir, memory_bytes, int(oom_killed), int(pressure * memory_bytes) // PAGE_SIZE)
+
+    # Write the memory, so it is actually resident
+    memory = b"\x01" * memory_bytes
+    time.sleep(max(0, latency - (time.monotonic() - start)))
+    del memory
+
+    if cgroup_id is not None:
+        io = {key: int(random.lognormvariate(0, profile["io"]["sigma"]) * profile["io"][key]) 
+            for key in ["read-bytes", "read-operations", "write-bytes"]}
+        with open(get_ledger_path(state_dir, cgroup_id), "w") as f:
+            json.dump({"deployment-mechanism": deployment_mechanism, "seconds": time.monotonic() - start,
+                "memory-bytes": memory_bytes,
+                "cpu-utilization-percentage": mechanism_profile["cpu-utilization-percentage"],
+                **{f"io-{key}": value for key, value in io.items()}}, f)
+
+        # The I/O is all charged to a single simulated device
+        io_stat_dir = os.path.join(state_dir, CGROUPS_DIR_NAME, cgroup_id.strip("/"))
+        os.makedirs(io_stat_dir, exist_ok=True)
+        with open(os.path.join(io_stat_dir, "io.stat"), "w") as f:
+            f.write(f"179:0 rbytes={io['read-bytes']} wbytes={io['write-bytes']} rios={io['read-operations']} wios=0 dbytes=0 dios=0\n")
+
+    perf_data_path = os.environ.get(SIMULATION_PERF_DATA_PATH_ENV_VAR)
+    if perf_data_path is not None:
+        record_simulated_call_stacks(perf_data_path, get_mechanism_profile(profile, deployment_mechanism, "call-stacks"), 
+            (time.monotonic() - start) * int(os.environ[SIMULATION_PERF_FREQUENCY_ENV_VAR]))
+
+    return OOM_KILLED_EXIT_STATUS if oom_killed else 0
+
+def record_simulated_call_stacks(perf_data_path, call_stacks, samples):
+    """Record the samples of the call stacks of a workload as perf script prints them, each sample's process name
+    followed by its frames from the sampled function up and a blank line.
+
+    Args:
+        perf_data_path: The file to append the samples to.
+        call_stacks: The share of the samples taken in each folded call stack.
+        samples: The number of samples taken.
+    """
+    with open(perf_data_path, "a") as f:
+        for stack, share in call_stacks.items():
+            process_name, *frames = stack.split(";")
+            sample = process_name + "\n" + "".join(f"\t{address:x} {frame}\n" 
+                for address, frame in enumerate(reversed(frames), start=0x400000)) + "\n"
+            f.write(sample * round(share * samples))
+
+def run_perf_stub(args):
+    """Stand in for perf, recording a command by having the workloads it runs record their simulated call stacks,
+    or printing the recorded samples as perf script does.
+
+    Args:
+        args: The arguments.
+    Returns:
+        int: The exit status.
+    """
+    if args[:1] == ["script"]:
+        with open(args[args.index("-i") + 1], "r") as f:
+            print(f.read(), end="")
+        return 0
+
+    perf_data_path = args[args.index("-o") + 1]
+    open(perf_data_path, "w").close()
+    env = dict(os.environ, **{SIMULATION_PERF_DATA_PATH_ENV_VAR: perf_data_path, 
+        SIMULATION_PERF_FREQUENCY_ENV_VAR: args[args.index("-F") + 1]})
+    return subprocess.run(args[args.index("--") + 1:], env=env).returncode
+
+def run_time_stub(args):
+    """Stand in for GNU time's verbose mode, running a command and reporting its wall time and peak memory usage.
+
+    Args:
+        args: The arguments, i.e. -v followed by the command.
+    Returns:
+        int: The command's exit status.
+    """
+    cmd = args[1:] if args and args[0] == "-v" else args
+    start = time.monotonic()
+    returncode = subprocess.run(cmd).returncode
+    wall_seconds = time.monotonic() - start
+    minutes, seconds = divmod(wall_seconds, 60)
+    print(f'\tCommand being timed: "{" ".join(cmd)}"', file=sys.stderr)
+    print(f"\tElapsed (wall clock) time (h:mm:ss or m:ss): {int(minutes)}:{seconds:05.2f}", file=sys.stderr)
+    print(f"\tMaximum resident set size (kbytes): {resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss}", file=sys.stderr)
+    print(f"\tExit status: {returncode}", file=sys.stderr)
+    return returncode
+
+def run_wasmedge_stub(args):
+    """Stand in for WasmEdge, reporting its version, AoT compiling by writing the optimization level to the compiled
+    file, or running the workload of the mechanism whose file it is given.
+
+    Args:
+        args: The arguments.
+    Returns:
+        int: The exit status.
+    """
+    state_dir = os.environ[SIMULATION_STATE_DIR_ENV_VAR]
+    if args[:1] == ["--version"]:
+        print("wasmedge version 0.0.0-simulated")
+    elif args[:1] == ["compile"]:
+        optimization_level = args[args.index("--optimize") + 1] if "--optimize" in args else None
+        with open(os.path.join(state_dir, PROFILE_FILENAME), "r") as f:
+            time.sleep(json.load(f)["aot-compile-seconds"])
+        with open(args[-1], "w") as f:
+            f.write(json.dumps({"optimization-level": optimization_level}))
+    else:
+        # Skip the directories the workload is given access to, each of which follows a --dir option
+        index = 0
+        while args[index] == "--dir":
+            index += 2
+        wasm_file_path = args[index]
+        if wasm_file_path.endswith("interpreted.wasm"):
+            deployment_mechanism = "wasm_interpreted"
+        else:
+            with open(wasm_file_path, "r") as f:
+                optimization_level = json.load(f)["optimization-level"]
+            deployment_mechanism = "wasm_aot" if optimization_level is None else f"wasm_aot_o{optimization_level}"
+        return run_simulated_workload(deployment_mechanism)
+    return 0
+
+def run_docker_stub(args):
+    """Stand in for the subset of the Docker CLI the data collection uses, keeping the containers it runs as files.
+
+    Args:
+        args: The arguments.
+    Returns:
+        int: The exit status.
+    """
+    state_dir = os.environ[SIMULATION_STATE_DIR_ENV_VAR]
+    with open(os.path.join(state_dir, PROFILE_FILENAME), "r") as f:
+        image_profile = json.load(f)["image"]
+
+    def get_container_path(container_name):
+        return os.path.join(state_dir, CONTAINERS_DIR_NAME, f"{container_name}.json")
+
+    def format_output(format, values):
+        for placeholder, value in values.items():
+            format = format.replace(placeholder, str(value))
+        print(format)
+
+    if args[0] == "run":
+        # Skip the options and their values up to the image, after which comes the command to run
+        options_with_values = ["--name", "-v", "-e", "--memory", "--memory-swap", "--cpus", "--cpuset-cpus", "--network"]
+        index = 1
+        container_name = None
+        memory_limit = None
+        cpus = None
+        cpuset = None
+        while args[index].startswith("-"):
+            if args[index] == "--name":
+                container_name = args[index + 1]
+            elif args[index] == "--memory":
+                memory_limit = args[index + 1]
+            elif args[index] == "--cpus":
+                cpus = float(args[index + 1])
+            elif args[index] == "--cpuset-cpus":
+                cpuset = args[index + 1]
+            index += 2 if args[index] in options_with_values else 1
+        image = args[index]
+        if container_name is not None and os.path.exists(get_container_path(container_name)):
+            print(f'docker: Error response from daemon: Conflict. The container name "/{container_name}" is already in use.',
+                file=sys.stderr)
+            return 125
+
+        container_id = hashlib.sha256(f"{container_name}|{time.time_ns()}".encode()).hexdigest()
+        container = {"id": container_id, "started-at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), 
+            "oom-killed": False}
+        with open(get_container_path(container_name or container_id), "w") as f:
+            json.dump(container, f)
+        # The container's cgroup is restricted as under cgroup v2, which the workloads read regardless of the host's version
+        cgroup_files = {}
+        if memory_limit is not None:
+            cgroup_files[SIMULATED_MEMORY_LIMIT_FILENAMES[0]] = memory_limit
+        if cpus is not None:
+            cgroup_files[SIMULATED_CPU_MAX_FILENAME] = f"{round(cpus * SIMULATED_CPU_QUOTA_PERIOD_US)} {SIMULATED_CPU_QUOTA_PERIOD_US}"
+        if cpuset is not None:
+            cgroup_files[SIMULATED_CPUSET_CPUS_FILENAME] = cpuset
+        if cgroup_files:
+            memory_cgroup_dir = get_simulated_memory_cgroup_dir(state_dir, container_id)
+            os.makedirs(memory_cgroup_dir, exist_ok=True)
+            for filename, value in cgroup_files.items():
+                with open(os.path.join(memory_cgroup_dir, filename), "w") as f:
+                    f.write(f"{value}\n")
+
+        # The image is named after its variant, e.g. image-classification-slim:arm64 for docker_slim
+        variant = image.split(":")[0][len("image-classification"):].lstrip("-")
+        os.environ[SIMULATION_CGROUP_ID_ENV_VAR] = container_id
+        returncode = run_simulated_workload(f"docker_{variant}" if variant else "docker")
+        if returncode == OOM_KILLED_EXIT_STATUS:
+            container["oom-killed"] = True
+            with open(get_container_path(container_name or container_id), "w") as f:
+                json.dump(container, f)
+        return returncode
+    elif args[0] in ["rm", "stop"]:
+        container_name = args[-1]
+        if not os.path.exists(get_container_path(container_name)):
+            print(f"Error response from daemon: No such container: {container_name}", file=sys.stderr)
+            return 1
+        if args[0] == "rm":
+            os.remove(get_container_path(container_name))
+    elif args[0] == "inspect":
+        container_name = args[-1]
+        if not os.path.exists(get_container_path(container_name)):
+            print(f"Error: No such object: {container_name}", file=sys.stderr)
+            return 1
+        with open(get_container_path(container_name), "r") as f:
+            container = json.load(f)
+        format_output(args[args.index("-f") + 1], {"{{.Id}}": container["id"], "{{.State.StartedAt}}": container["started-at"],
+            "{{.State.OOMKilled}}": str(container["oom-killed"]).lower()})
+    elif args[:2] == ["image", "inspect"]:
+        image = args[-1]
+        format_output(args[args.index("-f") + 1], {"{{.Id}}": "sha256:" + hashlib.sha256(image.encode()).hexdigest(),
+            "{{.Size}}": image_profile["size-bytes"],
+            "{{len .RootFS.Layers}}": image_profile["layers"]})
+    elif args[0] == "load":
+        time.sleep(image_profile["load-seconds"])
+        print(f"Loaded image from {args[-1]}")
+    return 0
+
+def run_stub(name, args):
+    """Act as one of the stand-ins.
+
+    Args:
+        name: The name of the stand-in.
+        args: The arguments it was invoked with.
+    Returns:
+        int: The exit status.
+    """
+    if name == "time":
+        return run_time_stub(args)
+    elif name == "wasmedge":
+        return run_wasmedge_stub(args)
+    elif name == "docker":
+        return run_docker_stub(args)
+    elif name == "perf":
+        return run_perf_stub(args)
+    elif name == "native":
+        return run_simulated_workload("native")
+    elif name == "cadvisor":
+        # Record the perf events config, for the Prometheus stand-in to answer with the events it measures
+        for arg in args:
+            if arg.startswith(CADVISOR_PERF_CONFIG_ARG_PREFIX):
+                with open(os.path.join(os.environ[SIMULATION_STATE_DIR_ENV_VAR], CADVISOR_PERF_CONFIG_STATE_FILENAME), "w") as f:
+                    f.write(arg[len(CADVISOR_PERF_CONFIG_ARG_PREFIX):])
+    # cAdvisor and Prometheus exit straight away, since the Prometheus stand-in answers the queries instead
+    return 0
+
+def run_collect_data(suite_dir, prometheus_url, collect_data_args):
+    """Run the data collection script staged in the simulated suite, pointed at the Prometheus stand-in and at the
+    simulated cgroups' files, without the waits for cAdvisor and Prometheus and the page cache to be dropped, and with 
+    short windows of the daemon's baseline, which only matter on a real device. The script is loaded afresh, so every run starts from its initial state.
+
+    Args:
+        suite_dir: The directory of the simulated suite.
+        prometheus_url: The URL of the Prometheus stand-in.
+        collect_data_args: The arguments to run the script with.
+    """
+    spec = importlib.util.spec_from_file_location("collect_data", os.path.join(suite_dir, "collect_data.py"))
+    collect_data = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(collect_data)
+
+    collect_data.PROMETHEUS_URL = prometheus_url
+    collect_data.CADVISOR_PROMETHEUS_WAIT_TIME = 0
+    collect_data.DAEMON_BASELINE_WINDOW_TIME = SIMULATED_DAEMON_BASELINE_WINDOW_TIME
+    collect_data.DAEMON_BASELINE_POLL_INTERVAL = SIMULATED_DAEMON_BASELINE_POLL_INTERVAL
+    collect_data.TIME_CMD_PREFIX = f"{os.path.join(suite_dir, STUBS_DIR_NAME, 'time')} -v"
+    collect_data.DROP_PAGE_CACHE_CMD = ["true"]
+    collect_data.CGROUP_IO_STAT_PATH_TEMPLATE = os.path.join(suite_dir, CGROUPS_DIR_NAME, "{cgroup_name}", "io.stat")
+    collect_data.CGROUP_FILE_PATH_TEMPLATE = os.path.join(suite_dir, CGROUPS_DIR_NAME, "{cgroup_path}", "{filename}")
+
+    sys.argv = [collect_data.__file__] + collect_data_args
+    collect_data.main()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the data collection hermetically against simulated workloads, Docker and Prometheus.",
+        epilog="Any other arguments are passed on to collect_data.py, e.g. --mode density --instances 1,2,4.", allow_abbrev=False)
+    parser.add_argument("--set-name", type=str, default=DEFAULT_SET_NAME, help="The name of the simulated experiment set.")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="The number of trials to run for each experiment.")
+    parser.add_argument("--models", type=int, default=DEFAULT_MODELS, help="The number of simulated models to run the experiments for.")
+    parser.add_argument("--mechanisms", type=str, default=DEFAULT_MECHANISMS, help="Comma-separated list of mechanisms to include.")
+    parser.add_argument("--profile", type=str,
+        help="A JSON file with the simulation profile, whose entries replace those of the default profile.")
+    parser.add_argument("--suite-dir", type=str,
+        help="The directory to stage the simulated suite in and keep afterwards; by default, a temporary directory.")
+    args, collect_data_args = parser.parse_known_args()
+
+    arch = "arm64" if os.uname().machine == "aarch64" else "amd64"
+    profile = load_profile(args.profile)
+    suite_dir = os.path.abspath(args.suite_dir) if args.suite_dir else tempfile.mkdtemp(prefix="simulated_suite-")
+    stage_simulated_suite(suite_dir, profile, arch)
+    model_filenames = stage_simulated_models(suite_dir, args.models)
+
+    # The stand-ins find the simulation's state and each other through the environment, and WasmEdge is found in
+    # the home directory, which must be set before the data collection script is loaded
+    os.environ[SIMULATION_STATE_DIR_ENV_VAR] = suite_dir
+    os.environ["HOME"] = suite_dir
+    os.environ["PATH"] = os.path.join(suite_dir, STUBS_DIR_NAME) + os.pathsep + os.environ.get("PATH", "")
+    prometheus_url = start_prometheus_stand_in(suite_dir)
+
+    results_path = os.path.join(suite_dir, "results", args.set_name)
+    os.makedirs(results_path, exist_ok=True)
+    original_dir = os.getcwd()
+    os.chdir(suite_dir)
+    start = time.monotonic()
+    try:
+        for model_filename in model_filenames:
+            print(f"Running collect_data.py with model: {model_filename} and input: {SIMULATED_INPUT_FILENAME}")
+            run_collect_data(suite_dir, prometheus_url, ["--model", model_filename, "--input", SIMULATED_INPUT_FILENAME,
+                "--trials", str(args.trials), "--set_name", args.set_name, "--mechanisms", args.mechanisms, "--arch", arch]
+                + collect_data_args)
+    finally:
+        os.chdir(original_dir)
+
+        # Copy the results as they would be from a target device, even if the simulation failed part of the way
+        shutil.copytree(results_path, os.path.join(RESULTS_DIR, args.set_name), dirs_exist_ok=True)
+        if not args.suite_dir:
+            shutil.rmtree(suite_dir)
+
+    print(f"Simulated {len(model_filenames)} models in {time.monotonic() - start:.1f} seconds; the results are in "
+        + os.path.join(RESULTS_DIR, args.set_name))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == STUB_ARG:
+        sys.exit(run_stub(sys.argv[2], sys.argv[3:]))
+    main()
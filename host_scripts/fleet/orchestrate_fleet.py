@@ -0,0 +1,632 @@
+"""This module runs the data collection across a fleet of target machines in parallel from the host.
+
+The matrix of models and inputs is split into units, one per combination, which the targets listed in an inventory
+file take from a shared queue. Every deployment mechanism of a unit runs on the same target, with their trials
+interspersed as usual, so the mechanisms of an experiment are only ever compared on the machine they were all
+measured on. Each target first has the suite's files synced
+to it incrementally, then runs its units one at a time through target_scripts/collect_data.sh, each under its
+own set name within the set's hidden ".fleet" directory. The results of each unit are fetched back into that
+directory on the host periodically while it runs, and merged into the set's results files, with a "target" column
+recording the target each row was collected on, so they can be analyzed as usual.
+
+If a unit fails, the target is probed: a target that cannot be reached is considered failed and takes no
+further units, while a unit that failed on a reachable target is retried on another target up to a limit.
+Either way, the unit goes back on the queue. The state of every unit is recorded in the set's fleet manifest,
+and units recorded as done are skipped when the same set is collected again.
+
+The inventory is a JSON file listing the targets, e.g.
+
+    {"targets": [
+        {"name": "pi1", "type": "ssh", "address": "192.168.0.10", "username": "pi", "password_env": "PI1_PASSWORD"},
+        {"name": "stand-in", "type": "local", "suite_path": "/tmp/stand-in-suite"}
+    ]}
+
+SSH targets must have been set up with the suite's setup step, and are synced with rsync over sshpass. Local
+targets are directories on the host, optionally entered through "exec_prefix", e.g. ["docker", "exec", "ctr"]
+for a container the directory is mounted into at the same path, and are stand-ins for real targets in tests.
+"""
+import argparse
+import csv
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# The absolute path of the "fleet" directory where this script is in
+SCRIPTS_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# The absolute path of the root of the benchmark suite
+BENCHMARK_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, "..", ".."))
+
+# The absolute path of the "results" directory where the results of the experiments are stored
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+
+# Default locations of the models and inputs whose combinations are collected
+DEFAULT_MODELS_DIR = os.path.join(BENCHMARK_DIR, "models", "models")
+DEFAULT_INPUTS_DIR = os.path.join(BENCHMARK_DIR, "inputs", "inputs")
+
+# The directory the suite is transferred to on SSH targets, unless their inventory entry gives a "suite_path"
+SSH_SUITE_PATH_TEMPLATE = "/home/{username}/Desktop/CS4099Suite"
+
+# The files synced to each target, as paths relative to the root of the benchmark suite mapped to paths relative
+# to the suite directory on the target, mirroring the transfer step of suite.sh; files missing on the host, such
+# as the pre-decoded tensors when none were generated, are skipped
+SUITE_FILES = [
+    ("models/models", "models"),
+    ("inputs/inputs", "inputs"),
+    ("inputs/tensors", "inputs/tensors"),
+    ("native", "native"),
+    ("wasm", "wasm"),
+    ("libtorch", "libtorch"),
+    ("cadvisor", "cadvisor"),
+    ("prometheus", "prometheus"),
+    ("python", "python"),
+    ("docker", "docker"),
+    ("target_scripts", "target_scripts"),
+    ("data_scripts/collect_data.py", "collect_data.py"),
+    ("models/manifest.json", "model_manifest.json")
+]
+
+# The name of the hidden directory within a set's results directory where the results of each unit are fetched
+# to, which the analysis scripts do not look into, and of the set's fleet manifest
+FLEET_DIR_NAME = ".fleet"
+FLEET_MANIFEST_FILENAME = "fleet_manifest.json"
+
+# The suffix shared by every results file written by the data collection script
+RESULTS_FILENAME_SUFFIX = "_results.csv"
+
+# The file within a unit's results directory recording the target its results were collected on, and the column 
+# the merged results files record it in
+UNIT_TARGET_FILENAME = "target"
+TARGET_COLUMN = "target"
+
+# How often the results of running units are fetched, in seconds
+FETCH_INTERVAL = 30
+
+# How many times a unit is attempted on reachable targets before it is considered failed
+MAX_UNIT_ATTEMPTS = 2
+
+# How long an idle target waits before checking the queue again, in seconds, while other targets' units may
+# still be put back on it
+QUEUE_POLL_INTERVAL = 1
+
+# The return code recorded when a command could not be run at all, e.g. because sshpass is not installed, as a 
+# shell does
+COMMAND_NOT_FOUND_RETURNCODE = 127
+
+# The states of each unit recorded in the fleet manifest
+UNIT_QUEUED = "queued"
+UNIT_RUNNING = "running"
+UNIT_DONE = "done"
+UNIT_FAILED = "failed"
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the data collection across a fleet of target machines in parallel")
+    parser.add_argument("--inventory", type=str, required=True, help="The path of the JSON file listing the targets")
+    parser.add_argument("--set-name", type=str, required=True, help="The name of the set of experiments being run")
+    parser.add_argument("--trials", type=int, required=True, help="The number of trials to run for each experiment")
+    parser.add_argument("--mechanisms", type=str, default="docker,wasm_interpreted,wasm_aot,native",
+        help="Comma-separated list of mechanisms to collect, all of which are run together in each unit")
+    parser.add_argument("--models", type=str, help="Comma-separated list of models to collect; by default, every model in the models directory")
+    parser.add_argument("--inputs", type=str, help="Comma-separated list of inputs to collect; by default, every input in the inputs directory")
+    parser.add_argument("--collect-data-options", type=str, default="",
+        help="Further options to pass to target_scripts/collect_data.sh on every target, e.g. \"-a -t 1,2,4\"")
+    parser.add_argument("--skip-sync", action="store_true", help="Do not sync the suite's files to the targets first")
+    args = parser.parse_args()
+
+    with open(args.inventory, "r") as f:
+        targets = json.load(f)["targets"]
+    if not targets:
+        print("Error: the inventory lists no targets")
+        sys.exit(2)
+
+    models = split_list(args.models) if args.models else list_files(DEFAULT_MODELS_DIR)
+    inputs = split_list(args.inputs) if args.inputs else list_files(DEFAULT_INPUTS_DIR)
+    mechanisms = split_list(args.mechanisms)
+
+    succeeded = orchestrate_fleet(targets, args.set_name, args.trials, models, inputs, mechanisms,
+        shlex.split(args.collect_data_options), not args.skip_sync)
+    if not succeeded:
+        sys.exit(1)
+
+def split_list(value):
+    """Splits a comma-separated list given on the command line.
+
+    Args:
+        value: The comma-separated list
+    Returns:
+        list: The stripped, non-empty items
+    """
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+def list_files(directory):
+    """Lists the files directly within a directory, as the data collection script considers each a model or input.
+
+    Args:
+        directory: The directory
+    Returns:
+        list: The sorted filenames
+    """
+    return sorted(filename for filename in os.listdir(directory) if os.path.isfile(os.path.join(directory, filename)))
+
+def orchestrate_fleet(targets, set_name, trials, models, inputs, mechanisms, collect_data_options, sync):
+    """Runs every unit of the matrix of models and inputs, each collecting every mechanism, across the targets in 
+    parallel, one worker thread per target, and merges their results into the set's results files.
+
+    Args:
+        targets: The inventory entries of the targets
+        set_name: The name of the set of experiments being run
+        trials: The number of trials to run for each experiment
+        models: The models to collect
+        inputs: The inputs to collect
+        mechanisms: The deployment mechanisms to collect
+        collect_data_options: Further options to pass to target_scripts/collect_data.sh
+        sync: Whether to sync the suite's files to the targets before running units on them
+    Returns:
+        bool: Whether every unit is done
+    """
+    set_path = os.path.join(RESULTS_DIR, set_name)
+    os.makedirs(os.path.join(set_path, FLEET_DIR_NAME), exist_ok=True)
+
+    manifest = read_fleet_manifest(set_path)
+    for model in models:
+        for input in inputs:
+            unit_id = get_unit_id(model, input)
+            unit = manifest["units"].get(unit_id)
+            if unit is not None and unit["status"] == UNIT_DONE and unit["mechanisms"] == mechanisms:
+                print(f"Skipping {unit_id} since it is already done")
+                continue
+            manifest["units"][unit_id] = {"model": model, "input": input, "mechanisms": mechanisms, "status": UNIT_QUEUED,
+                "target": None, "failed-targets": [], "attempts": []}
+    manifest["targets"] = {target["name"]: "healthy" for target in targets}
+    write_fleet_manifest(set_path, manifest)
+
+    # The state shared by the workers, where the condition guards the manifest and is notified whenever a unit
+    # or target changes state
+    state = {"set-name": set_name, "set-path": set_path, "trials": trials, "collect-data-options": collect_data_options,
+        "sync": sync, "manifest": manifest, "condition": threading.Condition(), "merge-lock": threading.Lock()}
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        for future in [executor.submit(run_target_worker, target, state) for target in targets]:
+            future.result()
+
+    merge_unit_results(set_path)
+
+    units = manifest["units"].values()
+    done_units = sum(unit["status"] == UNIT_DONE for unit in units)
+    failed_unit_ids = [unit_id for unit_id, unit in manifest["units"].items() if unit["status"] != UNIT_DONE]
+    print(f"Finished {done_units} of {len(units)} units of {set_name}")
+    for unit_id in failed_unit_ids:
+        print(f"Failed to collect {unit_id}")
+    return not failed_unit_ids
+
+def run_target_worker(target, state):
+    """Syncs the suite's files to a target, then runs units from the queue on it until none are left or the
+    target fails.
+
+    Args:
+        target: The inventory entry of the target
+        state: The state shared by the workers
+    """
+    name = target["name"]
+    if state["sync"]:
+        print(f"[{name}] Syncing the suite's files")
+        try:
+            sync_suite_files(target)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"[{name}] Failed to sync the suite's files: {e}")
+            mark_target_failed(state, name)
+            return
+
+    while True:
+        unit_id = take_next_unit(state, name)
+        if unit_id is None:
+            return
+
+        returncode = run_unit(target, unit_id, state)
+        if returncode == 0:
+            complete_unit(state, unit_id, name)
+            continue
+
+        # Tell a target that cannot be reached apart from a unit that failed on a reachable one
+        target_reachable = run_on_target(target, "true") == 0
+        release_failed_unit(state, unit_id, name, count_attempt=target_reachable)
+        if not target_reachable:
+            print(f"[{name}] Target is unreachable, so it will take no further units")
+            mark_target_failed(state, name)
+            return
+
+def take_next_unit(state, target_name):
+    """Takes the next queued unit that has not failed on a target, waiting while units are running elsewhere
+    that may still be put back on the queue.
+
+    Args:
+        state: The state shared by the workers
+        target_name: The name of the target taking the unit
+    Returns:
+        str: The ID of the unit, which is marked as running on the target, or None if no units are left for it
+    """
+    condition = state["condition"]
+    units = state["manifest"]["units"]
+    with condition:
+        while True:
+            pending = False
+            for unit_id, unit in units.items():
+                if unit["status"] == UNIT_QUEUED and target_name not in unit["failed-targets"]:
+                    unit["status"] = UNIT_RUNNING
+                    unit["target"] = target_name
+                    write_fleet_manifest(state["set-path"], state["manifest"])
+                    return unit_id
+                pending = pending or (unit["status"] == UNIT_RUNNING)
+            if not pending:
+                return None
+            condition.wait(QUEUE_POLL_INTERVAL)
+
+def complete_unit(state, unit_id, target_name):
+    """Marks a unit as done after fetching and merging its final results.
+
+    Args:
+        state: The state shared by the workers
+        unit_id: The ID of the unit
+        target_name: The name of the target the unit ran on
+    """
+    print(f"[{target_name}] Finished {unit_id}")
+    with state["condition"]:
+        state["manifest"]["units"][unit_id]["status"] = UNIT_DONE
+        write_fleet_manifest(state["set-path"], state["manifest"])
+        state["condition"].notify_all()
+
+def release_failed_unit(state, unit_id, target_name, count_attempt):
+    """Puts a unit that failed back on the queue for the other targets, or marks it as failed once it has been
+    attempted too many times or no healthy target is left to run it.
+
+    Args:
+        state: The state shared by the workers
+        unit_id: The ID of the unit
+        target_name: The name of the target the unit failed on
+        count_attempt: Whether the failure counts against the unit's attempts, i.e. whether the target was reachable
+    """
+    with state["condition"]:
+        manifest = state["manifest"]
+        unit = manifest["units"][unit_id]
+        unit["failed-targets"].append(target_name)
+        unit["attempts"][-1]["counted"] = count_attempt
+        failed_attempts = sum(1 for attempt in unit["attempts"] if attempt["returncode"] != 0 and attempt["counted"])
+        remaining_targets = [name for name, health in manifest["targets"].items()
+            if health == "healthy" and name not in unit["failed-targets"]]
+
+        if (count_attempt and failed_attempts >= MAX_UNIT_ATTEMPTS) or not remaining_targets:
+            print(f"[{target_name}] {unit_id} failed and will not be retried")
+            unit["status"] = UNIT_FAILED
+        else:
+            print(f"[{target_name}] {unit_id} failed, so it was put back on the queue")
+            unit["status"] = UNIT_QUEUED
+        write_fleet_manifest(state["set-path"], manifest)
+        state["condition"].notify_all()
+
+def mark_target_failed(state, target_name):
+    """Marks a target as failed, and fails the queued units that no healthy target is left to run.
+
+    Args:
+        state: The state shared by the workers
+        target_name: The name of the target
+    """
+    with state["condition"]:
+        manifest = state["manifest"]
+        manifest["targets"][target_name] = "failed"
+        healthy_targets = [name for name, health in manifest["targets"].items() if health == "healthy"]
+        for unit in manifest["units"].values():
+            if unit["status"] == UNIT_QUEUED and all(name in unit["failed-targets"] for name in healthy_targets):
+                unit["status"] = UNIT_FAILED
+        write_fleet_manifest(state["set-path"], manifest)
+        state["condition"].notify_all()
+
+def run_unit(target, unit_id, state):
+    """Runs a unit on a target through target_scripts/collect_data.sh, fetching and merging its results
+    periodically while it runs and once it finishes. The output of the run is saved to the unit's log file.
+
+    Args:
+        target: The inventory entry of the target
+        unit_id: The ID of the unit
+        state: The state shared by the workers
+    Returns:
+        int: The return code of the run
+    """
+    with state["condition"]:
+        unit = dict(state["manifest"]["units"][unit_id])
+
+    unit_set_name = f"{state['set-name']}/{FLEET_DIR_NAME}/{unit_id}"
+    suite_path = get_suite_path(target)
+    options = list(state["collect-data-options"]) + (["-m"] if target.get("is_mac") else [])
+    cmd = " ".join(shlex.quote(arg) for arg in [f"SUITE_PATH={suite_path}", "bash", f"{suite_path}/target_scripts/collect_data.sh"]
+        + options + ["-M", unit["model"], "-I", unit["input"], str(state["trials"]), unit_set_name, ",".join(unit["mechanisms"])])
+
+    unit_results_path = os.path.join(state["set-path"], FLEET_DIR_NAME, unit_id)
+    prepare_unit_results_path(unit_results_path, target["name"], state)
+    print(f"[{target['name']}] Running {unit_id}")
+    started_at = datetime.now(timezone.utc).isoformat()
+
+    with open(os.path.join(unit_results_path, "collect_data.log"), "w") as log_file:
+        try:
+            process = subprocess.Popen(get_target_cmd(target, cmd), stdout=log_file, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+            while True:
+                try:
+                    returncode = process.wait(FETCH_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    fetch_and_merge_unit_results(target, unit_set_name, unit_results_path, state)
+        except OSError as e:
+            log_file.write(f"Failed to run {unit_id}: {e}\n")
+            returncode = COMMAND_NOT_FOUND_RETURNCODE
+
+    if returncode == 0:
+        fetch_and_merge_unit_results(target, unit_set_name, unit_results_path, state)
+
+    with state["condition"]:
+        state["manifest"]["units"][unit_id]["attempts"].append({"target": target["name"], "started-at": started_at,
+            "finished-at": datetime.now(timezone.utc).isoformat(), "returncode": returncode, "counted": True})
+        write_fleet_manifest(state["set-path"], state["manifest"])
+    return returncode
+
+def fetch_and_merge_unit_results(target, unit_set_name, unit_results_path, state):
+    """Fetches the results files a unit has written on a target so far, and merges them into the set's results files.
+    Failing to fetch them is only reported, since the unit's run decides whether it failed.
+
+    Args:
+        target: The inventory entry of the target
+        unit_set_name: The set name the unit's results are written under on the target
+        unit_results_path: The directory on the host to fetch the unit's results into
+        state: The state shared by the workers
+    """
+    remote_results_path = f"{get_suite_path(target)}/results/{unit_set_name}"
+    try:
+        if target["type"] == "ssh":
+            run_rsync(target, [f"{get_ssh_destination(target)}:{remote_results_path}/", f"{unit_results_path}/"])
+        elif os.path.isdir(remote_results_path):
+            copy_changed_files(remote_results_path, unit_results_path)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"[{target['name']}] Failed to fetch the results of {unit_set_name}: {e}")
+        return
+
+    with state["merge-lock"]:
+        merge_unit_results(state["set-path"])
+
+def prepare_unit_results_path(unit_results_path, target_name, state):
+    """Prepares the directory on the host a unit's results are fetched into for running it on a target, clearing 
+    the results an earlier attempt fetched from another target, and records the target.
+
+    Args:
+        unit_results_path: The directory on the host the unit's results are fetched into
+        target_name: The name of the target the unit runs on
+        state: The state shared by the workers
+    """
+    with state["merge-lock"]:
+        if read_unit_target(unit_results_path) not in [None, target_name]:
+            shutil.rmtree(unit_results_path)
+        os.makedirs(unit_results_path, exist_ok=True)
+        with open(os.path.join(unit_results_path, UNIT_TARGET_FILENAME), "w") as f:
+            f.write(target_name)
+
+def read_unit_target(unit_results_path):
+    """Reads the target a unit's results were collected on.
+
+    Args:
+        unit_results_path: The directory on the host the unit's results are fetched into
+    Returns:
+        str: The name of the target, or None if the unit has not run yet
+    """
+    target_path = os.path.join(unit_results_path, UNIT_TARGET_FILENAME)
+    if not os.path.exists(target_path):
+        return None
+    with open(target_path, "r") as f:
+        return f.read().strip()
+
+def merge_unit_results(set_path):
+    """Merges the results files of every unit fetched so far into the set's results files, recording the target
+    each row was collected on. Since a unit collects every mechanism of a model and input, each results file comes
+    from a single unit; the rows of a results file are never merged across targets, since the mechanisms in it
+    are compared against each other, and a ValueError is raised if they were collected on more than one. Since the
+    results files may have different columns, such as perf events only some targets support, their union is written.
+
+    Args:
+        set_path: The path of the set's results directory
+    """
+    fleet_path = os.path.join(set_path, FLEET_DIR_NAME)
+    results_files = {}
+    for unit_id in sorted(os.listdir(fleet_path)):
+        unit_results_path = os.path.join(fleet_path, unit_id)
+        if not os.path.isdir(unit_results_path):
+            continue
+        target_name = read_unit_target(unit_results_path)
+        for filename in sorted(os.listdir(unit_results_path)):
+            if filename.endswith(RESULTS_FILENAME_SUFFIX):
+                results_files.setdefault(filename, []).append((os.path.join(unit_results_path, filename), target_name))
+
+    for filename, unit_results_filenames in results_files.items():
+        targets = {target_name for _, target_name in unit_results_filenames}
+        if len(targets) > 1:
+            raise ValueError(f"The rows of {filename} were collected on different targets ({', '.join(sorted(map(str, targets)))}), "
+                + "so its mechanisms cannot be compared")
+
+        field_names = []
+        rows = []
+        for unit_results_filename, target_name in unit_results_filenames:
+            with open(unit_results_filename, "r", newline="") as f:
+                reader = csv.DictReader(f)
+                field_names.extend(field_name for field_name in reader.fieldnames or [] if field_name not in field_names)
+                rows.extend(dict(row, **{TARGET_COLUMN: target_name}) for row in reader)
+        if TARGET_COLUMN not in field_names:
+            field_names.append(TARGET_COLUMN)
+
+        # Write to a temporary file first, so the results file is never seen half-written
+        merged_filename = os.path.join(set_path, filename)
+        with open(f"{merged_filename}.partial", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=field_names)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(f"{merged_filename}.partial", merged_filename)
+
+def sync_suite_files(target):
+    """Syncs the suite's files to a target, only copying the files that changed since they were last synced.
+
+    Args:
+        target: The inventory entry of the target
+    """
+    suite_path = get_suite_path(target)
+    suite_files = [(os.path.join(BENCHMARK_DIR, source), f"{suite_path}/{destination}") for source, destination in SUITE_FILES
+        if os.path.exists(os.path.join(BENCHMARK_DIR, source))]
+
+    if target["type"] == "ssh":
+        # rsync only creates the last directory of each destination, so create their parents first
+        parents = sorted(set(os.path.dirname(destination) for _, destination in suite_files) | {f"{suite_path}/results"})
+        if run_on_target(target, " ".join(["mkdir", "-p"] + [shlex.quote(parent) for parent in parents])) != 0:
+            raise OSError(f"could not create the suite directory {suite_path}")
+        for source, destination in suite_files:
+            # A trailing slash syncs the contents of a directory rather than the directory itself
+            source_suffix = "/" if os.path.isdir(source) else ""
+            run_rsync(target, [source + source_suffix, f"{get_ssh_destination(target)}:{destination}{source_suffix}"])
+    else:
+        os.makedirs(os.path.join(suite_path, "results"), exist_ok=True)
+        for source, destination in suite_files:
+            copy_changed_files(source, destination)
+
+def copy_changed_files(source, destination):
+    """Copies a file, or the files within a directory recursively, skipping files whose size and modification time
+    match those of their copy, like rsync does.
+
+    Args:
+        source: The path of the file or directory to copy
+        destination: The path to copy it to
+    """
+    if os.path.isdir(source):
+        for root, _, filenames in os.walk(source):
+            for filename in filenames:
+                source_filename = os.path.join(root, filename)
+                copy_changed_files(source_filename, os.path.join(destination, os.path.relpath(source_filename, source)))
+        return
+
+    if os.path.exists(destination):
+        source_stat = os.stat(source)
+        destination_stat = os.stat(destination)
+        if source_stat.st_size == destination_stat.st_size and int(source_stat.st_mtime) == int(destination_stat.st_mtime):
+            return
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    shutil.copy2(source, destination)
+
+def run_rsync(target, args):
+    """Runs rsync between the host and an SSH target, through sshpass if the target has a password.
+
+    Args:
+        target: The inventory entry of the target
+        args: The source and destination to sync
+    """
+    subprocess.run(get_sshpass_prefix(target) + ["rsync", "-az"] + args, check=True, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, text=True)
+
+def run_on_target(target, cmd):
+    """Runs a shell command on a target.
+
+    Args:
+        target: The inventory entry of the target
+        cmd: The shell command
+    Returns:
+        int: The return code of the command, which is COMMAND_NOT_FOUND_RETURNCODE if it could not be run at all
+    """
+    try:
+        return subprocess.run(get_target_cmd(target, cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL, text=True).returncode
+    except OSError:
+        return COMMAND_NOT_FOUND_RETURNCODE
+
+def get_target_cmd(target, cmd):
+    """Gets the command running a shell command on a target: over SSH for SSH targets, and through the target's
+    exec prefix, if any, for local targets.
+
+    Args:
+        target: The inventory entry of the target
+        cmd: The shell command
+    Returns:
+        list: The command
+    """
+    if target["type"] == "ssh":
+        return get_sshpass_prefix(target) + ["ssh", get_ssh_destination(target), cmd]
+    return target.get("exec_prefix", []) + ["sh", "-c", cmd]
+
+def get_sshpass_prefix(target):
+    """Gets the sshpass command prefix passing an SSH target's password, read from the inventory or from the
+    environment variable it names, or no prefix if the target has no password, e.g. when using SSH keys.
+
+    Args:
+        target: The inventory entry of the target
+    Returns:
+        list: The command prefix
+    """
+    password = target.get("password") or os.environ.get(target.get("password_env", ""))
+    return ["sshpass", "-p", password] if password else []
+
+def get_ssh_destination(target):
+    """Gets the destination to connect to an SSH target at.
+
+    Args:
+        target: The inventory entry of the target
+    Returns:
+        str: The destination, in the format username@address
+    """
+    return f"{target['username']}@{target['address']}"
+
+def get_suite_path(target):
+    """Gets the path of the suite directory on a target.
+
+    Args:
+        target: The inventory entry of the target
+    Returns:
+        str: The path
+    """
+    if "suite_path" in target:
+        return target["suite_path"]
+    return SSH_SUITE_PATH_TEMPLATE.format(username=target["username"])
+
+def get_unit_id(model, input):
+    """Gets the ID of the unit collecting a model and input, which names its directories.
+
+    Args:
+        model: The model
+        input: The input
+    Returns:
+        str: The ID of the unit
+    """
+    return f"{model}-{input}"
+
+def read_fleet_manifest(set_path):
+    """Reads a set's fleet manifest, recording the state of every unit and target of its last collection.
+
+    Args:
+        set_path: The path of the set's results directory
+    Returns:
+        dict: The manifest, which is empty if the set was not collected across a fleet before
+    """
+    manifest_path = os.path.join(set_path, FLEET_MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return {"units": {}, "targets": {}}
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+def write_fleet_manifest(set_path, manifest):
+    """Writes a set's fleet manifest.
+
+    Args:
+        set_path: The path of the set's results directory
+        manifest: The manifest
+    """
+    manifest_path = os.path.join(set_path, FLEET_MANIFEST_FILENAME)
+    with open(f"{manifest_path}.partial", "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(f"{manifest_path}.partial", manifest_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""This module preprocesses the inputs once into raw tensors, so that the binaries can load them directly
+instead of decoding, resizing and normalizing the image on every trial.
+
+Each tensor is stored as raw little-endian float32 values in NCHW order (with N = 1 and C = 3), using the
+same resizing filter and normalization as the binaries' image_to_tensor() functions, and is named after the
+input and the resolution it was resized to, e.g. 1_SingleObject.jpg.224.bin.
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+# The absolute path of the "input_preprocessing" directory where this script is in
+SCRIPTS_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# The absolute path of the root of the benchmark suite
+BENCHMARK_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, "..", ".."))
+
+# Default locations of the inputs, of the preprocessed tensors and of the model manifest; the tensors are
+# kept outside the nested inputs directory since every file in there is considered an input
+DEFAULT_INPUTS_DIR = os.path.join(BENCHMARK_DIR, "inputs", "inputs")
+DEFAULT_OUTPUT_DIR = os.path.join(BENCHMARK_DIR, "inputs", "tensors")
+DEFAULT_MANIFEST_PATH = os.path.join(BENCHMARK_DIR, "models", "manifest.json")
+
+# The resolution to preprocess inputs at if none are given and there is no model manifest
+DEFAULT_RESOLUTION = 224
+
+# The per-channel mean and standard deviation used for normalization, matching the binaries
+CHANNEL_MEANS = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+CHANNEL_STDS = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+def main():
+    parser = argparse.ArgumentParser(description="Preprocess inputs into raw NCHW float32 tensors")
+    parser.add_argument("--inputs-dir", type=str, default=DEFAULT_INPUTS_DIR, help="The directory containing the inputs")
+    parser.add_argument("--output-dir", type=str, default=DEFAULT_OUTPUT_DIR, help="The directory to save the tensors in")
+    parser.add_argument("--resolutions", type=str,
+        help="Comma-separated list of resolutions to preprocess each input at; by default, every resolution in the model manifest")
+    parser.add_argument("--manifest", type=str, default=DEFAULT_MANIFEST_PATH, help="The path of the model manifest")
+    parser.add_argument("--force", action="store_true", help="Preprocess inputs even if an up-to-date tensor already exists")
+    args = parser.parse_args()
+
+    if args.resolutions is not None:
+        resolutions = sorted(set(int(resolution.strip()) for resolution in args.resolutions.split(",") if resolution.strip()))
+    else:
+        resolutions = get_manifest_resolutions(args.manifest)
+
+    generate_input_tensors(args.inputs_dir, args.output_dir, resolutions, args.force)
+
+def get_manifest_resolutions(manifest_path):
+    """Gets every input resolution that the models in the model manifest were exported at.
+
+    Args:
+        manifest_path: The path of the model manifest
+    Returns:
+        list: The sorted resolutions, or just the default resolution if there is no manifest
+    """
+    if not os.path.exists(manifest_path):
+        return [DEFAULT_RESOLUTION]
+
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+
+    resolutions = set(entry["input_shape"][-1] for entry in manifest.get("models", {}).values())
+    return sorted(resolutions) if resolutions else [DEFAULT_RESOLUTION]
+
+def generate_input_tensors(inputs_dir, output_dir, resolutions, force=False):
+    """Preprocesses every input at every given resolution, skipping tensors that are newer than their input.
+
+    Args:
+        inputs_dir: The directory containing the inputs
+        output_dir: The directory to save the tensors in
+        resolutions: The resolutions to preprocess each input at
+        force: Whether to preprocess inputs even if an up-to-date tensor already exists
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    for input_file in sorted(os.listdir(inputs_dir)):
+        input_path = os.path.join(inputs_dir, input_file)
+        if not os.path.isfile(input_path):
+            continue
+
+        for resolution in resolutions:
+            output_path = os.path.join(output_dir, get_tensor_filename(input_file, resolution))
+            if not force and os.path.exists(output_path) and os.path.getmtime(output_path) >= os.path.getmtime(input_path):
+                print(f"Skipping {output_path} since it is up to date")
+                continue
+
+            image_to_tensor(input_path, resolution, resolution).tofile(output_path)
+            print(f"Generated {output_path}")
+
+def get_tensor_filename(input_file, resolution):
+    """Gets the filename the tensor of an input preprocessed at a given resolution is saved under.
+
+    Args:
+        input_file: The filename of the input
+        resolution: The resolution the input was resized to
+    Returns:
+        str: The filename of the tensor
+    """
+    return f"{input_file}.{resolution}.bin"
+
+def image_to_tensor(path, height, width):
+    """Opens the image at the given path, resizes it to height x width and normalizes it, mirroring the
+    binaries' image_to_tensor() functions. Pillow's bilinear filter, like the image crate's triangle filter
+    the binaries use, widens its support when downscaling, so both produce near-identical pixels.
+
+    Args:
+        path: The path to the image
+        height: The height to resize the image to
+        width: The width to resize the image to
+    Returns:
+        np.ndarray: The normalized little-endian float32 tensor, in NCHW order
+    """
+    img = Image.open(path).convert("RGB")
+    resized = img.resize((width, height), Image.BILINEAR)
+
+    pixels = np.asarray(resized, dtype=np.float32) / 255.0
+    normalized = (pixels - CHANNEL_MEANS) / CHANNEL_STDS
+
+    # Convert from HWC to NCHW
+    return np.ascontiguousarray(normalized.transpose(2, 0, 1)[np.newaxis], dtype="<f4")
+
+if __name__ == "__main__":
+    main()
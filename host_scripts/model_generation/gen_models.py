@@ -0,0 +1,333 @@
+"""This module downloads and converts selected model variants to TorchScript format.
+
+Every supported variant is described by an entry in MODEL_REGISTRY. Variants are exported in parallel
+worker processes, and an export is skipped if the output file already exists and was produced from
+the same source weights with the same exporter settings. A manifest describing every generated model
+(parameter count, FLOPs, file size, input shape and export options) is written alongside the models
+so that the data collection and analysis scripts can read machine-readable metadata about them.
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import torch
+import torchvision
+from torch.utils.flop_counter import FlopCounterMode
+
+# The absolute path of the "model_generation" directory where this script is in
+SCRIPTS_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# The absolute path of the root of the benchmark suite
+BENCHMARK_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, "..", ".."))
+
+# Default locations of the generated models and of the manifest describing them; the manifest
+# is kept outside the nested models directory since every file in there is considered a model
+DEFAULT_OUTPUT_DIR = os.path.join(BENCHMARK_DIR, "models", "models")
+DEFAULT_MANIFEST_PATH = os.path.join(BENCHMARK_DIR, "models", "manifest.json")
+
+# The version of the manifest format, bumped whenever its structure changes
+MANIFEST_VERSION = 1
+
+# The pretrained weights to use for every variant; IMAGENET1K_V1 is what the deprecated
+# pretrained=True argument used to resolve to
+WEIGHTS_NAME = "IMAGENET1K_V1"
+
+# Maps the name of each supported model variant to its family, the name of the torchvision
+# function building it, the name of the torchvision enum describing its weights, and the input
+# resolution the variant was designed for (as used by torchvision's evaluation transforms)
+MODEL_REGISTRY = {
+    "efficientnet_b0": ("efficientnet", "efficientnet_b0", "EfficientNet_B0_Weights", 224),
+    "efficientnet_b1": ("efficientnet", "efficientnet_b1", "EfficientNet_B1_Weights", 240),
+    "efficientnet_b2": ("efficientnet", "efficientnet_b2", "EfficientNet_B2_Weights", 288),
+    "efficientnet_b3": ("efficientnet", "efficientnet_b3", "EfficientNet_B3_Weights", 300),
+    "efficientnet_b4": ("efficientnet", "efficientnet_b4", "EfficientNet_B4_Weights", 380),
+    "efficientnet_b5": ("efficientnet", "efficientnet_b5", "EfficientNet_B5_Weights", 456),
+    "efficientnet_b6": ("efficientnet", "efficientnet_b6", "EfficientNet_B6_Weights", 528),
+    "efficientnet_b7": ("efficientnet", "efficientnet_b7", "EfficientNet_B7_Weights", 600),
+    "mobilenetv3_small": ("mobilenet", "mobilenet_v3_small", "MobileNet_V3_Small_Weights", 224),
+    "mobilenetv3_large": ("mobilenet", "mobilenet_v3_large", "MobileNet_V3_Large_Weights", 224),
+    "resnet18": ("resnet", "resnet18", "ResNet18_Weights", 224),
+    "resnet34": ("resnet", "resnet34", "ResNet34_Weights", 224),
+    "resnet50": ("resnet", "resnet50", "ResNet50_Weights", 224),
+    "resnet101": ("resnet", "resnet101", "ResNet101_Weights", 224),
+    "resnet152": ("resnet", "resnet152", "ResNet152_Weights", 224),
+}
+
+# The height and width of the dummy input used when tracing, unless other resolutions are requested;
+# models exported at this resolution keep their plain filename, while models exported at any
+# other resolution have it appended to their filename, e.g. efficientnet_b3_res300.pt
+DEFAULT_RESOLUTION = 224
+
+# The value that can be given in place of a resolution to export each variant at the resolution
+# it was designed for
+NATIVE_RESOLUTION_KEYWORD = "native"
+
+def main():
+    # Parse input arguments representing which variants to generate
+    parser = argparse.ArgumentParser(description="Download and convert model variants to TorchScript format")
+    parser.add_argument("--models", type=str,
+        help=f"Comma-separated list of model variants to generate (choose from {', '.join(MODEL_REGISTRY)})")
+    parser.add_argument("--list", action="store_true", help="List the model variants that can be generated and exit")
+    parser.add_argument("--output-dir", type=str, default=DEFAULT_OUTPUT_DIR, help="The directory to save the models in")
+    parser.add_argument("--manifest", type=str, default=DEFAULT_MANIFEST_PATH, help="The path of the model manifest to update")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count()),
+        help="The number of worker processes to export models in")
+    parser.add_argument("--resolutions", type=str, default=str(DEFAULT_RESOLUTION),
+        help=f"Comma-separated list of input resolutions to export each variant at; use '{NATIVE_RESOLUTION_KEYWORD}' "
+            "for the resolution each variant was designed for")
+    parser.add_argument("--force", action="store_true", help="Re-export models even if an up-to-date export already exists")
+    args = parser.parse_args()
+
+    if args.list:
+        for model_name, (family, _, _, native_resolution) in MODEL_REGISTRY.items():
+            print(f"{model_name} ({family}, designed for {native_resolution}x{native_resolution} inputs)")
+        return
+
+    if args.models is None:
+        parser.error("You must provide a list of models to generate.")
+
+    model_names = [model_name.strip() for model_name in args.models.split(",") if model_name.strip()]
+    unknown_model_names = [model_name for model_name in model_names if model_name not in MODEL_REGISTRY]
+    if unknown_model_names:
+        parser.error(f"Unknown models: {', '.join(unknown_model_names)}")
+
+    resolutions = [resolution.strip().lower() for resolution in args.resolutions.split(",") if resolution.strip()]
+    invalid_resolutions = [resolution for resolution in resolutions 
+        if resolution != NATIVE_RESOLUTION_KEYWORD and not resolution.isdigit()]
+    if invalid_resolutions:
+        parser.error(f"Invalid resolutions: {', '.join(invalid_resolutions)}")
+
+    generate_models(model_names, resolutions, args.output_dir, args.manifest, args.workers, args.force)
+
+def generate_models(model_names, resolutions, output_dir, manifest_path, workers, force=False):
+    """Exports the given model variants at the given resolutions in parallel, skipping those whose 
+    existing export is up to date, and records every exported model in the manifest.
+
+    Args:
+        model_names: The names of the model variants to generate, as keys of MODEL_REGISTRY
+        resolutions: The input resolutions to export each variant at, as strings that are either
+            a number or NATIVE_RESOLUTION_KEYWORD
+        output_dir: The directory to save the models in
+        manifest_path: The path of the model manifest to update
+        workers: The number of worker processes to export models in
+        force: Whether to re-export models even if an up-to-date export already exists
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = read_manifest(manifest_path)
+
+    # Work out which models need to be exported; the weights are downloaded here rather than in the
+    # workers so that multiple workers never download into the same cache file at once
+    jobs = []
+    for model_name in model_names:
+        weights_hash = hash_file(download_weights(model_name))
+
+        for resolution in resolve_resolutions(model_name, resolutions):
+            export_options = get_export_options(resolution)
+            cache_key = compute_cache_key(weights_hash, export_options)
+            filename = get_model_filename(model_name, resolution)
+
+            existing_entry = manifest["models"].get(filename)
+            output_path = os.path.join(output_dir, filename)
+            if not force and existing_entry is not None and existing_entry.get("cache_key") == cache_key \
+                    and os.path.exists(output_path):
+                print(f"Skipping {filename} since it is up to date")
+                continue
+
+            jobs.append((model_name, output_path, export_options, cache_key))
+
+    if not jobs:
+        print("All models are up to date")
+        return
+
+    # Split the available cores between the workers so they do not oversubscribe the CPU
+    workers = max(1, min(workers, len(jobs)))
+    threads_per_worker = max(1, os.cpu_count() // workers)
+
+    # Use spawn rather than fork, since forking a process that has already initialized torch is unsafe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {executor.submit(export_model, *job, threads_per_worker): job[0] for job in jobs}
+
+        for future in as_completed(futures):
+            model_name = futures[future]
+            filename, entry = future.result()
+            print(f"Generated {filename} from {model_name}")
+
+            # Write the manifest after every export so that progress is not lost if a later export fails
+            manifest["models"][filename] = entry
+            write_manifest(manifest_path, manifest)
+
+def export_model(model_name, output_path, export_options, cache_key, num_threads):
+    """Exports a single model variant to TorchScript format. This is run inside a worker process.
+
+    Args:
+        model_name: The name of the model variant, as a key of MODEL_REGISTRY
+        output_path: The path to save the model to
+        export_options: The exporter settings to use
+        cache_key: The cache key identifying the source weights and exporter settings
+        num_threads: The number of intra-op threads torch may use in this worker
+    Returns:
+        tuple: The filename of the exported model and its manifest entry
+    """
+    torch.set_num_threads(num_threads)
+
+    family, builder_name, weights_enum_name, _ = MODEL_REGISTRY[model_name]
+
+    # Load the pretrained model
+    model = getattr(torchvision.models, builder_name)(weights=WEIGHTS_NAME)
+    model.eval()
+
+    # Create a dummy input
+    input_shape = export_options["input_shape"]
+    fake_input = torch.rand(*input_shape)
+
+    # Count the parameters and FLOPs of a single forward pass
+    parameters = sum(parameter.numel() for parameter in model.parameters())
+    with torch.no_grad(), FlopCounterMode(display=False) as flop_counter:
+        model(fake_input)
+    flops = flop_counter.get_total_flops()
+
+    # Convert the model into a TorchScript module using tracing,
+    # passing in the dummy input to trace
+    traced_model = torch.jit.trace(model, fake_input)
+
+    # Freeze the model to optimize it
+    frozen_model = torch.jit.freeze(traced_model)
+
+    # Save the frozen model
+    frozen_model.save(output_path)
+
+    entry = {
+        "model": model_name,
+        "family": family,
+        "weights": f"{weights_enum_name}.{WEIGHTS_NAME}",
+        "parameters": parameters,
+        "flops": flops,
+        "file_size_bytes": os.path.getsize(output_path),
+        "input_shape": input_shape,
+        "resolution": input_shape[-1],
+        "export_options": export_options,
+        "cache_key": cache_key,
+    }
+    return os.path.basename(output_path), entry
+
+def resolve_resolutions(model_name, resolutions):
+    """Resolves the requested resolutions into the distinct numeric resolutions to export a model variant at.
+
+    Args:
+        model_name: The name of the model variant
+        resolutions: The requested resolutions, as strings that are either a number or NATIVE_RESOLUTION_KEYWORD
+    Returns:
+        list: The numeric resolutions, in the order they were requested
+    """
+    native_resolution = MODEL_REGISTRY[model_name][3]
+    numeric_resolutions = [native_resolution if resolution == NATIVE_RESOLUTION_KEYWORD else int(resolution)
+        for resolution in resolutions]
+    return list(dict.fromkeys(numeric_resolutions))
+
+def get_model_filename(model_name, resolution):
+    """Gets the filename a model variant exported at a given resolution is saved under.
+
+    Args:
+        model_name: The name of the model variant
+        resolution: The input resolution the model was exported at
+    Returns:
+        str: The filename of the model
+    """
+    if resolution == DEFAULT_RESOLUTION:
+        return f"{model_name}.pt"
+    return f"{model_name}_res{resolution}.pt"
+
+def get_export_options(resolution):
+    """Gets the exporter settings used for exporting models. These are part of the cache key,
+    so a change to any of them causes models to be re-exported.
+
+    Args:
+        resolution: The input resolution to trace the model at
+    Returns:
+        dict: The exporter settings
+    """
+    return {
+        "method": "trace",
+        "freeze": True,
+        "input_shape": [1, 3, resolution, resolution],
+        "torch_version": torch.__version__,
+        "torchvision_version": torchvision.__version__,
+    }
+
+def download_weights(model_name):
+    """Downloads the pretrained weights of a model variant into torch's cache, if they are not already there.
+
+    Args:
+        model_name: The name of the model variant
+    Returns:
+        str: The path to the downloaded weights
+    """
+    _, _, weights_enum_name, _ = MODEL_REGISTRY[model_name]
+    weights = torchvision.models.get_weight(f"{weights_enum_name}.{WEIGHTS_NAME}")
+
+    # This is the same location torchvision loads the weights from when building the model
+    weights_path = os.path.join(torch.hub.get_dir(), "checkpoints", os.path.basename(weights.url))
+    if not os.path.exists(weights_path):
+        os.makedirs(os.path.dirname(weights_path), exist_ok=True)
+        torch.hub.download_url_to_file(weights.url, weights_path)
+
+    return weights_path
+
+def hash_file(path):
+    """Computes the SHA-256 hash of a file's contents.
+
+    Args:
+        path: The path to the file
+    Returns:
+        str: The hexadecimal digest of the file's contents
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+def compute_cache_key(weights_hash, export_options):
+    """Computes the cache key of an export from its source weights and exporter settings.
+
+    Args:
+        weights_hash: The hash of the source weights
+        export_options: The exporter settings
+    Returns:
+        str: The cache key
+    """
+    key_source = weights_hash + json.dumps(export_options, sort_keys=True)
+    return hashlib.sha256(key_source.encode()).hexdigest()
+
+def read_manifest(manifest_path):
+    """Reads the model manifest, returning an empty manifest if it does not exist yet.
+
+    Args:
+        manifest_path: The path of the manifest
+    Returns:
+        dict: The manifest
+    """
+    if not os.path.exists(manifest_path):
+        return {"version": MANIFEST_VERSION, "models": {}}
+
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+def write_manifest(manifest_path, manifest):
+    """Writes the model manifest, replacing the previous one atomically.
+
+    Args:
+        manifest_path: The path of the manifest
+        manifest: The manifest to write
+    """
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,69 @@ use image;
 use std::env;
 use std::fs::File;
 use std::io::Read;
+use memmap2::Mmap;
 use tch::{nn, Device, Kind, Tensor};
 mod imagenet_classes;
 
+// The height and width the image is resized to if no size is given on the command line
+const DEFAULT_IMAGE_SIZE: u32 = 224;
+
 pub fn main() {
     let args: Vec<String> = env::args().collect();
     let model_bin_name: &str = &args[1];
     let image_name: &str = &args[2];
 
+    // Parse the optional arguments following the model and image; --size gives the height and
+    // width the model expects its input in, and --tensor indicates that the image is a tensor
+    // that has already been decoded, resized and normalized, and --threads gives the number of
+    // threads libtorch uses for intra-op parallelism instead of its default
+    let mut image_size = DEFAULT_IMAGE_SIZE;
+    let mut pre_decoded = false;
+    let mut num_threads: Option<i32> = None;
+    let mut i = 3;
+    while i < args.len() {
+        match args[i].as_str() {
+            "--tensor" => {
+                pre_decoded = true;
+                i += 1;
+            }
+            "--size" => {
+                image_size = args
+                    .get(i + 1)
+                    .and_then(|value| value.parse().ok())
+                    .unwrap_or_else(|| panic!("--size requires a positive integer value"));
+                i += 2;
+            }
+            "--threads" => {
+                num_threads = Some(
+                    args.get(i + 1)
+                        .and_then(|value| value.parse().ok())
+                        .filter(|&value| value > 0)
+                        .unwrap_or_else(|| panic!("--threads requires a positive integer value")),
+                );
+                i += 2;
+            }
+            option => panic!("Unknown option: {}", option),
+        }
+    }
+
+    if let Some(threads) = num_threads {
+        tch::set_num_threads(threads);
+    }
+
     println!("Loading model");
     let model = tch::CModule::load(model_bin_name)
         .unwrap_or_else(|e| panic!("Failed to load model: {:?}", e));
     println!("Loaded model");
 
-    // Load a tensor that precisely matches the graph input tensor 
-    let tensor_data = image_to_tensor(image_name.to_string(), 224, 224);
+    // Load a tensor that precisely matches the graph input tensor. A pre-decoded tensor borrows the
+    // memory mapping of its file, which must therefore stay alive until the inference has run
+    let (tensor_data, _mapping) = if pre_decoded {
+        let (tensor, mapping) = tensor_from_file(image_name.to_string(), image_size, image_size);
+        (tensor, Some(mapping))
+    } else {
+        (image_to_tensor(image_name.to_string(), image_size, image_size), None)
+    };
     //println!("Read input tensor, size in bytes: {}", tensor_data.len());
 
     // Execute the inference.
@@ -79,6 +127,41 @@ fn image_to_tensor(path: String, height: u32, width: u32) -> tch::Tensor {
     return tensor;
 }
 
+// Memory-map the pre-decoded tensor located at 'path', which holds the normalized FP32 pixels of an
+// image already resized to height x width in NCHW order, so no decoding is needed. The resulting
+// tensor is returned together with the mapping: it points into the mapped pages rather than copying
+// them, so the mapping must outlive every use of the tensor.
+fn tensor_from_file(path: String, height: u32, width: u32) -> (tch::Tensor, Mmap) {
+    let file = File::open(&path).unwrap();
+    let mapped = unsafe { Mmap::map(&file) }.unwrap();
+    let expected_len = 3 * height as usize * width as usize * std::mem::size_of::<f32>();
+    if mapped.len() != expected_len {
+        panic!(
+            "Tensor file {} has {} bytes, expected {} for a {}x{} input",
+            path,
+            mapped.len(),
+            expected_len,
+            height,
+            width
+        );
+    }
+
+    let (height, width) = (height as i64, width as i64);
+    // Safety: the mapping holds exactly 3 x height x width contiguous FP32 values, checked above, and
+    // is returned alongside the tensor so that it is only unmapped once the tensor is no longer used.
+    // The model only reads its input, so the read-only mapping is never written through.
+    let tensor = unsafe {
+        tch::Tensor::from_blob(
+            mapped.as_ptr(),
+            &[1, 3, height, width],
+            &[3 * height * width, height * width, width, 1],
+            Kind::Float,
+            Device::Cpu,
+        )
+    };
+    (tensor, mapped)
+}
+
 // A wrapper for class ID and match probabilities.
 #[derive(Debug, PartialEq)]
 struct InferenceResult(usize, f32);
@@ -5,11 +5,37 @@ use std::io::Read;
 use wasi_nn;
 mod imagenet_classes;
 
+// The height and width the image is resized to if no size is given on the command line
+const DEFAULT_IMAGE_SIZE: u32 = 224;
+
 pub fn main() {
     let args: Vec<String> = env::args().collect();
     let model_bin_name: &str = &args[1];
     let image_name: &str = &args[2];
 
+    // Parse the optional arguments following the model and image; --size gives the height and
+    // width the model expects its input in, and --tensor indicates that the image is a tensor
+    // that has already been decoded, resized and normalized
+    let mut image_size = DEFAULT_IMAGE_SIZE;
+    let mut pre_decoded = false;
+    let mut i = 3;
+    while i < args.len() {
+        match args[i].as_str() {
+            "--tensor" => {
+                pre_decoded = true;
+                i += 1;
+            }
+            "--size" => {
+                image_size = args
+                    .get(i + 1)
+                    .and_then(|value| value.parse().ok())
+                    .unwrap_or_else(|| panic!("--size requires a positive integer value"));
+                i += 2;
+            }
+            option => panic!("Unknown option: {}", option),
+        }
+    }
+
     println!("Loading graph");
     let graph = wasi_nn::GraphBuilder::new(
         wasi_nn::GraphEncoding::Pytorch,
@@ -23,10 +49,19 @@ pub fn main() {
     println!("Created wasi-nn execution context with ID: {:?}", context);
 
     // Load a tensor that precisely matches the graph input tensor (see
-    let tensor_data = image_to_tensor(image_name.to_string(), 224, 224);
+    let tensor_data = if pre_decoded {
+        tensor_from_file(image_name.to_string(), image_size, image_size)
+    } else {
+        image_to_tensor(image_name.to_string(), image_size, image_size)
+    };
     println!("Read input tensor, size in bytes: {}", tensor_data.len());
     context
-        .set_input(0, wasi_nn::TensorType::F32, &[1, 3, 224, 224], &tensor_data)
+        .set_input(
+            0,
+            wasi_nn::TensorType::F32,
+            &[1, 3, image_size as usize, image_size as usize],
+            &tensor_data,
+        )
         .unwrap();
     // Execute the inference.
     context.compute().unwrap();
@@ -68,7 +103,7 @@ fn image_to_tensor(path: String, height: u32, width: u32) -> Vec<u8> {
     file_img.read_to_end(&mut img_buf).unwrap();
     let img = image::load_from_memory(&img_buf).unwrap().to_rgb8();
     let resized =
-        image::imageops::resize(&img, height, width, ::image::imageops::FilterType::Triangle);
+        image::imageops::resize(&img, width, height, ::image::imageops::FilterType::Triangle);
     let mut flat_img: Vec<f32> = Vec::new();
     for rgb in resized.pixels() {
         flat_img.push((rgb[0] as f32 / 255. - 0.485) / 0.229);
@@ -92,6 +127,26 @@ fn image_to_tensor(path: String, height: u32, width: u32) -> Vec<u8> {
     return u8_f32_arr;
 }
 
+// Read the pre-decoded tensor located at 'path', which holds the normalized FP32 pixels of an image
+// already resized to height x width in NCHW order. WASI does not support memory-mapping files, so the
+// bytes are read once and returned as they are, ready to be passed to set_input without conversion.
+fn tensor_from_file(path: String, height: u32, width: u32) -> Vec<u8> {
+    let tensor_bytes = std::fs::read(&path).unwrap();
+    let expected_len = 3 * height as usize * width as usize * std::mem::size_of::<f32>();
+    if tensor_bytes.len() != expected_len {
+        panic!(
+            "Tensor file {} has {} bytes, expected {} for a {}x{} input",
+            path,
+            tensor_bytes.len(),
+            expected_len,
+            height,
+            width
+        );
+    }
+
+    return tensor_bytes;
+}
+
 // A wrapper for class ID and match probabilities.
 #[derive(Debug, PartialEq)]
 struct InferenceResult(usize, f32);
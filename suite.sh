@@ -8,6 +8,10 @@ export PYTORCH_ABI="libtorch-cxx11-abi"
 export PROMETHEUS_VERSION="3.2.1"
 export SUITE_NAME="CS4099Suite"
 
+# The targets of the Dockerfile besides the default one, each built as a variant of the Docker image
+# and run as its own deployment mechanism, e.g. docker_slim
+DOCKER_IMAGE_VARIANTS=("no_models" "slim" "stripped" "distroless")
+
 function main() {
     prompt_user_for_action
 }
@@ -119,7 +123,8 @@ function prompt_user_for_specific_steps() {
             echo "4. Run data collection on target machine"
             echo "5. Retrieve data collection results from target machine"
             echo "6. Run data analysis on host machine"
-            echo "7. Back to main menu"
+            echo "7. Run data collection across a fleet of target machines in parallel"
+            echo "8. Back to main menu"
         local action
         read -p "Enter the number identifying the action you would like to perform: " action
         case $action in
@@ -129,7 +134,8 @@ function prompt_user_for_specific_steps() {
             4) run_data_collection ;;
             5) retrieve_data_collection_results ;;
             6) run_data_analysis ;;
-            7) prompt_user_for_action ;;
+            7) run_fleet_data_collection ;;
+            8) prompt_user_for_action ;;
             *) echo "Invalid option." ;;
         esac
     done
@@ -161,6 +167,7 @@ function acquire_files() {
     install_python_and_dependencies # TODO: check if torchvision really required
     
     generate_model_files
+    generate_input_tensors
 
     case $arch in 
         "arm64") 
@@ -261,15 +268,51 @@ function generate_model_files() {
 
     mkdir -p models/models
 
-    generate_mobilenet_model
-    generate_efficientnet_models
-    generate_resnet_models
+    # Collect the selected variants of every model family first, so that they can all be
+    # exported in parallel by a single run of the model generation script
+    models_to_generate=()
+    prompt_user_for_mobilenet_models
+    prompt_user_for_efficientnet_models
+    prompt_user_for_resnet_models
+
+    if [ ${#models_to_generate[@]} -eq 0 ]; then
+        echo "No models selected. Skipping generation."
+        return
+    fi
+
+    local resolutions
+    echo "Which input resolutions would you like to export the models at? Enter 'native' to use the resolution each model was designed for."
+    read -p "Enter the resolutions (comma-separated, default: 224): " resolutions
+    if [ -z "$resolutions" ]; then
+        resolutions="224"
+    fi
+
+    # Models that are already up to date are skipped by the script
+    python3 host_scripts/model_generation/gen_models.py \
+        --models "$(IFS=,; echo "${models_to_generate[*]}")" \
+        --resolutions "$resolutions" \
+        --output-dir models/models \
+        --manifest models/manifest.json
 
     echo "Finished generating model files!"
 }
 
-function generate_efficientnet_models() {
-    # Generate EfficientNet models
+function generate_input_tensors() {
+    # Preprocess the inputs once into tensors at every resolution the models were exported at,
+    # so the binaries can optionally load them without decoding the images on every trial
+    echo "Generating pre-decoded input tensors..."
+
+    # Tensors that are already up to date are skipped by the script
+    python3 host_scripts/input_preprocessing/gen_input_tensors.py \
+        --inputs-dir inputs/inputs \
+        --output-dir inputs/tensors \
+        --manifest models/manifest.json
+
+    echo "Finished generating pre-decoded input tensors!"
+}
+
+function prompt_user_for_efficientnet_models() {
+    # Prompt the user for the EfficientNet models to generate
     echo "Which EfficientNet models would you like to generate?"
         echo "1. EfficientNetB0"
         echo "2. EfficientNetB1"
@@ -283,35 +326,23 @@ function generate_efficientnet_models() {
     read -p "Enter the numbers identifying the EfficientNet models you would like to generate (comma-separated): " efficientnet_input
     
     IFS="," read -r -a efficientnet_models_idx <<< "$efficientnet_input"
-    local efficientnet_models=()
 
     for efficientnet_model_idx in "${efficientnet_models_idx[@]}"; do
         case $efficientnet_model_idx in
-            1) efficientnet_models+=("--b0") ;;
-            2) efficientnet_models+=("--b1") ;;
-            3) efficientnet_models+=("--b2") ;;
-            4) efficientnet_models+=("--b3") ;;
-            5) efficientnet_models+=("--b4") ;;
-            6) efficientnet_models+=("--b5") ;;
-            7) efficientnet_models+=("--b6") ;;
-            8) efficientnet_models+=("--b7") ;;
+            1) models_to_generate+=("efficientnet_b0") ;;
+            2) models_to_generate+=("efficientnet_b1") ;;
+            3) models_to_generate+=("efficientnet_b2") ;;
+            4) models_to_generate+=("efficientnet_b3") ;;
+            5) models_to_generate+=("efficientnet_b4") ;;
+            6) models_to_generate+=("efficientnet_b5") ;;
+            7) models_to_generate+=("efficientnet_b6") ;;
+            8) models_to_generate+=("efficientnet_b7") ;;
         esac
     done
-
-    if [ ${#efficientnet_models[@]} -eq 0 ]; then
-        echo "No EfficientNet models selected. Skipping generation."
-        return
-    fi
-
-    cd models/models
-    echo "Generating EfficientNet models..."
-    python3 ../../host_scripts/model_generation/gen_efficientnet_models.py "${efficientnet_models[@]}"
-    echo "Finished generating EfficientNet models!"
-    cd -
 }
 
-function generate_resnet_models() {
-    # Generate ResNet models
+function prompt_user_for_resnet_models() {
+    # Prompt the user for the ResNet models to generate
     echo "Which ResNet models would you like to generate?"
         echo "1. ResNet18"
         echo "2. ResNet34"
@@ -322,32 +353,20 @@ function generate_resnet_models() {
     read -p "Enter the numbers identifying the ResNet models you would like to generate (comma-separated): " resnet_input
 
     IFS="," read -r -a resnet_models_idx <<< "$resnet_input"
-    local resnet_models=()
 
     for resnet_model_idx in "${resnet_models_idx[@]}"; do
         case $resnet_model_idx in
-            1) resnet_models+=("--resnet18") ;;
-            2) resnet_models+=("--resnet34") ;;
-            3) resnet_models+=("--resnet50") ;;
-            4) resnet_models+=("--resnet101") ;;
-            5) resnet_models+=("--resnet152") ;;
+            1) models_to_generate+=("resnet18") ;;
+            2) models_to_generate+=("resnet34") ;;
+            3) models_to_generate+=("resnet50") ;;
+            4) models_to_generate+=("resnet101") ;;
+            5) models_to_generate+=("resnet152") ;;
         esac
     done
-
-    if [ ${#resnet_models[@]} -eq 0 ]; then
-        echo "No ResNet models selected. Skipping generation."
-        return
-    fi
-
-    cd models/models
-    echo "Generating ResNet models..."
-    python3 ../../host_scripts/model_generation/gen_resnet_models.py "${resnet_models[@]}"
-    echo "Finished generating ResNet models!"
-    cd -
 }
 
-function generate_mobilenet_model() {
-    # Generate MobileNet models
+function prompt_user_for_mobilenet_models() {
+    # Prompt the user for the MobileNet models to generate
     echo "Which MobileNet models would you like to generate?"
         echo "1. MobileNetV3-Small"
         echo "2. MobileNetV3-Large"
@@ -355,25 +374,13 @@ function generate_mobilenet_model() {
     read -p "Enter the numbers identifying the MobileNet models you would like to generate (comma-separated): " mobilenet_input
     
     IFS="," read -r -a mobilenet_models_idx <<< "$mobilenet_input"
-    local mobilenet_models=()
 
     for mobilenet_model_idx in "${mobilenet_models_idx[@]}"; do
         case $mobilenet_model_idx in
-            1) mobilenet_models+=("--mobilenetv3_small") ;;
-            2) mobilenet_models+=("--mobilenetv3_large") ;;
+            1) models_to_generate+=("mobilenetv3_small") ;;
+            2) models_to_generate+=("mobilenetv3_large") ;;
         esac
     done
-
-    if [ ${#mobilenet_models[@]} -eq 0 ]; then
-        echo "No MobileNet models selected. Skipping generation."
-        return
-    fi
-
-    cd models/models
-    echo "Generating MobileNet models..."
-    python3 ../../host_scripts/model_generation/gen_mobilenet_models.py "${mobilenet_models[@]}"
-    echo "Finished generating MobileNet models!"
-    cd -
 }
 
 function build_wasmedge() {
@@ -513,6 +520,15 @@ function build_docker_and_native() {
     # Save the Docker container into a tar file
     docker save -o docker/image-classification-${arch}.tar "$image_name"
 
+    # Build each variant of the Docker image from its target in the Dockerfile, which run as
+    # separate deployment mechanisms (e.g. docker_slim for the "slim" target)
+    local variant
+    for variant in "${DOCKER_IMAGE_VARIANTS[@]}"; do
+        local variant_image_name="image-classification-$variant:$arch"
+        docker buildx build --platform linux/"$arch" --target "$variant" -t "$variant_image_name" -f Dockerfiles/image_classification/Dockerfile --output type=docker .
+        docker save -o docker/image-classification-$variant-${arch}.tar "$variant_image_name"
+    done
+
     # Extract the binary compiled for the container so it can also be run for the 
     # native deployment mechanism
     mkdir -p native
@@ -569,6 +585,20 @@ function transfer_suite_files() {
     sshpass -p "$target_password" scp -r models/models inputs/inputs native wasm libtorch cadvisor prometheus python docker target_scripts data_scripts/collect_data.py \
         "$target_username"@"$target_address":/home/"$target_username"/Desktop/"$SUITE_NAME"
 
+    # Transfer the pre-decoded input tensors into the inputs directory; being a directory, it will not
+    # be considered an input itself
+    if [ -d inputs/tensors ]; then
+        sshpass -p "$target_password" scp -r inputs/tensors \
+            "$target_username"@"$target_address":/home/"$target_username"/Desktop/"$SUITE_NAME"/inputs
+    fi
+
+    # Transfer the model manifest, if models were generated, so the data collection script can read
+    # the input resolution each model expects
+    if [ -f models/manifest.json ]; then
+        sshpass -p "$target_password" scp models/manifest.json \
+            "$target_username"@"$target_address":/home/"$target_username"/Desktop/"$SUITE_NAME"/model_manifest.json
+    fi
+
     # Create a directory in the suite directory to store results 
     sshpass -p "$target_password" ssh "$target_username"@"$target_address" "mkdir -p /home/$target_username/Desktop/$SUITE_NAME/results"
 }   
@@ -639,6 +669,7 @@ function run_data_collection() {
 
     echo "Running data collection on target device..."
 
+    echo "If a set with the given name was already collected, only the experiments whose model, input, binaries, images or options changed since are run again."
     local set_name
     read -p "Enter a name to identify this set of experiments: " set_name
 
@@ -673,19 +704,220 @@ function run_data_collection() {
         esac
     done
 
+    echo "Would you like the binaries to load inputs as tensors pre-decoded on this machine, rather than decoding the images in every trial?"
+    echo "This excludes image decoding from the measurements, but requires the pre-decoded tensors to have been generated and transferred."
+        echo "1. Yes"
+        echo "2. No"
+
+    while true; do
+        local pre_decoded_inputs_input
+        read -p "Enter the number identifying your choice: " pre_decoded_inputs_input
+        case $pre_decoded_inputs_input in
+            1) pre_decoded_inputs=1; break ;;
+            2) pre_decoded_inputs=0; break ;;
+            *) echo "Invalid option. Please try again." ;;
+        esac
+    done
+
+    echo "Would you like to run density experiments, which run several instances of each mechanism concurrently, instead of the standard experiments?"
+        echo "1. Yes"
+        echo "2. No"
+
+    local instance_counts=""
+    while true; do
+        local density_input
+        read -p "Enter the number identifying your choice: " density_input
+        case $density_input in
+            1) read -p "Enter the numbers of concurrent instances to run (comma-separated, default: 1,2,4): " instance_counts
+               if [ -z "$instance_counts" ]; then
+                   instance_counts="1,2,4"
+               fi
+               break ;;
+            2) break ;;
+            *) echo "Invalid option. Please try again." ;;
+        esac
+    done
+
+    local rates=""
+    local load_duration=""
+    local constant_arrival=0
+    if [ -z "$instance_counts" ]; then
+        echo "Would you like to run load experiments, which invoke each mechanism open-loop at target arrival rates to measure its tail latency, instead of the standard experiments?"
+            echo "1. Yes"
+            echo "2. No"
+
+        while true; do
+            local load_input
+            read -p "Enter the number identifying your choice: " load_input
+            case $load_input in
+                1) read -p "Enter the arrival rates to sweep in requests per second (comma-separated, default: 0.5,1,2): " rates
+                   if [ -z "$rates" ]; then
+                       rates="0.5,1,2"
+                   fi
+                   read -p "Enter the number of seconds to issue requests for in each trial (default: 60): " load_duration
+                   echo "Should requests arrive as a Poisson process, or at constant intervals?"
+                       echo "1. Poisson process"
+                       echo "2. Constant intervals"
+                   local arrival_input
+                   read -p "Enter the number identifying your choice: " arrival_input
+                   if [ "$arrival_input" = 2 ]; then
+                       constant_arrival=1
+                   fi
+                   break ;;
+                2) break ;;
+                *) echo "Invalid option. Please try again." ;;
+            esac
+        done
+    fi
+
+    local image_characterization=0
+    if [ -z "$instance_counts" ] && [ -z "$rates" ]; then
+        echo "Would you like to run image experiments, which characterize the Docker image of each Docker mechanism (its size, layers, load time and start latency), instead of the standard experiments?"
+        echo "This removes and reloads the images and drops the page cache in every trial."
+            echo "1. Yes"
+            echo "2. No"
+
+        while true; do
+            local image_characterization_input
+            read -p "Enter the number identifying your choice: " image_characterization_input
+            case $image_characterization_input in
+                1) image_characterization=1; break ;;
+                2) break ;;
+                *) echo "Invalid option. Please try again." ;;
+            esac
+        done
+    fi
+
+    local memory_attribution=0
+    if [ -z "$instance_counts" ] && [ -z "$rates" ] && [ "$image_characterization" = 0 ]; then
+        echo "Would you like to attribute the memory of each mechanism's processes to shared libraries, model files, heap and anonymous memory during the perf experiments?"
+        echo "This samples their smaps files, which adds some CPU overhead to the experiments."
+            echo "1. Yes"
+            echo "2. No"
+
+        while true; do
+            local memory_attribution_input
+            read -p "Enter the number identifying your choice: " memory_attribution_input
+            case $memory_attribution_input in
+                1) memory_attribution=1; break ;;
+                2) break ;;
+                *) echo "Invalid option. Please try again." ;;
+            esac
+        done
+    fi
+
+    echo "The binaries can be run with a fixed number of intra-op threads, sweeping each given thread count as a separate experiment."
+    local thread_counts
+    read -p "Enter the thread counts to run with (comma-separated, e.g. 1,2,4). If nothing is entered, the runtimes' default is used: " thread_counts
+
+    local storage_media=""
+    if [ -z "$instance_counts" ] && [ -z "$rates" ] && [ "$image_characterization" = 0 ]; then
+        echo "The models and inputs can be staged on other storage media of the target machine, e.g. a tmpfs or a USB SSD, sweeping each as a separate experiment."
+        read -p "Enter the storage media to read them from (comma-separated, each as name=path or default, e.g. default,tmpfs=/mnt/tmpfs). If nothing is entered, only the suite's own directory is used: " storage_media
+    fi
+
+    local device_profiles=""
+    if [ -z "$instance_counts" ] && [ -z "$rates" ] && [ "$image_characterization" = 0 ]; then
+        echo "Smaller edge devices can be emulated on the target machine by restricting every mechanism to a CPU quota and/or a set of CPUs, sweeping each device profile as a separate experiment."
+        read -p "Enter the device profiles to emulate (comma-separated, each as name=cpus:cpuset or default, where either may be omitted, e.g. default,small=1.5:0-1,pinned=:0). If nothing is entered, all of the target machine's CPUs are used: " device_profiles
+    fi
+
+    echo "Each trial can be held until the target machine cools down below a given temperature, to reduce thermal throttling."
+    local cooldown_temperature
+    read -p "Enter the temperature in degrees Celsius to cool down to before each trial. If nothing is entered, trials are not held: " cooldown_temperature
+
+    echo "The energy consumed by each trial is measured using RAPL where the target machine supports it (typically x86 CPUs)."
+    echo "Otherwise, it can be estimated from the trial's CPU time, given the thermal design power of the target machine's CPU."
+    local tdp_watts
+    read -p "Enter the thermal design power of the target machine's CPU in watts. If nothing is entered, energy is not estimated: " tdp_watts
+
     options=""
     if [ "$is_mac" = 1 ]; then
         options="$options -m"
     fi
+    if [ -n "$tdp_watts" ]; then
+        options="$options -w $tdp_watts"
+    fi
+    if [ -n "$instance_counts" ]; then
+        options="$options -d $instance_counts"
+    fi
+    if [ -n "$rates" ]; then
+        options="$options -l $rates"
+    fi
+    if [ -n "$load_duration" ]; then
+        options="$options -s $load_duration"
+    fi
+    if [ "$constant_arrival" = 1 ]; then
+        options="$options -o"
+    fi
+    if [ "$image_characterization" = 1 ]; then
+        options="$options -i"
+    fi
+    if [ "$memory_attribution" = 1 ]; then
+        options="$options -r"
+    fi
+    if [ -n "$cooldown_temperature" ]; then
+        options="$options -c $cooldown_temperature"
+    fi
+    if [ -n "$thread_counts" ]; then
+        options="$options -t $thread_counts"
+    fi
+    if [ -n "$storage_media" ]; then
+        options="$options -S $storage_media"
+    fi
+    if [ -n "$device_profiles" ]; then
+        options="$options -D $device_profiles"
+    fi
     if [ "$allow_missing_metrics" = 1 ]; then
         options="$options -a"
     fi
+    if [ "$pre_decoded_inputs" = 1 ]; then
+        options="$options -p"
+    fi
 
     sshpass -p "$target_password" ssh -t "$target_username@$target_address" "/home/$target_username/Desktop/$SUITE_NAME/target_scripts/collect_data.sh $options $trials "$set_name" $mechanisms"
 
     echo "Finished running data collection on target device!"
 }
 
+function run_fleet_data_collection() {
+    # Run the data collection across the target machines listed in an inventory file in parallel, syncing the
+    # suite files to each and retrieving the results into the results directory as they complete
+    echo "Running data collection across a fleet of target machines..."
+    echo "The target machines are listed in an inventory file; see host_scripts/fleet/inventory.example.json for its format."
+
+    local inventory
+    read -p "Enter the path of the inventory file: " inventory
+
+    local set_name
+    read -p "Enter a name to identify this set of experiments: " set_name
+
+    while true; do
+        local trials
+        read -p "Enter the number of trials to run for each experiment (at least 2): " trials
+        if [ "$trials" -ge 2 ]; then
+            break
+        else
+            echo "Invalid number of trials. Please enter a number greater than or equal to 2."
+        fi
+    done
+
+    prompt_user_for_mechanisms
+
+    echo "Any options of the data collection script on the target machines can be passed along, e.g. \"-a -t 1,2,4\" to allow missing metrics and sweep thread counts."
+    local collect_data_options
+    read -p "Enter the options to pass to the data collection script. If nothing is entered, the defaults are used: " collect_data_options
+
+    python3 host_scripts/fleet/orchestrate_fleet.py \
+        --inventory "$inventory" \
+        --set-name "$set_name" \
+        --trials "$trials" \
+        --mechanisms "$mechanisms" \
+        --collect-data-options "$collect_data_options"
+
+    echo "Finished running data collection across the fleet!"
+}
+
 function retrieve_data_collection_results() {
     # Retrieve the results of the data collection from the target machine
     prompt_user_for_target_details_if_not_set
@@ -731,9 +963,51 @@ function run_data_analysis() {
         esac
     done
 
+    echo "Would you like to compare this set against a baseline set, e.g. one run with a previous runtime build, to find regressions?"
+        echo "1. Yes"
+        echo "2. No"
+
+    while true; do
+        local set_comparison
+        read -p "Enter the number identifying your choice: " set_comparison
+        case $set_comparison in
+            1) run_set_comparison "$set_name" "$analyzed_results_dir"; break ;;
+            2) break ;;
+            *) echo "Invalid option. Please try again." ;;
+        esac
+    done
+
     echo "Finished analyzing results of experiments!"
 }
 
+function run_set_comparison() {
+    # Compare the results of the set against those of a baseline set, flagging significant regressions and improvements
+    set_name="$1"
+    analyzed_results_dir="$2"
+
+    local baseline_set_name
+    read -p "Enter the name of the baseline set of experiments: " baseline_set_name
+
+    local threshold
+    read -p "Enter the relative change beyond which significant changes are flagged (default: 0.05, i.e. 5%): " threshold
+    if [ -z "$threshold" ]; then
+        threshold="0.05"
+    fi
+
+    prompt_user_for_mechanisms
+
+    python3 data_scripts/compare_sets.py \
+        --baseline-set "$baseline_set_name" \
+        --candidate-set "$set_name" \
+        --threshold "$threshold" \
+        --mechanisms "$mechanisms" \
+        --analyzed-results-dir "$analyzed_results_dir" \
+        --view-output --save-output
+    if [ $? -ne 0 ]; then
+        echo "Regressions were found against $baseline_set_name; see results/$set_name/$analyzed_results_dir/set_comparison-$baseline_set_name.csv"
+    fi
+}
+
 function run_per_experiment_data_analysis() { 
     # Run data analysis for each experiment in a specified set
     set_name="$1"
@@ -796,6 +1070,20 @@ function run_per_experiment_data_analysis() {
         esac
     done
 
+    echo "Would you like to exclude trials during which the target machine was thermally throttled, if this was recorded?"
+        echo "1. Yes"
+        echo "2. No"
+
+    while true; do
+        local exclude_throttled_input
+        read -p "Enter the number identifying your choice: " exclude_throttled_input
+        case $exclude_throttled_input in
+            1) options="$options --exclude-throttled-trials"; break ;;
+            2) break ;;
+            *) echo "Invalid option. Please try again." ;;
+        esac
+    done
+
     if [ "$view_output" = 1 ]; then
         echo "Would you like to print statistically insignificant output during the analysis?"
             echo "1. Yes"
@@ -812,11 +1100,11 @@ function run_per_experiment_data_analysis() {
         done
     fi
     
-    # For each combination of model and input, there's a perf results file and a time results file
-    # so only need to iterate over one of them
-    for results_file in $(ls results/"$set_name"/*time_results.csv); do
-        model=$(basename "$results_file" | cut -d '-' -f 1)
-        input=$(basename "$results_file" | cut -d '-' -f 2)
+    # For each combination of model and input, there's a perf results file and a time results file, and/or
+    # a density results file, a load results file, an image results file and an AoT results file, so only need to iterate over each combination once
+    for results_prefix in $(ls results/"$set_name"/*_results.csv | xargs -n 1 basename | cut -d '-' -f 1,2 | sort -u); do
+        model=$(echo "$results_prefix" | cut -d '-' -f 1)
+        input=$(echo "$results_prefix" | cut -d '-' -f 2)
         echo "Analyzing data for $model and $input..."
         python3 data_scripts/analyze_data.py \
             --experiment-set "$set_name" \
@@ -844,6 +1132,11 @@ function prompt_user_for_mechanisms() {
         echo "2. Docker"
         echo "3. WebAssembly interpreted"
         echo "4. WebAssembly ahead of time (AoT)-compiled"
+        echo "5. Docker without the models and inputs baked into the image"
+        echo "6. Docker with a slim Debian base image"
+        echo "7. Docker with a slim Debian base image and stripped libraries"
+        echo "8. Docker with a distroless base image and stripped libraries"
+        echo "9. WebAssembly AoT-compiled at each optimization level (O0, O1, O2, O3, Os and Oz) as separate mechanisms"
     local mechanisms_input
     read -p "Enter the numbers identifying the deployment mechanisms you would like to include (comma-separated): " mechanisms_input
 
@@ -857,6 +1150,11 @@ function prompt_user_for_mechanisms() {
             2) mechanisms+=("docker") ;;
             3) mechanisms+=("wasm_interpreted") ;;
             4) mechanisms+=("wasm_aot") ;;
+            5) mechanisms+=("docker_no_models") ;;
+            6) mechanisms+=("docker_slim") ;;
+            7) mechanisms+=("docker_stripped") ;;
+            8) mechanisms+=("docker_distroless") ;;
+            9) mechanisms+=("wasm_aot_o0" "wasm_aot_o1" "wasm_aot_o2" "wasm_aot_o3" "wasm_aot_os" "wasm_aot_oz") ;;
         esac
     done
 
@@ -868,14 +1166,21 @@ function prompt_user_for_metrics() {
     set_name="$1" # 
 
     echo "Based on the data collected, the following metrics are available for analysis:"
-        # Read one time file and one perf file to get the available metrics
-        time_file=$(ls results/"$set_name"/*time_results.csv | head -n 1)
-        perf_file=$(ls results/"$set_name"/*perf_results.csv | head -n 1)
+        # Read one time file and one perf file to get the available metrics; a set may only contain density,
+        # load or image experiments, whose metrics are always all analyzed
+        time_file=$(ls results/"$set_name"/*time_results.csv 2>/dev/null | head -n 1)
+        perf_file=$(ls results/"$set_name"/*perf_results.csv 2>/dev/null | head -n 1)
+        if [ -z "$time_file" ] || [ -z "$perf_file" ]; then
+            echo "No standard experiments were run in this set, so only the density, load and image experiments will be analyzed."
+            metrics="none"
+            return
+        fi
 
-        # The first 3 columns are the same for all result files; they only include non-metric columns
-        # such as deployment mechanism, trial number and start time
-        time_metrics=$(head -n 1 "$time_file" | tr -d '\r' | cut -d ',' -f 4-)
-        perf_metrics=$(head -n 1 "$perf_file" | tr -d '\r' | cut -d ',' -f 4-)
+        # Exclude the non-metric columns, such as deployment mechanism, trial number and start time, as well as
+        # the experiment dimensions such as the thread count and the thermal state of the device, which older 
+        # result files do not include
+        time_metrics=$(get_metric_columns "$time_file")
+        perf_metrics=$(get_metric_columns "$perf_file")
 
         # If perf_metrics includes instructions and cycles, then we must additionally consider the
         # instructions-per-cycle and cycles-per-instruction metrics calculated in the analysis
@@ -890,6 +1195,15 @@ function prompt_user_for_metrics() {
     fi
 }
 
+function get_metric_columns() {
+    # Print the comma-separated names of the metric columns in the header of the given results file
+    results_file="$1"
+
+    head -n 1 "$results_file" | tr -d '\r' | tr ',' '\n' \
+        | grep -vxE 'deployment-mechanism|trial-number|start-time|threads|(start|end)-temperature-celsius|(start|end)-cpu-frequency-mhz|throttled|energy-estimated' \
+        | paste -sd, -
+}
+
 function list_models_and_inputs() {
     # List the models and inputs available for analysis based on the data collected
     set_name="$1"
@@ -985,11 +1299,37 @@ function run_aggregate_data_analysis() {
         options="$options --compare-across-inputs --inputs-to-compare $inputs_to_compare --model $model"
     fi
 
-    if [ "$compare_across_models" = 0 ] && [ "$compare_across_inputs" = 0 ]; then
-        echo "You must compare across either models or inputs. Please try again."
+    echo "Would you like to compare across the input resolutions a model was exported at?"
+        echo "1. Yes"
+        echo "2. No"
+
+    while true; do
+        local compare_across_resolutions_input
+        read -p "Enter the number identifying your choice: " compare_across_resolutions_input
+        case $compare_across_resolutions_input in
+            1) compare_across_resolutions=1; break ;;
+            2) compare_across_resolutions=0; break ;;
+            *) echo "Invalid option. Please try again." ;;
+        esac
+    done
+
+    if [ "$compare_across_resolutions" = 1 ]; then
+        read -p "Enter the model to compare resolutions of, without any resolution suffix (e.g. efficientnet_b3.pt): " resolution_model
+        read -p "Enter the input to use in comparing resolutions: " resolution_input
+        options="$options --compare-across-resolutions --resolutions-model $resolution_model --resolutions-input $resolution_input"
+    fi
+
+    if [ "$compare_across_models" = 0 ] && [ "$compare_across_inputs" = 0 ] && [ "$compare_across_resolutions" = 0 ]; then
+        echo "You must compare across either models, inputs or resolutions. Please try again."
         return
     fi
 
+    local threads
+    read -p "Enter the thread count to compare at, if the experiments were run with more than one (otherwise, leave blank): " threads
+    if [ -n "$threads" ]; then
+        options="$options --threads $threads"
+    fi
+
     python3 data_scripts/analyze_aggregate_data.py \
         --experiment-set "$set_name" \
         --metrics "$metrics" \
@@ -3,7 +3,8 @@
 # of different models and inputs.
 
 export USERNAME=$(whoami)
-export SUITE_PATH="/home/$USERNAME/Desktop/CS4099Suite"
+# The suite directory can be overridden, e.g. by the fleet orchestrator for stand-in targets
+export SUITE_PATH="${SUITE_PATH:-/home/$USERNAME/Desktop/CS4099Suite}"
 export LD_LIBRARY_PATH=${LD_LIBRARY_PATH}:/home/$USERNAME/.wasmedge/lib64:$SUITE_PATH/libtorch/lib
 export PATH=${PATH}:/home/$USERNAME/.wasmedge/bin
 
@@ -33,16 +34,26 @@ function main() {
     source myenv/bin/activate
 
     run_data_collection
+
+    if [ "$collection_failed" = 1 ]; then
+        exit 1
+    fi
 }
 
 function run_data_collection() {
     # Iterate over each model file in the models folder and each input file in the inputs folder,
-    # and run the collect_data.py script on them with the specified options
+    # or only the given model and input, and run the collect_data.py script on them with the specified options
     for model in models/*; do
         for input in inputs/*; do
             if [ -f "$model" ] && [ -f "$input" ]; then
                 basename_model=$(basename "$model")
                 basename_input=$(basename "$input")
+                if [ -n "$only_model" ] && [ "$basename_model" != "$only_model" ]; then
+                    continue
+                fi
+                if [ -n "$only_input" ] && [ "$basename_input" != "$only_input" ]; then
+                    continue
+                fi
                 echo "Running collect_data.py with model: $basename_model and input: $basename_input"
 
                 options=""
@@ -52,17 +63,99 @@ function run_data_collection() {
                 if [ "$allow_missing_metrics" = 1 ]; then
                     options="$options --allow_missing_metrics"
                 fi
+                if [ "$pre_decoded_inputs" = 1 ]; then
+                    options="$options --input_mode pre_decoded"
+                fi
+                if [ -n "$thread_counts" ]; then
+                    options="$options --threads $thread_counts"
+                fi
+                if [ -n "$cooldown_temperature" ]; then
+                    options="$options --cooldown_temperature $cooldown_temperature"
+                fi
+                if [ -n "$tdp_watts" ]; then
+                    options="$options --tdp_watts $tdp_watts"
+                fi
+                if [ -n "$instance_counts" ]; then
+                    options="$options --mode density --instances $instance_counts"
+                fi
+                if [ -n "$rates" ]; then
+                    options="$options --mode load --rates $rates"
+                fi
+                if [ -n "$load_duration" ]; then
+                    options="$options --duration $load_duration"
+                fi
+                if [ "$constant_arrival" = 1 ]; then
+                    options="$options --arrival constant"
+                fi
+                if [ "$image_characterization" = 1 ]; then
+                    options="$options --mode image"
+                fi
+                if [ "$profiling" = 1 ]; then
+                    options="$options --mode profile"
+                fi
+                if [ "$memory_limiting" = 1 ]; then
+                    options="$options --mode memory"
+                fi
+                if [ -n "$memory_limits" ]; then
+                    options="$options --memory_limits $memory_limits"
+                fi
+                if [ "$memory_attribution" = 1 ]; then
+                    options="$options --memory_attribution"
+                fi
+                if [ "$force" = 1 ]; then
+                    options="$options --force"
+                fi
+                if [ -n "$perf_counters" ]; then
+                    options="$options --perf_counters $perf_counters"
+                fi
+                if [ "$perf_multiplex" = 1 ]; then
+                    options="$options --perf_scheduling multiplex"
+                fi
+                if [ -n "$storage_media" ]; then
+                    options="$options --storage $storage_media"
+                fi
+                if [ -n "$device_profiles" ]; then
+                    options="$options --devices $device_profiles"
+                fi
+                if [ "$drop_page_cache" = 1 ]; then
+                    options="$options --drop_page_cache"
+                fi
+                if [ -n "$metrics_port" ]; then
+                    options="$options --metrics_port $metrics_port"
+                fi
 
-                python collect_data.py --model "$basename_model" --input "$basename_input" \
+                # Carry on with the remaining models and inputs if one fails, but exit with an error at the end
+                if ! python collect_data.py --model "$basename_model" --input "$basename_input" \
                     --trials $trials --set_name $set_name --mechanisms "$mechanisms" \
-                    --arch $arch $options
+                    --arch $arch $options; then
+                    collection_failed=1
+                fi
             fi
         done
     done
 }
 
-# Check for optional arguments: -a for allowing missing perf events and -m for Mac
-while getopts "am" opt; do
+# Check for optional arguments: -a for allowing missing perf events, -m for Mac, -p for
+# using pre-decoded input tensors, -t for the comma-separated thread counts to sweep, -c for
+# the temperature to cool down to before each trial, -w for the CPU's thermal design power
+# in watts, used to estimate energy without RAPL, -d for the comma-separated numbers of
+# concurrent instances to run density experiments with instead of the standard experiments,
+# -l for the comma-separated arrival rates to run load experiments at instead, -s for the
+# number of seconds to issue requests for in each load trial, -o for requests arriving
+# at constant intervals rather than as a Poisson process, -i for characterizing the Docker
+# images instead, and -r for attributing the memory of the workload's processes to regions
+# such as shared libraries and heap in perf experiments, -M and -I for only running the
+# model and input with the given filenames, -F for running experiments even if their
+# existing results are up to date, -e for the port to serve the progress of each run on, -g
+# for the number of counters the CPU has for perf events, -x for multiplexing the groups
+# of perf events that do not fit in the counters at once rather than measuring them in passes,
+# -P for sampling the call stacks of each mechanism with perf instead, -S for the comma-separated
+# storage media to read the models and inputs from, each as name=path or default, -C for
+# dropping the page cache before each trial, -R for searching the minimum viable memory of each
+# mechanism and sweeping the memory limit it runs under instead, -L for the comma-separated
+# memory limits in MiB to sweep, where 0 is no limit, and -D for the comma-separated device
+# profiles to emulate smaller devices with, each as name=cpus:cpuset or default
+while getopts "ampt:c:w:d:l:s:oirM:I:Fe:g:xPS:CRL:D:" opt; do
     case $opt in
         a)
             allow_missing_metrics=1
@@ -70,6 +163,72 @@ while getopts "am" opt; do
         m)
             is_mac=1
             ;;
+        p)
+            pre_decoded_inputs=1
+            ;;
+        t)
+            thread_counts=$OPTARG
+            ;;
+        c)
+            cooldown_temperature=$OPTARG
+            ;;
+        w)
+            tdp_watts=$OPTARG
+            ;;
+        d)
+            instance_counts=$OPTARG
+            ;;
+        l)
+            rates=$OPTARG
+            ;;
+        s)
+            load_duration=$OPTARG
+            ;;
+        o)
+            constant_arrival=1
+            ;;
+        i)
+            image_characterization=1
+            ;;
+        r)
+            memory_attribution=1
+            ;;
+        M)
+            only_model=$OPTARG
+            ;;
+        I)
+            only_input=$OPTARG
+            ;;
+        F)
+            force=1
+            ;;
+        e)
+            metrics_port=$OPTARG
+            ;;
+        g)
+            perf_counters=$OPTARG
+            ;;
+        x)
+            perf_multiplex=1
+            ;;
+        P)
+            profiling=1
+            ;;
+        S)
+            storage_media=$OPTARG
+            ;;
+        C)
+            drop_page_cache=1
+            ;;
+        R)
+            memory_limiting=1
+            ;;
+        L)
+            memory_limits=$OPTARG
+            ;;
+        D)
+            device_profiles=$OPTARG
+            ;;
         \?)
             echo "Invalid option: -$OPTARG" >&2
             exit 1
@@ -29,13 +29,8 @@ function main() {
     setup_python
     setup_collect_data
 
-    # Setup LD_LIBRARY_PATH in preparation for AoT compilation
-    export LD_LIBRARY_PATH=${LD_LIBRARY_PATH}:$SUITE_PATH/libtorch/lib
-    if [ "$mac" = 1 ]; then
-        aot_compile_wasm_mac
-    else
-        aot_compile_wasm_non_mac
-    fi
+    # The WebAssembly code is AoT compiled by the data collection script itself, which caches the compiled
+    # file for each optimization level and records how long the compilation took
 }
 
 function install_time() {
@@ -94,8 +89,10 @@ function setup_docker() {
 }
 
 function load_docker_image() {
-    # Load the Docker image for the image classification model
-    docker load -i "$SUITE_PATH/docker/image-classification-$arch.tar"
+    # Load the Docker image for the image classification model, along with each of its variants
+    for image_tar in "$SUITE_PATH"/docker/image-classification*-$arch.tar; do
+        docker load -i "$image_tar"
+    done
 }
 
 function setup_cadvisor() {
@@ -138,16 +135,6 @@ function setup_collect_data() {
     chmod u+x "$SUITE_PATH/target_scripts/collect_data.sh"
 }
 
-function aot_compile_wasm_non_mac() {
-    # AoT compile the WebAssembly code (if not on Mac)
-    wasmedge compile "$SUITE_PATH/wasm/interpreted.wasm" "$SUITE_PATH/wasm/aot.wasm"
-}
-
-function aot_compile_wasm_mac() {
-    # AoT compile the WebAssembly code (if on Mac)
-    wasmedge compile "$SUITE_PATH/wasm/interpreted.wasm" "$SUITE_PATH/wasm/aot.so"
-}
-
 # Check if user passed in an optional argument specifying the target machine
 # is on a Mac
 while getopts "m" opt; do